@@ -15,7 +15,7 @@ src_dir = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_dir))
 
 # Import and run the MCP server
-from src.mcp_server import mcp
+from src.mcp_server import mcp, warm_up_from_env
 
 if __name__ == "__main__":
     # Set up environment
@@ -29,5 +29,8 @@ if __name__ == "__main__":
     print("📊 Core services: Identity, Provenance, Quality, Workflow State")
     print("🔗 Ready for vertical slice implementation")
     
+    # Build services in the background if MCP_WARM_UP is set
+    warm_up_from_env()
+    
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Artifact Store - Compact binary storage for workflow stage outputs
+
+Workflow checkpoints reference stage outputs (chunks, mentions,
+relationships, built entity IDs) by artifact ref instead of embedding them
+in the checkpoint state, so a failed workflow can resume from its last
+completed stage.
+
+Artifacts are written as msgpack when available, otherwise as
+zlib-compressed JSON. Files are written atomically so a checkpoint never
+references a partially written artifact.
+"""
+
+from typing import Any, Optional
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from pathlib import Path
+import logging
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactStore:
+    """Per-workflow directory of stage artifacts."""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def format(self) -> str:
+        return "msgpack" if msgpack is not None else "json.zz"
+
+    def _encode(self, data: Any) -> bytes:
+        if msgpack is not None:
+            return msgpack.packb(data, use_bin_type=True, default=str)
+        return zlib.compress(json.dumps(data, separators=(",", ":"), default=str).encode("utf-8"), 1)
+
+    @staticmethod
+    def _decode(path: Path, payload: bytes) -> Any:
+        if path.suffix == ".msgpack":
+            if msgpack is None:
+                raise RuntimeError(f"msgpack is required to read artifact {path.name}")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def save(self, workflow_id: str, name: str, data: Any) -> str:
+        """Write an artifact and return its ref (path relative to the store)."""
+        workflow_dir = self.root_dir / workflow_id
+        workflow_dir.mkdir(parents=True, exist_ok=True)
+        ref = f"{workflow_id}/{name}.{self.format}"
+
+        fd, temp_path = tempfile.mkstemp(dir=workflow_dir, prefix=f".{name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._encode(data))
+            os.replace(temp_path, self.root_dir / ref)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return ref
+
+    def load(self, ref: str) -> Any:
+        """Read an artifact by ref."""
+        path = self.root_dir / ref
+        with open(path, "rb") as f:
+            return self._decode(path, f.read())
+
+    def exists(self, ref: str) -> bool:
+        return (self.root_dir / ref).is_file()
+
+    def size(self, ref: str) -> Optional[int]:
+        try:
+            return (self.root_dir / ref).stat().st_size
+        except OSError:
+            return None
+
+    def delete_workflow(self, workflow_id: str):
+        """Remove all artifacts of a workflow."""
+        shutil.rmtree(self.root_dir / workflow_id, ignore_errors=True)
+
+    def delete_older_than(self, cutoff_timestamp: float) -> int:
+        """Remove workflow artifact directories not modified since the cutoff."""
+        removed = 0
+        for workflow_dir in self.root_dir.iterdir():
+            try:
+                if workflow_dir.is_dir() and workflow_dir.stat().st_mtime < cutoff_timestamp:
+                    shutil.rmtree(workflow_dir, ignore_errors=True)
+                    removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove artifacts in {workflow_dir}: {e}")
+        return removed
@@ -0,0 +1,307 @@
+"""Checkpoint Store - Indexed single-file workflow checkpoint storage
+
+Persists workflow checkpoints to one SQLite database (WAL mode) instead of
+one JSON file per checkpoint. Writes are queued and applied by a background
+thread in batched transactions; queued checkpoints stay readable until they
+are written. Checkpoints are indexed by workflow so per-workflow listings do
+not scan the whole store.
+
+Legacy checkpoint_*.json files in the storage directory are imported once,
+the first time the database is opened.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_SQL_BATCH = 500
+
+_CHECKPOINT_COLUMNS = (
+    "checkpoint_id, workflow_id, step_name, step_number, total_steps, state_data, created_at, metadata"
+)
+
+# (checkpoint_id, workflow_id, step_name, step_number, total_steps,
+#  state_data JSON, created_at ISO, metadata JSON)
+CheckpointRow = Tuple[str, str, str, int, int, str, str, str]
+
+
+class CheckpointStore:
+    """SQLite store of workflow checkpoints with a background writer."""
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval_seconds: float = 0.5,
+        flush_batch_size: int = 200,
+        legacy_dir: Optional[str] = None
+    ):
+        """Open (or create) the store and start the background writer.
+
+        Args:
+            db_path: Path to the SQLite checkpoint database
+            flush_interval_seconds: Maximum time a queued checkpoint waits before being written
+            flush_batch_size: Maximum checkpoints written per transaction
+            legacy_dir: Directory of checkpoint_*.json files to import on first open
+        """
+        self.db_path = db_path
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_batch_size = flush_batch_size
+
+        self._queue: "queue.Queue[Optional[CheckpointRow]]" = queue.Queue()
+        self._pending: Dict[str, CheckpointRow] = {}
+        self._lock = threading.Lock()
+        self._db_conn = None
+        self._writer = None
+        self.written = 0
+
+        self._init_database()
+        if self._db_conn:
+            if legacy_dir:
+                self._import_legacy_files(Path(legacy_dir))
+            self._writer = threading.Thread(target=self._write_loop, name="checkpoint-writer", daemon=True)
+            self._writer.start()
+            # Queued checkpoints are written before interpreter shutdown
+            atexit.register(self.close)
+
+    @property
+    def available(self) -> bool:
+        return self._db_conn is not None
+
+    def _init_database(self):
+        """Initialize SQLite checkpoint database."""
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    checkpoint_id TEXT PRIMARY KEY,
+                    workflow_id TEXT NOT NULL,
+                    step_name TEXT NOT NULL,
+                    step_number INTEGER NOT NULL,
+                    total_steps INTEGER NOT NULL,
+                    state_data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    metadata TEXT NOT NULL
+                )
+            """)
+            self._db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_checkpoints_workflow ON checkpoints(workflow_id, step_number)"
+            )
+            self._db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_checkpoints_created ON checkpoints(created_at)"
+            )
+            self._db_conn.execute(
+                "CREATE TABLE IF NOT EXISTS store_info (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize checkpoint store at {self.db_path}: {e}")
+            self._db_conn = None
+
+    def _import_legacy_files(self, legacy_dir: Path):
+        """Import checkpoint_*.json files once, in batched transactions."""
+        try:
+            imported = self._db_conn.execute(
+                "SELECT value FROM store_info WHERE key = 'legacy_imported'"
+            ).fetchone()
+            if imported:
+                return
+
+            rows = []
+            count = 0
+            for checkpoint_file in legacy_dir.glob("checkpoint_*.json"):
+                try:
+                    with open(checkpoint_file, 'r') as f:
+                        data = json.load(f)
+                    rows.append((
+                        data["checkpoint_id"], data["workflow_id"], data["step_name"],
+                        data["step_number"], data["total_steps"],
+                        json.dumps(data.get("state_data", {})), data["created_at"],
+                        json.dumps(data.get("metadata", {}))
+                    ))
+                except Exception as e:
+                    logger.warning(f"Failed to import checkpoint {checkpoint_file}: {e}")
+                if len(rows) >= _SQL_BATCH:
+                    count += self._insert_rows(rows, replace=False)
+                    rows = []
+            if rows:
+                count += self._insert_rows(rows, replace=False)
+
+            self._db_conn.execute(
+                "INSERT OR REPLACE INTO store_info (key, value) VALUES ('legacy_imported', ?)", (str(count),)
+            )
+            self._db_conn.commit()
+            if count:
+                logger.info(f"Imported {count} legacy checkpoint files into {self.db_path}")
+        except Exception as e:
+            logger.error(f"Failed to import legacy checkpoints: {e}")
+
+    def _insert_rows(self, rows: List[CheckpointRow], replace: bool = True) -> int:
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        self._db_conn.executemany(
+            f"{verb} INTO checkpoints ({_CHECKPOINT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        self._db_conn.commit()
+        return len(rows)
+
+    def append(self, row: CheckpointRow):
+        """Queue a checkpoint row for writing; it is readable immediately."""
+        if self._db_conn:
+            with self._lock:
+                self._pending[row[0]] = row
+            self._queue.put(row)
+
+    def _write_loop(self):
+        """Background writer: drain the queue in batched transactions."""
+        while True:
+            try:
+                row = self._queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                continue
+
+            batch = [row]
+            while len(batch) < self.flush_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [r for r in batch if r is not None]
+            if rows:
+                self._write_batch(rows)
+            for _ in batch:
+                self._queue.task_done()
+
+            if any(r is None for r in batch):
+                return
+
+    def _write_batch(self, rows: List[CheckpointRow]):
+        try:
+            with self._lock:
+                self._insert_rows(rows)
+                for row in rows:
+                    if self._pending.get(row[0]) is row:
+                        del self._pending[row[0]]
+            self.written += len(rows)
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} checkpoints: {e}")
+
+    def flush(self):
+        """Block until every queued checkpoint has been written."""
+        if self._writer and self._writer.is_alive():
+            self._queue.join()
+
+    def get(self, checkpoint_id: str) -> Optional[CheckpointRow]:
+        """Load one checkpoint row by ID."""
+        if not self._db_conn:
+            return None
+        try:
+            with self._lock:
+                pending = self._pending.get(checkpoint_id)
+                if pending is not None:
+                    return pending
+                return self._db_conn.execute(
+                    f"SELECT {_CHECKPOINT_COLUMNS} FROM checkpoints WHERE checkpoint_id = ?",
+                    (checkpoint_id,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to read checkpoint store: {e}")
+            return None
+
+    def get_workflow_rows(self, workflow_id: str, include_state: bool = True) -> List[CheckpointRow]:
+        """Checkpoint rows for one workflow, ordered by step number.
+
+        With include_state=False the state_data column is returned as "" so
+        listings do not read checkpoint payloads.
+        """
+        if not self._db_conn:
+            return []
+        state_column = "state_data" if include_state else "CASE WHEN state_data = '{}' THEN '' ELSE '1' END"
+        try:
+            with self._lock:
+                rows = {
+                    row[0]: row for row in self._db_conn.execute(f"""
+                        SELECT checkpoint_id, workflow_id, step_name, step_number, total_steps,
+                               {state_column}, created_at, metadata
+                        FROM checkpoints WHERE workflow_id = ?
+                        ORDER BY step_number, created_at
+                    """, (workflow_id,)).fetchall()
+                }
+                for row in self._pending.values():
+                    if row[1] == workflow_id:
+                        rows[row[0]] = row if include_state else row[:5] + (
+                            "" if row[5] == "{}" else "1",
+                        ) + row[6:]
+            return sorted(rows.values(), key=lambda r: (r[3], r[6]))
+        except Exception as e:
+            logger.error(f"Failed to read checkpoint store: {e}")
+            return []
+
+    def delete_older_than(self, cutoff_iso: str) -> List[str]:
+        """Remove checkpoints created before the cutoff, returning their IDs."""
+        if not self._db_conn:
+            return []
+        self.flush()
+        try:
+            with self._lock:
+                removed = [row[0] for row in self._db_conn.execute(
+                    "SELECT checkpoint_id FROM checkpoints WHERE created_at < ?", (cutoff_iso,)
+                ).fetchall()]
+                self._db_conn.execute("DELETE FROM checkpoints WHERE created_at < ?", (cutoff_iso,))
+                self._db_conn.commit()
+            return removed
+        except Exception as e:
+            logger.error(f"Failed to clean checkpoint store: {e}")
+            return []
+
+    def count(self) -> int:
+        """Number of stored and queued checkpoints."""
+        return sum(self.count_by_workflow().values())
+
+    def count_by_workflow(self) -> Dict[str, int]:
+        """Checkpoint count per workflow, including queued checkpoints."""
+        if not self._db_conn:
+            return {}
+        try:
+            with self._lock:
+                counts = dict(self._db_conn.execute(
+                    "SELECT workflow_id, COUNT(*) FROM checkpoints GROUP BY workflow_id"
+                ).fetchall())
+                pending = list(self._pending.values())
+                if pending:
+                    ids = [row[0] for row in pending]
+                    stored = set()
+                    for start in range(0, len(ids), _SQL_BATCH):
+                        chunk = ids[start:start + _SQL_BATCH]
+                        placeholders = ",".join("?" * len(chunk))
+                        stored.update(r[0] for r in self._db_conn.execute(
+                            f"SELECT checkpoint_id FROM checkpoints WHERE checkpoint_id IN ({placeholders})",
+                            chunk
+                        ).fetchall())
+                    for row in pending:
+                        if row[0] not in stored:
+                            counts[row[1]] = counts.get(row[1], 0) + 1
+            return counts
+        except Exception as e:
+            logger.error(f"Failed to read checkpoint store: {e}")
+            return {}
+
+    def close(self):
+        """Flush pending writes, stop the writer and close the store."""
+        if self._writer and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._db_conn:
+            self._db_conn.close()
+            self._db_conn = None
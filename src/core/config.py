@@ -22,6 +22,8 @@ class EntityProcessingConfig:
     chunk_overlap_size: int = 50
     embedding_batch_size: int = 100
     max_entities_per_chunk: int = 20
+    embedding_store_path: str = "./data/embeddings.db"
+    embedding_cache_size: int = 10000
 
 
 @dataclass
@@ -41,6 +43,8 @@ class GraphConstructionConfig:
     pagerank_min_score: float = 0.0001
     max_relationships_per_entity: int = 50
     graph_pruning_threshold: float = 0.1
+    bulk_write_batch_size: int = 1000
+    entity_cache_size: int = 100000
 
 
 @dataclass
@@ -51,6 +55,10 @@ class APIConfig:
     batch_processing_size: int = 10
     openai_model: str = "text-embedding-3-small"
     gemini_model: str = "gemini-2.0-flash-exp"
+    extraction_pack_token_budget: int = 6000
+    extraction_pack_max_chunks: int = 4
+    extraction_pack_output_tokens_per_chunk: int = 800
+    extraction_max_output_tokens: int = 4096
 
 
 @dataclass
@@ -64,6 +72,83 @@ class Neo4jConfig:
     keep_alive: bool = True
 
 
+@dataclass
+class GraphStoreConfig:
+    """Configuration for the graph storage backend."""
+    backend: str = "neo4j"  # neo4j, embedded
+    embedded_path: str = "./data/graph_store.db"
+
+
+@dataclass
+class QueryCacheConfig:
+    """Configuration for the in-memory graph query result cache."""
+    enabled: bool = True
+    ttl_seconds: int = 300
+    max_entries: int = 1000
+
+
+@dataclass
+class LayoutCacheConfig:
+    """Configuration for the persistent graph layout cache."""
+    enabled: bool = True
+    cache_path: str = "./data/layout_cache.db"
+    max_entries: int = 200
+
+
+@dataclass
+class LLMCacheConfig:
+    """Configuration for the persistent LLM response cache."""
+    enabled: bool = True
+    cache_path: str = "./data/llm_cache.db"
+    ttl_seconds: int = 604800
+    max_entries: int = 50000
+
+
+@dataclass
+class ProvenanceConfig:
+    """Configuration for provenance persistence."""
+    persistence_enabled: bool = False
+    log_path: str = "./data/provenance.db"
+    hot_window_operations: int = 50000
+    flush_interval_seconds: float = 1.0
+    flush_batch_size: int = 500
+
+
+@dataclass
+class WorkflowConfig:
+    """Configuration for workflow checkpoint storage and execution."""
+    checkpoint_cache_size: int = 1000
+    flush_interval_seconds: float = 0.5
+    flush_batch_size: int = 200
+    extraction_workers: int = 0  # 0 runs per-chunk extraction in-process
+    extraction_batch_chunks: int = 8
+
+
+@dataclass
+class JobsConfig:
+    """Configuration for background jobs run by the MCP server."""
+    max_workers: int = 2
+    max_queued_jobs: int = 32
+    default_timeout_seconds: float = 3600.0
+    finished_jobs_kept: int = 200
+
+
+@dataclass
+class ProcessingQueueConfig:
+    """Configuration for the UI document processing queue."""
+    db_path: str = "./data/processing_queue.db"
+    max_workers: int = 2
+    max_queued_jobs: int = 32
+    finished_jobs_kept: int = 200
+
+
+@dataclass
+class TrackingConfig:
+    """Configuration for provenance and quality tracking granularity."""
+    level: str = "full"  # full, batch, sampled, off
+    sample_rate: float = 0.1
+
+
 @dataclass
 class SystemConfig:
     """Complete system configuration."""
@@ -72,6 +157,15 @@ class SystemConfig:
     graph_construction: GraphConstructionConfig = field(default_factory=GraphConstructionConfig)
     api: APIConfig = field(default_factory=APIConfig)
     neo4j: Neo4jConfig = field(default_factory=Neo4jConfig)
+    graph_store: GraphStoreConfig = field(default_factory=GraphStoreConfig)
+    query_cache: QueryCacheConfig = field(default_factory=QueryCacheConfig)
+    layout_cache: LayoutCacheConfig = field(default_factory=LayoutCacheConfig)
+    llm_cache: LLMCacheConfig = field(default_factory=LLMCacheConfig)
+    provenance: ProvenanceConfig = field(default_factory=ProvenanceConfig)
+    tracking: TrackingConfig = field(default_factory=TrackingConfig)
+    workflow: WorkflowConfig = field(default_factory=WorkflowConfig)
+    jobs: JobsConfig = field(default_factory=JobsConfig)
+    processing_queue: ProcessingQueueConfig = field(default_factory=ProcessingQueueConfig)
     
     # Environment settings
     environment: str = "development"
@@ -159,7 +253,9 @@ class ConfigurationManager:
                 confidence_threshold=ep_data.get('confidence_threshold', 0.7),
                 chunk_overlap_size=ep_data.get('chunk_overlap_size', 50),
                 embedding_batch_size=ep_data.get('embedding_batch_size', 100),
-                max_entities_per_chunk=ep_data.get('max_entities_per_chunk', 20)
+                max_entities_per_chunk=ep_data.get('max_entities_per_chunk', 20),
+                embedding_store_path=ep_data.get('embedding_store_path', './data/embeddings.db'),
+                embedding_cache_size=ep_data.get('embedding_cache_size', 10000)
             )
         
         # Text processing
@@ -180,7 +276,9 @@ class ConfigurationManager:
                 pagerank_tolerance=gc_data.get('pagerank_tolerance', 1e-6),
                 pagerank_min_score=gc_data.get('pagerank_min_score', 0.0001),
                 max_relationships_per_entity=gc_data.get('max_relationships_per_entity', 50),
-                graph_pruning_threshold=gc_data.get('graph_pruning_threshold', 0.1)
+                graph_pruning_threshold=gc_data.get('graph_pruning_threshold', 0.1),
+                bulk_write_batch_size=gc_data.get('bulk_write_batch_size', 1000),
+                entity_cache_size=gc_data.get('entity_cache_size', 100000)
             )
         
         # API configuration
@@ -191,7 +289,11 @@ class ConfigurationManager:
                 timeout_seconds=api_data.get('timeout_seconds', 30),
                 batch_processing_size=api_data.get('batch_processing_size', 10),
                 openai_model=api_data.get('openai_model', 'text-embedding-3-small'),
-                gemini_model=api_data.get('gemini_model', 'gemini-2.0-flash-exp')
+                gemini_model=api_data.get('gemini_model', 'gemini-2.0-flash-exp'),
+                extraction_pack_token_budget=api_data.get('extraction_pack_token_budget', 6000),
+                extraction_pack_max_chunks=api_data.get('extraction_pack_max_chunks', 4),
+                extraction_pack_output_tokens_per_chunk=api_data.get('extraction_pack_output_tokens_per_chunk', 800),
+                extraction_max_output_tokens=api_data.get('extraction_max_output_tokens', 4096)
             )
         
         # Neo4j configuration
@@ -206,6 +308,92 @@ class ConfigurationManager:
                 keep_alive=neo4j_data.get('keep_alive', True)
             )
         
+        # LLM response cache configuration
+        if 'llm_cache' in config_dict:
+            cache_data = config_dict['llm_cache']
+            config.llm_cache = LLMCacheConfig(
+                enabled=cache_data.get('enabled', True),
+                cache_path=cache_data.get('cache_path', './data/llm_cache.db'),
+                ttl_seconds=cache_data.get('ttl_seconds', 604800),
+                max_entries=cache_data.get('max_entries', 50000)
+            )
+        
+        # Graph storage backend configuration
+        if 'graph_store' in config_dict:
+            store_data = config_dict['graph_store']
+            config.graph_store = GraphStoreConfig(
+                backend=store_data.get('backend', 'neo4j'),
+                embedded_path=store_data.get('embedded_path', './data/graph_store.db')
+            )
+        
+        # Query result cache configuration
+        if 'query_cache' in config_dict:
+            query_cache_data = config_dict['query_cache']
+            config.query_cache = QueryCacheConfig(
+                enabled=query_cache_data.get('enabled', True),
+                ttl_seconds=query_cache_data.get('ttl_seconds', 300),
+                max_entries=query_cache_data.get('max_entries', 1000)
+            )
+        
+        # Graph layout cache configuration
+        if 'layout_cache' in config_dict:
+            layout_cache_data = config_dict['layout_cache']
+            config.layout_cache = LayoutCacheConfig(
+                enabled=layout_cache_data.get('enabled', True),
+                cache_path=layout_cache_data.get('cache_path', './data/layout_cache.db'),
+                max_entries=layout_cache_data.get('max_entries', 200)
+            )
+        
+        # Provenance persistence configuration
+        if 'provenance' in config_dict:
+            prov_data = config_dict['provenance']
+            config.provenance = ProvenanceConfig(
+                persistence_enabled=prov_data.get('persistence_enabled', False),
+                log_path=prov_data.get('log_path', './data/provenance.db'),
+                hot_window_operations=prov_data.get('hot_window_operations', 50000),
+                flush_interval_seconds=prov_data.get('flush_interval_seconds', 1.0),
+                flush_batch_size=prov_data.get('flush_batch_size', 500)
+            )
+        
+        # Provenance/quality tracking configuration
+        if 'tracking' in config_dict:
+            tracking_data = config_dict['tracking']
+            config.tracking = TrackingConfig(
+                level=tracking_data.get('level', 'full'),
+                sample_rate=tracking_data.get('sample_rate', 0.1)
+            )
+        
+        # Workflow checkpoint storage configuration
+        if 'workflow' in config_dict:
+            workflow_data = config_dict['workflow']
+            config.workflow = WorkflowConfig(
+                checkpoint_cache_size=workflow_data.get('checkpoint_cache_size', 1000),
+                flush_interval_seconds=workflow_data.get('flush_interval_seconds', 0.5),
+                flush_batch_size=workflow_data.get('flush_batch_size', 200),
+                extraction_workers=workflow_data.get('extraction_workers', 0),
+                extraction_batch_chunks=workflow_data.get('extraction_batch_chunks', 8)
+            )
+        
+        # Background job configuration
+        if 'jobs' in config_dict:
+            jobs_data = config_dict['jobs']
+            config.jobs = JobsConfig(
+                max_workers=jobs_data.get('max_workers', 2),
+                max_queued_jobs=jobs_data.get('max_queued_jobs', 32),
+                default_timeout_seconds=jobs_data.get('default_timeout_seconds', 3600.0),
+                finished_jobs_kept=jobs_data.get('finished_jobs_kept', 200)
+            )
+        
+        # UI processing queue configuration
+        if 'processing_queue' in config_dict:
+            queue_data = config_dict['processing_queue']
+            config.processing_queue = ProcessingQueueConfig(
+                db_path=queue_data.get('db_path', './data/processing_queue.db'),
+                max_workers=queue_data.get('max_workers', 2),
+                max_queued_jobs=queue_data.get('max_queued_jobs', 32),
+                finished_jobs_kept=queue_data.get('finished_jobs_kept', 200)
+            )
+        
         # System-level settings
         config.environment = config_dict.get('environment', 'development')
         config.debug = config_dict.get('debug', False)
@@ -226,12 +414,52 @@ class ConfigurationManager:
         if os.getenv('NEO4J_PASSWORD'):
             self._config.neo4j.password = os.getenv('NEO4J_PASSWORD')
         
+        # Graph storage backend overrides
+        if os.getenv('GRAPH_STORE_BACKEND'):
+            self._config.graph_store.backend = os.getenv('GRAPH_STORE_BACKEND').lower()
+        if os.getenv('GRAPH_STORE_PATH'):
+            self._config.graph_store.embedded_path = os.getenv('GRAPH_STORE_PATH')
+        
+        # Query result cache overrides
+        if os.getenv('QUERY_CACHE_ENABLED'):
+            self._config.query_cache.enabled = os.getenv('QUERY_CACHE_ENABLED').lower() in ('true', '1', 'yes')
+        
+        # Graph layout cache overrides
+        if os.getenv('LAYOUT_CACHE_ENABLED'):
+            self._config.layout_cache.enabled = os.getenv('LAYOUT_CACHE_ENABLED').lower() in ('true', '1', 'yes')
+        if os.getenv('LAYOUT_CACHE_PATH'):
+            self._config.layout_cache.cache_path = os.getenv('LAYOUT_CACHE_PATH')
+        
         # API model overrides
         if os.getenv('OPENAI_MODEL'):
             self._config.api.openai_model = os.getenv('OPENAI_MODEL')
         if os.getenv('GEMINI_MODEL'):
             self._config.api.gemini_model = os.getenv('GEMINI_MODEL')
         
+        # LLM cache overrides
+        if os.getenv('LLM_CACHE_ENABLED'):
+            self._config.llm_cache.enabled = os.getenv('LLM_CACHE_ENABLED').lower() in ('true', '1', 'yes')
+        if os.getenv('LLM_CACHE_PATH'):
+            self._config.llm_cache.cache_path = os.getenv('LLM_CACHE_PATH')
+        
+        # Provenance overrides
+        if os.getenv('PROVENANCE_PERSISTENCE_ENABLED'):
+            self._config.provenance.persistence_enabled = os.getenv('PROVENANCE_PERSISTENCE_ENABLED').lower() in ('true', '1', 'yes')
+        if os.getenv('PROVENANCE_LOG_PATH'):
+            self._config.provenance.log_path = os.getenv('PROVENANCE_LOG_PATH')
+        if os.getenv('TRACKING_LEVEL'):
+            self._config.tracking.level = os.getenv('TRACKING_LEVEL').lower()
+        
+        # Workflow execution overrides
+        if os.getenv('EXTRACTION_WORKERS'):
+            self._config.workflow.extraction_workers = int(os.getenv('EXTRACTION_WORKERS'))
+        if os.getenv('JOB_WORKERS'):
+            self._config.jobs.max_workers = int(os.getenv('JOB_WORKERS'))
+        if os.getenv('PROCESSING_QUEUE_WORKERS'):
+            self._config.processing_queue.max_workers = int(os.getenv('PROCESSING_QUEUE_WORKERS'))
+        if os.getenv('PROCESSING_QUEUE_PATH'):
+            self._config.processing_queue.db_path = os.getenv('PROCESSING_QUEUE_PATH')
+        
         # Environment and debug
         if os.getenv('ENVIRONMENT'):
             self._config.environment = os.getenv('ENVIRONMENT')
@@ -268,7 +496,9 @@ class ConfigurationManager:
                 'confidence_threshold': config.entity_processing.confidence_threshold,
                 'chunk_overlap_size': config.entity_processing.chunk_overlap_size,
                 'embedding_batch_size': config.entity_processing.embedding_batch_size,
-                'max_entities_per_chunk': config.entity_processing.max_entities_per_chunk
+                'max_entities_per_chunk': config.entity_processing.max_entities_per_chunk,
+                'embedding_store_path': config.entity_processing.embedding_store_path,
+                'embedding_cache_size': config.entity_processing.embedding_cache_size
             },
             'text_processing': {
                 'chunk_size': config.text_processing.chunk_size,
@@ -281,14 +511,20 @@ class ConfigurationManager:
                 'pagerank_tolerance': config.graph_construction.pagerank_tolerance,
                 'pagerank_min_score': config.graph_construction.pagerank_min_score,
                 'max_relationships_per_entity': config.graph_construction.max_relationships_per_entity,
-                'graph_pruning_threshold': config.graph_construction.graph_pruning_threshold
+                'graph_pruning_threshold': config.graph_construction.graph_pruning_threshold,
+                'bulk_write_batch_size': config.graph_construction.bulk_write_batch_size,
+                'entity_cache_size': config.graph_construction.entity_cache_size
             },
             'api': {
                 'retry_attempts': config.api.retry_attempts,
                 'timeout_seconds': config.api.timeout_seconds,
                 'batch_processing_size': config.api.batch_processing_size,
                 'openai_model': config.api.openai_model,
-                'gemini_model': config.api.gemini_model
+                'gemini_model': config.api.gemini_model,
+                'extraction_pack_token_budget': config.api.extraction_pack_token_budget,
+                'extraction_pack_max_chunks': config.api.extraction_pack_max_chunks,
+                'extraction_pack_output_tokens_per_chunk': config.api.extraction_pack_output_tokens_per_chunk,
+                'extraction_max_output_tokens': config.api.extraction_max_output_tokens
             },
             'neo4j': {
                 'uri': config.neo4j.uri,
@@ -298,6 +534,56 @@ class ConfigurationManager:
                 'connection_acquisition_timeout': config.neo4j.connection_acquisition_timeout,
                 'keep_alive': config.neo4j.keep_alive
             },
+            'llm_cache': {
+                'enabled': config.llm_cache.enabled,
+                'cache_path': config.llm_cache.cache_path,
+                'ttl_seconds': config.llm_cache.ttl_seconds,
+                'max_entries': config.llm_cache.max_entries
+            },
+            'graph_store': {
+                'backend': config.graph_store.backend,
+                'embedded_path': config.graph_store.embedded_path
+            },
+            'query_cache': {
+                'enabled': config.query_cache.enabled,
+                'ttl_seconds': config.query_cache.ttl_seconds,
+                'max_entries': config.query_cache.max_entries
+            },
+            'layout_cache': {
+                'enabled': config.layout_cache.enabled,
+                'cache_path': config.layout_cache.cache_path,
+                'max_entries': config.layout_cache.max_entries
+            },
+            'provenance': {
+                'persistence_enabled': config.provenance.persistence_enabled,
+                'log_path': config.provenance.log_path,
+                'hot_window_operations': config.provenance.hot_window_operations,
+                'flush_interval_seconds': config.provenance.flush_interval_seconds,
+                'flush_batch_size': config.provenance.flush_batch_size
+            },
+            'tracking': {
+                'level': config.tracking.level,
+                'sample_rate': config.tracking.sample_rate
+            },
+            'workflow': {
+                'checkpoint_cache_size': config.workflow.checkpoint_cache_size,
+                'flush_interval_seconds': config.workflow.flush_interval_seconds,
+                'flush_batch_size': config.workflow.flush_batch_size,
+                'extraction_workers': config.workflow.extraction_workers,
+                'extraction_batch_chunks': config.workflow.extraction_batch_chunks
+            },
+            'jobs': {
+                'max_workers': config.jobs.max_workers,
+                'max_queued_jobs': config.jobs.max_queued_jobs,
+                'default_timeout_seconds': config.jobs.default_timeout_seconds,
+                'finished_jobs_kept': config.jobs.finished_jobs_kept
+            },
+            'processing_queue': {
+                'db_path': config.processing_queue.db_path,
+                'max_workers': config.processing_queue.max_workers,
+                'max_queued_jobs': config.processing_queue.max_queued_jobs,
+                'finished_jobs_kept': config.processing_queue.finished_jobs_kept
+            },
             'environment': config.environment,
             'debug': config.debug,
             'log_level': config.log_level
@@ -319,6 +605,8 @@ class ConfigurationManager:
             errors.append("entity_processing.chunk_overlap_size must be >= 0")
         if ep.embedding_batch_size <= 0:
             errors.append("entity_processing.embedding_batch_size must be > 0")
+        if ep.embedding_cache_size <= 0:
+            errors.append("entity_processing.embedding_cache_size must be > 0")
         
         tp = self._config.text_processing
         if tp.chunk_size <= 0:
@@ -331,12 +619,82 @@ class ConfigurationManager:
             errors.append("graph_construction.pagerank_iterations must be > 0")
         if not (0.0 <= gc.pagerank_damping_factor <= 1.0):
             errors.append("graph_construction.pagerank_damping_factor must be between 0.0 and 1.0")
+        if gc.bulk_write_batch_size <= 0:
+            errors.append("graph_construction.bulk_write_batch_size must be > 0")
+        if gc.entity_cache_size <= 0:
+            errors.append("graph_construction.entity_cache_size must be > 0")
         
         api = self._config.api
         if api.retry_attempts < 0:
             errors.append("api.retry_attempts must be >= 0")
         if api.timeout_seconds <= 0:
             errors.append("api.timeout_seconds must be > 0")
+        if api.extraction_pack_max_chunks <= 0:
+            errors.append("api.extraction_pack_max_chunks must be > 0")
+        if not 0 < api.extraction_pack_output_tokens_per_chunk <= api.extraction_max_output_tokens:
+            errors.append("api.extraction_pack_output_tokens_per_chunk must be > 0 and <= api.extraction_max_output_tokens")
+        
+        cache = self._config.llm_cache
+        if cache.ttl_seconds < 0:
+            errors.append("llm_cache.ttl_seconds must be >= 0")
+        if cache.max_entries <= 0:
+            errors.append("llm_cache.max_entries must be > 0")
+        
+        if self._config.graph_store.backend not in ('neo4j', 'embedded'):
+            errors.append("graph_store.backend must be one of: neo4j, embedded")
+        
+        query_cache = self._config.query_cache
+        if query_cache.ttl_seconds < 0:
+            errors.append("query_cache.ttl_seconds must be >= 0")
+        if query_cache.max_entries <= 0:
+            errors.append("query_cache.max_entries must be > 0")
+        
+        if self._config.layout_cache.max_entries <= 0:
+            errors.append("layout_cache.max_entries must be > 0")
+        
+        prov = self._config.provenance
+        if prov.hot_window_operations <= 0:
+            errors.append("provenance.hot_window_operations must be > 0")
+        if prov.flush_interval_seconds <= 0:
+            errors.append("provenance.flush_interval_seconds must be > 0")
+        if prov.flush_batch_size <= 0:
+            errors.append("provenance.flush_batch_size must be > 0")
+        
+        tracking = self._config.tracking
+        if tracking.level not in ('full', 'batch', 'sampled', 'off'):
+            errors.append("tracking.level must be one of: full, batch, sampled, off")
+        if not (0.0 <= tracking.sample_rate <= 1.0):
+            errors.append("tracking.sample_rate must be between 0.0 and 1.0")
+        
+        workflow = self._config.workflow
+        if workflow.checkpoint_cache_size <= 0:
+            errors.append("workflow.checkpoint_cache_size must be > 0")
+        if workflow.flush_interval_seconds <= 0:
+            errors.append("workflow.flush_interval_seconds must be > 0")
+        if workflow.flush_batch_size <= 0:
+            errors.append("workflow.flush_batch_size must be > 0")
+        if workflow.extraction_workers < 0:
+            errors.append("workflow.extraction_workers must be >= 0")
+        if workflow.extraction_batch_chunks <= 0:
+            errors.append("workflow.extraction_batch_chunks must be > 0")
+        
+        jobs = self._config.jobs
+        if jobs.max_workers <= 0:
+            errors.append("jobs.max_workers must be > 0")
+        if jobs.max_queued_jobs < 0:
+            errors.append("jobs.max_queued_jobs must be >= 0")
+        if jobs.default_timeout_seconds <= 0:
+            errors.append("jobs.default_timeout_seconds must be > 0")
+        if jobs.finished_jobs_kept <= 0:
+            errors.append("jobs.finished_jobs_kept must be > 0")
+        
+        queue = self._config.processing_queue
+        if queue.max_workers <= 0:
+            errors.append("processing_queue.max_workers must be > 0")
+        if queue.max_queued_jobs < 0:
+            errors.append("processing_queue.max_queued_jobs must be >= 0")
+        if queue.finished_jobs_kept <= 0:
+            errors.append("processing_queue.finished_jobs_kept must be > 0")
         
         # Warnings for potentially problematic values
         if tp.chunk_size > 2048:
@@ -0,0 +1,260 @@
+"""Embedding Service - Shared batched embedding generation
+
+Provides a single embedding path for all tools:
+- Coalesces lookups into batched API calls (entity_processing.embedding_batch_size)
+- Persistent float32 store keyed by (model, text hash) in SQLite
+- Bounded in-memory LRU layer in front of the store
+
+Texts that cannot be embedded (no client, API failure) come back as None so
+callers can keep their existing fallbacks.
+"""
+
+from typing import Dict, List, Optional, Any
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+import numpy as np
+import logging
+
+from .config import get_config
+from .lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_SQL_BATCH = 500
+
+
+class EmbeddingService:
+    """Batched embedding generation with persistent and in-memory caching."""
+
+    def __init__(
+        self,
+        client: Any = None,
+        store_path: Optional[str] = None,
+        batch_size: int = None,
+        memory_cache_size: int = None
+    ):
+        """Initialize embedding service.
+
+        Args:
+            client: OpenAI-compatible client (created lazily from OPENAI_API_KEY if None)
+            store_path: Path to SQLite embedding store, "" disables persistence
+                (uses config default if None)
+            batch_size: Texts per embeddings API call (uses config default if None)
+            memory_cache_size: Embeddings kept in memory (uses config default if None)
+        """
+        config = get_config().entity_processing
+
+        self.store_path = config.embedding_store_path if store_path is None else store_path
+        self.batch_size = batch_size or config.embedding_batch_size
+        self.memory_cache_size = memory_cache_size or config.embedding_cache_size
+
+        self._client = client
+        self._client_failed = False
+        self._memory_cache = LRUCache(self.memory_cache_size)
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "memory_hits": 0,
+            "store_hits": 0,
+            "api_calls": 0,
+            "api_texts": 0,
+            "failures": 0
+        }
+
+        self._db_conn = None
+        if self.store_path:
+            self._init_store()
+
+    def _init_store(self):
+        """Initialize SQLite embedding store."""
+        try:
+            Path(self.store_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    dimensions INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+            """)
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize embedding store at {self.store_path}: {e}")
+            self._db_conn = None
+
+    def _get_client(self):
+        """Lazy load OpenAI client."""
+        if self._client is None and not self._client_failed:
+            try:
+                import openai
+                self._client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            except Exception as e:
+                logger.error(f"Failed to initialize OpenAI client: {e}")
+                self._client_failed = True
+        return self._client
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _load_from_store(self, model: str, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Fetch stored vectors for the given text hashes."""
+        found = {}
+        if not self._db_conn or not hashes:
+            return found
+
+        try:
+            for start in range(0, len(hashes), _SQL_BATCH):
+                chunk = hashes[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db_conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model] + chunk
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Failed to read embedding store: {e}")
+        return found
+
+    def _save_to_store(self, model: str, vectors: Dict[str, np.ndarray]):
+        """Persist newly generated vectors."""
+        if not self._db_conn or not vectors:
+            return
+
+        try:
+            self._db_conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dimensions, vector) VALUES (?, ?, ?, ?)",
+                [(model, text_hash, len(vec), vec.tobytes()) for text_hash, vec in vectors.items()]
+            )
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to write embedding store: {e}")
+
+    def _embed_via_api(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Embed texts with batched API calls."""
+        client = self._get_client()
+        if not client:
+            return [None] * len(texts)
+
+        results: List[Optional[np.ndarray]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            try:
+                response = client.embeddings.create(input=batch, model=model)
+                self.stats["api_calls"] += 1
+                self.stats["api_texts"] += len(batch)
+                # Responses carry an index; order them explicitly
+                batch_vectors = [None] * len(batch)
+                for position, item in enumerate(response.data):
+                    index = getattr(item, "index", position)
+                    batch_vectors[index] = np.asarray(item.embedding, dtype=np.float32)
+                results.extend(batch_vectors)
+            except Exception as e:
+                logger.error(f"Failed to get embeddings for batch of {len(batch)}: {e}")
+                self.stats["failures"] += len(batch)
+                results.extend([None] * len(batch))
+        return results
+
+    def get_embeddings_array(self, texts: List[str], model: str) -> List[Optional[np.ndarray]]:
+        """Get float32 embeddings for texts, preserving input order."""
+        with self._lock:
+            hashes = [self._text_hash(text) for text in texts]
+            vectors: Dict[str, np.ndarray] = {}
+
+            # 1. In-memory LRU
+            missing = []
+            for text_hash in dict.fromkeys(hashes):
+                cached = self._memory_cache.get((model, text_hash))
+                if cached is not None:
+                    vectors[text_hash] = cached
+                    self.stats["memory_hits"] += 1
+                else:
+                    missing.append(text_hash)
+
+            # 2. Persistent store
+            stored = self._load_from_store(model, missing)
+            for text_hash, vec in stored.items():
+                vectors[text_hash] = vec
+                self._memory_cache.put((model, text_hash), vec)
+            self.stats["store_hits"] += len(stored)
+
+            # 3. Batched API calls for the remainder (deduplicated)
+            to_embed = {}
+            for text, text_hash in zip(texts, hashes):
+                if text_hash not in vectors and text_hash not in to_embed:
+                    to_embed[text_hash] = text
+
+            if to_embed:
+                generated = {}
+                api_vectors = self._embed_via_api(model, list(to_embed.values()))
+                for text_hash, vec in zip(to_embed.keys(), api_vectors):
+                    if vec is not None:
+                        generated[text_hash] = vec
+                        vectors[text_hash] = vec
+                        self._memory_cache.put((model, text_hash), vec)
+                self._save_to_store(model, generated)
+
+            return [vectors.get(text_hash) for text_hash in hashes]
+
+    def get_embeddings(self, texts: List[str], model: str) -> List[Optional[List[float]]]:
+        """Get embeddings for texts as lists, preserving input order."""
+        return [
+            vec.tolist() if vec is not None else None
+            for vec in self.get_embeddings_array(texts, model)
+        ]
+
+    def get_embedding(self, text: str, model: str) -> Optional[List[float]]:
+        """Get embedding for a single text."""
+        return self.get_embeddings([text], model)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get embedding service statistics."""
+        stats = dict(self.stats)
+        stats["memory_cache_entries"] = len(self._memory_cache)
+        stats["memory_cache_size"] = self.memory_cache_size
+        stats["batch_size"] = self.batch_size
+        stats["persistence_enabled"] = self._db_conn is not None
+        if self._db_conn:
+            try:
+                with self._lock:
+                    stats["stored_embeddings"] = self._db_conn.execute(
+                        "SELECT COUNT(*) FROM embeddings"
+                    ).fetchone()[0]
+            except Exception:
+                stats["stored_embeddings"] = None
+        return stats
+
+    def close(self):
+        """Close the embedding store."""
+        if self._db_conn:
+            self._db_conn.close()
+            self._db_conn = None
+
+
+_global_service: Optional[EmbeddingService] = None
+_global_service_lock = threading.Lock()
+
+
+def get_embedding_service(client: Any = None) -> EmbeddingService:
+    """Get the shared embedding service instance.
+
+    Args:
+        client: Optional OpenAI client to use if the shared service has none yet
+    """
+    global _global_service
+    if _global_service is None:
+        with _global_service_lock:
+            if _global_service is None:
+                _global_service = EmbeddingService(client=client)
+    if client is not None and _global_service._client is None:
+        _global_service._client = client
+        _global_service._client_failed = False
+    return _global_service
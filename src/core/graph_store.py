@@ -0,0 +1,1283 @@
+"""Graph Store - Backend-neutral storage for the entity graph
+
+The Phase 1 graph tools (T31 entity builder, T34 edge builder, T49 multi-hop
+query, T68 PageRank) read and write the graph through GraphStore instead of
+issuing Cypher themselves. The interface covers what they need: bulk upsert
+of nodes and edges, attribute scans, path and neighbourhood expansion,
+whole-graph loads for analytics and score write-back.
+
+Two backends implement it:
+
+- Neo4jGraphStore wraps a neo4j.Driver and sends every bulk operation as
+  batched UNWIND statements, one round trip per batch rather than per row
+- EmbeddedGraphStore keeps node and edge properties in columns with
+  adjacency lists in process and persists them to SQLite (WAL mode). It
+  needs no database server, so single-machine runs and tests have no
+  network round trips at all
+
+The backend is selected by graph_store.backend in the configuration;
+ServiceManager.get_graph_store() returns the shared instance.
+
+The Phase 2/3 ontology graph builder and multi-document fusion write
+through it as well; their remaining read queries are still Cypher.
+
+Every write through a store bumps a process-wide graph version, which read
+caches such as the multi-hop query result cache include in their keys.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
+import functools
+import heapq
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+import logging
+
+if TYPE_CHECKING:
+    from neo4j import Driver
+
+logger = logging.getLogger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_graph_version = 0
+_graph_version_lock = threading.Lock()
+
+
+def graph_version() -> int:
+    """Current graph version; changes whenever the graph is written in this process."""
+    return _graph_version
+
+
+def bump_graph_version() -> int:
+    """Record a write to the graph, invalidating results cached under the old version."""
+    global _graph_version
+    with _graph_version_lock:
+        _graph_version += 1
+        return _graph_version
+
+
+def _writes_graph(method):
+    """Bump the graph version after a store write, including a partially failed one."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            bump_graph_version()
+    return wrapper
+
+
+def sanitize_label(label: str, prefix: str = "REL_", default: str = "RELATED_TO") -> str:
+    """Make a node label or relationship type safe to use as a graph label."""
+    sanitized = re.sub(r"[^A-Za-z0-9_]", "_", label or "")
+    if sanitized and not sanitized[0].isalpha():
+        sanitized = prefix + sanitized
+    return sanitized or default
+
+
+def _identifier(name: str) -> str:
+    """Validate a property name before it is interpolated into a query."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid property name: {name!r}")
+    return name
+
+
+def _require_keys(rows: Iterable[Dict[str, Any]], key: str, kind: str):
+    """Reject rows without a key value, which MERGE cannot match on."""
+    for row in rows:
+        if row.get(key) is None:
+            raise ValueError(f"{kind} without a '{key}' value cannot be upserted: {row!r}")
+
+
+def _require_hops(hops: int):
+    if hops < 1:
+        raise ValueError(f"hops must be at least 1, got {hops}")
+
+
+def graph_store_error(operation: str, error: Exception) -> Dict[str, Any]:
+    """Error result for a failed graph store operation."""
+    error_msg = str(error).lower()
+    if any(keyword in error_msg for keyword in ["connection", "network", "timeout", "unreachable", "refused"]):
+        message = f"Graph store connection error during {operation}: {error}. Check database connectivity."
+    elif any(keyword in error_msg for keyword in ["authentication", "auth", "credentials", "unauthorized"]):
+        message = f"Graph store authentication failed during {operation}: {error}. Verify username and password."
+    else:
+        message = f"Graph store operation {operation} failed: {error}"
+    return {
+        "status": "error",
+        "error": message,
+        "message": message,
+        "operation": operation
+    }
+
+
+class GraphStore(ABC):
+    """Storage interface for the entity graph.
+
+    Nodes are identified by a key property (entity_id by default) within a
+    label and carry a secondary label taken from their type property; edges
+    are identified by their own key property (relationship_id). Returned
+    node and edge records are property dicts plus the store-assigned
+    "node_id" / "edge_id"; edge records also carry "relationship_type",
+    "source_id" and "target_id" (the endpoint key values).
+    """
+
+    backend = "abstract"
+
+    @property
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether the store can serve requests."""
+
+    def check_available(self) -> Optional[Dict[str, Any]]:
+        """Return an error result if the store is unavailable, otherwise None."""
+        if self.available:
+            return None
+        message = f"Graph store ({self.backend}) is not available"
+        return {"status": "error", "error": message, "message": message}
+
+    # Writes
+
+    @abstractmethod
+    def upsert_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        label: str = "Entity",
+        key: str = "entity_id",
+        type_property: Optional[str] = "entity_type"
+    ) -> List[str]:
+        """Create or update nodes (matched on key), returning their node ids in input order."""
+
+    @abstractmethod
+    def upsert_edges(
+        self,
+        edges: List[Dict[str, Any]],
+        label: str = "Entity",
+        node_key: str = "entity_id",
+        key: str = "relationship_id"
+    ) -> List[Optional[str]]:
+        """Create or update directed edges (matched on key).
+
+        Each edge is {"source", "target", "relationship_type", "properties"},
+        where source and target are node key values. Returns edge ids in input
+        order, None where an endpoint does not exist.
+        """
+
+    @abstractmethod
+    def update_nodes(self, rows: List[Dict[str, Any]], label: str = "Entity", key: str = "entity_id") -> int:
+        """Set properties on existing nodes (e.g. score write-back); returns the number updated."""
+
+    # Reads
+
+    @abstractmethod
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node by node id."""
+
+    @abstractmethod
+    def get_edge(self, edge_id: str) -> Optional[Dict[str, Any]]:
+        """Get an edge by edge id."""
+
+    @abstractmethod
+    def get_nodes_by_key(
+        self,
+        keys: Iterable[Any],
+        label: str = "Entity",
+        key: str = "entity_id"
+    ) -> Dict[Any, Dict[str, Any]]:
+        """Get the existing nodes with the given key values, as {key value: node}."""
+
+    @abstractmethod
+    def get_edges_by_key(
+        self,
+        keys: Iterable[Any],
+        relationship_type: str,
+        key: str = "relationship_id",
+        node_key: str = "entity_id"
+    ) -> Dict[Any, Dict[str, Any]]:
+        """Get the existing edges of a type with the given key values, as {key value: edge}."""
+
+    @abstractmethod
+    def scan_nodes(
+        self,
+        label: str = "Entity",
+        equals: Optional[Dict[str, Any]] = None,
+        min_values: Optional[Dict[str, float]] = None,
+        exists: Sequence[str] = (),
+        contains: Optional[str] = None,
+        contains_fields: Sequence[str] = ("canonical_name",),
+        contains_list_fields: Sequence[str] = (),
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan nodes by attribute.
+
+        Args:
+            equals: Properties that must equal the given values
+            min_values: Properties that must be >= the given values
+            exists: Properties that must be set
+            contains: Case-insensitive substring matched against any of
+                contains_fields (strings) or contains_list_fields (lists of strings)
+            order_by: Property to sort by, descending (unset values sort as 0)
+            limit: Maximum nodes returned
+        """
+
+    @abstractmethod
+    def scan_edges(
+        self,
+        relationship_type: Optional[str] = None,
+        min_values: Optional[Dict[str, float]] = None,
+        max_values: Optional[Dict[str, float]] = None,
+        label: str = "Entity",
+        node_key: str = "entity_id",
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan edges by type and numeric property bounds."""
+
+    @abstractmethod
+    def find_paths(
+        self,
+        start: Any,
+        hops: int,
+        limit: int,
+        label: str = "Entity",
+        node_key: str = "entity_id"
+    ) -> List[Dict[str, Any]]:
+        """Find outgoing paths of exactly `hops` (at least 1) edges from the node with key `start`.
+
+        Paths visit distinct nodes and are ordered by the product of edge
+        weights (unset weights count as 0.5), then by the end node's
+        pagerank_score. Each path is {"nodes": [...], "edges": [...]}.
+        """
+
+    @abstractmethod
+    def neighbourhood(
+        self,
+        keys: Iterable[Any],
+        hops: int = 1,
+        label: str = "Entity",
+        node_key: str = "entity_id",
+        limit: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Expand the nodes with the given keys by `hops` edges in either direction.
+
+        Returns {"nodes": [...], "edges": [...]}; limit caps the number of edges.
+        """
+
+    @abstractmethod
+    def load_graph(
+        self,
+        label: str = "Entity",
+        node_key: str = "entity_id",
+        equals: Optional[Dict[str, Any]] = None,
+        min_values: Optional[Dict[str, float]] = None,
+        node_properties: Optional[Sequence[str]] = None,
+        edge_properties: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Load every edge whose endpoints both pass the node filters, with those endpoints.
+
+        Returns {"nodes": [...], "edges": [...]}. node_properties and
+        edge_properties restrict the properties returned (default: all).
+        """
+
+    @abstractmethod
+    def get_statistics(self, label: str = "Entity", type_property: str = "entity_type") -> Dict[str, Any]:
+        """Node and edge counts, nodes per type and edges per relationship type with average weight."""
+
+    @abstractmethod
+    def clear(self, label: str = "Entity"):
+        """Delete all nodes with the label and their edges."""
+
+    def close(self):
+        """Release resources held by the store."""
+
+
+class Neo4jGraphStore(GraphStore):
+    """GraphStore backed by a Neo4j database."""
+
+    backend = "neo4j"
+
+    def __init__(self, driver: Optional["Driver"], batch_size: int = 1000, owns_driver: bool = False):
+        """
+        Args:
+            driver: Connected driver, or None if Neo4j is unavailable
+            batch_size: Rows sent per UNWIND statement
+            owns_driver: Close the driver when the store is closed
+        """
+        self.driver = driver
+        self.batch_size = batch_size
+        self._owns_driver = owns_driver
+
+    @property
+    def available(self) -> bool:
+        return self.driver is not None
+
+    def _batches(self, rows: List[Any]):
+        for start in range(0, len(rows), self.batch_size):
+            yield rows[start:start + self.batch_size]
+
+    @_writes_graph
+    def upsert_nodes(self, nodes, label="Entity", key="entity_id", type_property="entity_type"):
+        label = sanitize_label(label)
+        key = _identifier(key)
+        _require_keys(nodes, key, "Node")
+        node_ids: List[Optional[str]] = [None] * len(nodes)
+
+        # Labels cannot be parameterised: one statement per secondary label
+        groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for index, properties in enumerate(nodes):
+            type_label = properties.get(type_property) if type_property else None
+            type_label = sanitize_label(type_label, prefix="T_") if type_label else None
+            groups.setdefault(type_label, []).append({"i": index, "props": properties})
+
+        with self.driver.session() as session:
+            for type_label, rows in groups.items():
+                set_label = f", n:{type_label}" if type_label and type_label != label else ""
+                cypher = f"""
+                UNWIND $rows AS row
+                MERGE (n:{label} {{{key}: row.props.{key}}})
+                SET n += row.props{set_label}
+                RETURN row.i AS i, elementId(n) AS node_id
+                """
+                for batch in self._batches(rows):
+                    for record in session.run(cypher, rows=batch):
+                        node_ids[record["i"]] = record["node_id"]
+        return node_ids
+
+    @_writes_graph
+    def upsert_edges(self, edges, label="Entity", node_key="entity_id", key="relationship_id"):
+        label = sanitize_label(label)
+        node_key = _identifier(node_key)
+        key = _identifier(key)
+        _require_keys((edge.get("properties", {}) for edge in edges), key, "Edge")
+        edge_ids: List[Optional[str]] = [None] * len(edges)
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for index, edge in enumerate(edges):
+            rel_type = sanitize_label(edge.get("relationship_type"))
+            groups.setdefault(rel_type, []).append({
+                "i": index,
+                "source": edge["source"],
+                "target": edge["target"],
+                "props": edge.get("properties", {})
+            })
+
+        with self.driver.session() as session:
+            for rel_type, rows in groups.items():
+                cypher = f"""
+                UNWIND $rows AS row
+                MATCH (a:{label} {{{node_key}: row.source}})
+                MATCH (b:{label} {{{node_key}: row.target}})
+                MERGE (a)-[r:{rel_type} {{{key}: row.props.{key}}}]->(b)
+                SET r += row.props
+                RETURN row.i AS i, elementId(r) AS edge_id
+                """
+                for batch in self._batches(rows):
+                    for record in session.run(cypher, rows=batch):
+                        edge_ids[record["i"]] = record["edge_id"]
+        return edge_ids
+
+    @_writes_graph
+    def update_nodes(self, rows, label="Entity", key="entity_id"):
+        label = sanitize_label(label)
+        key = _identifier(key)
+        updates = [
+            {"key": row[key], "props": {k: v for k, v in row.items() if k != key}}
+            for row in rows
+        ]
+        cypher = f"""
+        UNWIND $updates AS update
+        MATCH (n:{label} {{{key}: update.key}})
+        SET n += update.props
+        RETURN count(n) AS updated_count
+        """
+        updated = 0
+        with self.driver.session() as session:
+            for batch in self._batches(updates):
+                record = session.run(cypher, updates=batch).single()
+                updated += record["updated_count"] if record else 0
+        return updated
+
+    def get_node(self, node_id):
+        with self.driver.session() as session:
+            record = session.run(
+                "MATCH (n) WHERE elementId(n) = $id RETURN n", id=node_id
+            ).single()
+            if record:
+                node = dict(record["n"])
+                node["node_id"] = node_id
+                return node
+        return None
+
+    def get_edge(self, edge_id):
+        with self.driver.session() as session:
+            record = session.run(
+                """
+                MATCH (a)-[r]->(b)
+                WHERE elementId(r) = $id
+                RETURN r, type(r) AS rel_type, a, b
+                """,
+                id=edge_id
+            ).single()
+            if record:
+                return self._edge_record(edge_id, record["r"], record["rel_type"], record["a"], record["b"])
+        return None
+
+    def get_nodes_by_key(self, keys, label="Entity", key="entity_id"):
+        label = sanitize_label(label)
+        key = _identifier(key)
+        cypher = f"""
+        UNWIND $keys AS k
+        MATCH (n:{label} {{{key}: k}})
+        RETURN k, elementId(n) AS node_id, n
+        """
+        nodes = {}
+        with self.driver.session() as session:
+            for batch in self._batches(list(keys)):
+                for record in session.run(cypher, keys=batch):
+                    node = dict(record["n"])
+                    node["node_id"] = record["node_id"]
+                    nodes[record["k"]] = node
+        return nodes
+
+    def get_edges_by_key(self, keys, relationship_type, key="relationship_id", node_key="entity_id"):
+        rel_type = sanitize_label(relationship_type)
+        key = _identifier(key)
+        cypher = f"""
+        UNWIND $keys AS k
+        MATCH (a)-[r:{rel_type} {{{key}: k}}]->(b)
+        RETURN k, elementId(r) AS edge_id, r, a, b
+        """
+        edges = {}
+        with self.driver.session() as session:
+            for batch in self._batches(list(keys)):
+                for record in session.run(cypher, keys=batch):
+                    edges[record["k"]] = self._edge_record(
+                        record["edge_id"], record["r"], rel_type, record["a"], record["b"], node_key
+                    )
+        return edges
+
+    def _edge_record(self, edge_id, rel, rel_type, source, target, node_key="entity_id") -> Dict[str, Any]:
+        edge = dict(rel)
+        edge.update({
+            "edge_id": edge_id,
+            "relationship_type": rel_type,
+            "source_id": source.get(node_key),
+            "target_id": target.get(node_key)
+        })
+        return edge
+
+    def _node_conditions(self, var: str, params: Dict[str, Any], equals=None, min_values=None, exists=()) -> List[str]:
+        conditions = []
+        for i, (prop, value) in enumerate((equals or {}).items()):
+            conditions.append(f"{var}.{_identifier(prop)} = ${var}_eq{i}")
+            params[f"{var}_eq{i}"] = value
+        for i, (prop, value) in enumerate((min_values or {}).items()):
+            conditions.append(f"{var}.{_identifier(prop)} >= ${var}_min{i}")
+            params[f"{var}_min{i}"] = value
+        for prop in exists:
+            conditions.append(f"{var}.{_identifier(prop)} IS NOT NULL")
+        return conditions
+
+    def scan_nodes(self, label="Entity", equals=None, min_values=None, exists=(), contains=None,
+                   contains_fields=("canonical_name",), contains_list_fields=(), order_by=None, limit=None):
+        label = sanitize_label(label)
+        params: Dict[str, Any] = {}
+        conditions = self._node_conditions("n", params, equals, min_values, exists)
+        if contains:
+            matches = [f"toLower(n.{_identifier(f)}) CONTAINS $term" for f in contains_fields]
+            matches += [
+                f"ANY(item IN coalesce(n.{_identifier(f)}, []) WHERE toLower(item) CONTAINS $term)"
+                for f in contains_list_fields
+            ]
+            conditions.append("(" + " OR ".join(matches) + ")")
+            params["term"] = contains.lower()
+
+        cypher = f"MATCH (n:{label})"
+        if conditions:
+            cypher += " WHERE " + " AND ".join(conditions)
+        cypher += " RETURN elementId(n) AS node_id, n"
+        if order_by:
+            cypher += f" ORDER BY coalesce(n.{_identifier(order_by)}, 0) DESC"
+        if limit is not None:
+            cypher += " LIMIT $limit"
+            params["limit"] = limit
+
+        nodes = []
+        with self.driver.session() as session:
+            for record in session.run(cypher, **params):
+                node = dict(record["n"])
+                node["node_id"] = record["node_id"]
+                nodes.append(node)
+        return nodes
+
+    def scan_edges(self, relationship_type=None, min_values=None, max_values=None,
+                   label="Entity", node_key="entity_id", limit=None):
+        label = sanitize_label(label)
+        params: Dict[str, Any] = {}
+        conditions = []
+        if relationship_type:
+            conditions.append("type(r) = $rel_type")
+            params["rel_type"] = relationship_type
+        for i, (prop, value) in enumerate((min_values or {}).items()):
+            conditions.append(f"r.{_identifier(prop)} >= $min{i}")
+            params[f"min{i}"] = value
+        for i, (prop, value) in enumerate((max_values or {}).items()):
+            conditions.append(f"r.{_identifier(prop)} <= $max{i}")
+            params[f"max{i}"] = value
+
+        cypher = f"MATCH (a:{label})-[r]->(b:{label})"
+        if conditions:
+            cypher += " WHERE " + " AND ".join(conditions)
+        cypher += " RETURN elementId(r) AS edge_id, r, type(r) AS rel_type, a, b"
+        if limit is not None:
+            cypher += " LIMIT $limit"
+            params["limit"] = limit
+
+        with self.driver.session() as session:
+            return [
+                self._edge_record(record["edge_id"], record["r"], record["rel_type"],
+                                  record["a"], record["b"], node_key)
+                for record in session.run(cypher, **params)
+            ]
+
+    def find_paths(self, start, hops, limit, label="Entity", node_key="entity_id"):
+        _require_hops(hops)
+        label = sanitize_label(label)
+        node_key = _identifier(node_key)
+        pattern = f"(n0:{label} {{{node_key}: $start}})"
+        for hop in range(1, hops + 1):
+            pattern += f"-[r{hop}]->(n{hop}:{label})"
+        distinct = [f"n{i} <> n{j}" for i in range(hops + 1) for j in range(i + 1, hops + 1)]
+        weight = " * ".join(f"coalesce(r{hop}.weight, 0.5)" for hop in range(1, hops + 1))
+        node_list = ", ".join(f"n{i}" for i in range(hops + 1))
+        rel_list = ", ".join(f"r{hop}" for hop in range(1, hops + 1))
+
+        cypher = f"""
+        MATCH {pattern}
+        {"WHERE " + " AND ".join(distinct) if distinct else ""}
+        RETURN [{node_list}] AS nodes, [{rel_list}] AS rels
+        ORDER BY ({weight}) DESC, coalesce(n{hops}.pagerank_score, 0) DESC
+        LIMIT $limit
+        """
+
+        paths = []
+        with self.driver.session() as session:
+            for record in session.run(cypher, start=start, limit=limit):
+                nodes = [dict(node) for node in record["nodes"]]
+                edges = []
+                for hop, rel in enumerate(record["rels"]):
+                    edge = dict(rel)
+                    edge.update({
+                        "edge_id": rel.element_id,
+                        "relationship_type": rel.type,
+                        "source_id": nodes[hop].get(node_key),
+                        "target_id": nodes[hop + 1].get(node_key)
+                    })
+                    edges.append(edge)
+                paths.append({"nodes": nodes, "edges": edges})
+        return paths
+
+    def neighbourhood(self, keys, hops=1, label="Entity", node_key="entity_id", limit=None):
+        label = sanitize_label(label)
+        node_key = _identifier(node_key)
+        params: Dict[str, Any] = {"keys": list(keys)}
+        cypher = f"""
+        MATCH (s:{label}) WHERE s.{node_key} IN $keys
+        MATCH p = (s)-[*1..{int(hops)}]-(:{label})
+        UNWIND relationships(p) AS r
+        WITH DISTINCT r
+        """
+        if limit is not None:
+            cypher += " LIMIT $limit"
+            params["limit"] = limit
+        cypher += " RETURN elementId(r) AS edge_id, r, type(r) AS rel_type, startNode(r) AS a, endNode(r) AS b"
+
+        nodes: Dict[str, Dict[str, Any]] = {}
+        edges = []
+        with self.driver.session() as session:
+            for record in session.run(cypher, **params):
+                edges.append(self._edge_record(record["edge_id"], record["r"], record["rel_type"],
+                                               record["a"], record["b"], node_key))
+                for node in (record["a"], record["b"]):
+                    if node.element_id not in nodes:
+                        nodes[node.element_id] = dict(node, node_id=node.element_id)
+            # Start nodes without edges are still part of the neighbourhood
+            for record in session.run(
+                f"MATCH (s:{label}) WHERE s.{node_key} IN $keys RETURN elementId(s) AS node_id, s",
+                keys=params["keys"]
+            ):
+                if record["node_id"] not in nodes:
+                    nodes[record["node_id"]] = dict(record["s"], node_id=record["node_id"])
+        return {"nodes": list(nodes.values()), "edges": edges}
+
+    @staticmethod
+    def _projection(var: str, properties: Optional[Sequence[str]]) -> str:
+        if properties is None:
+            return f"{var} {{.*}}"
+        return f"{var} {{" + ", ".join(f".{_identifier(p)}" for p in properties) + "}"
+
+    def load_graph(self, label="Entity", node_key="entity_id", equals=None, min_values=None,
+                   node_properties=None, edge_properties=None):
+        label = sanitize_label(label)
+        node_key = _identifier(node_key)
+        params: Dict[str, Any] = {}
+        conditions = [f"a.{node_key} IS NOT NULL", f"b.{node_key} IS NOT NULL"]
+        conditions += self._node_conditions("a", params, equals, min_values)
+        conditions += self._node_conditions("b", params, equals, min_values)
+
+        edges = []
+        node_keys = set()
+        with self.driver.session() as session:
+            result = session.run(f"""
+            MATCH (a:{label})-[r]->(b:{label})
+            WHERE {" AND ".join(conditions)}
+            RETURN a.{node_key} AS source, b.{node_key} AS target, type(r) AS rel_type,
+                   {self._projection("r", edge_properties)} AS props
+            """, **params)
+            for record in result:
+                edge = dict(record["props"])
+                edge.update({
+                    "source_id": record["source"],
+                    "target_id": record["target"],
+                    "relationship_type": record["rel_type"]
+                })
+                edges.append(edge)
+                node_keys.add(record["source"])
+                node_keys.add(record["target"])
+
+            nodes = []
+            keys = list(node_keys)
+            for start in range(0, len(keys), self.batch_size):
+                result = session.run(f"""
+                MATCH (n:{label}) WHERE n.{node_key} IN $keys
+                RETURN {self._projection("n", node_properties)} AS props, n.{node_key} AS key
+                """, keys=keys[start:start + self.batch_size])
+                for record in result:
+                    node = dict(record["props"])
+                    node[node_key] = record["key"]
+                    nodes.append(node)
+        return {"nodes": nodes, "edges": edges}
+
+    def get_statistics(self, label="Entity", type_property="entity_type"):
+        label = sanitize_label(label)
+        type_property = _identifier(type_property)
+        with self.driver.session() as session:
+            node_count = session.run(f"MATCH (n:{label}) RETURN count(n) AS count").single()["count"]
+            edge_count = session.run("MATCH ()-[r]->() RETURN count(r) AS count").single()["count"]
+            node_types = session.run(f"""
+            MATCH (n:{label})
+            RETURN n.{type_property} AS type, count(n) AS count
+            ORDER BY count DESC
+            """).data()
+            rel_types = session.run("""
+            MATCH ()-[r]->()
+            RETURN type(r) AS type, count(r) AS count, avg(r.weight) AS avg_weight
+            ORDER BY count DESC
+            """).data()
+        return {
+            "node_count": node_count,
+            "edge_count": edge_count,
+            "node_types": {r["type"] or "UNKNOWN": r["count"] for r in node_types},
+            "relationship_types": {
+                r["type"]: {"count": r["count"], "average_weight": r["avg_weight"] or 0}
+                for r in rel_types
+            }
+        }
+
+    @_writes_graph
+    def clear(self, label="Entity"):
+        with self.driver.session() as session:
+            session.run(f"MATCH (n:{sanitize_label(label)}) DETACH DELETE n")
+
+    def close(self):
+        if self._owns_driver and self.driver:
+            self.driver.close()
+            self.driver = None
+
+
+class EmbeddedGraphStore(GraphStore):
+    """In-process GraphStore with columnar properties and SQLite persistence.
+
+    Node and edge properties are held column-wise (one list per property,
+    aligned by row), so attribute scans walk a single column instead of
+    every record. Edge endpoints are kept in integer arrays with per-node
+    outgoing/incoming adjacency lists for path expansion. Each write call is
+    applied in memory and then to SQLite in one transaction; the file is
+    read back into columns when the store is opened. Rows are persisted
+    under their node/edge keys (never their in-memory positions), so stores
+    in several processes can share one file; writes to the same key merge
+    properties like MERGE ... SET +=.
+    """
+
+    backend = "embedded"
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file to persist to; None keeps the graph in memory only
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._db_conn = None
+        self._reset()
+
+        if path:
+            self._init_database()
+            self._load()
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def _reset(self):
+        """Empty the in-memory columns."""
+        # Node columns, aligned by row
+        self._node_labels: List[tuple] = []
+        self._node_columns: Dict[str, List[Any]] = {}
+        self._out: List[List[int]] = []
+        self._in: List[List[int]] = []
+
+        # Edge columns, aligned by row
+        self._edge_source = array("q")
+        self._edge_target = array("q")
+        self._edge_type: List[str] = []
+        self._edge_columns: Dict[str, List[Any]] = {}
+
+        # Key property per node label / relationship type, and the key indexes
+        self._node_key_names: Dict[str, str] = {}
+        self._edge_key_names: Dict[str, str] = {}
+        self._node_rows: Dict[tuple, int] = {}  # (label, key value) -> row
+        self._edge_rows: Dict[tuple, int] = {}  # (type, key value) -> row
+
+    def _init_database(self):
+        """Initialize SQLite persistence."""
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS nodes (
+                    label TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    labels TEXT NOT NULL,
+                    properties TEXT NOT NULL,
+                    PRIMARY KEY (label, key)
+                )
+            """)
+            # Endpoints are referenced by node (label, key); like MERGE on
+            # (source)-[type {key}]->(target), the endpoints are part of the key
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS edges (
+                    type TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    source_label TEXT NOT NULL,
+                    source_key TEXT NOT NULL,
+                    target_label TEXT NOT NULL,
+                    target_key TEXT NOT NULL,
+                    properties TEXT NOT NULL,
+                    PRIMARY KEY (type, key, source_label, source_key, target_label, target_key)
+                )
+            """)
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS key_names (
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    key_name TEXT NOT NULL,
+                    PRIMARY KEY (kind, name)
+                )
+            """)
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize graph store at {self.path}: {e}")
+            self._db_conn = None
+
+    def _load(self):
+        """Read persisted nodes and edges back into columns."""
+        if not self._db_conn:
+            return
+        for kind, name, key_name in self._db_conn.execute("SELECT kind, name, key_name FROM key_names"):
+            (self._node_key_names if kind == "node" else self._edge_key_names)[name] = key_name
+        for labels, properties in self._db_conn.execute("SELECT labels, properties FROM nodes ORDER BY rowid"):
+            properties = json.loads(properties)
+            row = self._append_node(tuple(json.loads(labels)))
+            self._set_node_properties(row, properties)
+            for label in self._node_labels[row]:
+                key_name = self._node_key_names.get(label)
+                if key_name:
+                    self._node_rows[(label, properties.get(key_name))] = row
+        for rel_type, source_label, source_key, target_label, target_key, properties in self._db_conn.execute(
+            "SELECT type, source_label, source_key, target_label, target_key, properties FROM edges ORDER BY rowid"
+        ):
+            source = self._node_rows.get((source_label, json.loads(source_key)))
+            target = self._node_rows.get((target_label, json.loads(target_key)))
+            if source is None or target is None:
+                continue
+            properties = json.loads(properties)
+            row = self._append_edge(source, target, rel_type)
+            self._set_edge_properties(row, properties)
+            key_name = self._edge_key_names.get(rel_type)
+            if key_name:
+                self._edge_rows[(rel_type, properties.get(key_name))] = row
+
+    def _persist_key_name(self, kind: str, name: str, key_name: str):
+        names = self._node_key_names if kind == "node" else self._edge_key_names
+        if names.get(name) != key_name:
+            names[name] = key_name
+            if self._db_conn:
+                self._db_conn.execute(
+                    "INSERT OR REPLACE INTO key_names (kind, name, key_name) VALUES (?, ?, ?)",
+                    (kind, name, key_name)
+                )
+
+    # Columnar helpers
+
+    def _append_node(self, labels: tuple) -> int:
+        row = len(self._node_labels)
+        self._node_labels.append(labels)
+        for column in self._node_columns.values():
+            column.append(None)
+        self._out.append([])
+        self._in.append([])
+        return row
+
+    def _set_node_properties(self, row: int, properties: Dict[str, Any]):
+        for prop, value in properties.items():
+            column = self._node_columns.get(prop)
+            if column is None:
+                column = self._node_columns[prop] = [None] * len(self._node_labels)
+            column[row] = value
+
+    def _append_edge(self, source: int, target: int, rel_type: str) -> int:
+        row = len(self._edge_type)
+        self._edge_source.append(source)
+        self._edge_target.append(target)
+        self._edge_type.append(rel_type)
+        for column in self._edge_columns.values():
+            column.append(None)
+        self._out[source].append(row)
+        self._in[target].append(row)
+        return row
+
+    def _set_edge_properties(self, row: int, properties: Dict[str, Any]):
+        for prop, value in properties.items():
+            column = self._edge_columns.get(prop)
+            if column is None:
+                column = self._edge_columns[prop] = [None] * len(self._edge_type)
+            column[row] = value
+
+    @staticmethod
+    def _row_values(columns: Dict[str, List[Any]], row: int, properties: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        names = columns.keys() if properties is None else [p for p in properties if p in columns]
+        return {name: columns[name][row] for name in names if columns[name][row] is not None}
+
+    def _node(self, row: int, properties: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        node = self._row_values(self._node_columns, row, properties)
+        node["node_id"] = f"n{row}"
+        return node
+
+    def _edge(self, row: int, node_key: str = "entity_id", properties: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        edge = self._row_values(self._edge_columns, row, properties)
+        key_column = self._node_columns.get(node_key)
+        edge.update({
+            "edge_id": f"r{row}",
+            "relationship_type": self._edge_type[row],
+            "source_id": key_column[self._edge_source[row]] if key_column else None,
+            "target_id": key_column[self._edge_target[row]] if key_column else None
+        })
+        return edge
+
+    @staticmethod
+    def _parse_id(item_id: Any, prefix: str) -> Optional[int]:
+        if isinstance(item_id, str) and item_id.startswith(prefix) and item_id[1:].isdigit():
+            return int(item_id[1:])
+        return None
+
+    def _node_key(self, row: int) -> tuple:
+        """Persisted (label, key) of a node: its first label, which it was upserted under."""
+        label = self._node_labels[row][0]
+        return label, json.dumps(self._node_columns[self._node_key_names[label]][row])
+
+    def _write_nodes(self, rows: Iterable[int]):
+        self._db_conn.executemany("""
+            INSERT INTO nodes (label, key, labels, properties) VALUES (?, ?, ?, ?)
+            ON CONFLICT (label, key) DO UPDATE SET
+                labels = excluded.labels,
+                properties = json_patch(nodes.properties, excluded.properties)
+        """, [
+            (*self._node_key(row), json.dumps(self._node_labels[row]),
+             json.dumps(self._row_values(self._node_columns, row)))
+            for row in rows
+        ])
+
+    def _write_edges(self, rows: Iterable[int]):
+        rows_to_write = []
+        for row in rows:
+            rel_type = self._edge_type[row]
+            key = self._edge_columns[self._edge_key_names[rel_type]][row]
+            rows_to_write.append((
+                rel_type, json.dumps(key), *self._node_key(self._edge_source[row]),
+                *self._node_key(self._edge_target[row]), json.dumps(self._row_values(self._edge_columns, row))
+            ))
+        self._db_conn.executemany("""
+            INSERT INTO edges (type, key, source_label, source_key, target_label, target_key, properties)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (type, key, source_label, source_key, target_label, target_key) DO UPDATE SET
+                properties = json_patch(edges.properties, excluded.properties)
+        """, rows_to_write)
+
+    # Writes
+
+    @_writes_graph
+    def upsert_nodes(self, nodes, label="Entity", key="entity_id", type_property="entity_type"):
+        label = sanitize_label(label)
+        _require_keys(nodes, key, "Node")
+        node_ids = []
+        with self._lock:
+            self._persist_key_name("node", label, key)
+            for properties in nodes:
+                row = self._node_rows.get((label, properties.get(key)))
+                if row is None:
+                    labels = [label]
+                    type_label = properties.get(type_property) if type_property else None
+                    if type_label:
+                        type_label = sanitize_label(type_label, prefix="T_")
+                        if type_label != label:
+                            labels.append(type_label)
+                    row = self._append_node(tuple(labels))
+                    self._node_rows[(label, properties.get(key))] = row
+                self._set_node_properties(row, properties)
+                node_ids.append(f"n{row}")
+
+            if self._db_conn:
+                self._write_nodes(sorted({int(node_id[1:]) for node_id in node_ids}))
+                self._db_conn.commit()
+        return node_ids
+
+    @_writes_graph
+    def upsert_edges(self, edges, label="Entity", node_key="entity_id", key="relationship_id"):
+        label = sanitize_label(label)
+        _require_keys((edge.get("properties", {}) for edge in edges), key, "Edge")
+        edge_ids: List[Optional[str]] = []
+        changed = set()
+        with self._lock:
+            for edge in edges:
+                source = self._node_rows.get((label, edge["source"]))
+                target = self._node_rows.get((label, edge["target"]))
+                if source is None or target is None:
+                    edge_ids.append(None)
+                    continue
+                rel_type = sanitize_label(edge.get("relationship_type"))
+                self._persist_key_name("edge", rel_type, key)
+                properties = edge.get("properties", {})
+                row = self._edge_rows.get((rel_type, properties.get(key)))
+                # Like MERGE on (source)-[type {key}]->(target): a different pair is a new edge
+                if row is None or self._edge_source[row] != source or self._edge_target[row] != target:
+                    row = self._append_edge(source, target, rel_type)
+                    self._edge_rows[(rel_type, properties.get(key))] = row
+                self._set_edge_properties(row, properties)
+                changed.add(row)
+                edge_ids.append(f"r{row}")
+
+            if self._db_conn:
+                self._write_edges(sorted(changed))
+                self._db_conn.commit()
+        return edge_ids
+
+    @_writes_graph
+    def update_nodes(self, rows, label="Entity", key="entity_id"):
+        label = sanitize_label(label)
+        changed = []
+        with self._lock:
+            for update in rows:
+                row = self._node_rows.get((label, update.get(key)))
+                if row is None:
+                    continue
+                self._set_node_properties(row, {k: v for k, v in update.items() if k != key})
+                changed.append(row)
+
+            if self._db_conn and changed:
+                self._write_nodes(changed)
+                self._db_conn.commit()
+        return len(changed)
+
+    # Reads
+
+    def get_node(self, node_id):
+        row = self._parse_id(node_id, "n")
+        with self._lock:
+            if row is None or row >= len(self._node_labels):
+                return None
+            return self._node(row)
+
+    def get_edge(self, edge_id):
+        row = self._parse_id(edge_id, "r")
+        with self._lock:
+            if row is None or row >= len(self._edge_type):
+                return None
+            return self._edge(row)
+
+    def get_nodes_by_key(self, keys, label="Entity", key="entity_id"):
+        label = sanitize_label(label)
+        keys = set(keys)
+        with self._lock:
+            # Nodes are indexed by the key they were upserted with; other keys need a column scan
+            if self._node_key_names.get(label) == key:
+                rows = {k: self._node_rows.get((label, k)) for k in keys}
+            else:
+                column = self._node_columns.get(key, [])
+                rows = {column[row]: row for row in self._filter_nodes(label) if column[row] in keys}
+            return {k: self._node(row) for k, row in rows.items() if row is not None}
+
+    def get_edges_by_key(self, keys, relationship_type, key="relationship_id", node_key="entity_id"):
+        rel_type = sanitize_label(relationship_type)
+        keys = set(keys)
+        with self._lock:
+            if self._edge_key_names.get(rel_type) == key:
+                rows = {k: self._edge_rows.get((rel_type, k)) for k in keys}
+            else:
+                column = self._edge_columns.get(key, [])
+                rows = {
+                    column[row]: row for row, edge_type in enumerate(self._edge_type)
+                    if edge_type == rel_type and column[row] in keys
+                }
+            return {k: self._edge(row, node_key) for k, row in rows.items() if row is not None}
+
+    def _filter_nodes(self, label: str, equals=None, min_values=None, exists=()) -> List[int]:
+        """Rows with the label that pass the filters, evaluated one column at a time."""
+        rows = [row for row, labels in enumerate(self._node_labels) if label in labels]
+        for prop, value in (equals or {}).items():
+            column = self._node_columns.get(prop)
+            rows = [row for row in rows if column[row] == value] if column else []
+        for prop, value in (min_values or {}).items():
+            column = self._node_columns.get(prop)
+            rows = [row for row in rows if column[row] is not None and column[row] >= value] if column else []
+        for prop in exists:
+            column = self._node_columns.get(prop)
+            rows = [row for row in rows if column[row] is not None] if column else []
+        return rows
+
+    def scan_nodes(self, label="Entity", equals=None, min_values=None, exists=(), contains=None,
+                   contains_fields=("canonical_name",), contains_list_fields=(), order_by=None, limit=None):
+        label = sanitize_label(label)
+        with self._lock:
+            rows = self._filter_nodes(label, equals, min_values, exists)
+            if contains:
+                term = contains.lower()
+                text_columns = [self._node_columns[f] for f in contains_fields if f in self._node_columns]
+                list_columns = [self._node_columns[f] for f in contains_list_fields if f in self._node_columns]
+                rows = [
+                    row for row in rows
+                    if any(isinstance(c[row], str) and term in c[row].lower() for c in text_columns)
+                    or any(c[row] and any(term in str(item).lower() for item in c[row]) for c in list_columns)
+                ]
+            if order_by:
+                column = self._node_columns.get(order_by)
+                if column:
+                    rows.sort(key=lambda row: column[row] or 0, reverse=True)
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._node(row) for row in rows]
+
+    def scan_edges(self, relationship_type=None, min_values=None, max_values=None,
+                   label="Entity", node_key="entity_id", limit=None):
+        label = sanitize_label(label)
+        with self._lock:
+            rows = [
+                row for row in range(len(self._edge_type))
+                if label in self._node_labels[self._edge_source[row]]
+                and label in self._node_labels[self._edge_target[row]]
+            ]
+            if relationship_type:
+                rows = [row for row in rows if self._edge_type[row] == relationship_type]
+            for prop, value in (min_values or {}).items():
+                column = self._edge_columns.get(prop)
+                rows = [row for row in rows if column[row] is not None and column[row] >= value] if column else []
+            for prop, value in (max_values or {}).items():
+                column = self._edge_columns.get(prop)
+                rows = [row for row in rows if column[row] is not None and column[row] <= value] if column else []
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._edge(row, node_key) for row in rows]
+
+    def find_paths(self, start, hops, limit, label="Entity", node_key="entity_id"):
+        _require_hops(hops)
+        label = sanitize_label(label)
+        with self._lock:
+            start_row = self._node_rows.get((label, start))
+            if start_row is None or limit <= 0:
+                return []
+            weights = self._edge_columns.get("weight")
+            pageranks = self._node_columns.get("pagerank_score")
+            targets = self._edge_target
+            candidates = []  # (weight product, end pagerank, node rows, edge rows)
+
+            def expand(node_rows: List[int], edge_rows: List[int], product: float):
+                if len(edge_rows) == hops:
+                    score = (pageranks[node_rows[-1]] if pageranks else None) or 0
+                    candidates.append((product, score, list(node_rows), list(edge_rows)))
+                    return
+                for edge_row in self._out[node_rows[-1]]:
+                    target = targets[edge_row]
+                    if target in node_rows or label not in self._node_labels[target]:
+                        continue
+                    weight = weights[edge_row] if weights and weights[edge_row] is not None else 0.5
+                    node_rows.append(target)
+                    edge_rows.append(edge_row)
+                    expand(node_rows, edge_rows, product * weight)
+                    node_rows.pop()
+                    edge_rows.pop()
+
+            expand([start_row], [], 1.0)
+            best = heapq.nlargest(limit, candidates, key=lambda c: (c[0], c[1]))
+            return [
+                {
+                    "nodes": [self._node(row) for row in node_rows],
+                    "edges": [self._edge(row, node_key) for row in edge_rows]
+                }
+                for _, _, node_rows, edge_rows in best
+            ]
+
+    def neighbourhood(self, keys, hops=1, label="Entity", node_key="entity_id", limit=None):
+        label = sanitize_label(label)
+        with self._lock:
+            frontier = [row for row in (self._node_rows.get((label, k)) for k in keys) if row is not None]
+            seen_nodes = set(frontier)
+            seen_edges: Dict[int, None] = {}  # insertion-ordered set
+            for _ in range(hops):
+                next_frontier = []
+                for row in frontier:
+                    for edge_row in self._out[row] + self._in[row]:
+                        if edge_row in seen_edges:
+                            continue
+                        if limit is not None and len(seen_edges) >= limit:
+                            break
+                        source, target = self._edge_source[edge_row], self._edge_target[edge_row]
+                        other = target if source == row else source
+                        if label not in self._node_labels[other]:
+                            continue
+                        seen_edges[edge_row] = None
+                        if other not in seen_nodes:
+                            seen_nodes.add(other)
+                            next_frontier.append(other)
+                frontier = next_frontier
+            return {
+                "nodes": [self._node(row) for row in sorted(seen_nodes)],
+                "edges": [self._edge(row, node_key) for row in seen_edges]
+            }
+
+    def load_graph(self, label="Entity", node_key="entity_id", equals=None, min_values=None,
+                   node_properties=None, edge_properties=None):
+        label = sanitize_label(label)
+        with self._lock:
+            allowed = set(self._filter_nodes(label, equals, min_values, exists=(node_key,)))
+            edge_rows = [
+                row for row in range(len(self._edge_type))
+                if self._edge_source[row] in allowed and self._edge_target[row] in allowed
+            ]
+            node_rows = sorted(
+                {self._edge_source[row] for row in edge_rows} | {self._edge_target[row] for row in edge_rows}
+            )
+            if node_properties is not None and node_key not in node_properties:
+                node_properties = list(node_properties) + [node_key]
+            key_column = self._node_columns.get(node_key)
+            edges = []
+            for row in edge_rows:
+                edge = self._row_values(self._edge_columns, row, edge_properties)
+                edge.update({
+                    "source_id": key_column[self._edge_source[row]],
+                    "target_id": key_column[self._edge_target[row]],
+                    "relationship_type": self._edge_type[row]
+                })
+                edges.append(edge)
+            return {
+                "nodes": [self._row_values(self._node_columns, row, node_properties) for row in node_rows],
+                "edges": edges
+            }
+
+    def get_statistics(self, label="Entity", type_property="entity_type"):
+        label = sanitize_label(label)
+        with self._lock:
+            type_column = self._node_columns.get(type_property)
+            node_types: Dict[str, int] = {}
+            node_count = 0
+            for row, labels in enumerate(self._node_labels):
+                if label in labels:
+                    node_count += 1
+                    node_type = (type_column[row] if type_column else None) or "UNKNOWN"
+                    node_types[node_type] = node_types.get(node_type, 0) + 1
+
+            weights = self._edge_columns.get("weight")
+            rel_types: Dict[str, List[float]] = {}
+            counts: Dict[str, int] = {}
+            for row, rel_type in enumerate(self._edge_type):
+                counts[rel_type] = counts.get(rel_type, 0) + 1
+                if weights and weights[row] is not None:
+                    rel_types.setdefault(rel_type, []).append(weights[row])
+            return {
+                "node_count": node_count,
+                "edge_count": len(self._edge_type),
+                "node_types": dict(sorted(node_types.items(), key=lambda item: -item[1])),
+                "relationship_types": {
+                    rel_type: {
+                        "count": count,
+                        "average_weight": sum(rel_types.get(rel_type, [])) / len(rel_types[rel_type])
+                        if rel_types.get(rel_type) else 0
+                    }
+                    for rel_type, count in sorted(counts.items(), key=lambda item: -item[1])
+                }
+            }
+
+    @_writes_graph
+    def clear(self, label="Entity"):
+        label = sanitize_label(label)
+        with self._lock:
+            # Rebuild from the nodes (and edges between them) that do not carry the label
+            kept_nodes = [row for row, labels in enumerate(self._node_labels) if label not in labels]
+            remap = {old: new for new, old in enumerate(kept_nodes)}
+            nodes = [(self._node_labels[row], self._row_values(self._node_columns, row)) for row in kept_nodes]
+            edges = [
+                (remap[self._edge_source[row]], remap[self._edge_target[row]], self._edge_type[row],
+                 self._row_values(self._edge_columns, row))
+                for row in range(len(self._edge_type))
+                if self._edge_source[row] in remap and self._edge_target[row] in remap
+            ]
+            node_key_names, edge_key_names = self._node_key_names, self._edge_key_names
+
+            self._reset()
+            self._node_key_names, self._edge_key_names = node_key_names, edge_key_names
+            for labels, properties in nodes:
+                row = self._append_node(labels)
+                self._set_node_properties(row, properties)
+                for node_label in labels:
+                    if node_label in node_key_names:
+                        self._node_rows[(node_label, properties.get(node_key_names[node_label]))] = row
+            for source, target, rel_type, properties in edges:
+                row = self._append_edge(source, target, rel_type)
+                self._set_edge_properties(row, properties)
+                if rel_type in edge_key_names:
+                    self._edge_rows[(rel_type, properties.get(edge_key_names[rel_type]))] = row
+
+            if self._db_conn:
+                # Also removes rows with the label written by other processes
+                self._db_conn.execute(
+                    "DELETE FROM nodes WHERE EXISTS (SELECT 1 FROM json_each(nodes.labels) WHERE value = ?)",
+                    (label,)
+                )
+                self._db_conn.execute("""
+                    DELETE FROM edges
+                    WHERE NOT EXISTS (SELECT 1 FROM nodes WHERE label = source_label AND key = source_key)
+                       OR NOT EXISTS (SELECT 1 FROM nodes WHERE label = target_label AND key = target_key)
+                """)
+                self._db_conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db_conn:
+                self._db_conn.close()
+                self._db_conn = None
@@ -6,9 +6,10 @@ to ensure consistent integration and prevent API compatibility issues.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable, Hashable, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import threading
 
 
 class PhaseStatus(Enum):
@@ -35,6 +36,109 @@ class PhaseResult:
     results: Optional[Dict[str, Any]] = None
 
 
+class ArtifactContext:
+    """Per-request store of intermediate artifacts shared by all phases.
+    
+    Loaded documents, chunks and spaCy parses are computed by the first phase
+    that needs them and reused by the rest. Safe for phases running
+    concurrently: a second caller waits for an in-progress computation
+    instead of repeating it.
+    """
+    
+    def __init__(self):
+        self._artifacts: Dict[Tuple[str, Hashable], Any] = {}
+        self._key_locks: Dict[Tuple[str, Hashable], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_or_compute(
+        self,
+        kind: str,
+        key: Hashable,
+        compute: Callable[[], Any],
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Return the artifact for (kind, key), computing it once if missing.
+        
+        Args:
+            kind: Artifact kind, e.g. "document", "chunks", "spacy_doc"
+            key: Artifact key within the kind, e.g. a document path
+            compute: Produces the artifact when it is not stored yet
+            should_cache: Decides whether a computed result is stored
+                (e.g. only successful tool results); stores everything if None
+        """
+        artifact_key = (kind, key)
+        with self._lock:
+            if artifact_key in self._artifacts:
+                self.hits += 1
+                return self._artifacts[artifact_key]
+            key_lock = self._key_locks.setdefault(artifact_key, threading.Lock())
+        
+        with key_lock:
+            with self._lock:
+                if artifact_key in self._artifacts:
+                    self.hits += 1
+                    return self._artifacts[artifact_key]
+                self.misses += 1
+            value = compute()
+            if should_cache is None or should_cache(value):
+                with self._lock:
+                    self._artifacts[artifact_key] = value
+            return value
+    
+    def get(self, kind: str, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._artifacts.get((kind, key), default)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            kinds: Dict[str, int] = {}
+            for kind, _ in self._artifacts:
+                kinds[kind] = kinds.get(kind, 0) + 1
+            return {"artifacts": kinds, "hits": self.hits, "misses": self.misses}
+
+
+def _succeeded(result: Dict[str, Any]) -> bool:
+    return result["status"] == "success"
+
+
+def load_document(pdf_loader: Any, pdf_path: str,
+                  artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
+    """Load a document, reusing the request's shared copy if already loaded."""
+    if artifact_context is None:
+        return pdf_loader.load_pdf(pdf_path)
+    return artifact_context.get_or_compute(
+        "document", pdf_path, lambda: pdf_loader.load_pdf(pdf_path), should_cache=_succeeded
+    )
+
+
+def chunk_document(text_chunker: Any, document: Dict[str, Any],
+                   artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
+    """Chunk a loaded document, reusing the request's shared chunks if already computed."""
+    def chunk():
+        return text_chunker.chunk_text(
+            document_ref=document["document_ref"],
+            text=document["text"],
+            document_confidence=document["confidence"]
+        )
+    if artifact_context is None:
+        return chunk()
+    return artifact_context.get_or_compute("chunks", document["document_ref"], chunk, should_cache=_succeeded)
+
+
+def parse_chunk(nlp: Optional[Callable[[str], Any]], chunk: Dict[str, Any],
+                artifact_context: Optional[ArtifactContext] = None) -> Any:
+    """Shared spaCy parse of a chunk for NER and relationship extraction.
+    
+    Returns None (each tool parses on its own) without a shared context
+    or a full spaCy pipeline.
+    """
+    if artifact_context is None or nlp is None:
+        return None
+    return artifact_context.get_or_compute("spacy_doc", chunk["chunk_ref"], lambda: nlp(chunk["text"]))
+
+
 @dataclass
 class ProcessingRequest:
     """Standard input structure for phase processing"""
@@ -56,6 +160,9 @@ class ProcessingRequest:
     # Phase integration data (for data flow between phases)
     phase1_graph_data: Optional[Dict[str, Any]] = None    # P1 results for P2/P3
     phase2_enhanced_data: Optional[Dict[str, Any]] = None # P2 results for P3
+    
+    # Shared per-request artifacts (loaded text, chunks, parses) reused across phases
+    artifact_context: Optional[ArtifactContext] = None
 
 
 class GraphRAGPhase(ABC):
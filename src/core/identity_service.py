@@ -19,6 +19,7 @@ import sqlite3
 from pathlib import Path
 import numpy as np
 from .config import get_config
+from .embedding_service import EmbeddingService, get_embedding_service
 from concurrent.futures import ThreadPoolExecutor
 import logging
 
@@ -76,7 +77,8 @@ class IdentityService:
         embedding_model: str = None,
         similarity_threshold: float = None,
         exact_match_threshold: float = None,
-        related_threshold: float = None
+        related_threshold: float = None,
+        embedding_service: Optional[EmbeddingService] = None
     ):
         """Initialize identity service with configurable features.
         
@@ -87,6 +89,7 @@ class IdentityService:
             similarity_threshold: Threshold for entity matching (uses config default if None)
             exact_match_threshold: Threshold for exact matches (calculated from config if None)
             related_threshold: Threshold for related entities (calculated from config if None)
+            embedding_service: Embedding provider (uses the shared service if None)
         """
         # Load configuration for defaults
         config = get_config()
@@ -110,13 +113,13 @@ class IdentityService:
         self.related_threshold = related_threshold
         
         # Optional features
-        self._openai_client = None
-        self._embedding_cache: Dict[str, List[float]] = {}
+        self._embedding_service = embedding_service
         self._executor = ThreadPoolExecutor(max_workers=4)
         
         # Persistence
         self.persistence_path = persistence_path
         self._db_conn = None
+        self._defer_commits = False  # Set by batch calls, which commit once at the end
         if persistence_path:
             self._init_database()
             self._load_from_database()
@@ -223,45 +226,34 @@ class IdentityService:
         except Exception as e:
             logger.error(f"Failed to load from database: {e}")
     
-    def _get_openai_client(self):
-        """Lazy load OpenAI client."""
-        if self._openai_client is None and self.use_embeddings:
-            try:
-                import openai
-                import os
-                self._openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
-                self.use_embeddings = False
-        return self._openai_client
+    def _get_embedding_service(self) -> EmbeddingService:
+        """Lazy load the shared embedding service."""
+        if self._embedding_service is None:
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
     
     def _get_embedding(self, text: str) -> Optional[List[float]]:
-        """Get embedding for text using OpenAI."""
+        """Get embedding for text (batched, persistent and LRU-cached by the embedding service)."""
         if not self.use_embeddings:
             return None
-            
-        # Check cache
-        if text in self._embedding_cache:
-            return self._embedding_cache[text]
-            
-        client = self._get_openai_client()
-        if not client:
-            return None
-            
-        try:
-            response = client.embeddings.create(
-                input=text,
-                model=self.embedding_model
-            )
-            embedding = response.data[0].embedding
-            
-            # Cache it
-            self._embedding_cache[text] = embedding
-            return embedding
-            
-        except Exception as e:
-            logger.error(f"Failed to get embedding: {e}")
-            return None
+        
+        return self._get_embedding_service().get_embedding(text, self.embedding_model)
+    
+    def warm_embeddings(self, surface_forms: List[str]) -> int:
+        """Fetch embeddings for many surface forms in batched API calls.
+        
+        Call before creating a batch of mentions so that per-mention lookups
+        are served from cache instead of one API request each.
+        
+        Returns:
+            Number of surface forms with an embedding available
+        """
+        if not self.use_embeddings or not surface_forms:
+            return 0
+        
+        normalized = [self._normalize_surface_form(s) for s in surface_forms if s and s.strip()]
+        vectors = self._get_embedding_service().get_embeddings(normalized, self.embedding_model)
+        return sum(1 for v in vectors if v is not None)
     
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -361,7 +353,56 @@ class IdentityService:
                 "error": f"Failed to create mention: {str(e)}",
                 "confidence": 0.0
             }
-    
+
+    def create_mentions(self, mentions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many mentions in one call.
+
+        Each item takes create_mention's arguments (surface_form, start_pos,
+        end_pos, source_ref and optionally entity_type, confidence, context).
+        Embeddings are fetched for all surface forms in batched requests and
+        persisted rows are committed in a single transaction.
+
+        Args:
+            mentions: Mention specifications
+
+        Returns:
+            Batch result with one create_mention result per item, in input order
+        """
+        if not isinstance(mentions, list):
+            return {"status": "error", "error": "mentions must be a list"}
+
+        required = ("surface_form", "start_pos", "end_pos", "source_ref")
+        optional = ("entity_type", "confidence", "context")
+        self.warm_embeddings([m.get("surface_form") for m in mentions
+                              if isinstance(m, dict) and isinstance(m.get("surface_form"), str)])
+
+        results = []
+        self._defer_commits = True
+        try:
+            for mention in mentions:
+                if not isinstance(mention, dict) or any(key not in mention for key in required):
+                    results.append({
+                        "status": "error",
+                        "error": f"Mention requires {', '.join(required)}",
+                        "confidence": 0.0
+                    })
+                    continue
+                results.append(self.create_mention(**{
+                    key: mention[key] for key in required + optional if key in mention
+                }))
+        finally:
+            self._defer_commits = False
+            if self._db_conn:
+                self._db_conn.commit()
+
+        created = sum(1 for r in results if r["status"] == "success")
+        return {
+            "status": "success",
+            "results": results,
+            "created_count": created,
+            "error_count": len(results) - created
+        }
+
     def _normalize_surface_form(self, surface_form: str) -> str:
         """Normalize surface form for entity matching."""
         # Same as minimal implementation
@@ -523,7 +564,25 @@ class IdentityService:
                 "status": "error",
                 "error": f"Failed to get entity: {str(e)}"
             }
-    
+
+    def get_entities_by_mentions(self, mention_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get the entities associated with many mentions.
+
+        Returns:
+            One result per mention ID, in input order: the get_entity_by_mention
+            fields with status "success", or status "not_found"
+        """
+        results = []
+        for mention_id in mention_ids:
+            entity = self.get_entity_by_mention(mention_id)
+            if entity is None:
+                results.append({"status": "not_found", "mention_id": mention_id})
+            elif entity.get("status") == "error":
+                results.append({**entity, "mention_id": mention_id})
+            else:
+                results.append({"status": "success", "mention_id": mention_id, **entity})
+        return results
+
     def get_mentions_for_entity(self, entity_id: str) -> List[Dict[str, Any]]:
         """Get all mentions for an entity (backward compatible)."""
         try:
@@ -723,7 +782,8 @@ class IdentityService:
                 embedding_blob
             ))
             
-            self._db_conn.commit()
+            if not self._defer_commits:
+                self._db_conn.commit()
         except Exception as e:
             logger.error(f"Failed to persist entity: {e}")
     
@@ -754,7 +814,8 @@ class IdentityService:
                 entity_id
             ))
             
-            self._db_conn.commit()
+            if not self._defer_commits:
+                self._db_conn.commit()
         except Exception as e:
             logger.error(f"Failed to persist mention: {e}")
     
@@ -0,0 +1,392 @@
+"""Job Manager - Background execution of long-running workflows
+
+Long operations (PDF → answer workflows, PageRank, graph queries) are
+submitted as jobs: submit() returns a job ID immediately and the work runs
+in a bounded pool of worker threads, so a server handling the submission
+stays responsive to other requests.
+
+Progress is recorded as a list of events per job. Workflows report progress
+through WorkflowStateService; attach_workflow_service() subscribes to its
+checkpoints and progress updates and files each event under the job running
+in the reporting thread. Clients poll with get_job(since_event=...) or block
+for the next events with wait().
+
+Cancellation and timeouts are cooperative: the job is marked cancelled or
+timed_out immediately, and the worker stops at the workflow's next
+checkpoint (JobCancelled is raised from the progress listener). Tools that
+run outside a workflow call check_cancelled() between their own stages, e.g.
+PageRank before writing scores and multi-hop queries between start entities.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+import threading
+import uuid
+import logging
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled", "timed_out")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job that was cancelled or timed out."""
+
+
+@dataclass
+class Job:
+    """A submitted job and its progress."""
+    job_id: str
+    kind: str
+    parameters: Dict[str, Any]
+    timeout_seconds: float
+    status: str = "queued"  # queued, running, completed, failed, cancelled, timed_out
+    submitted_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    workflow_ids: List[str] = field(default_factory=list)
+    worker_active: bool = False
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Any = None
+    timer: Optional[threading.Timer] = None
+
+
+_local = threading.local()
+
+
+def current_job() -> Optional["JobContext"]:
+    """Context of the job running in this thread, if any."""
+    return getattr(_local, "job", None)
+
+
+def check_cancelled():
+    """Raise JobCancelled if the job running in this thread was cancelled or timed out.
+
+    A no-op outside jobs, so tools can call it at their stage boundaries
+    whether or not they run as a job.
+    """
+    context = current_job()
+    if context is not None:
+        context.check_cancelled()
+
+
+class JobContext:
+    """Access to the running job for code executing inside it."""
+
+    def __init__(self, manager: "JobManager", job: Job):
+        self._manager = manager
+        self._job = job
+
+    @property
+    def job_id(self) -> str:
+        return self._job.job_id
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise JobCancelled if the job was cancelled or timed out."""
+        if self.cancelled:
+            raise JobCancelled(f"Job {self._job.job_id} was {self._job.status}")
+
+    def report(
+        self,
+        step_name: str,
+        step_number: Optional[int] = None,
+        total_steps: Optional[int] = None,
+        message: Optional[str] = None
+    ):
+        """Record a progress event for the job."""
+        self._manager._record_event(self._job, {
+            "step_name": step_name,
+            "step_number": step_number,
+            "total_steps": total_steps,
+            "status": "running",
+            "message": message
+        })
+
+
+class JobManager:
+    """Bounded worker pool for jobs with progress, cancellation and timeouts."""
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_queued_jobs: int = None,
+        default_timeout_seconds: float = None,
+        finished_jobs_kept: int = None
+    ):
+        """Create the manager (config.jobs values are used for None arguments).
+
+        Args:
+            max_workers: Jobs run concurrently
+            max_queued_jobs: Waiting jobs accepted before submissions are rejected
+            default_timeout_seconds: Timeout of jobs submitted without one
+            finished_jobs_kept: Finished jobs kept for status queries
+        """
+        config = get_config().jobs
+        self.max_workers = max_workers or config.max_workers
+        self.max_queued_jobs = max_queued_jobs if max_queued_jobs is not None else config.max_queued_jobs
+        self.default_timeout_seconds = default_timeout_seconds or config.default_timeout_seconds
+        self.finished_jobs_kept = finished_jobs_kept or config.finished_jobs_kept
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._workflow_jobs: Dict[str, Job] = {}
+        self._condition = threading.Condition()
+
+    def attach_workflow_service(self, workflow_service):
+        """Record the service's checkpoints and progress updates as job events."""
+        workflow_service.add_progress_listener(self._on_workflow_progress)
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[[], Any],
+        parameters: Dict[str, Any] = None,
+        timeout_seconds: float = None
+    ) -> Dict[str, Any]:
+        """Queue func to run in a worker thread.
+
+        Args:
+            kind: Job type shown in listings (e.g. "pdf_to_answer")
+            func: Work to run; its return value becomes the job result. A
+                dict result with status "failed" or "error" fails the job.
+            parameters: Submission parameters shown in status queries
+            timeout_seconds: Job timeout (default_timeout_seconds if None)
+
+        Returns:
+            Submission result with the job ID
+        """
+        with self._condition:
+            queued = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if queued >= self.max_queued_jobs:
+                return {
+                    "status": "error",
+                    "error": f"Job queue is full ({queued} jobs waiting)"
+                }
+
+            job = Job(
+                job_id=f"job_{uuid.uuid4().hex[:8]}",
+                kind=kind,
+                parameters=parameters or {},
+                timeout_seconds=timeout_seconds or self.default_timeout_seconds
+            )
+            self._jobs[job.job_id] = job
+            self._add_event_locked(job, {"step_name": "queued", "status": "queued"})
+            self._evict_finished_locked()
+            job.future = self._executor.submit(self._run, job, func)
+
+        return {
+            "status": "success",
+            "job_id": job.job_id,
+            "job_status": "queued",
+            "jobs_ahead": queued
+        }
+
+    def _run(self, job: Job, func: Callable[[], Any]):
+        with self._condition:
+            if job.status != "queued":
+                return
+            job.status = "running"
+            job.started_at = datetime.now()
+            job.worker_active = True
+            self._add_event_locked(job, {"step_name": "started", "status": "running"})
+            job.timer = threading.Timer(job.timeout_seconds, self._expire, args=(job,))
+            job.timer.daemon = True
+            job.timer.start()
+
+        result, error = None, None
+        _local.job = JobContext(self, job)
+        try:
+            result = func()
+        except JobCancelled:
+            pass
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}")
+            error = str(e)
+        finally:
+            _local.job = None
+            job.timer.cancel()
+
+        with self._condition:
+            job.worker_active = False
+            if job.status == "running":
+                failed_result = isinstance(result, dict) and result.get("status") in ("failed", "error")
+                job.result = result
+                self._finish_locked(
+                    job,
+                    "failed" if error is not None or failed_result else "completed",
+                    error or (result.get("error") if failed_result else None)
+                )
+            for workflow_id in job.workflow_ids:
+                self._workflow_jobs.pop(workflow_id, None)
+            self._condition.notify_all()
+
+    def _finish_locked(self, job: Job, status: str, error: Optional[str] = None):
+        job.status = status
+        job.error = error
+        job.finished_at = datetime.now()
+        if status in ("cancelled", "timed_out"):
+            job.cancel_event.set()
+        self._add_event_locked(job, {"step_name": status, "status": status, "message": error})
+
+    def _expire(self, job: Job):
+        with self._condition:
+            if job.status == "running":
+                self._finish_locked(job, "timed_out", f"Job exceeded its {job.timeout_seconds}s timeout")
+
+    def _add_event_locked(self, job: Job, event: Dict[str, Any]):
+        job.events.append({
+            "index": len(job.events),
+            "time": datetime.now().isoformat(),
+            "step_name": event.get("step_name"),
+            "step_number": event.get("step_number"),
+            "total_steps": event.get("total_steps"),
+            "status": event.get("status"),
+            "message": event.get("message"),
+            "workflow_id": event.get("workflow_id")
+        })
+        self._condition.notify_all()
+
+    def _record_event(self, job: Job, event: Dict[str, Any]):
+        with self._condition:
+            if job.status not in FINISHED_STATUSES:
+                self._add_event_locked(job, event)
+
+    def _on_workflow_progress(self, event: Dict[str, Any]):
+        """Workflow progress listener: file the event under its job."""
+        context = current_job()
+        with self._condition:
+            job = context._job if context else self._workflow_jobs.get(event["workflow_id"])
+            if job is None:
+                return
+            if event["workflow_id"] not in job.workflow_ids:
+                job.workflow_ids.append(event["workflow_id"])
+                self._workflow_jobs[event["workflow_id"]] = job
+            if job.status not in FINISHED_STATUSES:
+                self._add_event_locked(job, event)
+
+        # Stop the workflow at this step; terminal updates are let through so
+        # the workflow can record its own failure
+        if job.cancel_event.is_set() and event["status"] not in ("completed", "failed"):
+            raise JobCancelled(f"Job {job.job_id} was {job.status}")
+
+    def _evict_finished_locked(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATUSES]
+        for job_id in finished[:max(0, len(finished) - self.finished_jobs_kept)]:
+            job = self._jobs.pop(job_id)
+            for workflow_id in job.workflow_ids:
+                self._workflow_jobs.pop(workflow_id, None)
+
+    def _job_to_dict(self, job: Job, since_event: int = 0, include_events: bool = True) -> Dict[str, Any]:
+        progress = next(
+            (e for e in reversed(job.events) if e["total_steps"] and e["step_number"] is not None and e["step_number"] >= 0),
+            None
+        )
+        info = {
+            "status": "success",
+            "job_id": job.job_id,
+            "kind": job.kind,
+            "parameters": job.parameters,
+            "job_status": job.status,
+            "finished": job.status in FINISHED_STATUSES,
+            "submitted_at": job.submitted_at.isoformat(),
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+            "timeout_seconds": job.timeout_seconds,
+            "worker_active": job.worker_active,
+            "workflow_ids": list(job.workflow_ids),
+            "current_step": progress["step_name"] if progress else None,
+            "progress_percent": (
+                min(100.0, progress["step_number"] / progress["total_steps"] * 100) if progress else 0.0
+            ),
+            "error": job.error
+        }
+        if include_events:
+            info["events"] = job.events[since_event:]
+            info["next_event"] = len(job.events)
+        if job.status in FINISHED_STATUSES:
+            info["result"] = job.result
+        return info
+
+    def get_job(self, job_id: str, since_event: int = 0) -> Dict[str, Any]:
+        """Job status with the events recorded since since_event."""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"status": "error", "error": f"Job {job_id} not found"}
+            return self._job_to_dict(job, since_event)
+
+    def wait(self, job_id: str, since_event: int = 0, timeout: float = 30.0) -> Dict[str, Any]:
+        """Block until the job has events after since_event or finishes (or timeout)."""
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"status": "error", "error": f"Job {job_id} not found"}
+            self._condition.wait_for(
+                lambda: len(job.events) > since_event or job.status in FINISHED_STATUSES,
+                timeout=timeout
+            )
+            return self._job_to_dict(job, since_event)
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued or running job.
+
+        Queued jobs never start. Running jobs are marked cancelled at once;
+        their worker stops at the next workflow step (worker_active shows
+        whether it is still running).
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"status": "error", "error": f"Job {job_id} not found"}
+            if job.status in FINISHED_STATUSES:
+                return {"status": "error", "error": f"Job {job_id} already {job.status}"}
+            self._finish_locked(job, "cancelled", "Cancelled by client")
+            if job.future is not None:
+                job.future.cancel()
+            return {
+                "status": "success",
+                "job_id": job_id,
+                "job_status": job.status,
+                "worker_active": job.worker_active
+            }
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Summaries of known jobs, optionally filtered by status."""
+        with self._condition:
+            return [
+                self._job_to_dict(job, include_events=False)
+                for job in self._jobs.values()
+                if status is None or job.status == status
+            ]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._condition:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {
+                "max_workers": self.max_workers,
+                "max_queued_jobs": self.max_queued_jobs,
+                "jobs_by_status": counts,
+                "active_workers": sum(1 for job in self._jobs.values() if job.worker_active)
+            }
+
+    def shutdown(self, wait: bool = False):
+        """Cancel unfinished jobs and stop the worker pool."""
+        with self._condition:
+            for job in self._jobs.values():
+                if job.status not in FINISHED_STATUSES:
+                    self._finish_locked(job, "cancelled", "Job manager shut down")
+        self._executor.shutdown(wait=wait, cancel_futures=True)
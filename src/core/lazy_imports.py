@@ -0,0 +1,92 @@
+"""Lazy Imports - Deferred loading of heavy optional dependencies
+
+spaCy, Neo4j, networkx, pypdf, plotly and the LLM SDKs each take from tens
+of milliseconds to over a second to import. Modules bind them with
+lazy_import() instead of a top-level import, so importing a tool costs
+nothing until the backend is actually used:
+
+    spacy = lazy_import("spacy")
+    nx = lazy_import("networkx")
+
+    graph = nx.DiGraph()  # networkx is imported here, on first attribute access
+
+Names used only in annotations are imported under TYPE_CHECKING and the
+annotations quoted, so defining a class does not trigger the import.
+A missing package raises ImportError at first use (naming the package to
+install), not when the module that references it is imported.
+"""
+
+from typing import Any, Dict, Optional
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, install_hint: Optional[str] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_install_hint"] = install_hint
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                try:
+                    module = importlib.import_module(self.__name__)
+                except ImportError as e:
+                    hint = self.__dict__["_lazy_install_hint"] or self.__name__.split(".")[0]
+                    raise ImportError(
+                        f"{self.__name__} is required for this feature; install it with 'pip install {hint}'"
+                    ) from e
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+_proxies: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str, install_hint: Optional[str] = None) -> Any:
+    """Return the module if already imported, otherwise a proxy that imports it on first use.
+
+    Args:
+        name: Absolute module name (e.g. "plotly.graph_objects")
+        install_hint: pip package to suggest if the import fails (defaults to the top-level name)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name, install_hint)
+        return proxy
+
+
+def is_available(name: str) -> bool:
+    """Whether a module can be imported, without importing it."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
@@ -0,0 +1,110 @@
+"""Lazy Registry - Deferred construction of services and tools
+
+Servers register factories for their services and tools instead of
+constructing them at import time. Each component is built on first use
+(once, even when requested concurrently) so the server can answer requests
+that do not need the heavy components (spaCy models, Neo4j connections)
+immediately after start.
+
+warm_up() builds components ahead of use, by default in a background
+thread, so the first real request does not pay the construction cost.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRegistry:
+    """Named components constructed on first use."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._warm_up_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register a factory; nothing is constructed until get(name)."""
+        self._factories[name] = factory
+        self._locks.setdefault(name, threading.Lock())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str) -> Any:
+        """Return the component, constructing it on first use.
+
+        Raises:
+            KeyError: If no factory is registered under name
+            Exception: Whatever the factory raised; the next get retries
+        """
+        if name in self._instances:
+            return self._instances[name]
+        if name not in self._factories:
+            raise KeyError(f"No component registered as '{name}'")
+
+        with self._locks[name]:
+            if name in self._instances:
+                return self._instances[name]
+            start = time.perf_counter()
+            try:
+                instance = self._factories[name]()
+            except Exception as e:
+                self._errors[name] = str(e)
+                raise
+            self._load_seconds[name] = time.perf_counter() - start
+            self._errors.pop(name, None)
+            self._instances[name] = instance
+            return instance
+
+    def warm_up(self, names: Optional[List[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """Construct components ahead of first use.
+
+        Failures are logged and reported by get_status(); they do not
+        propagate, and the component is retried on its next get().
+
+        Args:
+            names: Components to construct, in order (all registered if None)
+            background: Construct in a daemon thread and return it
+
+        Returns:
+            The warm-up thread when background, otherwise None
+        """
+        names = list(names) if names is not None else self.names()
+
+        def run():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Warm-up of {name} failed: {e}")
+
+        if not background:
+            run()
+            return None
+        self._warm_up_thread = threading.Thread(target=run, name="component-warm-up", daemon=True)
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Load state of every registered component."""
+        return {
+            name: {
+                "loaded": name in self._instances,
+                "load_seconds": self._load_seconds.get(name),
+                "error": self._errors.get(name)
+            }
+            for name in self._factories
+        }
@@ -0,0 +1,246 @@
+"""LLM Response Cache - Persistent content-addressed cache
+
+Stores raw LLM responses on disk keyed by a hash of the normalized prompt,
+the model name and the generation parameters. Identical requests (re-runs,
+retries after downstream failures, test suites) are answered from the cache
+instead of a fresh API call.
+
+Features:
+- SQLite storage (WAL mode) shared across processes
+- TTL expiry and max-entry eviction (least recently used first, in batches)
+- Hit/miss statistics
+"""
+
+from typing import Dict, Optional, Any
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+import logging
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims the cache to this fraction of max_entries, so it runs once
+# per many writes instead of on every put
+EVICTION_LOW_WATER = 0.9
+
+
+class LLMResponseCache:
+    """Content-addressed on-disk cache for LLM responses."""
+
+    def __init__(
+        self,
+        cache_path: str = None,
+        ttl_seconds: int = None,
+        max_entries: int = None,
+        enabled: bool = None
+    ):
+        """Initialize the response cache.
+
+        Args:
+            cache_path: Path to SQLite cache database (uses config default if None)
+            ttl_seconds: Entry lifetime in seconds, 0 disables expiry (uses config default if None)
+            max_entries: Maximum cached responses before LRU eviction (uses config default if None)
+            enabled: Enable or disable caching (uses config default if None)
+        """
+        config = get_config().llm_cache
+
+        self.cache_path = cache_path or config.cache_path
+        self.ttl_seconds = config.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or config.max_entries
+        self.enabled = config.enabled if enabled is None else enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._db_conn = None
+        # Upper bound on stored entries (overwrites and other processes' evictions
+        # are not subtracted); recounted exactly before evicting
+        self._entry_count = 0
+        if self.enabled:
+            self._init_database()
+
+    def _init_database(self):
+        """Initialize SQLite cache database."""
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            """)
+            self._db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_last_accessed ON llm_responses(last_accessed)"
+            )
+            self._db_conn.commit()
+            self._entry_count = self._db_conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        except Exception as e:
+            logger.error(f"Failed to initialize LLM cache at {self.cache_path}: {e}")
+            self._db_conn = None
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """Normalize prompt whitespace so formatting-only differences share a key."""
+        return re.sub(r'\s+', ' ', prompt.strip())
+
+    def make_key(self, prompt: str, model: str, **params) -> str:
+        """Build the cache key for a prompt, model and generation parameters."""
+        key_material = json.dumps({
+            "prompt": self.normalize_prompt(prompt),
+            "model": model,
+            "params": params
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on miss/expiry."""
+        if not self._db_conn:
+            return None
+
+        try:
+            with self._lock:
+                row = self._db_conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                    (cache_key,)
+                ).fetchone()
+
+                now = time.time()
+                if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                    self._db_conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                    self._db_conn.commit()
+                    self.evictions += 1
+                    row = None
+
+                if not row:
+                    self.misses += 1
+                    return None
+
+                self._db_conn.execute(
+                    "UPDATE llm_responses SET last_accessed = ?, hit_count = hit_count + 1 WHERE cache_key = ?",
+                    (now, cache_key)
+                )
+                self._db_conn.commit()
+                self.hits += 1
+                return row[0]
+
+        except Exception as e:
+            logger.error(f"LLM cache lookup failed: {e}")
+            return None
+
+    def put(self, cache_key: str, response: str, model: str = None):
+        """Store a response. Callers should only store responses they could parse."""
+        if not self._db_conn or response is None:
+            return
+
+        try:
+            with self._lock:
+                now = time.time()
+                self._db_conn.execute("""
+                    INSERT OR REPLACE INTO llm_responses
+                    (cache_key, model, response, created_at, last_accessed, hit_count)
+                    VALUES (?, ?, ?, ?, ?, 0)
+                """, (cache_key, model, response, now, now))
+                self.writes += 1
+                self._entry_count += 1
+                if self._entry_count > self.max_entries:
+                    self._evict_excess()
+                self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"LLM cache write failed: {e}")
+
+    def _evict_excess(self):
+        """Drop expired entries, then least recently used entries down to the low-water mark."""
+        if self.ttl_seconds:
+            cursor = self._db_conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        count = self._db_conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        self._entry_count = count
+        if count <= self.max_entries:
+            return
+        excess = count - int(self.max_entries * EVICTION_LOW_WATER)
+        if excess > 0:
+            cursor = self._db_conn.execute("""
+                DELETE FROM llm_responses WHERE cache_key IN (
+                    SELECT cache_key FROM llm_responses ORDER BY last_accessed ASC LIMIT ?
+                )
+            """, (excess,))
+            self.evictions += max(cursor.rowcount, 0)
+            self._entry_count -= max(cursor.rowcount, 0)
+
+    def clear(self) -> Dict[str, Any]:
+        """Remove all cached responses."""
+        if not self._db_conn:
+            return {"status": "success", "removed_entries": 0}
+
+        try:
+            with self._lock:
+                cursor = self._db_conn.execute("DELETE FROM llm_responses")
+                self._db_conn.commit()
+                self._entry_count = 0
+            return {"status": "success", "removed_entries": cursor.rowcount}
+        except Exception as e:
+            return {"status": "error", "error": f"Failed to clear cache: {str(e)}"}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total_lookups = self.hits + self.misses
+        stats = {
+            "enabled": self._db_conn is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total_lookups if total_lookups else 0.0,
+            "cache_path": self.cache_path
+        }
+
+        if self._db_conn:
+            try:
+                with self._lock:
+                    stats["total_entries"] = self._db_conn.execute(
+                        "SELECT COUNT(*) FROM llm_responses"
+                    ).fetchone()[0]
+            except Exception:
+                stats["total_entries"] = None
+
+        return stats
+
+    def close(self):
+        """Close the cache database."""
+        if self._db_conn:
+            self._db_conn.close()
+            self._db_conn = None
+
+
+_global_cache: Optional[LLMResponseCache] = None
+_global_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the shared LLM response cache instance."""
+    global _global_cache
+    if _global_cache is None:
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = LLMResponseCache()
+    return _global_cache
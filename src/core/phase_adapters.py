@@ -6,11 +6,12 @@ interface without requiring massive refactoring of working code.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from .graphrag_phase_interface import (
-    GraphRAGPhase, PhaseResult, ProcessingRequest, PhaseStatus, register_phase
+    GraphRAGPhase, PhaseResult, ProcessingRequest, PhaseStatus, ArtifactContext, register_phase
 )
 
 
@@ -52,7 +53,8 @@ class Phase1Adapter(GraphRAGPhase):
             result = workflow.execute_workflow(
                 document_paths=request.documents,  # Use standardized interface
                 queries=request.queries,           # Use standardized interface  
-                workflow_name=request.workflow_id
+                workflow_name=request.workflow_id,
+                artifact_context=request.artifact_context
             )
             
             execution_time = time.time() - start_time
@@ -180,6 +182,7 @@ class Phase2Adapter(GraphRAGPhase):
                     workflow_id=request.workflow_id,    # Use standardized interface
                     use_existing_ontology=request.existing_ontology,
                     use_mock_apis=request.use_mock_apis,
+                    artifact_context=request.artifact_context,
                     phase1_context=phase1_context  # Pass Phase 1 context for enhancement
                 )
             except TypeError as e:
@@ -192,7 +195,8 @@ class Phase2Adapter(GraphRAGPhase):
                         queries=request.queries,
                         workflow_id=request.workflow_id,    # Use standardized interface
                         use_existing_ontology=request.existing_ontology,
-                        use_mock_apis=request.use_mock_apis
+                        use_mock_apis=request.use_mock_apis,
+                        artifact_context=request.artifact_context
                     )
                     # Simulate integration by adding phase1 context to results
                     if isinstance(result, dict) and phase1_context:
@@ -347,8 +351,21 @@ class IntegratedPipelineOrchestrator:
         self.phase2 = Phase2Adapter()
         self.phase3 = Phase3Adapter()
     
-    def execute_full_pipeline(self, pdf_path: str, query: str, domain_description: str, workflow_id: str = "integrated_test") -> Dict[str, Any]:
-        """Execute complete P1→P2→P3 pipeline with real data flow"""
+    def execute_full_pipeline(
+        self,
+        pdf_path: str,
+        query: str,
+        domain_description: str,
+        workflow_id: str = "integrated_test",
+        concurrent_phases: bool = False
+    ) -> Dict[str, Any]:
+        """Execute complete P1→P2→P3 pipeline with real data flow
+        
+        All phases share one ArtifactContext, so the PDF is loaded and
+        chunked (and chunks parsed by spaCy) once per request. With
+        concurrent_phases, Phase 1 and Phase 2 run in parallel since both
+        only need the document; Phase 2 then runs without Phase 1 counts.
+        """
         
         results = {
             "workflow_id": workflow_id,
@@ -357,18 +374,46 @@ class IntegratedPipelineOrchestrator:
             "status": "success",
             "errors": []
         }
+        artifact_context = ArtifactContext()
         
         try:
-            # Phase 1: Basic GraphRAG
-            print(f"🔄 Executing Phase 1: Basic GraphRAG...")
             p1_request = ProcessingRequest(
                 documents=[pdf_path],
                 queries=[query],
                 workflow_id=f"{workflow_id}_phase1",
-                use_mock_apis=False  # Use real APIs (OpenAI instead of Gemini)
+                use_mock_apis=False,  # Use real APIs (OpenAI instead of Gemini)
+                artifact_context=artifact_context
             )
             
-            p1_result = self.phase1.execute(p1_request)
+            def phase2_request(p1_result: Optional[PhaseResult]) -> ProcessingRequest:
+                return ProcessingRequest(
+                    documents=[pdf_path],  # Same document, but Phase 2 should enhance P1 results
+                    queries=[query],
+                    domain_description=domain_description,
+                    workflow_id=f"{workflow_id}_phase2",
+                    use_mock_apis=False,  # Use real APIs (OpenAI instead of Gemini)
+                    # Pass Phase 1 results for enhancement
+                    phase1_graph_data={
+                        "entities": p1_result.entity_count,
+                        "relationships": p1_result.relationship_count,
+                        "graph_metrics": p1_result.results.get("graph_metrics", {}) if p1_result.results else {}
+                    } if p1_result else None,
+                    artifact_context=artifact_context
+                )
+            
+            if concurrent_phases:
+                print(f"🔄 Executing Phase 1 and Phase 2 concurrently...")
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    p1_future = executor.submit(self.phase1.execute, p1_request)
+                    p2_future = executor.submit(self.phase2.execute, phase2_request(None))
+                    p1_result = p1_future.result()
+                    p2_result = p2_future.result()
+            else:
+                # Phase 1: Basic GraphRAG
+                print(f"🔄 Executing Phase 1: Basic GraphRAG...")
+                p1_result = self.phase1.execute(p1_request)
+                p2_result = None
+            
             results["phases"]["phase1"] = p1_result
             
             if p1_result.status != PhaseStatus.SUCCESS:
@@ -383,22 +428,9 @@ class IntegratedPipelineOrchestrator:
             print(f"✅ Phase 1 complete: {p1_result.entity_count} entities, {p1_result.relationship_count} relationships")
             
             # Phase 2: Enhanced with ontology (building on Phase 1 results)
-            print(f"🔄 Executing Phase 2: Enhanced with ontology...")
-            p2_request = ProcessingRequest(
-                documents=[pdf_path],  # Same document, but Phase 2 should enhance P1 results
-                queries=[query],
-                domain_description=domain_description,
-                workflow_id=f"{workflow_id}_phase2",
-                use_mock_apis=False,  # Use real APIs (OpenAI instead of Gemini)
-                # Pass Phase 1 results for enhancement
-                phase1_graph_data={
-                    "entities": p1_result.entity_count,
-                    "relationships": p1_result.relationship_count,
-                    "graph_metrics": p1_result.results.get("graph_metrics", {}) if p1_result.results else {}
-                }
-            )
-            
-            p2_result = self.phase2.execute(p2_request)
+            if p2_result is None:
+                print(f"🔄 Executing Phase 2: Enhanced with ontology...")
+                p2_result = self.phase2.execute(phase2_request(p1_result))
             results["phases"]["phase2"] = p2_result
             
             if p2_result.status != PhaseStatus.SUCCESS:
@@ -431,7 +463,8 @@ class IntegratedPipelineOrchestrator:
                     "entities": p2_result.entity_count,
                     "relationships": p2_result.relationship_count,
                     "ontology_info": p2_result.results.get("ontology_info", {}) if p2_result.results else {}
-                }
+                },
+                artifact_context=artifact_context
             )
             
             p3_result = self.phase3.execute(p3_request)
@@ -458,6 +491,7 @@ class IntegratedPipelineOrchestrator:
             ])
             
             results["evidence"]["total_execution_time"] = total_execution_time
+            results["evidence"]["artifact_reuse"] = artifact_context.get_stats()
             results["evidence"]["entity_progression"] = [
                 p1_result.entity_count,
                 p2_result.entity_count,
@@ -0,0 +1,422 @@
+"""Processing Queue - Document processing in worker processes
+
+The UIs run whole pipelines (PDF → graph) per uploaded document. Running
+them inline blocks the page for the whole pipeline and makes concurrent
+users wait for each other, so the UIs submit them here instead: submit()
+records the job in a SQLite job table and returns its ID at once, a pool of
+worker processes runs the jobs in parallel, and the UI polls get_job().
+
+Tasks are named "module:function" and called with JSON parameters, so a job
+can be run by a spawned worker and re-run from the table: jobs still queued
+when the queue stops are resumed by the next ProcessingQueue on the same
+database. Results are stored pickled and must be picklable.
+
+Several queues can share one database (one per UI server). Each queue owns
+the jobs it submitted and keeps a heartbeat in the table; a new queue only
+takes over queued jobs and fails running jobs of owners whose heartbeat
+has stopped.
+
+Every completed job that writes the graph bumps a graph version kept in the
+table. Submitting a document_hash that already has a completed result at
+the current graph version, or a queued or running job, returns that job
+instead of processing the document again.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+import importlib
+import json
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+# A queue whose heartbeat is older than HEARTBEAT_TIMEOUT_SECONDS is dead
+HEARTBEAT_INTERVAL_SECONDS = 5.0
+HEARTBEAT_TIMEOUT_SECONDS = 30.0
+
+
+def _remove_temp_file(temp_file: Optional[str]):
+    if temp_file:
+        try:
+            os.unlink(temp_file)
+        except FileNotFoundError:
+            pass
+
+
+def _run_task(db_path: str, job_id: str, task: str, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
+    """Worker entry point: claim a queued job and run its task.
+
+    Returns (False, None) if the job was cancelled before it started.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        with conn:
+            claimed = conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ? WHERE job_id = ? AND status = 'queued'",
+                (datetime.now().isoformat(), job_id)
+            ).rowcount
+    finally:
+        conn.close()
+    if not claimed:
+        return False, None
+
+    module_name, _, function_name = task.partition(":")
+    func = getattr(importlib.import_module(module_name), function_name)
+    return True, func(**parameters)
+
+
+class ProcessingQueue:
+    """Process pool for document processing jobs with a persistent job table."""
+
+    def __init__(
+        self,
+        db_path: str = None,
+        max_workers: int = None,
+        max_queued_jobs: int = None,
+        finished_jobs_kept: int = None
+    ):
+        """Open the job table and start the worker pool (config.processing_queue values are used for None arguments).
+
+        Args:
+            db_path: SQLite job table path
+            max_workers: Worker processes, i.e. documents processed in parallel
+            max_queued_jobs: Waiting jobs accepted before submissions are rejected
+            finished_jobs_kept: Finished jobs kept for status queries
+        """
+        config = get_config().processing_queue
+        self.db_path = db_path or config.db_path
+        self.max_workers = max_workers or config.max_workers
+        self.max_queued_jobs = max_queued_jobs if max_queued_jobs is not None else config.max_queued_jobs
+        self.finished_jobs_kept = finished_jobs_kept or config.finished_jobs_kept
+
+        # Reentrant: a future that is already done runs its callback in the submitting thread
+        self._lock = threading.RLock()
+        self._futures: Dict[str, Future] = {}
+        self.owner_id = f"queue_{uuid.uuid4().hex[:8]}"
+        self._init_database()
+        self._executor = self._create_executor()
+        self._resume_jobs()
+
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        self._heartbeat_thread.start()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: the UI server runs threads that must not be forked
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _init_database(self):
+        """Initialize the SQLite job table."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db_conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._db_conn.execute("PRAGMA journal_mode=WAL")
+        self._db_conn.execute("PRAGMA synchronous=NORMAL")
+        self._db_conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                task TEXT NOT NULL,
+                parameters TEXT NOT NULL,
+                document_hash TEXT,
+                writes_graph INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                submitted_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                graph_version INTEGER,
+                result BLOB,
+                error TEXT,
+                owner_id TEXT,
+                temp_file TEXT
+            )
+        """)
+        columns = {row[1] for row in self._db_conn.execute("PRAGMA table_info(jobs)")}
+        for column in ("owner_id", "temp_file"):
+            if column not in columns:
+                self._db_conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+        self._db_conn.execute(
+            "CREATE TABLE IF NOT EXISTS owners (owner_id TEXT PRIMARY KEY, heartbeat_at REAL NOT NULL)"
+        )
+        self._db_conn.execute(
+            "INSERT OR REPLACE INTO owners (owner_id, heartbeat_at) VALUES (?, ?)", (self.owner_id, time.time())
+        )
+        self._db_conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_document ON jobs (kind, document_hash)")
+        self._db_conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._db_conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('graph_version', 0)")
+        self._db_conn.commit()
+
+    _DEAD_OWNER = "(owner_id IS NULL OR owner_id NOT IN (SELECT owner_id FROM owners WHERE heartbeat_at > ?))"
+
+    def _resume_jobs(self):
+        """Fail running jobs of dead queues and take over their queued ones.
+
+        Jobs of queues that are still alive (e.g. another UI server on the
+        same database) are left alone.
+        """
+        with self._lock:
+            cutoff = time.time() - HEARTBEAT_TIMEOUT_SECONDS
+            self._db_conn.execute("DELETE FROM owners WHERE heartbeat_at <= ?", (cutoff,))
+            interrupted = self._db_conn.execute(
+                f"SELECT job_id, temp_file FROM jobs WHERE status = 'running' AND {self._DEAD_OWNER}", (cutoff,)
+            ).fetchall()
+            for job_id, temp_file in interrupted:
+                self._db_conn.execute(
+                    "UPDATE jobs SET status = 'failed', finished_at = ?, error = ? WHERE job_id = ?",
+                    (datetime.now().isoformat(), "Interrupted by a processing queue restart", job_id)
+                )
+                _remove_temp_file(temp_file)
+            self._db_conn.execute(
+                f"UPDATE jobs SET owner_id = ? WHERE status = 'queued' AND {self._DEAD_OWNER}",
+                (self.owner_id, cutoff)
+            )
+            self._db_conn.commit()
+            queued = self._db_conn.execute(
+                "SELECT job_id, task, parameters FROM jobs WHERE status = 'queued' AND owner_id = ? ORDER BY rowid",
+                (self.owner_id,)
+            ).fetchall()
+            for job_id, task, parameters in queued:
+                self._start_locked(job_id, task, json.loads(parameters))
+
+    def _heartbeat_loop(self):
+        while not self._stop_heartbeat.wait(HEARTBEAT_INTERVAL_SECONDS):
+            with self._lock:
+                if self._db_conn is None:
+                    return
+                self._db_conn.execute(
+                    "INSERT OR REPLACE INTO owners (owner_id, heartbeat_at) VALUES (?, ?)",
+                    (self.owner_id, time.time())
+                )
+                self._db_conn.commit()
+
+    def graph_version(self) -> int:
+        """Number of completed jobs that wrote the graph."""
+        with self._lock:
+            return self._graph_version_locked()
+
+    def _graph_version_locked(self) -> int:
+        return self._db_conn.execute("SELECT value FROM meta WHERE key = 'graph_version'").fetchone()[0]
+
+    def submit(
+        self,
+        kind: str,
+        task: str,
+        parameters: Dict[str, Any] = None,
+        document_hash: Optional[str] = None,
+        writes_graph: bool = True,
+        temp_file: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue a task to run in a worker process.
+
+        Args:
+            kind: Job type shown in listings (e.g. "phase1_document")
+            task: "module:function" run with parameters as keyword arguments;
+                its return value becomes the job result. A dict result with
+                status "failed" or "error" fails the job.
+            parameters: JSON-serializable keyword arguments
+            document_hash: Content hash of the input (and any options that
+                change the result), used to reuse an existing job
+            writes_graph: Whether completing the job changes the graph
+            temp_file: Temporary input file the task deletes when done; the
+                queue deletes it if the task does not run or fails
+
+        Returns:
+            Submission result with the job ID; "reused" is True when an
+            existing job for document_hash was returned
+        """
+        parameters = parameters or {}
+        with self._lock:
+            if document_hash:
+                row = self._db_conn.execute("""
+                    SELECT job_id, status, graph_version FROM jobs
+                    WHERE kind = ? AND document_hash = ? AND status IN ('queued', 'running', 'completed')
+                    ORDER BY rowid DESC LIMIT 1
+                """, (kind, document_hash)).fetchone()
+                if row and (row[1] != "completed" or row[2] == self._graph_version_locked()):
+                    return {"status": "success", "job_id": row[0], "job_status": row[1], "reused": True}
+
+            queued = self._db_conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            if queued >= self.max_queued_jobs:
+                return {
+                    "status": "error",
+                    "error": f"Processing queue is full ({queued} jobs waiting)"
+                }
+
+            job_id = f"job_{uuid.uuid4().hex[:8]}"
+            self._db_conn.execute("""
+                INSERT INTO jobs (job_id, kind, task, parameters, document_hash, writes_graph, status,
+                                  submitted_at, owner_id, temp_file)
+                VALUES (?, ?, ?, ?, ?, ?, 'queued', ?, ?, ?)
+            """, (job_id, kind, task, json.dumps(parameters), document_hash, int(writes_graph),
+                  datetime.now().isoformat(), self.owner_id, temp_file))
+            self._evict_finished_locked()
+            self._db_conn.commit()
+            self._start_locked(job_id, task, parameters)
+
+        return {
+            "status": "success",
+            "job_id": job_id,
+            "job_status": "queued",
+            "jobs_ahead": queued,
+            "reused": False
+        }
+
+    def _start_locked(self, job_id: str, task: str, parameters: Dict[str, Any]):
+        try:
+            future = self._executor.submit(_run_task, self.db_path, job_id, task, parameters)
+        except BrokenProcessPool:
+            # A worker died (its jobs were failed); start a new pool
+            self._executor = self._create_executor()
+            future = self._executor.submit(_run_task, self.db_path, job_id, task, parameters)
+        self._futures[job_id] = future
+        future.add_done_callback(lambda done, job_id=job_id: self._on_done(job_id, done))
+
+    def _on_done(self, job_id: str, future: Future):
+        """Record a finished job's result (runs in the executor's management thread)."""
+        with self._lock:
+            self._futures.pop(job_id, None)
+            if self._db_conn is None:
+                return
+            row = self._db_conn.execute(
+                "SELECT writes_graph, temp_file, status FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            writes_graph, temp_file, job_status = row if row else (False, None, None)
+            error = None if future.cancelled() else future.exception()
+            ran, result = (False, None) if future.cancelled() or error else future.result()
+            if error or (not ran and job_status != "queued"):
+                # The task did not run to completion, so it did not delete its
+                # input; jobs still queued at shutdown keep it for the next queue
+                _remove_temp_file(temp_file)
+            if not error and not ran:
+                return
+
+            failed_result = isinstance(result, dict) and result.get("status") in ("failed", "error")
+            status = "failed" if error or failed_result else "completed"
+            if error:
+                logger.error(f"Processing job {job_id} failed: {error}")
+                message = str(error)
+            else:
+                message = result.get("error") if failed_result else None
+
+            if status == "completed" and writes_graph:
+                self._db_conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'graph_version'")
+            updated = self._db_conn.execute("""
+                UPDATE jobs SET status = ?, finished_at = ?, graph_version = ?, result = ?, error = ?
+                WHERE job_id = ? AND status IN ('queued', 'running')
+            """, (status, datetime.now().isoformat(), self._graph_version_locked(),
+                  pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), message, job_id)).rowcount
+            if updated:
+                self._db_conn.commit()
+            else:
+                # The job was already finished elsewhere; do not count its graph write
+                self._db_conn.rollback()
+
+    def _evict_finished_locked(self):
+        self._db_conn.execute("""
+            DELETE FROM jobs WHERE status IN ('completed', 'failed', 'cancelled') AND job_id NOT IN (
+                SELECT job_id FROM jobs WHERE status IN ('completed', 'failed', 'cancelled')
+                ORDER BY rowid DESC LIMIT ?
+            )
+        """, (self.finished_jobs_kept,))
+
+    _COLUMNS = ("job_id, kind, parameters, document_hash, status, submitted_at, "
+                "started_at, finished_at, graph_version, error")
+
+    def _row_to_dict(self, row: Tuple) -> Dict[str, Any]:
+        job_id, kind, parameters, document_hash, status, submitted_at, started_at, finished_at, version, error = row
+        return {
+            "status": "success",
+            "job_id": job_id,
+            "kind": kind,
+            "parameters": json.loads(parameters),
+            "document_hash": document_hash,
+            "job_status": status,
+            "finished": status in FINISHED_STATUSES,
+            "submitted_at": submitted_at,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "graph_version": version,
+            "error": error
+        }
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """Job status, with the result once the job has finished."""
+        with self._lock:
+            row = self._db_conn.execute(
+                f"SELECT {self._COLUMNS}, result FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return {"status": "error", "error": f"Job {job_id} not found"}
+        info = self._row_to_dict(row[:-1])
+        if info["finished"]:
+            info["result"] = pickle.loads(row[-1]) if row[-1] is not None else None
+        return info
+
+    def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel a queued job; running jobs cannot be interrupted."""
+        with self._lock:
+            row = self._db_conn.execute(
+                "SELECT status, temp_file FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return {"status": "error", "error": f"Job {job_id} not found"}
+            if row[0] != "queued":
+                return {"status": "error", "error": f"Job {job_id} is {row[0]}"}
+            cancelled = self._db_conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ?, error = ? WHERE job_id = ? AND status = 'queued'",
+                (datetime.now().isoformat(), "Cancelled by client", job_id)
+            ).rowcount
+            self._db_conn.commit()
+            if not cancelled:
+                # Claimed by a worker since the check above
+                return {"status": "error", "error": f"Job {job_id} is running"}
+            _remove_temp_file(row[1])
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()
+        return {"status": "success", "job_id": job_id, "job_status": "cancelled"}
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Summaries of known jobs, oldest first, optionally filtered by status."""
+        with self._lock:
+            rows = self._db_conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE ? IS NULL OR status = ? ORDER BY rowid",
+                (status, status)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._db_conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            version = self._graph_version_locked()
+        return {
+            "max_workers": self.max_workers,
+            "max_queued_jobs": self.max_queued_jobs,
+            "jobs_by_status": counts,
+            "graph_version": version,
+            "db_path": self.db_path
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool; queued jobs stay queued for the next start."""
+        self._stop_heartbeat.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            # Removing the heartbeat lets the next queue take over at once
+            self._db_conn.execute("DELETE FROM owners WHERE owner_id = ?", (self.owner_id,))
+            self._db_conn.commit()
+            self._db_conn.close()
+            self._db_conn = None
@@ -9,19 +9,39 @@ This is a MINIMAL implementation focusing on:
 - Input/output relationship capture
 - Tool execution metadata
 
+Lineage is stored as a DAG of operation nodes with parent pointers in
+array-backed columns. All outputs of an operation share one node, and full
+chains are materialized lazily (and memoized) when lineage is requested.
+
+With persistence enabled, completed operations are appended to a durable
+log (see provenance_store.py) and only the most recent
+provenance.hot_window_operations stay in memory; lineage and operation
+lookups for older objects are served from the log.
+
 Deferred features:
 - Impact analysis algorithms
 - Cascading dependency tracking
 - Complex lineage queries
-- Performance optimization
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 import json
 
+from .config import get_config
+from .lru_cache import LRUCache
+from .provenance_store import ProvenanceStore
+from .tracking_policy import TrackingPolicy, get_tracking_policy
+
+# Root confidence and per-step cap for provenance chains
+_CHAIN_CONFIDENCE = 0.95
+
+# Returned by start_operation when tracking is off
+_UNTRACKED_OPERATION_ID = "op_untracked"
+
 
 @dataclass
 class Operation:
@@ -37,6 +57,7 @@ class Operation:
     status: str = "running"  # running, completed, failed
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    indexed: bool = True  # Inputs/outputs linked per object (lineage available)
 
 
 @dataclass
@@ -52,11 +73,52 @@ class ProvenanceChain:
 class ProvenanceService:
     """T110: Provenance Service - Operation tracking and lineage management."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        lineage_cache_size: int = 10000,
+        persistence_enabled: bool = None,
+        log_path: str = None,
+        hot_window_operations: int = None,
+        tracking_policy: Optional[TrackingPolicy] = None
+    ):
+        """Initialize provenance service.
+        
+        Args:
+            lineage_cache_size: Materialized lineage chains kept in memory
+            persistence_enabled: Append operations to the durable log (uses config default if None)
+            log_path: Path to the SQLite operation log (uses config default if None)
+            hot_window_operations: Operations kept in memory when persisting (uses config default if None)
+            tracking_policy: Tracking level policy (uses the shared policy if None)
+        """
+        config = get_config().provenance
+        if persistence_enabled is None:
+            persistence_enabled = config.persistence_enabled
+        self.hot_window_operations = hot_window_operations or config.hot_window_operations
+        self.tracking_policy = tracking_policy or get_tracking_policy()
+        
         self.operations: Dict[str, Operation] = {}
         self.object_to_operations: Dict[str, Set[str]] = {}  # object_ref -> operation_ids
-        self.operation_chains: Dict[str, ProvenanceChain] = {}  # object_ref -> chain
         self.tool_stats: Dict[str, Dict[str, int]] = {}  # tool_id -> {calls, successes, failures}
+        
+        # Provenance DAG: one node per completed operation, indexed by position
+        self._op_ids: List[str] = []  # node index -> operation ID
+        self._node_parent = array('l')  # node index -> parent node index (-1 for roots)
+        self._node_depth = array('l')
+        self._node_confidence = array('d')
+        self._object_nodes: Dict[str, int] = {}  # object_ref -> node index
+        self._lineage_cache = LRUCache(lineage_cache_size)  # node index -> operation IDs
+        self._cold_parents: Dict[int, str] = {}  # node index -> parent operation ID evicted to the log
+        # object_ref -> chain head in the log, or None if the log has none; filled on eviction and lookup
+        self._cold_heads = LRUCache(lineage_cache_size)
+        
+        self._store: Optional[ProvenanceStore] = None
+        if persistence_enabled:
+            store = ProvenanceStore(
+                log_path or config.log_path,
+                flush_interval_seconds=config.flush_interval_seconds,
+                flush_batch_size=config.flush_batch_size
+            )
+            self._store = store if store.available else None
     
     def start_operation(
         self,
@@ -81,14 +143,20 @@ class ProvenanceService:
             if not tool_id or not operation_type:
                 raise ValueError("tool_id and operation_type are required")
             
+            if not self.tracking_policy.enabled:
+                return _UNTRACKED_OPERATION_ID
+            
             if not isinstance(inputs, list):
                 inputs = []
                 
             if parameters is None:
                 parameters = {}
             
+            # Batch/sampled levels keep the operation record but skip per-object indexes
+            indexed = self.tracking_policy.track_in_full()
+            
             # Create operation record
-            operation_id = f"op_{uuid.uuid4().hex[:8]}"
+            operation_id = f"op_{uuid.uuid4().hex[:16]}"
             operation = Operation(
                 id=operation_id,
                 tool_id=tool_id,
@@ -96,7 +164,8 @@ class ProvenanceService:
                 inputs=inputs,
                 outputs=[],  # Will be populated when operation completes
                 parameters=parameters.copy(),
-                started_at=datetime.now()
+                started_at=datetime.now(),
+                indexed=indexed
             )
             
             self.operations[operation_id] = operation
@@ -107,16 +176,17 @@ class ProvenanceService:
             self.tool_stats[tool_id]["calls"] += 1
             
             # Link inputs to this operation
-            for input_ref in inputs:
-                if input_ref not in self.object_to_operations:
-                    self.object_to_operations[input_ref] = set()
-                self.object_to_operations[input_ref].add(operation_id)
+            if indexed:
+                for input_ref in inputs:
+                    if input_ref not in self.object_to_operations:
+                        self.object_to_operations[input_ref] = set()
+                    self.object_to_operations[input_ref].add(operation_id)
             
             return operation_id
             
         except Exception as e:
             # Return a failed operation ID for error tracking
-            error_op_id = f"op_error_{uuid.uuid4().hex[:8]}"
+            error_op_id = f"op_error_{uuid.uuid4().hex[:16]}"
             error_operation = Operation(
                 id=error_op_id,
                 tool_id=tool_id,
@@ -130,6 +200,8 @@ class ProvenanceService:
                 error_message=f"Failed to start operation: {str(e)}"
             )
             self.operations[error_op_id] = error_operation
+            if self._store:
+                self._store.append(self._operation_record(error_operation, -1))
             return error_op_id
     
     def complete_operation(
@@ -152,7 +224,28 @@ class ProvenanceService:
         Returns:
             Operation completion status
         """
+        return self._complete_operation(operation_id, outputs, success, error_message, metadata)
+    
+    def _complete_operation(
+        self,
+        operation_id: str,
+        outputs: List[str],
+        success: bool = True,
+        error_message: Optional[str] = None,
+        metadata: Dict[str, Any] = None,
+        evict: bool = True
+    ) -> Dict[str, Any]:
+        """Complete an operation; batch callers evict cold operations once at the end."""
         try:
+            if operation_id == _UNTRACKED_OPERATION_ID:
+                return {
+                    "status": "success",
+                    "operation_id": operation_id,
+                    "duration_seconds": 0.0,
+                    "outputs_count": len(outputs) if outputs else 0,
+                    "tracked": False
+                }
+            
             if operation_id not in self.operations:
                 return {
                     "status": "error",
@@ -175,14 +268,22 @@ class ProvenanceService:
             else:
                 self.tool_stats[tool_id]["failures"] += 1
             
-            # Link outputs to this operation
-            for output_ref in operation.outputs:
-                if output_ref not in self.object_to_operations:
-                    self.object_to_operations[output_ref] = set()
-                self.object_to_operations[output_ref].add(operation_id)
+            # Link outputs to this operation and create/update their provenance
+            # chain (one shared DAG node)
+            node = -1
+            if operation.indexed:
+                for output_ref in operation.outputs:
+                    if output_ref not in self.object_to_operations:
+                        self.object_to_operations[output_ref] = set()
+                    self.object_to_operations[output_ref].add(operation_id)
                 
-                # Create/update provenance chain for output
-                self._update_provenance_chain(output_ref, operation_id)
+                if operation.outputs:
+                    node = self._link_outputs(operation.outputs, operation_id)
+            
+            if self._store:
+                self._store.append(self._operation_record(operation, node))
+                if evict:
+                    self._evict_cold_operations()
             
             return {
                 "status": "success",
@@ -199,41 +300,166 @@ class ProvenanceService:
                 "error": f"Failed to complete operation: {str(e)}"
             }
     
+    def start_operations(self, operations: List[Dict[str, Any]]) -> List[str]:
+        """Start tracking many operations.
+        
+        Args:
+            operations: start_operation arguments per operation (tool_id,
+                operation_type, inputs, optional parameters)
+            
+        Returns:
+            Operation IDs in input order (failed starts get an op_error_ ID,
+            as with start_operation)
+        """
+        return [
+            self.start_operation(
+                tool_id=operation.get("tool_id"),
+                operation_type=operation.get("operation_type"),
+                inputs=operation.get("inputs", []),
+                parameters=operation.get("parameters")
+            )
+            for operation in operations
+        ]
+    
+    def complete_operations(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Complete many operations and record their outputs.
+        
+        Cold operations are evicted to the log once for the whole batch.
+        
+        Args:
+            completions: complete_operation arguments per operation
+                (operation_id, outputs, optional success, error_message, metadata)
+            
+        Returns:
+            One completion status per item, in input order
+        """
+        try:
+            return [
+                self._complete_operation(
+                    operation_id=completion.get("operation_id"),
+                    outputs=completion.get("outputs", []),
+                    success=completion.get("success", True),
+                    error_message=completion.get("error_message"),
+                    metadata=completion.get("metadata"),
+                    evict=False
+                )
+                for completion in completions
+            ]
+        finally:
+            if self._store:
+                self._evict_cold_operations()
+    
     def _update_provenance_chain(self, object_ref: str, operation_id: str):
         """Update the provenance chain for an object."""
+        self._link_outputs([object_ref], operation_id)
+    
+    def _link_outputs(self, object_refs: List[str], operation_id: str) -> int:
+        """Point outputs at a new DAG node whose parent is the deepest input chain.
+        
+        Returns:
+            Index of the new node, or -1 if it could not be created
+        """
         try:
             operation = self.operations[operation_id]
             
             # Find the longest input chain
-            input_chains = []
+            parent = -1
             for input_ref in operation.inputs:
-                if input_ref in self.operation_chains:
-                    input_chains.append(self.operation_chains[input_ref])
-            
-            # Create new chain
-            if input_chains:
-                # Use the longest input chain as base
-                longest_chain = max(input_chains, key=lambda x: x.depth)
-                new_operations = longest_chain.operations + [operation_id]
-                new_depth = longest_chain.depth + 1
+                node = self._object_nodes.get(input_ref)
+                if node is not None and (parent < 0 or self._node_depth[node] > self._node_depth[parent]):
+                    parent = node
+            
+            # Inputs only known to the log (evicted or from a previous run)
+            cold_parent = None
+            if parent < 0 and self._store:
+                for head in self._cold_chain_heads(operation.inputs):
+                    if head and (cold_parent is None or head[1] > cold_parent[1]):
+                        cold_parent = head
+            
+            if parent >= 0:
+                depth = self._node_depth[parent] + 1
                 # Chain confidence is minimum of all operations
-                new_confidence = min(longest_chain.confidence, 0.95)  # Slight degradation
+                confidence = min(self._node_confidence[parent], _CHAIN_CONFIDENCE)  # Slight degradation
+            elif cold_parent:
+                depth = cold_parent[1] + 1
+                confidence = min(cold_parent[2], _CHAIN_CONFIDENCE)
             else:
                 # This is a root object
-                new_operations = [operation_id]
-                new_depth = 1
-                new_confidence = 0.95  # High confidence for root objects
+                depth = 1
+                confidence = _CHAIN_CONFIDENCE  # High confidence for root objects
             
-            self.operation_chains[object_ref] = ProvenanceChain(
-                target_ref=object_ref,
-                operations=new_operations,
-                depth=new_depth,
-                confidence=new_confidence
-            )
+            node = len(self._op_ids)
+            self._op_ids.append(operation_id)
+            self._node_parent.append(parent)
+            self._node_depth.append(depth)
+            self._node_confidence.append(confidence)
+            if cold_parent:
+                self._cold_parents[node] = cold_parent[0]
+            
+            for object_ref in object_refs:
+                self._object_nodes[object_ref] = node
+            return node
             
         except Exception:
             # Silently fail - provenance chain creation is not critical
-            pass
+            return -1
+    
+    def _cold_chain_heads(self, object_refs: List[str]) -> List[Optional[Tuple[str, int, float]]]:
+        """Log chain heads for objects, reading refs not seen before in one batched query."""
+        missing = [ref for ref in dict.fromkeys(object_refs) if ref not in self._cold_heads]
+        if missing:
+            heads = self._store.get_chain_heads(missing)
+            for ref in missing:
+                self._cold_heads.put(ref, heads.get(ref))
+        return [self._cold_heads.get(ref) for ref in object_refs]
+    
+    def _chain_operation_ids(self, node: int) -> Tuple[str, ...]:
+        """Materialize operation IDs from the root to node, reusing memoized prefixes."""
+        cached = self._lineage_cache.get(node)
+        if cached is not None:
+            return cached
+        
+        path = []
+        prefix: Tuple[str, ...] = ()
+        current = node
+        while current >= 0:
+            cached = self._lineage_cache.get(current)
+            if cached is not None:
+                prefix = cached
+                break
+            path.append(self._op_ids[current])
+            parent = self._node_parent[current]
+            if parent < 0 and current in self._cold_parents:
+                # Ancestors were evicted from memory; resolve them from the log
+                if self._store:
+                    prefix = tuple(self._store.get_chain_operation_ids(self._cold_parents[current]))
+                break
+            current = parent
+        
+        chain = prefix + tuple(reversed(path))
+        self._lineage_cache.put(node, chain)
+        return chain
+    
+    def get_chain(self, object_ref: str) -> Optional[ProvenanceChain]:
+        """Get the provenance chain leading to an object."""
+        node = self._object_nodes.get(object_ref)
+        if node is None:
+            head = self._store.get_chain_head(object_ref) if self._store else None
+            if head is None:
+                return None
+            op_id, depth, confidence = head
+            return ProvenanceChain(
+                target_ref=object_ref,
+                operations=self._store.get_chain_operation_ids(op_id),
+                depth=depth,
+                confidence=confidence
+            )
+        return ProvenanceChain(
+            target_ref=object_ref,
+            operations=list(self._chain_operation_ids(node)),
+            depth=self._node_depth[node],
+            confidence=self._node_confidence[node]
+        )
     
     def get_lineage(self, object_ref: str, max_depth: int = 10) -> Dict[str, Any]:
         """Get the lineage chain for an object.
@@ -246,23 +472,28 @@ class ProvenanceService:
             Lineage information
         """
         try:
-            if object_ref not in self.operation_chains:
+            chain = self.get_chain(object_ref)
+            if chain is None:
                 return {
                     "status": "not_found",
                     "object_ref": object_ref,
                     "lineage": []
                 }
             
-            chain = self.operation_chains[object_ref]
             lineage = []
+            op_ids = chain.operations[:max_depth]
+            cold_operations = self._load_cold_operations(op_ids)
             
             # Build lineage from operations
-            for i, op_id in enumerate(chain.operations):
-                if i >= max_depth:
-                    break
-                    
+            for op_id in op_ids:
                 operation = self.operations.get(op_id)
-                if operation:
+                if operation is None and op_id in cold_operations:
+                    record = cold_operations[op_id]
+                    lineage.append({key: record[key] for key in (
+                        "operation_id", "tool_id", "operation_type", "started_at",
+                        "completed_at", "status", "inputs", "outputs"
+                    )})
+                elif operation:
                     lineage.append({
                         "operation_id": operation.id,
                         "tool_id": operation.tool_id,
@@ -293,7 +524,8 @@ class ProvenanceService:
         try:
             operation = self.operations.get(operation_id)
             if not operation:
-                return None
+                record = self._load_cold_operations([operation_id]).get(operation_id)
+                return self._cold_operation_details(record) if record else None
             
             duration = None
             if operation.completed_at:
@@ -317,15 +549,42 @@ class ProvenanceService:
         except Exception:
             return None
     
+    def get_operations(self, operation_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get details of many operations, reading evicted ones from the log in one query.
+        
+        Returns:
+            get_operation's result per operation ID, in input order (None if not found)
+        """
+        try:
+            cold_operations = self._load_cold_operations(list(operation_ids))
+        except Exception:
+            cold_operations = {}
+        details = []
+        for op_id in operation_ids:
+            if op_id in self.operations:
+                details.append(self.get_operation(op_id))
+            else:
+                record = cold_operations.get(op_id)
+                details.append(self._cold_operation_details(record) if record else None)
+        return details
+    
     def get_operations_for_object(self, object_ref: str) -> List[Dict[str, Any]]:
         """Get all operations that touched an object."""
         try:
-            if object_ref not in self.object_to_operations:
+            op_ids = set(self.object_to_operations.get(object_ref, ()))
+            if self._store:
+                op_ids.update(self._store.get_operation_ids_for_object(object_ref))
+            if not op_ids:
                 return []
             
+            cold_operations = self._load_cold_operations(list(op_ids))
             operations = []
-            for op_id in self.object_to_operations[object_ref]:
-                op_details = self.get_operation(op_id)
+            for op_id in op_ids:
+                if op_id in self.operations:
+                    op_details = self.get_operation(op_id)
+                else:
+                    record = cold_operations.get(op_id)
+                    op_details = self._cold_operation_details(record) if record else None
                 if op_details:
                     operations.append(op_details)
             
@@ -336,6 +595,131 @@ class ProvenanceService:
         except Exception:
             return []
     
+    def _load_cold_operations(self, op_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load operations that are no longer in memory from the log."""
+        if not self._store:
+            return {}
+        missing = [op_id for op_id in op_ids if op_id not in self.operations]
+        return self._store.get_operations(missing) if missing else {}
+    
+    @staticmethod
+    def _cold_operation_details(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a logged operation like get_operation's result."""
+        details = {key: value for key, value in record.items()
+                   if key not in ("parent_op_id", "depth", "confidence")}
+        details["duration_seconds"] = None
+        if record["completed_at"]:
+            details["duration_seconds"] = (
+                datetime.fromisoformat(record["completed_at"]) - datetime.fromisoformat(record["started_at"])
+            ).total_seconds()
+        return details
+    
+    def _operation_record(self, operation: Operation, node: int) -> Dict[str, Any]:
+        """Serialize a completed operation with its DAG position for the log."""
+        record = {
+            "operation_id": operation.id,
+            "tool_id": operation.tool_id,
+            "operation_type": operation.operation_type,
+            "inputs": list(operation.inputs or []),
+            "outputs": list(operation.outputs or []),
+            "parameters": operation.parameters,
+            "started_at": operation.started_at.isoformat(),
+            "completed_at": operation.completed_at.isoformat() if operation.completed_at else None,
+            "status": operation.status,
+            "error_message": operation.error_message,
+            "metadata": operation.metadata,
+            "indexed": operation.indexed
+        }
+        if node >= 0:
+            parent = self._node_parent[node]
+            record["parent_op_id"] = self._op_ids[parent] if parent >= 0 else self._cold_parents.get(node)
+            record["depth"] = self._node_depth[node]
+            record["confidence"] = self._node_confidence[node]
+        return record
+    
+    def _evict_cold_operations(self):
+        """Keep at most hot_window_operations in memory once they are durable."""
+        if len(self.operations) <= self.hot_window_operations:
+            return
+        
+        # Evict down to 90% of the window so eviction cost is amortized
+        excess = len(self.operations) - int(self.hot_window_operations * 0.9)
+        evicted = set()
+        for op_id, operation in self.operations.items():
+            if len(evicted) >= excess:
+                break
+            if operation.status != "running":
+                evicted.add(op_id)
+        
+        self._store.flush()
+        self._drop_operations(evicted)
+    
+    def _drop_operations(self, op_ids: Set[str]):
+        """Remove operations from memory and compact the DAG around them."""
+        if not op_ids:
+            return
+        
+        for op_id in op_ids:
+            operation = self.operations.pop(op_id, None)
+            if operation is None:
+                continue
+            for obj_ref in operation.inputs + operation.outputs:
+                if obj_ref in self.object_to_operations:
+                    self.object_to_operations[obj_ref].discard(op_id)
+                    if not self.object_to_operations[obj_ref]:
+                        del self.object_to_operations[obj_ref]
+        
+        new_index: Dict[int, int] = {}
+        op_ids_kept: List[str] = []
+        parents, depths, confidences = array('l'), array('l'), array('d')
+        cold_parents: Dict[int, str] = {}
+        for node, op_id in enumerate(self._op_ids):
+            if op_id in op_ids:
+                continue
+            new_node = len(op_ids_kept)
+            new_index[node] = new_node
+            op_ids_kept.append(op_id)
+            depths.append(self._node_depth[node])
+            confidences.append(self._node_confidence[node])
+            
+            parent = self._node_parent[node]
+            if parent >= 0 and parent in new_index:
+                parents.append(new_index[parent])
+            else:
+                parents.append(-1)
+                cold_parent = self._op_ids[parent] if parent >= 0 else self._cold_parents.get(node)
+                if cold_parent:
+                    cold_parents[new_node] = cold_parent
+        
+        # Evicted chain heads are served from memory when later operations use them as inputs
+        object_nodes = {}
+        for object_ref, node in self._object_nodes.items():
+            if node in new_index:
+                object_nodes[object_ref] = new_index[node]
+            else:
+                self._cold_heads.put(
+                    object_ref, (self._op_ids[node], self._node_depth[node], self._node_confidence[node])
+                )
+        
+        self._op_ids = op_ids_kept
+        self._node_parent = parents
+        self._node_depth = depths
+        self._node_confidence = confidences
+        self._cold_parents = cold_parents
+        self._object_nodes = object_nodes
+        self._lineage_cache.clear()
+    
+    def flush(self):
+        """Block until all completed operations are written to the log."""
+        if self._store:
+            self._store.flush()
+    
+    def close(self):
+        """Flush and close the operation log."""
+        if self._store:
+            self._store.close()
+            self._store = None
+    
     def get_tool_statistics(self) -> Dict[str, Any]:
         """Get statistics about tool usage."""
         try:
@@ -356,7 +740,9 @@ class ProvenanceService:
                 "status": "success",
                 "tool_statistics": stats,
                 "total_operations": len(self.operations),
-                "total_objects_tracked": len(self.object_to_operations)
+                "total_objects_tracked": len(self.object_to_operations),
+                "persistence_enabled": self._store is not None,
+                "logged_operations": self._store.count() if self._store else None
             }
             
         except Exception as e:
@@ -366,35 +752,25 @@ class ProvenanceService:
             }
     
     def cleanup_old_operations(self, days_old: int = 30) -> Dict[str, Any]:
-        """Remove operations older than specified days."""
+        """Remove operations older than specified days from memory and the log."""
         try:
-            cutoff_date = datetime.now() - datetime.timedelta(days=days_old)
-            removed_count = 0
+            cutoff_date = datetime.now() - timedelta(days=days_old)
             
             # Find old operations
-            old_operation_ids = []
-            for op_id, operation in self.operations.items():
-                if operation.started_at < cutoff_date:
-                    old_operation_ids.append(op_id)
-            
-            # Remove operations and update indices
-            for op_id in old_operation_ids:
-                operation = self.operations[op_id]
-                
-                # Remove from object-to-operations mapping
-                for obj_ref in operation.inputs + operation.outputs:
-                    if obj_ref in self.object_to_operations:
-                        self.object_to_operations[obj_ref].discard(op_id)
-                        if not self.object_to_operations[obj_ref]:
-                            del self.object_to_operations[obj_ref]
-                
-                # Remove operation
-                del self.operations[op_id]
-                removed_count += 1
+            old_operation_ids = {
+                op_id for op_id, operation in self.operations.items()
+                if operation.started_at < cutoff_date
+            }
+            self._drop_operations(old_operation_ids)
+            
+            removed_logged = self._store.delete_older_than(cutoff_date.isoformat()) if self._store else 0
+            # Cached heads may point at removed operations
+            self._cold_heads.clear()
             
             return {
                 "status": "success",
-                "removed_operations": removed_count,
+                "removed_operations": len(old_operation_ids),
+                "removed_logged_operations": removed_logged,
                 "cutoff_date": cutoff_date.isoformat()
             }
             
@@ -402,4 +778,4 @@ class ProvenanceService:
             return {
                 "status": "error",
                 "error": f"Failed to cleanup: {str(e)}"
-            }
\ No newline at end of file
+            }
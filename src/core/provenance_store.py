@@ -0,0 +1,316 @@
+"""Provenance Store - Durable append-only operation log
+
+Persists completed provenance operations to SQLite (WAL mode) so lineage
+survives restarts and ProvenanceService can keep only a bounded hot window
+in memory. Writes are queued and applied by a background thread in batched
+transactions; reads go straight to the indexed tables.
+
+Each operation row carries its provenance DAG parent (parent_op_id), so
+lineage for cold objects is resolved with a recursive query.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_SQL_BATCH = 500
+
+
+class ProvenanceStore:
+    """Append-only SQLite log of completed provenance operations."""
+
+    def __init__(self, log_path: str, flush_interval_seconds: float = 1.0, flush_batch_size: int = 500):
+        """Open (or create) the log and start the background writer.
+
+        Args:
+            log_path: Path to the SQLite log database
+            flush_interval_seconds: Maximum time a queued operation waits before being written
+            flush_batch_size: Maximum operations written per transaction
+        """
+        self.log_path = log_path
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_batch_size = flush_batch_size
+
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._db_conn = None
+        self._writer = None
+        self.written = 0
+
+        self._init_database()
+        if self._db_conn:
+            self._writer = threading.Thread(target=self._write_loop, name="provenance-writer", daemon=True)
+            self._writer.start()
+            # Queued operations are written before interpreter shutdown
+            atexit.register(self.close)
+
+    @property
+    def available(self) -> bool:
+        return self._db_conn is not None
+
+    def _init_database(self):
+        """Initialize SQLite log database."""
+        try:
+            Path(self.log_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.log_path, check_same_thread=False, timeout=30.0)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS operations (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    op_id TEXT UNIQUE NOT NULL,
+                    tool_id TEXT,
+                    operation_type TEXT,
+                    inputs TEXT,
+                    outputs TEXT,
+                    parameters TEXT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    status TEXT,
+                    error_message TEXT,
+                    metadata TEXT,
+                    parent_op_id TEXT,
+                    depth INTEGER,
+                    confidence REAL
+                )
+            """)
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS object_operations (
+                    object_ref TEXT NOT NULL,
+                    op_id TEXT NOT NULL,
+                    is_output INTEGER NOT NULL
+                )
+            """)
+            self._db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_object_operations_ref ON object_operations(object_ref)"
+            )
+            self._db_conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_operations_started ON operations(started_at)"
+            )
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize provenance log at {self.log_path}: {e}")
+            self._db_conn = None
+
+    def append(self, record: Dict[str, Any]):
+        """Queue a completed operation record for writing."""
+        if self._db_conn:
+            self._queue.put(record)
+
+    def _write_loop(self):
+        """Background writer: drain the queue in batched transactions."""
+        while True:
+            try:
+                record = self._queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                continue
+
+            batch = [record]
+            while len(batch) < self.flush_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [r for r in batch if r is not None]
+            if records:
+                self._write_batch(records)
+            for _ in batch:
+                self._queue.task_done()
+
+            if any(r is None for r in batch):
+                return
+
+    def _write_batch(self, records: List[Dict[str, Any]]):
+        try:
+            with self._lock:
+                self._db_conn.executemany("""
+                    INSERT OR REPLACE INTO operations
+                    (op_id, tool_id, operation_type, inputs, outputs, parameters, started_at,
+                     completed_at, status, error_message, metadata, parent_op_id, depth, confidence)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(
+                    r["operation_id"], r["tool_id"], r["operation_type"],
+                    json.dumps(r["inputs"]), json.dumps(r["outputs"]),
+                    json.dumps(r["parameters"], default=str),
+                    r["started_at"], r["completed_at"], r["status"], r["error_message"],
+                    json.dumps(r["metadata"], default=str),
+                    r.get("parent_op_id"), r.get("depth"), r.get("confidence")
+                ) for r in records])
+                self._db_conn.executemany(
+                    "INSERT INTO object_operations (object_ref, op_id, is_output) VALUES (?, ?, ?)",
+                    [(ref, r["operation_id"], 0) for r in records if r.get("indexed", True) for ref in r["inputs"]] +
+                    [(ref, r["operation_id"], 1) for r in records if r.get("indexed", True) for ref in r["outputs"]]
+                )
+                self._db_conn.commit()
+            self.written += len(records)
+        except Exception as e:
+            logger.error(f"Failed to write {len(records)} provenance operations: {e}")
+
+    def flush(self):
+        """Block until every queued operation has been written."""
+        if self._writer and self._writer.is_alive():
+            self._queue.join()
+
+    @staticmethod
+    def _row_to_operation(row) -> Dict[str, Any]:
+        (op_id, tool_id, operation_type, inputs, outputs, parameters, started_at,
+         completed_at, status, error_message, metadata, parent_op_id, depth, confidence) = row
+        return {
+            "operation_id": op_id,
+            "tool_id": tool_id,
+            "operation_type": operation_type,
+            "inputs": json.loads(inputs) if inputs else [],
+            "outputs": json.loads(outputs) if outputs else [],
+            "parameters": json.loads(parameters) if parameters else {},
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "status": status,
+            "error_message": error_message,
+            "metadata": json.loads(metadata) if metadata else {},
+            "parent_op_id": parent_op_id,
+            "depth": depth,
+            "confidence": confidence
+        }
+
+    _OPERATION_COLUMNS = """op_id, tool_id, operation_type, inputs, outputs, parameters, started_at,
+        completed_at, status, error_message, metadata, parent_op_id, depth, confidence"""
+
+    def get_operations(self, op_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load operation records by ID."""
+        found = {}
+        if not self._db_conn or not op_ids:
+            return found
+        try:
+            with self._lock:
+                for start in range(0, len(op_ids), _SQL_BATCH):
+                    chunk = op_ids[start:start + _SQL_BATCH]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._db_conn.execute(
+                        f"SELECT {self._OPERATION_COLUMNS} FROM operations WHERE op_id IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    for row in rows:
+                        found[row[0]] = self._row_to_operation(row)
+        except Exception as e:
+            logger.error(f"Failed to read provenance log: {e}")
+        return found
+
+    def get_operation_ids_for_object(self, object_ref: str) -> List[str]:
+        """IDs of logged operations that used or produced an object."""
+        if not self._db_conn:
+            return []
+        try:
+            with self._lock:
+                rows = self._db_conn.execute(
+                    "SELECT DISTINCT op_id FROM object_operations WHERE object_ref = ?",
+                    (object_ref,)
+                ).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to read provenance log: {e}")
+            return []
+
+    def get_chain_head(self, object_ref: str) -> Optional[Tuple[str, int, float]]:
+        """Most recent logged operation that produced an object: (op_id, depth, confidence)."""
+        if not self._db_conn:
+            return None
+        try:
+            with self._lock:
+                return self._db_conn.execute("""
+                    SELECT o.op_id, o.depth, o.confidence
+                    FROM object_operations r JOIN operations o ON o.op_id = r.op_id
+                    WHERE r.object_ref = ? AND r.is_output = 1 AND o.depth IS NOT NULL
+                    ORDER BY o.seq DESC LIMIT 1
+                """, (object_ref,)).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to read provenance log: {e}")
+            return None
+
+    def get_chain_heads(self, object_refs: List[str]) -> Dict[str, Tuple[str, int, float]]:
+        """get_chain_head for many objects in one query per _SQL_BATCH refs; refs without a chain are omitted."""
+        heads: Dict[str, Tuple[str, int, float]] = {}
+        if not self._db_conn or not object_refs:
+            return heads
+        try:
+            with self._lock:
+                for start in range(0, len(object_refs), _SQL_BATCH):
+                    chunk = object_refs[start:start + _SQL_BATCH]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._db_conn.execute(f"""
+                        SELECT r.object_ref, o.op_id, o.depth, o.confidence
+                        FROM object_operations r JOIN operations o ON o.op_id = r.op_id
+                        WHERE r.object_ref IN ({placeholders}) AND r.is_output = 1 AND o.depth IS NOT NULL
+                        ORDER BY o.seq
+                    """, chunk).fetchall()
+                    # Ascending seq: the most recent operation per object wins
+                    for object_ref, op_id, depth, confidence in rows:
+                        heads[object_ref] = (op_id, depth, confidence)
+        except Exception as e:
+            logger.error(f"Failed to read provenance log: {e}")
+        return heads
+
+    def get_chain_operation_ids(self, op_id: str) -> List[str]:
+        """Operation IDs from the DAG root down to op_id, following parent_op_id."""
+        if not self._db_conn:
+            return []
+        try:
+            with self._lock:
+                rows = self._db_conn.execute("""
+                    WITH RECURSIVE chain(op_id, parent_op_id, level) AS (
+                        SELECT op_id, parent_op_id, 0 FROM operations WHERE op_id = ?
+                        UNION ALL
+                        SELECT o.op_id, o.parent_op_id, chain.level + 1
+                        FROM operations o JOIN chain ON o.op_id = chain.parent_op_id
+                    )
+                    SELECT op_id FROM chain ORDER BY level DESC
+                """, (op_id,)).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to read provenance log: {e}")
+            return []
+
+    def delete_older_than(self, cutoff_iso: str) -> int:
+        """Remove logged operations started before the cutoff."""
+        if not self._db_conn:
+            return 0
+        self.flush()
+        try:
+            with self._lock:
+                self._db_conn.execute("""
+                    DELETE FROM object_operations WHERE op_id IN (
+                        SELECT op_id FROM operations WHERE started_at < ?
+                    )
+                """, (cutoff_iso,))
+                cursor = self._db_conn.execute("DELETE FROM operations WHERE started_at < ?", (cutoff_iso,))
+                self._db_conn.commit()
+            return max(cursor.rowcount, 0)
+        except Exception as e:
+            logger.error(f"Failed to clean provenance log: {e}")
+            return 0
+
+    def count(self) -> Optional[int]:
+        if not self._db_conn:
+            return None
+        try:
+            with self._lock:
+                return self._db_conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+        except Exception:
+            return None
+
+    def close(self):
+        """Flush pending writes, stop the writer and close the log."""
+        if self._writer and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._db_conn:
+            self._db_conn.close()
+            self._db_conn = None
@@ -9,6 +9,10 @@ This is a MINIMAL implementation focusing on:
 - Quality tier assignment (HIGH/MEDIUM/LOW)
 - Confidence degradation modeling
 
+Batch APIs (assess_confidence_batch, propagate_confidence_batch) score whole
+arrays of objects with NumPy. Assessments are stored column-wise (confidence,
+tier and timestamp arrays) behind a dict-like view.
+
 Deferred features:
 - Complex aggregation algorithms
 - Machine learning quality models
@@ -16,12 +20,17 @@ Deferred features:
 - Quality-based filtering optimizations
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Sequence, Union
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import statistics
 import math
+import time
+import numpy as np
+
+from .tracking_policy import TrackingPolicy, get_tracking_policy
 
 
 class QualityTier(Enum):
@@ -42,6 +51,142 @@ class QualityAssessment:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_TIERS = [QualityTier.HIGH, QualityTier.MEDIUM, QualityTier.LOW]
+_TIER_CODES = {tier: code for code, tier in enumerate(_TIERS)}
+
+
+def _tier_codes(confidences: np.ndarray) -> np.ndarray:
+    """Vectorized tier assignment (codes index into _TIERS)."""
+    return np.where(confidences >= 0.8, 0, np.where(confidences >= 0.5, 1, 2)).astype(np.int8)
+
+
+class AssessmentStore(MutableMapping):
+    """Column-oriented assessment storage with a dict-like QualityAssessment view.
+    
+    Confidences, tiers and timestamps live in growable NumPy arrays indexed
+    by row; factors and metadata are kept per row only when provided.
+    """
+    
+    def __init__(self, initial_capacity: int = 1024):
+        self._index: Dict[str, int] = {}
+        self._refs: List[str] = []
+        self._confidence = np.zeros(initial_capacity, dtype=np.float64)
+        self._tier = np.zeros(initial_capacity, dtype=np.int8)
+        self._assessed_at = np.zeros(initial_capacity, dtype=np.float64)
+        self._factors: List[Optional[Dict[str, float]]] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+    
+    def _reserve(self, extra: int):
+        needed = len(self._refs) + extra
+        capacity = len(self._confidence)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_confidence", "_tier", "_assessed_at"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def _rows_for(self, object_refs: Sequence[str]) -> np.ndarray:
+        """Row indices for refs, inserting rows for new refs."""
+        new_refs = [ref for ref in dict.fromkeys(object_refs) if ref not in self._index]
+        self._reserve(len(new_refs))
+        for ref in new_refs:
+            self._index[ref] = len(self._refs)
+            self._refs.append(ref)
+            self._factors.append(None)
+            self._metadata.append(None)
+        return np.fromiter((self._index[ref] for ref in object_refs), dtype=np.int64, count=len(object_refs))
+    
+    def set_many(
+        self,
+        object_refs: Sequence[str],
+        confidences: np.ndarray,
+        tier_codes: np.ndarray,
+        assessed_at: float,
+        factors: Optional[Sequence[Optional[Dict[str, float]]]] = None,
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+    ):
+        """Store assessments for many objects at once."""
+        rows = self._rows_for(object_refs)
+        self._confidence[rows] = confidences
+        self._tier[rows] = tier_codes
+        self._assessed_at[rows] = assessed_at
+        for position, row in enumerate(rows.tolist()):
+            self._factors[row] = factors[position] if factors is not None else None
+            self._metadata[row] = metadata[position] if metadata is not None else None
+    
+    def lookup_confidences(self, object_refs: Sequence[str], default: float) -> np.ndarray:
+        """Confidence per ref, default for refs without an assessment."""
+        index = self._index
+        rows = np.fromiter((index.get(ref, -1) for ref in object_refs), dtype=np.int64, count=len(object_refs))
+        found = rows >= 0
+        values = np.full(len(object_refs), default, dtype=np.float64)
+        values[found] = self._confidence[rows[found]]
+        return values
+    
+    def lookup_rows(self, object_refs: Sequence[str]) -> np.ndarray:
+        """Row per ref, -1 for refs without an assessment."""
+        index = self._index
+        return np.fromiter((index.get(ref, -1) for ref in object_refs), dtype=np.int64, count=len(object_refs))
+    
+    @property
+    def confidences(self) -> np.ndarray:
+        return self._confidence[:len(self._refs)]
+    
+    @property
+    def tier_codes(self) -> np.ndarray:
+        return self._tier[:len(self._refs)]
+    
+    def __getitem__(self, object_ref: str) -> QualityAssessment:
+        row = self._index[object_ref]
+        return QualityAssessment(
+            object_ref=object_ref,
+            confidence=float(self._confidence[row]),
+            quality_tier=_TIERS[self._tier[row]],
+            factors=self._factors[row] or {},
+            assessed_at=datetime.fromtimestamp(self._assessed_at[row]),
+            metadata=self._metadata[row] or {}
+        )
+    
+    def __setitem__(self, object_ref: str, assessment: QualityAssessment):
+        self.set_many(
+            [object_ref],
+            np.array([assessment.confidence]),
+            np.array([_TIER_CODES[assessment.quality_tier]], dtype=np.int8),
+            assessment.assessed_at.timestamp(),
+            factors=[assessment.factors],
+            metadata=[assessment.metadata]
+        )
+    
+    def __delitem__(self, object_ref: str):
+        # Move the last row into the freed slot
+        row = self._index.pop(object_ref)
+        last = len(self._refs) - 1
+        if row != last:
+            last_ref = self._refs[last]
+            self._refs[row] = last_ref
+            self._index[last_ref] = row
+            for column in (self._confidence, self._tier, self._assessed_at):
+                column[row] = column[last]
+            self._factors[row] = self._factors[last]
+            self._metadata[row] = self._metadata[last]
+        self._refs.pop()
+        self._factors.pop()
+        self._metadata.pop()
+    
+    def __contains__(self, object_ref: object) -> bool:
+        return object_ref in self._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._refs))
+    
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
 @dataclass
 class QualityRule:
     """Rule for quality propagation."""
@@ -55,11 +200,16 @@ class QualityRule:
 class QualityService:
     """T111: Quality Service - Confidence management and propagation."""
     
-    def __init__(self):
-        self.assessments: Dict[str, QualityAssessment] = {}
+    def __init__(self, tracking_policy: Optional[TrackingPolicy] = None):
+        self.tracking_policy = tracking_policy or get_tracking_policy()
+        self.assessments = AssessmentStore()
         self.quality_rules: Dict[str, QualityRule] = {}
         self.confidence_history: Dict[str, List[Tuple[datetime, float]]] = {}
         
+        # Rule lookup by operation type, rebuilt when quality_rules changes size
+        self._rules_by_source_type: Dict[str, QualityRule] = {}
+        self._indexed_rule_count = -1
+        
         # Initialize default quality rules
         self._initialize_default_rules()
     
@@ -105,6 +255,25 @@ class QualityService:
         
         for rule in default_rules:
             self.quality_rules[rule.rule_id] = rule
+        self._index_rules()
+    
+    def add_quality_rule(self, rule: QualityRule):
+        """Add or replace a propagation rule."""
+        self.quality_rules[rule.rule_id] = rule
+        self._index_rules()
+    
+    def _index_rules(self):
+        """Index rules by source type (first rule per type wins, as in a linear scan)."""
+        index = {}
+        for rule in self.quality_rules.values():
+            index.setdefault(rule.source_type, rule)
+        self._rules_by_source_type = index
+        self._indexed_rule_count = len(self.quality_rules)
+    
+    def _rule_for(self, operation_type: str) -> Optional[QualityRule]:
+        if self._indexed_rule_count != len(self.quality_rules):
+            self._index_rules()
+        return self._rules_by_source_type.get(operation_type)
     
     def assess_confidence(
         self,
@@ -144,6 +313,18 @@ class QualityService:
             # Determine quality tier
             quality_tier = self._determine_quality_tier(adjusted_confidence)
             
+            # Outside full tracking only sampled objects are recorded
+            if not self.tracking_policy.track_in_full():
+                return {
+                    "status": "success",
+                    "object_ref": object_ref,
+                    "confidence": adjusted_confidence,
+                    "quality_tier": quality_tier.value,
+                    "factors": factors,
+                    "assessed_at": None,
+                    "tracked": False
+                }
+            
             # Create assessment
             assessment = QualityAssessment(
                 object_ref=object_ref,
@@ -181,6 +362,214 @@ class QualityService:
                 "confidence": 0.0
             }
     
+    def assess_confidence_batch(
+        self,
+        object_refs: Sequence[str],
+        base_confidences: Sequence[float],
+        factors: Dict[str, Sequence[float]] = None,
+        metadata: Union[Dict[str, Any], Sequence[Dict[str, Any]], None] = None
+    ) -> Dict[str, Any]:
+        """Assess and record confidence for many objects at once.
+        
+        Vectorized equivalent of assess_confidence for each object.
+        
+        Args:
+            object_refs: References to objects being assessed
+            base_confidences: Base confidence score per object (0.0-1.0)
+            factors: Factor name -> one value per object
+            metadata: Metadata shared by all objects, or one dict per object
+            
+        Returns:
+            Batch result with confidences and quality tiers in input order
+        """
+        try:
+            base = np.asarray(base_confidences, dtype=np.float64)
+            if len(base) != len(object_refs):
+                return {"status": "error", "error": "object_refs and base_confidences must have the same length"}
+            
+            invalid = np.flatnonzero((base < 0.0) | (base > 1.0) | np.isnan(base))
+            if invalid.size:
+                return {
+                    "status": "error",
+                    "error": "Confidence must be between 0.0 and 1.0",
+                    "invalid_indices": invalid.tolist()
+                }
+            
+            # Same weighted average as _apply_confidence_factors: base weight 1.0, each factor 0.2
+            factors = factors or {}
+            factor_columns = {name: np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0)
+                              for name, values in factors.items()}
+            weighted_sum = base.copy()
+            for column in factor_columns.values():
+                weighted_sum += column * 0.2
+            adjusted = np.clip(weighted_sum / (1.0 + 0.2 * len(factor_columns)), 0.0, 1.0)
+            tiers = _tier_codes(adjusted)
+            
+            # Store only objects selected for full tracking
+            tracked_rows = np.flatnonzero(self.tracking_policy.full_tracking_mask(len(base))).tolist()
+            if tracked_rows:
+                now = time.time()
+                refs = [object_refs[i] for i in tracked_rows]
+                row_factors = [{name: float(values[i]) for name, values in factors.items()} for i in tracked_rows] if factors else None
+                if isinstance(metadata, dict):
+                    shared = dict(metadata)
+                    row_metadata = [shared] * len(tracked_rows)
+                elif metadata is not None:
+                    row_metadata = [dict(metadata[i]) for i in tracked_rows]
+                else:
+                    row_metadata = None
+                self.assessments.set_many(refs, adjusted[tracked_rows], tiers[tracked_rows], now,
+                                          factors=row_factors, metadata=row_metadata)
+                
+                timestamp = datetime.fromtimestamp(now)
+                for ref, confidence in zip(refs, adjusted[tracked_rows].tolist()):
+                    history = self.confidence_history.setdefault(ref, [])
+                    history.append((timestamp, confidence))
+                    if len(history) > 10:
+                        del history[:-10]
+            
+            return {
+                "status": "success",
+                "object_refs": list(object_refs),
+                "confidences": adjusted.tolist(),
+                "quality_tiers": [_TIERS[code].value for code in tiers.tolist()],
+                "tracked_count": len(tracked_rows)
+            }
+            
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Failed to assess confidence batch: {str(e)}"
+            }
+
+    def assess_confidences(self, assessments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assess many objects given as assess_confidence argument dicts.
+
+        Unlike assess_confidence_batch, invalid items fail individually.
+        Valid items are grouped by their factor names and each group is
+        assessed with one vectorized assess_confidence_batch call.
+
+        Args:
+            assessments: Items with object_ref, base_confidence and optional
+                factors and metadata
+
+        Returns:
+            Batch result with one status per item, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(assessments)
+        factor_values: Dict[int, Dict[str, float]] = {}
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, item in enumerate(assessments):
+            object_ref = item.get("object_ref") if isinstance(item, dict) else None
+            base = item.get("base_confidence") if isinstance(item, dict) else None
+            if not object_ref or not isinstance(base, (int, float)) or not (0.0 <= base <= 1.0):
+                results[i] = {
+                    "status": "error",
+                    "object_ref": object_ref,
+                    "error": "object_ref and a base_confidence between 0.0 and 1.0 are required",
+                    "confidence": 0.0
+                }
+                continue
+            # Convert factors here so one bad value fails its item, not its group
+            try:
+                factors = {str(name): float(value) for name, value in (item.get("factors") or {}).items()}
+                if any(math.isnan(value) for value in factors.values()):
+                    raise ValueError("factor values must be numbers")
+            except (AttributeError, TypeError, ValueError) as e:
+                results[i] = {"status": "error", "object_ref": object_ref,
+                              "error": f"Invalid factors: {e}", "confidence": 0.0}
+                continue
+            factor_values[i] = factors
+            groups.setdefault(tuple(sorted(factors)), []).append(i)
+
+        for factor_names, rows in groups.items():
+            items = [assessments[i] for i in rows]
+            batch = self.assess_confidence_batch(
+                [item["object_ref"] for item in items],
+                [float(item["base_confidence"]) for item in items],
+                factors={name: [factor_values[i][name] for i in rows] for name in factor_names},
+                metadata=[item.get("metadata") or {} for item in items]
+            )
+            for j, i in enumerate(rows):
+                if batch["status"] != "success":
+                    results[i] = {"status": "error", "object_ref": items[j]["object_ref"],
+                                  "error": batch["error"], "confidence": 0.0}
+                    continue
+                results[i] = {
+                    "status": "success",
+                    "object_ref": items[j]["object_ref"],
+                    "confidence": batch["confidences"][j],
+                    "quality_tier": batch["quality_tiers"][j],
+                    "factors": factor_values[i]
+                }
+
+        assessed = sum(1 for r in results if r["status"] == "success")
+        return {
+            "status": "success",
+            "results": results,
+            "assessed_count": assessed,
+            "error_count": len(results) - assessed
+        }
+
+    def record_batch_assessment(
+        self,
+        batch_ref: str,
+        confidences: List[float],
+        metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Record one aggregate assessment for a batch of objects.
+        
+        Only recorded at the batch and sampled tracking levels, where
+        per-object assessments are skipped; tools call this once per batch.
+        
+        Args:
+            batch_ref: Reference for the batch (typically the operation ID)
+            confidences: Confidence scores of the objects in the batch
+            metadata: Additional assessment metadata
+            
+        Returns:
+            Aggregate assessment result, or status "skipped"
+        """
+        if not self.tracking_policy.records_batches:
+            return {"status": "skipped", "object_ref": batch_ref}
+        
+        try:
+            valid = [c for c in confidences if 0.0 <= c <= 1.0]
+            confidence = statistics.fmean(valid) if valid else 0.0
+            quality_tier = self._determine_quality_tier(confidence)
+            
+            batch_metadata = dict(metadata) if metadata else {}
+            batch_metadata.update({
+                "batch": True,
+                "object_count": len(valid),
+                "min_confidence": min(valid) if valid else 0.0,
+                "max_confidence": max(valid) if valid else 0.0
+            })
+            
+            assessment = QualityAssessment(
+                object_ref=batch_ref,
+                confidence=confidence,
+                quality_tier=quality_tier,
+                factors={},
+                metadata=batch_metadata
+            )
+            self.assessments[batch_ref] = assessment
+            
+            return {
+                "status": "success",
+                "object_ref": batch_ref,
+                "confidence": confidence,
+                "quality_tier": quality_tier.value,
+                "object_count": len(valid),
+                "assessed_at": assessment.assessed_at.isoformat()
+            }
+            
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Failed to record batch assessment: {str(e)}"
+            }
+    
     def _apply_confidence_factors(self, base_confidence: float, factors: Dict[str, float]) -> float:
         """Apply confidence factors to base confidence."""
         if not factors:
@@ -231,15 +620,8 @@ class QualityService:
             if not input_refs:
                 return 0.5  # Default confidence for operations with no inputs
             
-            # Get confidence scores for inputs
-            input_confidences = []
-            for ref in input_refs:
-                assessment = self.assessments.get(ref)
-                if assessment:
-                    input_confidences.append(assessment.confidence)
-                else:
-                    # Default confidence for unknown objects
-                    input_confidences.append(0.7)
+            # Get confidence scores for inputs (default confidence for unknown objects)
+            input_confidences = self.assessments.lookup_confidences(input_refs, default=0.7).tolist()
             
             # Calculate base propagated confidence
             if len(input_confidences) == 1:
@@ -269,22 +651,69 @@ class QualityService:
     
     def _get_degradation_factor(self, operation_type: str) -> float:
         """Get degradation factor for operation type."""
-        for rule in self.quality_rules.values():
-            if rule.source_type == operation_type:
-                return rule.degradation_factor
+        rule = self._rule_for(operation_type)
+        if rule:
+            return rule.degradation_factor
         
         # Default degradation for unknown operations
         return 0.9
     
     def _get_min_confidence(self, operation_type: str) -> float:
         """Get minimum confidence for operation type."""
-        for rule in self.quality_rules.values():
-            if rule.source_type == operation_type:
-                return rule.min_confidence
+        rule = self._rule_for(operation_type)
+        if rule:
+            return rule.min_confidence
         
         # Default minimum confidence
         return 0.1
     
+    def propagate_confidence_batch(
+        self,
+        input_refs_list: Sequence[Sequence[str]],
+        operation_type: str,
+        boost_factor: float = 1.0
+    ) -> np.ndarray:
+        """Propagate confidence for many outputs at once.
+        
+        Vectorized equivalent of calling propagate_confidence once per
+        element of input_refs_list.
+        
+        Args:
+            input_refs_list: Input references for each output
+            operation_type: Type of operation being performed
+            boost_factor: Factor to boost/reduce confidence
+            
+        Returns:
+            Array of propagated confidence scores, one per output
+        """
+        counts = np.fromiter((len(refs) for refs in input_refs_list), dtype=np.int64, count=len(input_refs_list))
+        result = np.full(len(counts), 0.5)  # Default confidence for operations with no inputs
+        has_inputs = counts > 0
+        if not has_inputs.any():
+            return result
+        
+        flat_refs = [ref for refs in input_refs_list for ref in refs]
+        confidences = self.assessments.lookup_confidences(flat_refs, default=0.7)
+        
+        # Harmonic mean per output over its inputs (zero confidences excluded from the sum)
+        inverse = np.divide(1.0, confidences, out=np.zeros_like(confidences), where=confidences > 0)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[has_inputs]
+        inverse_sums = np.add.reduceat(inverse, starts)
+        single = counts[has_inputs] == 1
+        
+        with np.errstate(divide="ignore"):
+            harmonic = counts[has_inputs] / inverse_sums
+        base = np.where(single, confidences[starts], harmonic)
+        
+        propagated = base * self._get_degradation_factor(operation_type) * boost_factor
+        propagated = np.maximum(propagated, self._get_min_confidence(operation_type))
+        propagated = np.clip(propagated, 0.0, 1.0)
+        # Conservative confidence where the harmonic mean is undefined
+        propagated[~single & (inverse_sums == 0)] = 0.3
+        
+        result[has_inputs] = propagated
+        return result
+    
     def get_quality_assessment(self, object_ref: str) -> Optional[Dict[str, Any]]:
         """Get quality assessment for an object."""
         try:
@@ -303,7 +732,23 @@ class QualityService:
             
         except Exception:
             return None
-    
+
+    def get_quality_assessments(self, object_refs: List[str]) -> List[Dict[str, Any]]:
+        """Get quality assessments for many objects.
+
+        Returns:
+            One result per object, in input order: the get_quality_assessment
+            fields with status "success", or status "not_found"
+        """
+        results = []
+        for object_ref in object_refs:
+            assessment = self.get_quality_assessment(object_ref)
+            if assessment is None:
+                results.append({"status": "not_found", "object_ref": object_ref})
+            else:
+                results.append({"status": "success", **assessment})
+        return results
+
     def get_confidence_trend(self, object_ref: str) -> Dict[str, Any]:
         """Get confidence trend for an object."""
         try:
@@ -384,29 +829,16 @@ class QualityService:
     ) -> List[str]:
         """Filter objects by quality criteria."""
         try:
-            filtered = []
+            rows = self.assessments.lookup_rows(object_refs)
+            found = rows >= 0
+            safe_rows = np.where(found, rows, 0)
             
-            for ref in object_refs:
-                assessment = self.assessments.get(ref)
-                if not assessment:
-                    continue
-                
-                # Check tier requirement
-                tier_ok = False
-                if min_tier == QualityTier.LOW:
-                    tier_ok = True
-                elif min_tier == QualityTier.MEDIUM:
-                    tier_ok = assessment.quality_tier in [QualityTier.MEDIUM, QualityTier.HIGH]
-                elif min_tier == QualityTier.HIGH:
-                    tier_ok = assessment.quality_tier == QualityTier.HIGH
-                
-                # Check confidence requirement
-                confidence_ok = assessment.confidence >= min_confidence
-                
-                if tier_ok and confidence_ok:
-                    filtered.append(ref)
+            # Tier codes are ordered HIGH=0, MEDIUM=1, LOW=2
+            tier_ok = self.assessments.tier_codes[safe_rows] <= _TIER_CODES[min_tier]
+            confidence_ok = self.assessments.confidences[safe_rows] >= min_confidence
             
-            return filtered
+            keep = found & tier_ok & confidence_ok
+            return [ref for ref, ok in zip(object_refs, keep.tolist()) if ok]
             
         except Exception:
             return []
@@ -451,21 +883,18 @@ class QualityService:
                 }
             
             # Calculate distribution
-            tier_counts = {tier.value: 0 for tier in QualityTier}
-            confidences = []
-            
-            for assessment in self.assessments.values():
-                tier_counts[assessment.quality_tier.value] += 1
-                confidences.append(assessment.confidence)
+            tier_totals = np.bincount(self.assessments.tier_codes, minlength=len(_TIERS))
+            tier_counts = {tier.value: int(tier_totals[code]) for code, tier in enumerate(_TIERS)}
+            confidences = self.assessments.confidences
             
             return {
                 "status": "success",
                 "total_assessments": len(self.assessments),
                 "quality_distribution": tier_counts,
-                "average_confidence": statistics.mean(confidences),
-                "confidence_std": statistics.stdev(confidences) if len(confidences) > 1 else 0.0,
-                "min_confidence": min(confidences),
-                "max_confidence": max(confidences),
+                "average_confidence": float(confidences.mean()),
+                "confidence_std": float(confidences.std(ddof=1)) if len(confidences) > 1 else 0.0,
+                "min_confidence": float(confidences.min()),
+                "max_confidence": float(confidences.max()),
                 "total_rules": len(self.quality_rules)
             }
             
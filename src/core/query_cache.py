@@ -0,0 +1,122 @@
+"""Query Result Cache - In-memory cache for graph query results
+
+Caches complete query results keyed by the normalized query text, the query
+parameters and the graph version (core.graph_store.graph_version). Graph
+writers bump the version, so a result is only served while the graph it was
+computed from is unchanged; stale entries are never matched again and age
+out through LRU eviction. The TTL bounds staleness for writes the version
+cannot see, such as another process writing to a shared Neo4j database.
+
+Features:
+- LRU eviction beyond max_entries and per-entry TTL
+- Results stored as pickled snapshots, so callers cannot mutate cached
+  entries and a hit costs one unpickle rather than a deep copy
+- Hit/miss statistics
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import json
+import pickle
+import threading
+import time
+
+from .config import get_config
+
+
+class QueryResultCache:
+    """Thread-safe LRU cache with TTL for query results."""
+
+    def __init__(self, max_entries: int = None, ttl_seconds: int = None, enabled: bool = None):
+        """Initialize the result cache.
+
+        Args:
+            max_entries: Maximum cached results before LRU eviction (uses config default if None)
+            ttl_seconds: Entry lifetime in seconds, 0 disables expiry (uses config default if None)
+            enabled: Enable or disable caching (uses config default if None)
+        """
+        config = get_config().query_cache
+
+        self.max_entries = max_entries or config.max_entries
+        self.ttl_seconds = config.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.enabled = config.enabled if enabled is None else enabled
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def normalize_query(query_text: str) -> str:
+        """Normalize query text so trivially different phrasings share an entry."""
+        return " ".join(query_text.lower().split())
+
+    @classmethod
+    def make_key(cls, query_text: str, parameters: Dict[str, Any], version: int) -> Tuple[str, str, int]:
+        """Build the cache key for a query.
+
+        Args:
+            query_text: Raw query text
+            parameters: Query parameters that affect the result
+            version: Graph version read before the query is executed
+        """
+        return (
+            cls.normalize_query(query_text),
+            json.dumps(parameters, sort_keys=True, default=str),
+            version
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached result, or None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, snapshot = entry
+            if self.ttl_seconds and time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(snapshot)
+
+    def put(self, key: Hashable, value: Any):
+        """Store a snapshot of a result, evicting the oldest entries beyond max_entries."""
+        if not self.enabled:
+            return
+        snapshot = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (time.time(), snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
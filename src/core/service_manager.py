@@ -7,12 +7,15 @@ Target: 10x speedup by eliminating redundant service creation.
 
 from typing import Optional, Dict, Any
 import threading
-from neo4j import GraphDatabase
 
 from .identity_service import IdentityService
 from .provenance_service import ProvenanceService
 from .quality_service import QualityService
 from .config import get_config
+from .graph_store import GraphStore, Neo4jGraphStore, EmbeddedGraphStore
+from .lazy_imports import lazy_import
+
+neo4j = lazy_import("neo4j")
 
 
 class ServiceManager:
@@ -36,7 +39,9 @@ class ServiceManager:
             self._quality_service = None
             self._neo4j_driver = None
             self._neo4j_config = None
+            self._graph_store = None
             self._identity_config = None  # Store identity service configuration
+            self._provenance_config = None
     
     @property
     def identity_service(self) -> IdentityService:
@@ -64,9 +69,21 @@ class ServiceManager:
     def provenance_service(self) -> ProvenanceService:
         """Get shared provenance service instance."""
         if not self._provenance_service:
-            self._provenance_service = ProvenanceService()
+            self._provenance_service = ProvenanceService(**(self._provenance_config or {}))
         return self._provenance_service
     
+    def configure_provenance_service(self, **config):
+        """Configure provenance service before first use.
+        
+        Args:
+            persistence_enabled: Append operations to the durable log
+            log_path: Path to the SQLite operation log
+            hot_window_operations: Operations kept in memory when persisting
+        """
+        if self._provenance_service:
+            raise RuntimeError("Cannot configure provenance service after it's been created")
+        self._provenance_config = config
+    
     @property
     def quality_service(self) -> QualityService:
         """Get shared quality service instance."""
@@ -102,7 +119,7 @@ class ServiceManager:
             
             if not self._neo4j_driver:
                 try:
-                    self._neo4j_driver = GraphDatabase.driver(
+                    self._neo4j_driver = neo4j.GraphDatabase.driver(
                         uri,
                         auth=(user, password),
                         max_connection_pool_size=neo4j_config.max_connection_pool_size,
@@ -124,8 +141,39 @@ class ServiceManager:
         
         return self._neo4j_driver
     
+    def get_graph_store(
+        self,
+        uri: str = None,
+        user: str = None,
+        password: str = None
+    ) -> GraphStore:
+        """Get the shared graph store for the configured backend.
+        
+        The neo4j backend wraps the shared driver (see get_neo4j_driver);
+        the embedded backend needs no server and persists to
+        graph_store.embedded_path.
+        """
+        config = get_config()
+        
+        if config.graph_store.backend == "embedded":
+            with self._lock:
+                if not isinstance(self._graph_store, EmbeddedGraphStore):
+                    self._graph_store = EmbeddedGraphStore(config.graph_store.embedded_path)
+            return self._graph_store
+        
+        driver = self.get_neo4j_driver(uri, user, password)
+        with self._lock:
+            if not isinstance(self._graph_store, Neo4jGraphStore) or self._graph_store.driver is not driver:
+                self._graph_store = Neo4jGraphStore(
+                    driver, batch_size=config.graph_construction.bulk_write_batch_size
+                )
+        return self._graph_store
+    
     def close_all(self):
         """Close all managed resources."""
+        if self._graph_store:
+            self._graph_store.close()
+            self._graph_store = None
         if self._neo4j_driver:
             self._neo4j_driver.close()
             self._neo4j_driver = None
@@ -138,6 +186,7 @@ class ServiceManager:
             "provenance_service_active": self._provenance_service is not None,
             "quality_service_active": self._quality_service is not None,
             "neo4j_driver_active": self._neo4j_driver is not None,
+            "graph_store_backend": self._graph_store.backend if self._graph_store else None,
             "neo4j_config": self._neo4j_config
         }
 
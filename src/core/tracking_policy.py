@@ -0,0 +1,90 @@
+"""Tracking Policy - How much provenance and quality bookkeeping to record
+
+Provenance and quality services consult one shared policy so the tracking
+level is set in one place (tracking.level in config, TRACKING_LEVEL env, or
+set_level at runtime) instead of in every tool.
+
+Levels:
+- full: every operation indexed per object, every object assessed
+- batch: operations recorded without per-object indexes; tools record one
+  aggregate quality assessment per batch instead of one per object
+- sampled: like batch, plus full tracking for a random sample_rate fraction
+  of operations and objects
+- off: no provenance or quality records
+"""
+
+from typing import Optional
+from enum import Enum
+import random
+import threading
+import numpy as np
+
+from .config import get_config
+
+
+class TrackingLevel(Enum):
+    """Provenance and quality tracking level."""
+    FULL = "full"
+    BATCH = "batch"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class TrackingPolicy:
+    """Decides which operations and objects get per-object tracking."""
+
+    def __init__(self, level: str = None, sample_rate: float = None):
+        """Initialize tracking policy.
+
+        Args:
+            level: full, batch, sampled or off (uses config default if None)
+            sample_rate: Fraction tracked in sampled mode (uses config default if None)
+        """
+        config = get_config().tracking
+        self.level = TrackingLevel(level or config.level)
+        self.sample_rate = config.sample_rate if sample_rate is None else sample_rate
+
+    def set_level(self, level: str, sample_rate: float = None):
+        """Change the tracking level for every service sharing this policy."""
+        self.level = TrackingLevel(level)
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.level is not TrackingLevel.OFF
+
+    @property
+    def records_batches(self) -> bool:
+        """Whether tools should record per-batch aggregate assessments."""
+        return self.level in (TrackingLevel.BATCH, TrackingLevel.SAMPLED)
+
+    def track_in_full(self) -> bool:
+        """Whether the next operation or object gets full per-object tracking."""
+        if self.level is TrackingLevel.FULL:
+            return True
+        if self.level is TrackingLevel.SAMPLED:
+            return random.random() < self.sample_rate
+        return False
+
+    def full_tracking_mask(self, count: int) -> np.ndarray:
+        """Vectorized track_in_full for count objects."""
+        if self.level is TrackingLevel.FULL:
+            return np.ones(count, dtype=bool)
+        if self.level is TrackingLevel.SAMPLED:
+            return np.random.random(count) < self.sample_rate
+        return np.zeros(count, dtype=bool)
+
+
+_global_policy: Optional[TrackingPolicy] = None
+_global_policy_lock = threading.Lock()
+
+
+def get_tracking_policy() -> TrackingPolicy:
+    """Get the shared tracking policy instance."""
+    global _global_policy
+    if _global_policy is None:
+        with _global_policy_lock:
+            if _global_policy is None:
+                _global_policy = TrackingPolicy()
+    return _global_policy
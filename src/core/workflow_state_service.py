@@ -9,21 +9,36 @@ This is a MINIMAL implementation focusing on:
 - Progress tracking for long operations
 - Error recovery support
 
+Checkpoints are stored in a single indexed SQLite database
+(storage_dir/checkpoints.db, see checkpoint_store.py) and written
+asynchronously in batches. Only the most recently used
+workflow.checkpoint_cache_size checkpoints are kept in memory; others are
+loaded on demand, so startup does not depend on how many checkpoints exist.
+
+Large stage outputs are saved as binary artifacts (see artifact_store.py)
+and referenced from checkpoint state, so workflows can resume from their
+latest checkpoint with reopen_workflow / get_latest_checkpoint.
+
+Progress listeners (add_progress_listener) are called on every checkpoint
+and progress update, e.g. to stream per-stage progress of background jobs.
+
 Deferred features:
 - State compression algorithms
 - Automatic cleanup policies
 - Advanced recovery strategies
-- Performance optimization
 """
 
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Set
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 import uuid
 import json
-import pickle
 from pathlib import Path
-import os
+
+from .config import get_config
+from .lru_cache import LRUCache
+from .checkpoint_store import CheckpointStore, CheckpointRow
+from .artifact_store import ArtifactStore
 
 
 @dataclass
@@ -57,41 +72,84 @@ class WorkflowProgress:
 class WorkflowStateService:
     """T121: Workflow State Service - Checkpoint and recovery management."""
     
-    def __init__(self, storage_dir: str = "./data/workflows"):
+    def __init__(self, storage_dir: str = "./data/workflows", checkpoint_cache_size: int = None):
+        """Initialize workflow state service.
+        
+        Args:
+            storage_dir: Directory holding checkpoints.db (legacy checkpoint_*.json
+                files found here are imported once)
+            checkpoint_cache_size: Checkpoints kept in memory (uses config default if None)
+        """
+        config = get_config().workflow
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         
-        self.checkpoints: Dict[str, WorkflowCheckpoint] = {}
+        # Recently used checkpoints; the rest are loaded from the store on demand
+        self.checkpoints = LRUCache(checkpoint_cache_size or config.checkpoint_cache_size)
         self.workflows: Dict[str, WorkflowProgress] = {}
-        self.checkpoint_files: Dict[str, Path] = {}  # checkpoint_id -> file_path
         
-        # Load existing checkpoints on startup
-        self._load_existing_checkpoints()
+        self.store = CheckpointStore(
+            str(self.storage_dir / "checkpoints.db"),
+            flush_interval_seconds=config.flush_interval_seconds,
+            flush_batch_size=config.flush_batch_size,
+            legacy_dir=str(self.storage_dir)
+        )
+        self.artifacts = ArtifactStore(str(self.storage_dir / "artifacts"))
+        self._progress_listeners: List[Callable[[Dict[str, Any]], None]] = []
     
-    def _load_existing_checkpoints(self):
-        """Load existing checkpoints from storage directory."""
-        try:
-            checkpoint_pattern = "checkpoint_*.json"
-            for checkpoint_file in self.storage_dir.glob(checkpoint_pattern):
-                try:
-                    with open(checkpoint_file, 'r') as f:
-                        checkpoint_data = json.load(f)
-                    
-                    # Reconstruct checkpoint object
-                    checkpoint_data['created_at'] = datetime.fromisoformat(
-                        checkpoint_data['created_at']
-                    )
-                    checkpoint = WorkflowCheckpoint(**checkpoint_data)
-                    
-                    self.checkpoints[checkpoint.checkpoint_id] = checkpoint
-                    self.checkpoint_files[checkpoint.checkpoint_id] = checkpoint_file
-                    
-                except Exception as e:
-                    # Log error and continue with other checkpoints
-                    print(f"Warning: Failed to load checkpoint {checkpoint_file}: {e}")
-                    
-        except Exception as e:
-            print(f"Warning: Failed to load checkpoints directory: {e}")
+    def add_progress_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """Call listener with a progress event on every checkpoint and progress update.
+        
+        Events have workflow_id, workflow_name, step_name, step_number,
+        total_steps, status and message. Listeners run in the thread that
+        made the update; an exception raised by a listener propagates to the
+        caller, which lets a listener stop a workflow at its next step.
+        """
+        if listener not in self._progress_listeners:
+            self._progress_listeners.append(listener)
+    
+    def remove_progress_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        if listener in self._progress_listeners:
+            self._progress_listeners.remove(listener)
+    
+    def _notify_progress(self, workflow: WorkflowProgress, step_name: str, message: Optional[str] = None):
+        if not self._progress_listeners:
+            return
+        event = {
+            "workflow_id": workflow.workflow_id,
+            "workflow_name": workflow.name,
+            "step_name": step_name,
+            "step_number": workflow.step_number,
+            "total_steps": workflow.total_steps,
+            "status": workflow.status,
+            "message": message
+        }
+        for listener in list(self._progress_listeners):
+            listener(event)
+    
+    @staticmethod
+    def _row_to_checkpoint(row: CheckpointRow) -> WorkflowCheckpoint:
+        checkpoint_id, workflow_id, step_name, step_number, total_steps, state_data, created_at, metadata = row
+        return WorkflowCheckpoint(
+            checkpoint_id=checkpoint_id,
+            workflow_id=workflow_id,
+            step_name=step_name,
+            step_number=step_number,
+            total_steps=total_steps,
+            state_data=json.loads(state_data),
+            created_at=datetime.fromisoformat(created_at),
+            metadata=json.loads(metadata)
+        )
+    
+    def _get_checkpoint(self, checkpoint_id: str) -> Optional[WorkflowCheckpoint]:
+        """Get a checkpoint from memory, loading it from the store if needed."""
+        checkpoint = self.checkpoints.get(checkpoint_id)
+        if checkpoint is None:
+            row = self.store.get(checkpoint_id)
+            if row is not None:
+                checkpoint = self._row_to_checkpoint(row)
+                self.checkpoints.put(checkpoint_id, checkpoint)
+        return checkpoint
     
     def start_workflow(
         self,
@@ -135,7 +193,8 @@ class WorkflowStateService:
                     workflow_id=workflow_id,
                     step_name="initialization",
                     step_number=0,
-                    state_data=initial_state
+                    state_data=initial_state,
+                    metadata={"workflow_name": name}
                 )
                 workflow.last_checkpoint_id = checkpoint_id
             
@@ -175,14 +234,15 @@ class WorkflowStateService:
             if step_number < 0:
                 raise ValueError("step_number must be non-negative")
             
-            # Validate state_data is JSON serializable
+            if metadata is None:
+                metadata = {}
+            
+            # Serialize once; this is both the validation and the stored form
             try:
-                json.dumps(state_data)
+                state_json = json.dumps(state_data, separators=(",", ":"))
             except (TypeError, ValueError) as e:
                 raise ValueError(f"state_data must be JSON serializable: {e}")
-            
-            if metadata is None:
-                metadata = {}
+            metadata_json = json.dumps(metadata, separators=(",", ":"), default=str)
             
             # Create checkpoint
             checkpoint_id = f"checkpoint_{uuid.uuid4().hex[:8]}"
@@ -198,27 +258,22 @@ class WorkflowStateService:
                 metadata=metadata.copy()
             )
             
-            # Store checkpoint in memory
-            self.checkpoints[checkpoint_id] = checkpoint
-            
-            # Save checkpoint to file
-            checkpoint_file = self.storage_dir / f"checkpoint_{checkpoint_id}.json"
-            checkpoint_dict = asdict(checkpoint)
-            checkpoint_dict['created_at'] = checkpoint.created_at.isoformat()
-            
-            with open(checkpoint_file, 'w') as f:
-                json.dump(checkpoint_dict, f, indent=2)
-            
-            self.checkpoint_files[checkpoint_id] = checkpoint_file
+            # Keep in memory and queue for the background writer
+            self.checkpoints.put(checkpoint_id, checkpoint)
+            self.store.append((
+                checkpoint_id, workflow_id, step_name, step_number, workflow.total_steps,
+                state_json, checkpoint.created_at.isoformat(), metadata_json
+            ))
             
             # Update workflow progress
             workflow.step_number = step_number
             workflow.last_checkpoint_id = checkpoint_id
             
-            return checkpoint_id
-            
         except Exception as e:
             raise RuntimeError(f"Failed to create checkpoint: {str(e)}")
+        
+        self._notify_progress(workflow, step_name)
+        return checkpoint_id
     
     def restore_from_checkpoint(self, checkpoint_id: str) -> Dict[str, Any]:
         """Restore workflow state from a checkpoint.
@@ -230,18 +285,17 @@ class WorkflowStateService:
             Restored workflow state
         """
         try:
-            if checkpoint_id not in self.checkpoints:
+            checkpoint = self._get_checkpoint(checkpoint_id)
+            if checkpoint is None:
                 return {
                     "status": "error",
                     "error": f"Checkpoint {checkpoint_id} not found"
                 }
             
-            checkpoint = self.checkpoints[checkpoint_id]
-            
             # Update workflow status if workflow still exists
             if checkpoint.workflow_id in self.workflows:
                 workflow = self.workflows[checkpoint.workflow_id]
-                workflow.current_step = checkpoint.step_number
+                workflow.step_number = checkpoint.step_number
                 workflow.status = "running"
                 workflow.error_message = None
             
@@ -301,7 +355,7 @@ class WorkflowStateService:
                 workflow.failed_steps.add(step_number)
                 workflow.completed_steps.discard(step_number)
             
-            return {
+            result = {
                 "status": "success",
                 "workflow_id": workflow_id,
                 "step_number": step_number,
@@ -314,6 +368,9 @@ class WorkflowStateService:
                 "status": "error",
                 "error": f"Failed to update progress: {str(e)}"
             }
+        
+        self._notify_progress(workflow, status, error_message)
+        return result
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get current workflow status.
@@ -358,21 +415,19 @@ class WorkflowStateService:
             List of checkpoint information
         """
         try:
-            checkpoints = []
-            for checkpoint in self.checkpoints.values():
-                if checkpoint.workflow_id == workflow_id:
-                    checkpoints.append({
-                        "checkpoint_id": checkpoint.checkpoint_id,
-                        "step_name": checkpoint.step_name,
-                        "step_number": checkpoint.step_number,
-                        "created_at": checkpoint.created_at.isoformat(),
-                        "has_state_data": bool(checkpoint.state_data),
-                        "metadata": checkpoint.metadata
-                    })
-            
-            # Sort by step number
-            checkpoints.sort(key=lambda x: x["step_number"])
-            return checkpoints
+            # Indexed lookup sorted by step number; state payloads are not read
+            return [
+                {
+                    "checkpoint_id": checkpoint_id,
+                    "step_name": step_name,
+                    "step_number": step_number,
+                    "created_at": created_at,
+                    "has_state_data": bool(has_state),
+                    "metadata": json.loads(metadata)
+                }
+                for checkpoint_id, _, step_name, step_number, _, has_state, created_at, metadata
+                in self.store.get_workflow_rows(workflow_id, include_state=False)
+            ]
             
         except Exception:
             return []
@@ -387,35 +442,17 @@ class WorkflowStateService:
             Cleanup result
         """
         try:
-            cutoff_date = datetime.now() - datetime.timedelta(days=days_old)
-            removed_count = 0
-            
-            # Find old checkpoints
-            old_checkpoint_ids = []
-            for checkpoint_id, checkpoint in self.checkpoints.items():
-                if checkpoint.created_at < cutoff_date:
-                    old_checkpoint_ids.append(checkpoint_id)
-            
-            # Remove checkpoints
-            for checkpoint_id in old_checkpoint_ids:
-                # Remove file
-                if checkpoint_id in self.checkpoint_files:
-                    file_path = self.checkpoint_files[checkpoint_id]
-                    try:
-                        file_path.unlink()
-                    except Exception:
-                        pass  # File might already be deleted
-                    del self.checkpoint_files[checkpoint_id]
-                
-                # Remove from memory
-                if checkpoint_id in self.checkpoints:
-                    del self.checkpoints[checkpoint_id]
-                
-                removed_count += 1
+            cutoff_date = datetime.now() - timedelta(days=days_old)
+            
+            removed_ids = self.store.delete_older_than(cutoff_date.isoformat())
+            for checkpoint_id in removed_ids:
+                self.checkpoints.pop(checkpoint_id)
+            removed_artifacts = self.artifacts.delete_older_than(cutoff_date.timestamp())
             
             return {
                 "status": "success",
-                "removed_checkpoints": removed_count,
+                "removed_checkpoints": len(removed_ids),
+                "removed_artifact_sets": removed_artifacts,
                 "cutoff_date": cutoff_date.isoformat()
             }
             
@@ -425,6 +462,88 @@ class WorkflowStateService:
                 "error": f"Failed to cleanup: {str(e)}"
             }
     
+    def get_latest_checkpoint(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Get the highest-step checkpoint of a workflow, with its state.
+        
+        Args:
+            workflow_id: ID of workflow
+            
+        Returns:
+            Restored checkpoint (as restore_from_checkpoint) or None
+        """
+        rows = self.store.get_workflow_rows(workflow_id, include_state=False)
+        if not rows:
+            return None
+        result = self.restore_from_checkpoint(rows[-1][0])
+        return result if result["status"] == "success" else None
+    
+    def reopen_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Make a stored workflow trackable again, e.g. after a restart.
+        
+        Rebuilds the workflow's progress entry from its checkpoints so new
+        checkpoints can be created for it.
+        
+        Args:
+            workflow_id: ID of workflow to reopen
+            
+        Returns:
+            Reopen result with the latest checkpoint
+        """
+        try:
+            latest = self.get_latest_checkpoint(workflow_id)
+            if latest is None:
+                return {
+                    "status": "error",
+                    "error": f"No checkpoints found for workflow {workflow_id}"
+                }
+            
+            workflow = self.workflows.get(workflow_id)
+            if workflow is None:
+                rows = self.store.get_workflow_rows(workflow_id, include_state=False)
+                first_metadata = json.loads(rows[0][7])
+                workflow = WorkflowProgress(
+                    workflow_id=workflow_id,
+                    name=first_metadata.get("workflow_name", workflow_id),
+                    started_at=datetime.fromisoformat(rows[0][6]),
+                    step_number=latest["step_number"],
+                    total_steps=latest["total_steps"],
+                    completed_steps={row[3] for row in rows if row[3] > 0}
+                )
+                self.workflows[workflow_id] = workflow
+            
+            workflow.status = "running"
+            workflow.error_message = None
+            workflow.last_checkpoint_id = latest["checkpoint_id"]
+            
+            return {
+                "status": "success",
+                "workflow_id": workflow_id,
+                "latest_checkpoint": latest
+            }
+            
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Failed to reopen workflow: {str(e)}"
+            }
+    
+    def save_artifact(self, workflow_id: str, name: str, data: Any) -> str:
+        """Persist a stage output and return a ref for checkpoint state.
+        
+        Args:
+            workflow_id: ID of the workflow producing the artifact
+            name: Artifact name, unique within the workflow
+            data: msgpack/JSON-compatible data
+            
+        Returns:
+            Artifact ref
+        """
+        return self.artifacts.save(workflow_id, name, data)
+    
+    def load_artifact(self, artifact_ref: str) -> Any:
+        """Load a stage output saved with save_artifact."""
+        return self.artifacts.load(artifact_ref)
+    
     def create_workflow(self, workflow_id: str, total_steps: int) -> Dict[str, Any]:
         """Create new workflow tracking entry (API contract compliance method).
         
@@ -487,26 +606,33 @@ class WorkflowStateService:
             for workflow in self.workflows.values():
                 status_counts[workflow.status] = status_counts.get(workflow.status, 0) + 1
             
-            # Checkpoint statistics
-            checkpoint_count_by_workflow = {}
-            for checkpoint in self.checkpoints.values():
-                wf_id = checkpoint.workflow_id
-                checkpoint_count_by_workflow[wf_id] = checkpoint_count_by_workflow.get(wf_id, 0) + 1
+            # Checkpoint statistics (from the store's workflow index)
+            total_checkpoints = self.store.count()
             
             return {
                 "status": "success",
                 "total_workflows": len(self.workflows),
-                "total_checkpoints": len(self.checkpoints),
+                "total_checkpoints": total_checkpoints,
                 "workflow_status_distribution": status_counts,
                 "average_checkpoints_per_workflow": (
-                    len(self.checkpoints) / len(self.workflows) if self.workflows else 0
+                    total_checkpoints / len(self.workflows) if self.workflows else 0
                 ),
                 "storage_directory": str(self.storage_dir),
-                "checkpoint_files_on_disk": len(list(self.storage_dir.glob("checkpoint_*.json")))
+                "checkpoint_store": self.store.db_path,
+                "checkpoints_in_memory": len(self.checkpoints),
+                "checkpoints_written": self.store.written
             }
             
         except Exception as e:
             return {
                 "status": "error",
                 "error": f"Failed to get statistics: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    def flush(self):
+        """Block until all queued checkpoints are written."""
+        self.store.flush()
+    
+    def close(self):
+        """Write queued checkpoints and close the checkpoint store."""
+        self.store.close()
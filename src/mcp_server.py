@@ -10,35 +10,67 @@ Currently implements:
 - T121: Workflow State Service tools
 """
 
-from fastmcp import FastMCP
+from fastmcp import FastMCP, Context
 from typing import Dict, List, Optional, Any
+import asyncio
 import os
+import queue
+import time
 from pathlib import Path
 
-# Import core services
+# Import core services (light; construction is deferred)
 from src.core.identity_service import IdentityService
-from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService, QualityTier
 from src.core.workflow_state_service import WorkflowStateService
+from src.core.lazy_registry import LazyRegistry
+from src.core.job_manager import JobManager
+from src.core.service_manager import get_service_manager
 
 # Import Phase 1 tools
-from src.tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
 from src.tools.phase1.phase1_mcp_tools import create_phase1_mcp_tools
 
 # Initialize MCP server
 mcp = FastMCP("super-digimon")
 
-# Initialize core services
-identity_service = IdentityService()
-provenance_service = ProvenanceService()
-quality_service = QualityService()
-
 # Get workflow storage directory from environment
 workflow_storage = os.getenv("WORKFLOW_STORAGE_DIR", "./data/workflows")
-workflow_service = WorkflowStateService(workflow_storage)
 
-# Initialize vertical slice workflow
-vertical_slice = VerticalSliceWorkflow(workflow_storage_dir=workflow_storage)
+
+def _create_provenance_service():
+    # Shared with the workflows. Persisted, so lineage survives restarts and
+    # memory stays bounded by provenance.hot_window_operations
+    manager = get_service_manager()
+    try:
+        manager.configure_provenance_service(persistence_enabled=True)
+    except RuntimeError:
+        pass  # Already created by the process embedding the server
+    return manager.provenance_service
+
+
+def _create_vertical_slice():
+    # Imports spaCy and the Neo4j driver; deferred until first use. All
+    # workflows share the server's provenance and workflow state services
+    from src.tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
+    components.get("provenance_service")
+    return VerticalSliceWorkflow(
+        workflow_storage_dir=workflow_storage, workflow_service=components.get("workflow_service")
+    )
+
+
+# Idle workflows for background jobs. A job takes one (or creates one) and
+# returns it when done, so at most job_manager.max_workers are ever created
+_job_workflows = queue.SimpleQueue()
+
+
+# Services and tools are constructed on first use (or by warm-up), so the
+# server answers test_connection without loading models or connecting to Neo4j
+components = LazyRegistry()
+components.register("identity_service", IdentityService)
+components.register("provenance_service", _create_provenance_service)
+components.register("quality_service", QualityService)
+components.register("workflow_service", lambda: WorkflowStateService(workflow_storage))
+components.register("vertical_slice", _create_vertical_slice)
+components.register("job_manager", JobManager)
 
 
 # =============================================================================
@@ -64,7 +96,7 @@ def create_mention(
         entity_type: Optional entity type hint
         confidence: Confidence score (0.0-1.0)
     """
-    return identity_service.create_mention(
+    return components.get("identity_service").create_mention(
         surface_form=surface_form,
         start_pos=start_pos,
         end_pos=end_pos,
@@ -81,7 +113,28 @@ def get_entity_by_mention(mention_id: str) -> Optional[Dict[str, Any]]:
     Args:
         mention_id: ID of the mention
     """
-    return identity_service.get_entity_by_mention(mention_id)
+    return components.get("identity_service").get_entity_by_mention(mention_id)
+
+
+@mcp.tool()
+def create_mentions(mentions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create many mentions in one call.
+    
+    Args:
+        mentions: Items with create_mention's arguments (surface_form, start_pos,
+            end_pos, source_ref, optional entity_type and confidence)
+    """
+    return components.get("identity_service").create_mentions(mentions)
+
+
+@mcp.tool()
+def get_entities_by_mentions(mention_ids: List[str]) -> List[Dict[str, Any]]:
+    """Get the entities associated with many mentions.
+    
+    Args:
+        mention_ids: IDs of the mentions
+    """
+    return components.get("identity_service").get_entities_by_mentions(mention_ids)
 
 
 @mcp.tool()
@@ -91,7 +144,7 @@ def get_mentions_for_entity(entity_id: str) -> List[Dict[str, Any]]:
     Args:
         entity_id: ID of the entity
     """
-    return identity_service.get_mentions_for_entity(entity_id)
+    return components.get("identity_service").get_mentions_for_entity(entity_id)
 
 
 @mcp.tool()
@@ -102,13 +155,13 @@ def merge_entities(entity_id1: str, entity_id2: str) -> Dict[str, Any]:
         entity_id1: ID of entity to keep
         entity_id2: ID of entity to merge into first
     """
-    return identity_service.merge_entities(entity_id1, entity_id2)
+    return components.get("identity_service").merge_entities(entity_id1, entity_id2)
 
 
 @mcp.tool()
 def get_identity_stats() -> Dict[str, Any]:
     """Get identity service statistics."""
-    return identity_service.get_stats()
+    return components.get("identity_service").get_stats()
 
 
 # =============================================================================
@@ -130,7 +183,7 @@ def start_operation(
         inputs: List of input object references
         parameters: Tool parameters
     """
-    return provenance_service.start_operation(
+    return components.get("provenance_service").start_operation(
         tool_id=tool_id,
         operation_type=operation_type,
         inputs=inputs,
@@ -155,7 +208,7 @@ def complete_operation(
         error_message: Error message if failed
         metadata: Additional metadata
     """
-    return provenance_service.complete_operation(
+    return components.get("provenance_service").complete_operation(
         operation_id=operation_id,
         outputs=outputs,
         success=success,
@@ -164,6 +217,28 @@ def complete_operation(
     )
 
 
+@mcp.tool()
+def start_operations(operations: List[Dict[str, Any]]) -> List[str]:
+    """Start tracking many operations.
+    
+    Args:
+        operations: Items with start_operation's arguments (tool_id,
+            operation_type, inputs, optional parameters)
+    """
+    return components.get("provenance_service").start_operations(operations)
+
+
+@mcp.tool()
+def complete_operations(completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Complete many operations and record their outputs.
+    
+    Args:
+        completions: Items with complete_operation's arguments (operation_id,
+            outputs, optional success, error_message, metadata)
+    """
+    return components.get("provenance_service").complete_operations(completions)
+
+
 @mcp.tool()
 def get_lineage(object_ref: str, max_depth: int = 10) -> Dict[str, Any]:
     """Get the lineage chain for an object.
@@ -172,7 +247,7 @@ def get_lineage(object_ref: str, max_depth: int = 10) -> Dict[str, Any]:
         object_ref: Reference to object
         max_depth: Maximum depth to traverse
     """
-    return provenance_service.get_lineage(object_ref, max_depth)
+    return components.get("provenance_service").get_lineage(object_ref, max_depth)
 
 
 @mcp.tool()
@@ -182,7 +257,17 @@ def get_operation_details(operation_id: str) -> Optional[Dict[str, Any]]:
     Args:
         operation_id: ID of operation
     """
-    return provenance_service.get_operation(operation_id)
+    return components.get("provenance_service").get_operation(operation_id)
+
+
+@mcp.tool()
+def get_operations_details(operation_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Get details of many operations (None for unknown IDs).
+    
+    Args:
+        operation_ids: IDs of operations
+    """
+    return components.get("provenance_service").get_operations(operation_ids)
 
 
 @mcp.tool()
@@ -192,13 +277,13 @@ def get_operations_for_object(object_ref: str) -> List[Dict[str, Any]]:
     Args:
         object_ref: Reference to object
     """
-    return provenance_service.get_operations_for_object(object_ref)
+    return components.get("provenance_service").get_operations_for_object(object_ref)
 
 
 @mcp.tool()
 def get_tool_statistics() -> Dict[str, Any]:
     """Get statistics about tool usage."""
-    return provenance_service.get_tool_statistics()
+    return components.get("provenance_service").get_tool_statistics()
 
 
 # =============================================================================
@@ -220,7 +305,7 @@ def assess_confidence(
         factors: Contributing factors to confidence
         metadata: Additional assessment metadata
     """
-    return quality_service.assess_confidence(
+    return components.get("quality_service").assess_confidence(
         object_ref=object_ref,
         base_confidence=base_confidence,
         factors=factors,
@@ -228,6 +313,17 @@ def assess_confidence(
     )
 
 
+@mcp.tool()
+def assess_confidence_batch(assessments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Assess and record confidence for many objects.
+    
+    Args:
+        assessments: Items with assess_confidence's arguments (object_ref,
+            base_confidence, optional factors and metadata)
+    """
+    return components.get("quality_service").assess_confidences(assessments)
+
+
 @mcp.tool()
 def propagate_confidence(
     input_refs: List[str],
@@ -241,7 +337,7 @@ def propagate_confidence(
         operation_type: Type of operation being performed
         boost_factor: Factor to boost/reduce confidence
     """
-    return quality_service.propagate_confidence(
+    return components.get("quality_service").propagate_confidence(
         input_refs=input_refs,
         operation_type=operation_type,
         boost_factor=boost_factor
@@ -255,7 +351,17 @@ def get_quality_assessment(object_ref: str) -> Optional[Dict[str, Any]]:
     Args:
         object_ref: Reference to object
     """
-    return quality_service.get_quality_assessment(object_ref)
+    return components.get("quality_service").get_quality_assessment(object_ref)
+
+
+@mcp.tool()
+def get_quality_assessments(object_refs: List[str]) -> List[Dict[str, Any]]:
+    """Get quality assessments for many objects.
+    
+    Args:
+        object_refs: References to objects
+    """
+    return components.get("quality_service").get_quality_assessments(object_refs)
 
 
 @mcp.tool()
@@ -265,7 +371,7 @@ def get_confidence_trend(object_ref: str) -> Dict[str, Any]:
     Args:
         object_ref: Reference to object
     """
-    return quality_service.get_confidence_trend(object_ref)
+    return components.get("quality_service").get_confidence_trend(object_ref)
 
 
 @mcp.tool()
@@ -289,7 +395,7 @@ def filter_by_quality(
     
     min_tier_enum = tier_map.get(min_tier, QualityTier.LOW)
     
-    return quality_service.filter_by_quality(
+    return components.get("quality_service").filter_by_quality(
         object_refs=object_refs,
         min_tier=min_tier_enum,
         min_confidence=min_confidence
@@ -299,7 +405,7 @@ def filter_by_quality(
 @mcp.tool()
 def get_quality_statistics() -> Dict[str, Any]:
     """Get quality service statistics."""
-    return quality_service.get_quality_statistics()
+    return components.get("quality_service").get_quality_statistics()
 
 
 # =============================================================================
@@ -319,7 +425,7 @@ def start_workflow(
         total_steps: Expected total number of steps
         initial_state: Initial workflow state data
     """
-    return workflow_service.start_workflow(
+    return components.get("workflow_service").start_workflow(
         name=name,
         total_steps=total_steps,
         initial_state=initial_state
@@ -343,7 +449,7 @@ def create_checkpoint(
         state_data: Current workflow state
         metadata: Additional checkpoint metadata
     """
-    return workflow_service.create_checkpoint(
+    return components.get("workflow_service").create_checkpoint(
         workflow_id=workflow_id,
         step_name=step_name,
         step_number=step_number,
@@ -359,7 +465,7 @@ def restore_from_checkpoint(checkpoint_id: str) -> Dict[str, Any]:
     Args:
         checkpoint_id: ID of checkpoint to restore from
     """
-    return workflow_service.restore_from_checkpoint(checkpoint_id)
+    return components.get("workflow_service").restore_from_checkpoint(checkpoint_id)
 
 
 @mcp.tool()
@@ -377,7 +483,7 @@ def update_workflow_progress(
         status: Workflow status (running, completed, failed, paused)
         error_message: Error message if failed
     """
-    return workflow_service.update_workflow_progress(
+    return components.get("workflow_service").update_workflow_progress(
         workflow_id=workflow_id,
         step_number=step_number,
         status=status,
@@ -392,7 +498,7 @@ def get_workflow_status(workflow_id: str) -> Optional[Dict[str, Any]]:
     Args:
         workflow_id: ID of workflow
     """
-    return workflow_service.get_workflow_status(workflow_id)
+    return components.get("workflow_service").get_workflow_status(workflow_id)
 
 
 @mcp.tool()
@@ -402,13 +508,13 @@ def get_workflow_checkpoints(workflow_id: str) -> List[Dict[str, Any]]:
     Args:
         workflow_id: ID of workflow
     """
-    return workflow_service.get_workflow_checkpoints(workflow_id)
+    return components.get("workflow_service").get_workflow_checkpoints(workflow_id)
 
 
 @mcp.tool()
 def get_workflow_statistics() -> Dict[str, Any]:
     """Get workflow service statistics."""
-    return workflow_service.get_service_statistics()
+    return components.get("workflow_service").get_service_statistics()
 
 
 # =============================================================================
@@ -428,13 +534,127 @@ def execute_pdf_to_answer_workflow(
         query: Question to answer using the extracted graph
         workflow_name: Name for workflow tracking
     """
-    return vertical_slice.execute_workflow(document_paths=document_paths, queries=[query], workflow_name=workflow_name)
+    return components.get("vertical_slice").execute_workflow(document_paths=document_paths, queries=[query], workflow_name=workflow_name)
+
+
+@mcp.tool()
+def submit_pdf_to_answer_workflow(
+    document_paths: List[str],
+    query: str,
+    workflow_name: str = "PDF_Analysis",
+    timeout_seconds: float = None
+) -> Dict[str, Any]:
+    """Start the PDF → PageRank → Answer workflow as a background job.
+    
+    Returns a job ID immediately; follow progress with get_job_status,
+    wait_for_job or stream_job_progress.
+    
+    Args:
+        document_paths: List of document file paths to process
+        query: Question to answer using the extracted graph
+        workflow_name: Name for workflow tracking
+        timeout_seconds: Job timeout (server default if omitted)
+    """
+    jobs = components.get("job_manager")
+    
+    def run():
+        # A workflow per running job, built in the worker so a cold submission
+        # does not block the server; concurrent jobs share no workflow state
+        try:
+            workflow = _job_workflows.get_nowait()
+        except queue.Empty:
+            workflow = _create_vertical_slice()
+            jobs.attach_workflow_service(workflow.workflow_service)
+        try:
+            return workflow.execute_workflow(document_paths=document_paths, queries=[query], workflow_name=workflow_name)
+        finally:
+            _job_workflows.put(workflow)
+    
+    return jobs.submit(
+        "pdf_to_answer",
+        run,
+        parameters={"document_paths": document_paths, "query": query, "workflow_name": workflow_name},
+        timeout_seconds=timeout_seconds
+    )
 
 
 @mcp.tool()
 def get_vertical_slice_info() -> Dict[str, Any]:
     """Get information about the vertical slice workflow."""
-    return vertical_slice.get_tool_info()
+    return components.get("vertical_slice").get_tool_info()
+
+
+# =============================================================================
+# Background Job Tools
+# =============================================================================
+
+@mcp.tool()
+def get_job_status(job_id: str, since_event: int = 0) -> Dict[str, Any]:
+    """Get a background job's status, progress events and (when finished) result.
+    
+    Args:
+        job_id: ID returned by a submit_* tool
+        since_event: Return only events from this index (next_event of the previous call)
+    """
+    return components.get("job_manager").get_job(job_id, since_event)
+
+
+@mcp.tool()
+async def wait_for_job(job_id: str, since_event: int = 0, timeout_seconds: float = 30.0) -> Dict[str, Any]:
+    """Wait until a job reports new progress or finishes, then return its status.
+    
+    Args:
+        job_id: ID returned by a submit_* tool
+        since_event: Wait for events after this index (next_event of the previous call)
+        timeout_seconds: Maximum time to wait
+    """
+    jobs = components.get("job_manager")
+    return await asyncio.to_thread(jobs.wait, job_id, since_event, timeout_seconds)
+
+
+@mcp.tool()
+async def stream_job_progress(job_id: str, ctx: Context, timeout_seconds: float = 600.0) -> Dict[str, Any]:
+    """Stream a job's per-stage progress as MCP progress notifications until it finishes.
+    
+    Args:
+        job_id: ID returned by a submit_* tool
+        timeout_seconds: Stop streaming after this long (the job keeps running)
+    """
+    jobs = components.get("job_manager")
+    deadline = time.monotonic() + timeout_seconds
+    since_event = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        status = await asyncio.to_thread(jobs.wait, job_id, since_event, max(0.0, min(5.0, remaining)))
+        if status["status"] != "success":
+            return status
+        for event in status["events"]:
+            if event["total_steps"]:
+                await ctx.report_progress(max(0, event["step_number"] or 0), event["total_steps"])
+            await ctx.info(f"{event['step_name']}: {event['status']}" + (f" ({event['message']})" if event["message"] else ""))
+        since_event = status["next_event"]
+        if status["finished"] or remaining <= 0:
+            return status
+
+
+@mcp.tool()
+def cancel_job(job_id: str) -> Dict[str, Any]:
+    """Cancel a queued or running job (running jobs stop at their next step).
+    
+    Args:
+        job_id: ID returned by a submit_* tool
+    """
+    return components.get("job_manager").cancel(job_id)
+
+
+@mcp.tool()
+def list_jobs(status: str = None) -> List[Dict[str, Any]]:
+    """List background jobs.
+    
+    Args:
+        status: Only jobs with this status (queued, running, completed, failed, cancelled, timed_out)
+    """
+    return components.get("job_manager").list_jobs(status)
 
 
 # =============================================================================
@@ -456,25 +676,62 @@ def echo(message: str) -> str:
 @mcp.tool()
 def get_system_status() -> Dict[str, Any]:
     """Get overall system status."""
+    component_status = components.get_status()
+    
+    def state(name: str) -> str:
+        status = component_status[name]
+        if status["loaded"]:
+            return "active"
+        return "error" if status["error"] else "not_loaded"
+    
     return {
         "status": "operational",
         "services": {
-            "identity_service": "active",
-            "provenance_service": "active", 
-            "quality_service": "active",
-            "workflow_service": "active",
-            "vertical_slice": "active",
-            "phase1_pipeline": "active"
+            "identity_service": state("identity_service"),
+            "provenance_service": state("provenance_service"), 
+            "quality_service": state("quality_service"),
+            "workflow_service": state("workflow_service"),
+            "vertical_slice": state("vertical_slice"),
+            "phase1_pipeline": state("entity_extractor")
         },
         "core_services_count": 4,
-        "phase1_tools_count": 33,  # Updated count: 8 existing + 25 new pipeline tools
-        "vertical_slice_ready": True,
+        "phase1_tools_count": 35,  # 8 existing + 27 pipeline tools
+        "vertical_slice_ready": components.is_loaded("vertical_slice"),
+        "jobs": components.get("job_manager").get_statistics() if components.is_loaded("job_manager") else None,
         "server_name": "super-digimon"
     }
 
 
-# Add Phase 1 pipeline tools to the server
-create_phase1_mcp_tools(mcp)
+@mcp.tool()
+def warm_up_components(names: List[str] = None, wait: bool = False) -> Dict[str, Any]:
+    """Construct services and tools ahead of first use.
+    
+    Args:
+        names: Components to construct (all if omitted)
+        wait: Block until construction finishes instead of warming up in the background
+    """
+    unknown = [name for name in names or [] if name not in components]
+    if unknown:
+        return {"status": "error", "error": f"Unknown components: {unknown}", "available": components.names()}
+    
+    components.warm_up(names, background=not wait)
+    return {"status": "success" if wait else "started", "components": components.get_status()}
+
+
+def warm_up_from_env():
+    """Start background warm-up of the components named in MCP_WARM_UP.
+    
+    MCP_WARM_UP is "all" or a comma-separated list of component names;
+    components are built while the server is already accepting requests.
+    """
+    warm_up = os.getenv("MCP_WARM_UP", "").strip()
+    if warm_up:
+        components.warm_up(None if warm_up == "all" else [n.strip() for n in warm_up.split(",") if n.strip()])
+
+
+# Add Phase 1 pipeline tools to the server (sharing the server's services)
+create_phase1_mcp_tools(mcp, components)
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    warm_up_from_env()
+    mcp.run()
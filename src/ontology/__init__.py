@@ -2,6 +2,19 @@
 Ontology generation and management module.
 """
 
-from .gemini_ontology_generator import GeminiOntologyGenerator
+import importlib
 
-__all__ = ["GeminiOntologyGenerator"]
\ No newline at end of file
+# Resolved on first access so the OpenAI client is only loaded when used
+_EXPORTS = {
+    "GeminiOntologyGenerator": ".gemini_ontology_generator",
+}
+
+__all__ = ["GeminiOntologyGenerator"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
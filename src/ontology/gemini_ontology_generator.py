@@ -8,10 +8,13 @@ import json
 import re
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict
-from openai import OpenAI
 import logging
 
 from src.ontology_generator import DomainOntology, EntityType, RelationshipType
+from src.core.lazy_imports import lazy_import
+from src.core.llm_cache import get_llm_cache
+
+openai = lazy_import("openai")
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +33,35 @@ class GeminiOntologyGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY env var or pass api_key.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = openai.OpenAI(api_key=self.api_key)
         # o3-mini is a real OpenAI model - do not change this
         self.model = "o3-mini"
+        self.llm_cache = get_llm_cache()
+    
+    def _complete_json(self, prompt: str, max_completion_tokens: int) -> Dict[str, Any]:
+        """Run a JSON-mode completion, reusing cached responses for identical requests."""
+        cache_key = self.llm_cache.make_key(
+            prompt, self.model, max_completion_tokens=max_completion_tokens, response_format="json_object"
+        )
+        response_text = self.llm_cache.get(cache_key)
+        if response_text is not None:
+            logger.info("o3-mini response served from LLM cache")
+            return self._parse_response(response_text)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            max_completion_tokens=max_completion_tokens,
+            response_format={"type": "json_object"}
+        )
+        
+        # Extract response text and parse structured output
+        response_text = response.choices[0].message.content
+        data = self._parse_response(response_text)
+        self.llm_cache.put(cache_key, response_text, model=self.model)
+        return data
     
     def generate_from_conversation(self, messages: List[Dict[str, str]], 
                                  temperature: float = 0.7,
@@ -57,20 +86,7 @@ class GeminiOntologyGenerator:
         try:
             # Generate with OpenAI o3-mini
             print(f"OPENAI o3-mini API PROMPT:\n{prompt}\n" + "="*80)
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=4000,
-                response_format={"type": "json_object"}
-            )
-            
-            # Extract response text
-            response_text = response.choices[0].message.content
-            
-            # Parse structured output
-            ontology_data = self._parse_response(response_text)
+            ontology_data = self._complete_json(prompt, max_completion_tokens=4000)
             
             # Convert to DomainOntology
             return self._build_ontology(ontology_data, conversation_text)
@@ -318,17 +334,7 @@ Extract entities and relationships in this JSON format:
 Respond ONLY with the JSON."""
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=2000,
-                response_format={"type": "json_object"}
-            )
-            
-            response_text = response.choices[0].message.content
-            return self._parse_response(response_text)
+            return self._complete_json(prompt, max_completion_tokens=2000)
             
         except Exception as e:
             logger.error(f"Error validating ontology: {e}")
@@ -371,17 +377,7 @@ Generate the refined ontology in the same JSON format. Make only the requested c
 Respond ONLY with the JSON."""
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_completion_tokens=4000,
-                response_format={"type": "json_object"}
-            )
-            
-            response_text = response.choices[0].message.content
-            refined_data = self._parse_response(response_text)
+            refined_data = self._complete_json(prompt, max_completion_tokens=4000)
             return self._build_ontology(refined_data, 
                                       ontology.created_by_conversation + f"\n\nRefinement: {refinement_request}")
             
@@ -8,13 +8,15 @@ import json
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import google.generativeai as genai
 from pathlib import Path
 
-# Configure Gemini
+from src.core.lazy_imports import lazy_import
+from src.core.llm_cache import get_llm_cache
+
+genai = lazy_import("google.generativeai", install_hint="google-generativeai")
+
+# Gemini is configured when the first generator is created
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if GOOGLE_API_KEY:
-    genai.configure(api_key=GOOGLE_API_KEY)
 
 # Data classes matching the Streamlit app
 @dataclass
@@ -76,12 +78,36 @@ class OntologyGenerator:
         self.model = None
         if GOOGLE_API_KEY:
             try:
+                genai.configure(api_key=GOOGLE_API_KEY)
                 self.model = genai.GenerativeModel(model_name)
             except Exception as e:
                 print(f"Warning: Could not initialize Gemini model: {e}")
         
         # Load prompts
         self.prompts = self._load_prompts()
+        
+        # Persistent response cache for repeated prompts
+        self.llm_cache = get_llm_cache()
+    
+    def _generate_json(self, prompt: str, temperature: float) -> Dict[str, Any]:
+        """Generate a JSON response with Gemini, reusing cached responses for identical requests"""
+        cache_key = self.llm_cache.make_key(
+            prompt, self.model_name, temperature=temperature, response_mime_type="application/json"
+        )
+        response_text = self.llm_cache.get(cache_key)
+        if response_text is None:
+            response = self.model.generate_content(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=temperature,
+                    response_mime_type="application/json"
+                )
+            )
+            response_text = response.text
+            data = json.loads(response_text)
+            self.llm_cache.put(cache_key, response_text, model=self.model_name)
+            return data
+        return json.loads(response_text)
     
     def _load_prompts(self) -> Dict[str, str]:
         """Load prompt templates"""
@@ -205,17 +231,8 @@ Format as JSON:
                 auto_suggest_attributes=config.get("auto_suggest_attributes", True)
             )
             
-            # Generate with Gemini
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=config.get("temperature", 0.7),
-                    response_mime_type="application/json"
-                )
-            )
-            
-            # Parse response
-            ontology_data = json.loads(response.text)
+            # Generate with Gemini and parse response
+            ontology_data = self._generate_json(prompt, config.get("temperature", 0.7))
             
             # Convert to Ontology object
             entity_types = [EntityType(**et) for et in ontology_data["entity_types"]]
@@ -250,17 +267,8 @@ Format as JSON:
                 refinement_request=refinement_request
             )
             
-            # Generate with Gemini
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.7,
-                    response_mime_type="application/json"
-                )
-            )
-            
-            # Parse response
-            refined_data = json.loads(response.text)
+            # Generate with Gemini and parse response
+            refined_data = self._generate_json(prompt, 0.7)
             
             # Convert to Ontology object
             entity_types = [EntityType(**et) for et in refined_data["entity_types"]]
@@ -301,17 +309,8 @@ Format as JSON:
                 text=text[:2000]  # Limit text length
             )
             
-            # Generate with Gemini
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.3,
-                    response_mime_type="application/json"
-                )
-            )
-            
-            # Parse response
-            result = json.loads(response.text)
+            # Generate with Gemini and parse response
+            result = self._generate_json(prompt, 0.3)
             return result.get("entities", [])
             
         except Exception as e:
@@ -1,25 +1,40 @@
-"""Base class for Phase 1 tools that use Neo4j
+"""Base class for Phase 1 tools that use the graph store
 
 Implements performance optimization F2 from CLAUDE.md.
 Provides shared Neo4j driver management to prevent connection duplication.
 Target: 3x speedup by eliminating redundant connections.
+
+Tools access the graph through self.graph_store (see core.graph_store), so
+they run unchanged on Neo4j or on the embedded backend.
 """
 
-from typing import Optional
-from neo4j import GraphDatabase, Driver
+from typing import Optional, TYPE_CHECKING
 
 try:
     from src.core.identity_service import IdentityService
     from src.core.provenance_service import ProvenanceService
     from src.core.quality_service import QualityService
+    from src.core.lazy_imports import lazy_import
+    from src.core.config import get_config
+    from src.core.graph_store import GraphStore, Neo4jGraphStore
+    from src.core.service_manager import get_service_manager
 except ImportError:
     from core.identity_service import IdentityService
     from core.provenance_service import ProvenanceService
     from core.quality_service import QualityService
+    from core.lazy_imports import lazy_import
+    from core.config import get_config
+    from core.graph_store import GraphStore, Neo4jGraphStore
+    from core.service_manager import get_service_manager
+
+if TYPE_CHECKING:
+    from neo4j import Driver
+
+neo4j = lazy_import("neo4j")
 
 
 class BaseNeo4jTool:
-    """Base class for tools that need Neo4j access."""
+    """Base class for tools that need graph storage."""
     
     def __init__(
         self,
@@ -29,24 +44,39 @@ class BaseNeo4jTool:
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None
     ):
         self.identity_service = identity_service
         self.provenance_service = provenance_service
         self.quality_service = quality_service
+        self._owns_driver = False
+        
+        # Use the given store, else the shared embedded store if configured,
+        # else Neo4j through the shared driver or our own connection
+        config = get_config()
+        if graph_store is None and not shared_driver and config.graph_store.backend == "embedded":
+            graph_store = get_service_manager().get_graph_store()
         
-        # Use shared driver if provided, otherwise create own
-        if shared_driver:
+        if graph_store is not None:
+            self.graph_store = graph_store
+            self.driver = getattr(graph_store, "driver", None)
+        elif shared_driver:
             self.driver = shared_driver
-            self._owns_driver = False
+            self.graph_store = Neo4jGraphStore(
+                shared_driver, batch_size=config.graph_construction.bulk_write_batch_size
+            )
         else:
             self._connect_neo4j(neo4j_uri, neo4j_user, neo4j_password)
             self._owns_driver = True
+            self.graph_store = Neo4jGraphStore(
+                self.driver, batch_size=config.graph_construction.bulk_write_batch_size
+            )
     
     def _connect_neo4j(self, uri: str, user: str, password: str):
         """Connect to Neo4j database."""
         try:
-            self.driver = GraphDatabase.driver(
+            self.driver = neo4j.GraphDatabase.driver(
                 uri,
                 auth=(user, password),
                 max_connection_pool_size=50,
@@ -74,4 +104,5 @@ class BaseNeo4jTool:
         """Close the connection if we own it."""
         if self._owns_driver and self.driver:
             self.driver.close()
-            self.driver = None
\ No newline at end of file
+            self.driver = None
+            self.graph_store.driver = None
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""Parallel Chunk Extraction - Process-pool NER and relationship extraction
+
+Entity and relationship extraction per chunk only needs spaCy, so chunk
+batches can be processed by worker processes. Workers never touch the
+identity, provenance or quality services (process-local singletons that are
+not safe to share between processes); they return plain records:
+
+- entities: SpacyNER.find_entities records with provisional mention and
+  entity IDs of the form "local:<start_char>:<end_char>"
+- relationships: RelationshipExtractor.find_relationships records that
+  reference those provisional IDs
+
+The parent registers the records chunk by chunk, in document order, with
+SpacyNER.extract_entities(entities=...) and
+RelationshipExtractor.extract_relationships(relationships=...), so service
+state does not depend on how batches were scheduled across workers.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
+
+from .t23a_spacy_ner import SpacyNER
+from .t27_relationship_extractor import RelationshipExtractor
+
+
+# Tools of the current worker process, created once by _init_worker
+_worker_tools: Optional[Tuple[SpacyNER, RelationshipExtractor]] = None
+
+
+def local_entity_id(entity: Dict[str, Any]) -> str:
+    """Provisional ID of an entity found in a worker, unique within its chunk."""
+    return f"local:{entity['start_char']}:{entity['end_char']}"
+
+
+def extract_chunk_records(
+    chunks: List[Dict[str, Any]],
+    entity_extractor: SpacyNER,
+    relationship_extractor: RelationshipExtractor
+) -> List[Dict[str, Any]]:
+    """Find entities and relationships in chunks, parsing each chunk once.
+
+    Args:
+        chunks: Chunks with chunk_ref, text and confidence
+        entity_extractor: NER tool (its services are not used)
+        relationship_extractor: Relationship tool (its services are not used)
+
+    Returns:
+        One record per chunk, in input order, with chunk_ref, entities
+        and relationships
+    """
+    entity_extractor._initialize_spacy_model()
+    nlp = entity_extractor.nlp
+
+    texts = [chunk["text"] if chunk["text"] and chunk["text"].strip() else "" for chunk in chunks]
+    docs = nlp.pipe(texts) if nlp is not None else [None] * len(chunks)
+
+    records = []
+    for chunk, text, doc in zip(chunks, texts, docs):
+        entities = []
+        relationships = []
+        if nlp is not None and text:
+            entities = entity_extractor.find_entities(text, chunk["confidence"], doc)
+            for entity in entities:
+                entity["mention_id"] = entity["entity_id"] = local_entity_id(entity)
+            if len(entities) >= 2:
+                relationships = relationship_extractor.find_relationships(
+                    text, entities, chunk["chunk_ref"], chunk["confidence"], doc
+                )
+        records.append({
+            "chunk_ref": chunk["chunk_ref"],
+            "entities": entities,
+            "relationships": relationships
+        })
+    return records
+
+
+def _init_worker():
+    """Load one spaCy model per worker process, shared by both tools."""
+    global _worker_tools
+    relationship_extractor = RelationshipExtractor(None, None, None)
+    entity_extractor = SpacyNER(None, None, None)
+    if relationship_extractor.nlp is not None:
+        entity_extractor.nlp = relationship_extractor.nlp
+        entity_extractor._model_initialized = True
+    _worker_tools = (entity_extractor, relationship_extractor)
+
+
+def _extract_batch(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if _worker_tools is None:
+        _init_worker()
+    return extract_chunk_records(chunks, *_worker_tools)
+
+
+class ParallelChunkExtractor:
+    """Runs extract_chunk_records over chunk batches in a process pool.
+
+    The pool is started on first use and kept until close(), so the spaCy
+    model is loaded once per worker rather than once per document.
+    """
+
+    def __init__(self, workers: int, batch_chunks: int = 8):
+        """
+        Args:
+            workers: Number of worker processes
+            batch_chunks: Maximum chunks sent to a worker per task
+        """
+        self.workers = workers
+        self.batch_chunks = batch_chunks
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _batches(self, chunks: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        # Smaller batches for short documents so every worker gets work
+        size = max(1, min(self.batch_chunks, math.ceil(len(chunks) / self.workers)))
+        plain = [
+            {"chunk_ref": c["chunk_ref"], "text": c["text"], "confidence": c["confidence"]}
+            for c in chunks
+        ]
+        return [plain[i:i + size] for i in range(0, len(plain), size)]
+
+    def extract(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract records for all chunks; results are in chunk order."""
+        if not chunks:
+            return []
+        if self._executor is None:
+            # spawn: the parent runs service threads (checkpoint and
+            # provenance writers) that must not be forked
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+
+        records = []
+        for batch_records in self._executor.map(_extract_batch, self._batches(chunks)):
+            records.extend(batch_records)
+        return records
+
+    def close(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -22,41 +22,95 @@ from pathlib import Path
 from src.core.identity_service import IdentityService
 from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService
+from src.core.lazy_registry import LazyRegistry
+from src.core.service_manager import get_service_manager
+from src.core.job_manager import JobManager
 
-# Import Phase 1 tools
-from src.tools.phase1.t01_pdf_loader import PDFLoader
-from src.tools.phase1.t15a_text_chunker import TextChunker
-from src.tools.phase1.t23a_spacy_ner import SpacyNER
-from src.tools.phase1.t27_relationship_extractor import RelationshipExtractor
-from src.tools.phase1.t31_entity_builder import EntityBuilder
-from src.tools.phase1.t34_edge_builder import EdgeBuilder
-from src.tools.phase1.t68_pagerank import PageRankCalculator
-from src.tools.phase1.t49_multihop_query import MultiHopQuery
 
-
-def create_phase1_mcp_tools(mcp: FastMCP):
-    """Add Phase 1 pipeline tools to an existing MCP server"""
+def _register_phase1_tools(components: LazyRegistry):
+    """Register factories for the core services (unless already registered)
+    and the Phase 1 tools.
+    
+    Tool modules are imported inside the factories: they pull in spaCy,
+    the Neo4j driver and networkx, which the server does not need until a
+    Phase 1 tool is called.
+    """
+    for name, service_class in (
+        ("identity_service", IdentityService),
+        ("provenance_service", ProvenanceService),
+        ("quality_service", QualityService),
+        ("job_manager", JobManager)
+    ):
+        if name not in components:
+            components.register(name, service_class)
+    
+    def services():
+        return (
+            components.get("identity_service"),
+            components.get("provenance_service"),
+            components.get("quality_service")
+        )
+    
+    # Neo4j connection parameters
+    def neo4j_params():
+        return (
+            os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+            os.getenv("NEO4J_USER", "neo4j"),
+            os.getenv("NEO4J_PASSWORD", "password")
+        )
     
-    # Initialize core services
-    identity_service = IdentityService()
-    provenance_service = ProvenanceService()
-    quality_service = QualityService()
+    # Graph tools share one graph store (Neo4j or embedded, per configuration)
+    if "graph_store" not in components:
+        components.register("graph_store", lambda: get_service_manager().get_graph_store(*neo4j_params()))
     
-    # Initialize Phase 1 tools
-    pdf_loader = PDFLoader(identity_service, provenance_service, quality_service)
-    text_chunker = TextChunker(identity_service, provenance_service, quality_service)
-    entity_extractor = SpacyNER(identity_service, provenance_service, quality_service)
-    relationship_extractor = RelationshipExtractor(identity_service, provenance_service, quality_service)
+    def pdf_loader():
+        from src.tools.phase1.t01_pdf_loader import PDFLoader
+        return PDFLoader(*services())
     
-    # Neo4j connection parameters
-    neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-    neo4j_password = os.getenv("NEO4J_PASSWORD", "password")
+    def text_chunker():
+        from src.tools.phase1.t15a_text_chunker import TextChunker
+        return TextChunker(*services())
+    
+    def entity_extractor():
+        from src.tools.phase1.t23a_spacy_ner import SpacyNER
+        return SpacyNER(*services())
+    
+    def relationship_extractor():
+        from src.tools.phase1.t27_relationship_extractor import RelationshipExtractor
+        return RelationshipExtractor(*services())
+    
+    def entity_builder():
+        from src.tools.phase1.t31_entity_builder import EntityBuilder
+        return EntityBuilder(*services(), *neo4j_params(), graph_store=components.get("graph_store"))
+    
+    def edge_builder():
+        from src.tools.phase1.t34_edge_builder import EdgeBuilder
+        return EdgeBuilder(*services(), *neo4j_params(), graph_store=components.get("graph_store"))
+    
+    def pagerank_calculator():
+        from src.tools.phase1.t68_pagerank import PageRankCalculator
+        return PageRankCalculator(*services(), *neo4j_params(), graph_store=components.get("graph_store"))
     
-    entity_builder = EntityBuilder(identity_service, provenance_service, quality_service, neo4j_uri, neo4j_user, neo4j_password)
-    edge_builder = EdgeBuilder(identity_service, provenance_service, quality_service, neo4j_uri, neo4j_user, neo4j_password)
-    pagerank_calculator = PageRankCalculator(identity_service, provenance_service, quality_service, neo4j_uri, neo4j_user, neo4j_password)
-    query_engine = MultiHopQuery(identity_service, provenance_service, quality_service, neo4j_uri, neo4j_user, neo4j_password)
+    def query_engine():
+        from src.tools.phase1.t49_multihop_query import MultiHopQuery
+        return MultiHopQuery(*services(), *neo4j_params(), graph_store=components.get("graph_store"))
+    
+    for factory in (
+        pdf_loader, text_chunker, entity_extractor, relationship_extractor,
+        entity_builder, edge_builder, pagerank_calculator, query_engine
+    ):
+        components.register(factory.__name__, factory)
+
+
+def create_phase1_mcp_tools(mcp: FastMCP, components: Optional[LazyRegistry] = None) -> Dict[str, Any]:
+    """Add Phase 1 pipeline tools to an existing MCP server
+    
+    Tools are constructed on first use. Pass the server's registry to share
+    its core services and warm-up; otherwise a new registry is created.
+    """
+    if components is None:
+        components = LazyRegistry()
+    _register_phase1_tools(components)
     
     # =============================================================================
     # T01: PDF Loading Tools
@@ -71,14 +125,14 @@ def create_phase1_mcp_tools(mcp: FastMCP):
         """
         results = []
         for path in document_paths:
-            result = pdf_loader.load_pdf(path)  # pdf_loader can handle various formats
+            result = components.get("pdf_loader").load_pdf(path)  # pdf_loader can handle various formats
             results.append(result)
         return {"documents": results, "total_loaded": len(results)}
     
     @mcp.tool()
     def get_pdf_loader_info() -> Dict[str, Any]:
         """Get PDF loader tool information."""
-        return pdf_loader.get_tool_info()
+        return components.get("pdf_loader").get_tool_info()
     
     # =============================================================================
     # T15a: Text Chunking Tools
@@ -101,7 +155,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             chunk_size: Target size of each chunk in characters
             overlap: Number of characters to overlap between chunks
         """
-        return text_chunker.chunk_text(
+        return components.get("text_chunker").chunk_text(
             document_ref=document_ref,
             text=text,
             document_confidence=document_confidence,
@@ -112,7 +166,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_text_chunker_info() -> Dict[str, Any]:
         """Get text chunker tool information."""
-        return text_chunker.get_tool_info()
+        return components.get("text_chunker").get_tool_info()
     
     # =============================================================================
     # T23a: Entity Extraction Tools
@@ -131,7 +185,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             text: Text to analyze for entities
             chunk_confidence: Confidence score from chunk
         """
-        return entity_extractor.extract_entities(
+        return components.get("entity_extractor").extract_entities(
             chunk_ref=chunk_ref,
             text=text,
             chunk_confidence=chunk_confidence
@@ -140,17 +194,17 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_supported_entity_types() -> List[str]:
         """Get list of entity types supported by spaCy NER."""
-        return entity_extractor.get_supported_entity_types()
+        return components.get("entity_extractor").get_supported_entity_types()
     
     @mcp.tool()
     def get_entity_extractor_info() -> Dict[str, Any]:
         """Get entity extractor tool information."""
-        return entity_extractor.get_tool_info()
+        return components.get("entity_extractor").get_tool_info()
     
     @mcp.tool()
     def get_spacy_model_info() -> Dict[str, Any]:
         """Get information about the loaded spaCy model."""
-        return entity_extractor.get_model_info()
+        return components.get("entity_extractor").get_model_info()
     
     # =============================================================================
     # T27: Relationship Extraction Tools
@@ -171,7 +225,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             entities: List of entities found in this chunk
             chunk_confidence: Confidence score from chunk
         """
-        return relationship_extractor.extract_relationships(
+        return components.get("relationship_extractor").extract_relationships(
             chunk_ref=chunk_ref,
             text=text,
             entities=entities,
@@ -181,12 +235,12 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_supported_relationship_types() -> List[str]:
         """Get list of relationship types supported by pattern extraction."""
-        return relationship_extractor.get_supported_relationship_types()
+        return components.get("relationship_extractor").get_supported_relationship_types()
     
     @mcp.tool()
     def get_relationship_extractor_info() -> Dict[str, Any]:
         """Get relationship extractor tool information."""
-        return relationship_extractor.get_tool_info()
+        return components.get("relationship_extractor").get_tool_info()
     
     # =============================================================================
     # T31: Entity Building Tools
@@ -203,7 +257,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             mentions: List of entity mentions to process
             source_refs: List of source document references
         """
-        return entity_builder.build_entities(
+        return components.get("entity_builder").build_entities(
             mentions=mentions,
             source_refs=source_refs
         )
@@ -211,7 +265,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_entity_builder_info() -> Dict[str, Any]:
         """Get entity builder tool information."""
-        return entity_builder.get_tool_info()
+        return components.get("entity_builder").get_tool_info()
     
     # =============================================================================
     # T34: Edge Building Tools
@@ -228,7 +282,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             relationships: List of relationships to process
             source_refs: List of source document references
         """
-        return edge_builder.build_edges(
+        return components.get("edge_builder").build_edges(
             relationships=relationships,
             source_refs=source_refs
         )
@@ -236,7 +290,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_edge_builder_info() -> Dict[str, Any]:
         """Get edge builder tool information."""
-        return edge_builder.get_tool_info()
+        return components.get("edge_builder").get_tool_info()
     
     # =============================================================================
     # T68: PageRank Tools
@@ -255,12 +309,41 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             max_iterations: Maximum iterations for convergence
             tolerance: Convergence tolerance
         """
-        return pagerank_calculator.calculate_pagerank(
+        return components.get("pagerank_calculator").calculate_pagerank(
             damping_factor=damping_factor,
             max_iterations=max_iterations,
             tolerance=tolerance
         )
     
+    @mcp.tool()
+    def submit_calculate_pagerank(
+        damping_factor: float = 0.85,
+        max_iterations: int = 100,
+        tolerance: float = 1e-6,
+        timeout_seconds: float = None
+    ) -> Dict[str, Any]:
+        """Start calculate_pagerank as a background job and return its job ID.
+        
+        Cancellation and timeouts stop the job after the graph is loaded or
+        before scores are written, not during the PageRank iteration itself.
+        
+        Args:
+            damping_factor: PageRank damping factor (0.0-1.0)
+            max_iterations: Maximum iterations for convergence
+            tolerance: Convergence tolerance
+            timeout_seconds: Job timeout (server default if omitted)
+        """
+        return components.get("job_manager").submit(
+            "calculate_pagerank",
+            lambda: components.get("pagerank_calculator").calculate_pagerank(
+                damping_factor=damping_factor,
+                max_iterations=max_iterations,
+                tolerance=tolerance
+            ),
+            parameters={"damping_factor": damping_factor, "max_iterations": max_iterations, "tolerance": tolerance},
+            timeout_seconds=timeout_seconds
+        )
+    
     @mcp.tool()
     def get_top_entities(limit: int = 10) -> List[Dict[str, Any]]:
         """Get top entities by PageRank score.
@@ -268,7 +351,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
         Args:
             limit: Maximum number of entities to return
         """
-        result = pagerank_calculator.calculate_pagerank()
+        result = components.get("pagerank_calculator").calculate_pagerank()
         if result["status"] == "success":
             return result["ranked_entities"][:limit]
         return []
@@ -276,7 +359,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     @mcp.tool()
     def get_pagerank_calculator_info() -> Dict[str, Any]:
         """Get PageRank calculator tool information."""
-        return pagerank_calculator.get_tool_info()
+        return components.get("pagerank_calculator").get_tool_info()
     
     # =============================================================================
     # T49: Multi-hop Query Tools
@@ -295,16 +378,45 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             max_hops: Maximum hops to traverse in graph
             result_limit: Maximum number of results to return
         """
-        return query_engine.query_graph(
+        return components.get("query_engine").query_graph(
             query_text=query_text,
             max_hops=max_hops,
             result_limit=result_limit
         )
     
+    @mcp.tool()
+    def submit_query_graph(
+        query_text: str,
+        max_hops: int = 2,
+        result_limit: int = 10,
+        timeout_seconds: float = None
+    ) -> Dict[str, Any]:
+        """Start query_graph as a background job and return its job ID.
+        
+        Cancellation and timeouts stop the job after entity extraction or
+        between start entities, not during a single path search.
+        
+        Args:
+            query_text: Natural language query
+            max_hops: Maximum hops to traverse in graph
+            result_limit: Maximum number of results to return
+            timeout_seconds: Job timeout (server default if omitted)
+        """
+        return components.get("job_manager").submit(
+            "query_graph",
+            lambda: components.get("query_engine").query_graph(
+                query_text=query_text,
+                max_hops=max_hops,
+                result_limit=result_limit
+            ),
+            parameters={"query_text": query_text, "max_hops": max_hops, "result_limit": result_limit},
+            timeout_seconds=timeout_seconds
+        )
+    
     @mcp.tool()
     def get_query_engine_info() -> Dict[str, Any]:
         """Get query engine tool information."""
-        return query_engine.get_tool_info()
+        return components.get("query_engine").get_tool_info()
     
     # =============================================================================
     # Graph Analysis Tools
@@ -314,7 +426,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     def get_graph_statistics() -> Dict[str, Any]:
         """Get comprehensive graph statistics."""
         # Use PageRank calculator to get graph stats
-        pagerank_result = pagerank_calculator.calculate_pagerank()
+        pagerank_result = components.get("pagerank_calculator").calculate_pagerank()
         if pagerank_result["status"] == "success":
             return pagerank_result.get("graph_stats", {})
         return {"error": "Failed to get graph statistics"}
@@ -327,10 +439,10 @@ def create_phase1_mcp_tools(mcp: FastMCP):
             entity_id: ID of the entity to examine
         """
         # Get mentions for this entity
-        mentions = identity_service.get_mentions_for_entity(entity_id)
+        mentions = components.get("identity_service").get_mentions_for_entity(entity_id)
         
         # Get entity from graph
-        entity_result = entity_builder.get_entity_by_id(entity_id)
+        entity_result = components.get("entity_builder").get_entity_by_id(entity_id)
         
         return {
             "entity_id": entity_id,
@@ -347,14 +459,14 @@ def create_phase1_mcp_tools(mcp: FastMCP):
     def get_phase1_tool_registry() -> Dict[str, Any]:
         """Get registry of all Phase 1 tools and their capabilities."""
         return {
-            "T01_PDF_LOADER": pdf_loader.get_tool_info(),
-            "T15A_TEXT_CHUNKER": text_chunker.get_tool_info(),
-            "T23A_SPACY_NER": entity_extractor.get_tool_info(),
-            "T27_RELATIONSHIP_EXTRACTOR": relationship_extractor.get_tool_info(),
-            "T31_ENTITY_BUILDER": entity_builder.get_tool_info(),
-            "T34_EDGE_BUILDER": edge_builder.get_tool_info(),
-            "T68_PAGERANK": pagerank_calculator.get_tool_info(),
-            "T49_MULTIHOP_QUERY": query_engine.get_tool_info()
+            "T01_PDF_LOADER": components.get("pdf_loader").get_tool_info(),
+            "T15A_TEXT_CHUNKER": components.get("text_chunker").get_tool_info(),
+            "T23A_SPACY_NER": components.get("entity_extractor").get_tool_info(),
+            "T27_RELATIONSHIP_EXTRACTOR": components.get("relationship_extractor").get_tool_info(),
+            "T31_ENTITY_BUILDER": components.get("entity_builder").get_tool_info(),
+            "T34_EDGE_BUILDER": components.get("edge_builder").get_tool_info(),
+            "T68_PAGERANK": components.get("pagerank_calculator").get_tool_info(),
+            "T49_MULTIHOP_QUERY": components.get("query_engine").get_tool_info()
         }
     
     @mcp.tool()
@@ -364,14 +476,14 @@ def create_phase1_mcp_tools(mcp: FastMCP):
         
         # Test PDF loader
         try:
-            loader_info = pdf_loader.get_tool_info()
+            loader_info = components.get("pdf_loader").get_tool_info()
             validation_results["pdf_loader"] = {"status": "ok", "info": loader_info}
         except Exception as e:
             validation_results["pdf_loader"] = {"status": "error", "error": str(e)}
         
         # Test entity extractor
         try:
-            model_info = entity_extractor.get_model_info()
+            model_info = components.get("entity_extractor").get_model_info()
             validation_results["entity_extractor"] = {
                 "status": "ok" if model_info["available"] else "warning",
                 "info": model_info
@@ -381,7 +493,7 @@ def create_phase1_mcp_tools(mcp: FastMCP):
         
         # Test graph connections
         try:
-            stats = pagerank_calculator.calculate_pagerank()
+            stats = components.get("pagerank_calculator").calculate_pagerank()
             validation_results["graph_connection"] = {
                 "status": "ok" if stats["status"] == "success" else "error",
                 "info": stats.get("graph_stats", {})
@@ -404,7 +516,8 @@ def create_phase1_mcp_tools(mcp: FastMCP):
         }
     
     return {
-        "tools_added": 25,
+        "tools_added": 27,
+        "components": components.names(),
         "categories": [
             "PDF Loading (T01)",
             "Text Chunking (T15a)",
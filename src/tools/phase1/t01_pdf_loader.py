@@ -21,13 +21,15 @@ import os
 from pathlib import Path
 import uuid
 from datetime import datetime
-import pypdf
 import sys
 
 # Import core services
 from src.core.identity_service import IdentityService
 from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService
+from src.core.lazy_imports import lazy_import
+
+pypdf = lazy_import("pypdf")
 
 
 class PDFLoader:
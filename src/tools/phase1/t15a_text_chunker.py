@@ -102,37 +102,41 @@ class TextChunker:
                     document_ref, text, tokens, document_confidence
                 )
             
-            # Track quality for each chunk
-            chunk_refs = []
-            for chunk in chunks:
-                chunk_ref = chunk["chunk_ref"]
-                chunk_refs.append(chunk_ref)
-                
-                # Propagate confidence from document with slight degradation
-                propagated_confidence = self.quality_service.propagate_confidence(
-                    input_refs=[document_ref],
-                    operation_type="text_chunking",
-                    boost_factor=0.98  # Small degradation for chunking
-                )
-                
-                # Assess chunk quality
-                quality_result = self.quality_service.assess_confidence(
-                    object_ref=chunk_ref,
-                    base_confidence=propagated_confidence,
-                    factors={
-                        "chunk_length": min(1.0, len(chunk["text"]) / 1000),  # Longer chunks better
-                        "token_count": min(1.0, chunk["token_count"] / self.chunk_size),  # Target size
-                        "position_factor": 1.0 - (chunk["chunk_index"] * 0.01)  # Early chunks slightly better
-                    },
-                    metadata={
-                        "source_document": document_ref,
-                        "chunk_method": "sliding_window"
-                    }
-                )
-                
-                if quality_result["status"] == "success":
-                    chunk["confidence"] = quality_result["confidence"]
-                    chunk["quality_tier"] = quality_result["quality_tier"]
+            # Propagate confidence from document with slight degradation
+            # (same inputs for every chunk)
+            propagated_confidence = self.quality_service.propagate_confidence(
+                input_refs=[document_ref],
+                operation_type="text_chunking",
+                boost_factor=0.98  # Small degradation for chunking
+            )
+            
+            # Assess quality for all chunks in one call
+            chunk_refs = [chunk["chunk_ref"] for chunk in chunks]
+            quality_result = self.quality_service.assess_confidence_batch(
+                object_refs=chunk_refs,
+                base_confidences=[propagated_confidence] * len(chunks),
+                factors={
+                    "chunk_length": [min(1.0, len(c["text"]) / 1000) for c in chunks],  # Longer chunks better
+                    "token_count": [min(1.0, c["token_count"] / self.chunk_size) for c in chunks],  # Target size
+                    "position_factor": [1.0 - (c["chunk_index"] * 0.01) for c in chunks]  # Early chunks slightly better
+                },
+                metadata={
+                    "source_document": document_ref,
+                    "chunk_method": "sliding_window"
+                }
+            )
+            
+            if quality_result["status"] == "success":
+                for chunk, confidence, tier in zip(chunks, quality_result["confidences"], quality_result["quality_tiers"]):
+                    chunk["confidence"] = confidence
+                    chunk["quality_tier"] = tier
+            
+            # One aggregate quality record when per-chunk tracking is reduced
+            self.quality_service.record_batch_assessment(
+                batch_ref=operation_id,
+                confidences=[c["confidence"] for c in chunks],
+                metadata={"tool_id": self.tool_id, "source_document": document_ref}
+            )
             
             # Complete operation
             completion_result = self.provenance_service.complete_operation(
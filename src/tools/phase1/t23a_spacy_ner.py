@@ -19,13 +19,15 @@ Deferred features:
 from typing import Dict, List, Optional, Any, Tuple
 import uuid
 from datetime import datetime
-import spacy
-from spacy.lang.en import English
 
 # Import core services
 from src.core.identity_service import IdentityService
 from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService
+from src.core.lazy_imports import lazy_import
+
+spacy = lazy_import("spacy")
+spacy_en = lazy_import("spacy.lang.en", install_hint="spacy")
 
 
 class SpacyNER:
@@ -80,7 +82,7 @@ class SpacyNER:
                     self.nlp = spacy.load("en_core_web_sm")
                 except OSError:
                     # Create a blank English model as fallback
-                    self.nlp = English()
+                    self.nlp = spacy_en.English()
                     print("Warning: No spaCy model found. Using blank model. Install with: python -m spacy download en_core_web_sm")
             
             self._model_initialized = True
@@ -94,7 +96,9 @@ class SpacyNER:
         self,
         chunk_ref: str,
         text: str,
-        chunk_confidence: float = 0.8
+        chunk_confidence: float = 0.8,
+        doc: Any = None,
+        entities: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Extract named entities from text chunk.
         
@@ -102,6 +106,9 @@ class SpacyNER:
             chunk_ref: Reference to source text chunk
             text: Text to analyze
             chunk_confidence: Confidence score from chunk
+            doc: Existing spaCy parse of text to reuse (parsed here if None)
+            entities: Entities already found by find_entities (e.g. in a
+                worker process); only mention creation and tracking run here
             
         Returns:
             List of extracted entities with positions and confidence
@@ -118,15 +125,6 @@ class SpacyNER:
         )
         
         try:
-            # Initialize spaCy model only when needed
-            self._initialize_spacy_model()
-            
-            if not self.nlp:
-                return self._complete_with_error(
-                    operation_id,
-                    "spaCy model not available"
-                )
-            
             # Input validation
             if not text or not text.strip():
                 return self._complete_with_error(
@@ -140,43 +138,30 @@ class SpacyNER:
                     "chunk_ref is required"
                 )
             
-            if not self.nlp:
-                return self._complete_with_error(
-                    operation_id,
-                    "spaCy model not available"
-                )
-            
-            # Process text with spaCy
-            doc = self.nlp(text)
+            if entities is None:
+                # Initialize spaCy model only when needed
+                self._initialize_spacy_model()
+                
+                if not self.nlp:
+                    return self._complete_with_error(
+                        operation_id,
+                        "spaCy model not available"
+                    )
+                
+                entities = self.find_entities(text, chunk_confidence, doc)
             
-            # Extract entities
             extracted_entities = []
             mention_refs = []
             
-            for ent in doc.ents:
-                # Filter to target entity types
-                if ent.label_ not in self.target_entity_types:
-                    continue
-                
-                # Skip very short entities (likely noise)
-                if len(ent.text.strip()) < 2:
-                    continue
-                
-                # Calculate entity confidence
-                entity_confidence = self._calculate_entity_confidence(
-                    entity_text=ent.text,
-                    entity_type=ent.label_,
-                    context_confidence=chunk_confidence
-                )
-                
+            for entity in entities:
                 # Create mention through identity service
                 mention_result = self.identity_service.create_mention(
-                    surface_form=ent.text,
-                    start_pos=ent.start_char,
-                    end_pos=ent.end_char,
+                    surface_form=entity["surface_form"],
+                    start_pos=entity["start_char"],
+                    end_pos=entity["end_char"],
                     source_ref=chunk_ref,
-                    entity_type=ent.label_,
-                    confidence=entity_confidence
+                    entity_type=entity["entity_type"],
+                    confidence=entity["confidence"]
                 )
                 
                 if mention_result["status"] == "success":
@@ -184,12 +169,12 @@ class SpacyNER:
                         "mention_id": mention_result["mention_id"],
                         "entity_id": mention_result["entity_id"],
                         "mention_ref": f"storage://mention/{mention_result['mention_id']}",
-                        "surface_form": ent.text,
+                        "surface_form": entity["surface_form"],
                         "normalized_form": mention_result["normalized_form"],
-                        "entity_type": ent.label_,
-                        "start_char": ent.start_char,
-                        "end_char": ent.end_char,
-                        "confidence": entity_confidence,
+                        "entity_type": entity["entity_type"],
+                        "start_char": entity["start_char"],
+                        "end_char": entity["end_char"],
+                        "confidence": entity["confidence"],
                         "source_chunk": chunk_ref,
                         "extraction_method": "spacy_ner",
                         "created_at": datetime.now().isoformat()
@@ -197,26 +182,37 @@ class SpacyNER:
                     
                     extracted_entities.append(entity_data)
                     mention_refs.append(entity_data["mention_ref"])
-                    
-                    # Assess quality for mention
-                    quality_result = self.quality_service.assess_confidence(
-                        object_ref=entity_data["mention_ref"],
-                        base_confidence=entity_confidence,
-                        factors={
-                            "entity_length": min(1.0, len(ent.text) / 20),  # Longer entities better
-                            "entity_type_confidence": self._get_type_confidence(ent.label_),
-                            "context_quality": chunk_confidence
-                        },
-                        metadata={
-                            "extraction_tool": "spacy",
-                            "entity_type": ent.label_,
-                            "source_chunk": chunk_ref
-                        }
-                    )
-                    
-                    if quality_result["status"] == "success":
-                        entity_data["quality_confidence"] = quality_result["confidence"]
-                        entity_data["quality_tier"] = quality_result["quality_tier"]
+            
+            # Assess quality for all mentions in one call
+            if extracted_entities:
+                quality_result = self.quality_service.assess_confidence_batch(
+                    object_refs=mention_refs,
+                    base_confidences=[e["confidence"] for e in extracted_entities],
+                    factors={
+                        "entity_length": [min(1.0, len(e["surface_form"]) / 20) for e in extracted_entities],  # Longer entities better
+                        "entity_type_confidence": [self._get_type_confidence(e["entity_type"]) for e in extracted_entities],
+                        "context_quality": [chunk_confidence] * len(extracted_entities)
+                    },
+                    metadata=[{
+                        "extraction_tool": "spacy",
+                        "entity_type": e["entity_type"],
+                        "source_chunk": chunk_ref
+                    } for e in extracted_entities]
+                )
+                
+                if quality_result["status"] == "success":
+                    for entity_data, confidence, tier in zip(
+                        extracted_entities, quality_result["confidences"], quality_result["quality_tiers"]
+                    ):
+                        entity_data["quality_confidence"] = confidence
+                        entity_data["quality_tier"] = tier
+            
+            # One aggregate quality record when per-mention tracking is reduced
+            self.quality_service.record_batch_assessment(
+                batch_ref=operation_id,
+                confidences=[e.get("quality_confidence", e["confidence"]) for e in extracted_entities],
+                metadata={"tool_id": self.tool_id, "source_chunk": chunk_ref}
+            )
             
             # Complete operation
             completion_result = self.provenance_service.complete_operation(
@@ -245,6 +241,46 @@ class SpacyNER:
                 f"Unexpected error during entity extraction: {str(e)}"
             )
     
+    def find_entities(
+        self,
+        text: str,
+        chunk_confidence: float = 0.8,
+        doc: Any = None
+    ) -> List[Dict[str, Any]]:
+        """Find target entities in text without creating mentions.
+        
+        Uses only the spaCy model, so it can run in worker processes;
+        the plain records are registered with extract_entities(entities=...).
+        """
+        self._initialize_spacy_model()
+        
+        # Process text with spaCy unless a shared parse was provided
+        if doc is None:
+            doc = self.nlp(text)
+        
+        entities = []
+        for ent in doc.ents:
+            # Filter to target entity types
+            if ent.label_ not in self.target_entity_types:
+                continue
+            
+            # Skip very short entities (likely noise)
+            if len(ent.text.strip()) < 2:
+                continue
+            
+            entities.append({
+                "surface_form": ent.text,
+                "entity_type": ent.label_,
+                "start_char": ent.start_char,
+                "end_char": ent.end_char,
+                "confidence": self._calculate_entity_confidence(
+                    entity_text=ent.text,
+                    entity_type=ent.label_,
+                    context_confidence=chunk_confidence
+                )
+            })
+        return entities
+    
     def _calculate_entity_confidence(
         self, 
         entity_text: str, 
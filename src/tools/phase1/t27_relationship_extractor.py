@@ -20,12 +20,14 @@ from typing import Dict, List, Optional, Any, Tuple
 import uuid
 from datetime import datetime
 import re
-import spacy
 
 # Import core services
 from src.core.identity_service import IdentityService
 from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService
+from src.core.lazy_imports import lazy_import
+
+spacy = lazy_import("spacy")
 
 
 class RelationshipExtractor:
@@ -115,7 +117,9 @@ class RelationshipExtractor:
         chunk_ref: str,
         text: str,
         entities: List[Dict[str, Any]],
-        chunk_confidence: float = 0.8
+        chunk_confidence: float = 0.8,
+        doc: Any = None,
+        relationships: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Extract relationships from text using entity mentions.
         
@@ -124,6 +128,9 @@ class RelationshipExtractor:
             text: Text to analyze
             entities: List of entities extracted from this chunk
             chunk_confidence: Confidence score from chunk
+            doc: Existing spaCy parse of text to reuse (parsed here if None)
+            relationships: Relationships already found by find_relationships
+                (e.g. in a worker process); only tracking runs here
             
         Returns:
             List of extracted relationships with confidence scores
@@ -163,56 +170,51 @@ class RelationshipExtractor:
                     "Not enough entities for relationship extraction"
                 )
             
-            # Extract relationships using different methods
-            relationships = []
-            relationship_refs = []
-            
-            # Method 1: Pattern-based extraction
-            pattern_relationships = self._extract_pattern_relationships(
-                text, entities, chunk_ref, chunk_confidence
-            )
-            relationships.extend(pattern_relationships)
-            
-            # Method 2: Dependency parsing (if spaCy available)
-            if self.nlp:
-                dependency_relationships = self._extract_dependency_relationships(
-                    text, entities, chunk_ref, chunk_confidence
+            if relationships is None:
+                relationships = self.find_relationships(
+                    text, entities, chunk_ref, chunk_confidence, doc
                 )
-                relationships.extend(dependency_relationships)
-            
-            # Method 3: Proximity-based relationships (simple fallback)
-            proximity_relationships = self._extract_proximity_relationships(
-                text, entities, chunk_ref, chunk_confidence
-            )
-            relationships.extend(proximity_relationships)
-            
-            # Remove duplicates and assess quality
-            relationships = self._deduplicate_relationships(relationships)
+            else:
+                # Found elsewhere against provisional entity IDs; entities
+                # may have resolved to the same ID since
+                relationships = self._deduplicate_relationships(relationships)
             
+            relationship_refs = []
             for rel in relationships:
                 rel_ref = f"storage://relationship/{rel['relationship_id']}"
                 rel["relationship_ref"] = rel_ref
                 relationship_refs.append(rel_ref)
-                
-                # Assess relationship quality
-                quality_result = self.quality_service.assess_confidence(
-                    object_ref=rel_ref,
-                    base_confidence=rel["confidence"],
+            
+            # Assess quality for all relationships in one call
+            if relationships:
+                quality_result = self.quality_service.assess_confidence_batch(
+                    object_refs=relationship_refs,
+                    base_confidences=[rel["confidence"] for rel in relationships],
                     factors={
-                        "pattern_strength": rel.get("pattern_confidence", 0.5),
-                        "entity_distance": 1.0 - min(0.5, rel.get("entity_distance", 50) / 100),
-                        "context_quality": chunk_confidence
+                        "pattern_strength": [rel.get("pattern_confidence", 0.5) for rel in relationships],
+                        "entity_distance": [1.0 - min(0.5, rel.get("entity_distance", 50) / 100) for rel in relationships],
+                        "context_quality": [chunk_confidence] * len(relationships)
                     },
-                    metadata={
+                    metadata=[{
                         "extraction_method": rel["extraction_method"],
                         "relationship_type": rel["relationship_type"],
                         "source_chunk": chunk_ref
-                    }
+                    } for rel in relationships]
                 )
                 
                 if quality_result["status"] == "success":
-                    rel["quality_confidence"] = quality_result["confidence"]
-                    rel["quality_tier"] = quality_result["quality_tier"]
+                    for rel, confidence, tier in zip(
+                        relationships, quality_result["confidences"], quality_result["quality_tiers"]
+                    ):
+                        rel["quality_confidence"] = confidence
+                        rel["quality_tier"] = tier
+            
+            # One aggregate quality record when per-relationship tracking is reduced
+            self.quality_service.record_batch_assessment(
+                batch_ref=operation_id,
+                confidences=[r.get("quality_confidence", r["confidence"]) for r in relationships],
+                metadata={"tool_id": self.tool_id, "source_chunk": chunk_ref}
+            )
             
             # Complete operation
             completion_result = self.provenance_service.complete_operation(
@@ -241,6 +243,41 @@ class RelationshipExtractor:
                 f"Unexpected error during relationship extraction: {str(e)}"
             )
     
+    def find_relationships(
+        self,
+        text: str,
+        entities: List[Dict[str, Any]],
+        chunk_ref: str,
+        chunk_confidence: float = 0.8,
+        doc: Any = None
+    ) -> List[Dict[str, Any]]:
+        """Find relationships between entities without provenance or quality tracking.
+        
+        Uses only spaCy and the patterns, so it can run in worker processes;
+        the plain records are registered with
+        extract_relationships(relationships=...).
+        """
+        relationships = []
+        
+        # Method 1: Pattern-based extraction
+        relationships.extend(self._extract_pattern_relationships(
+            text, entities, chunk_ref, chunk_confidence
+        ))
+        
+        # Method 2: Dependency parsing (if spaCy available)
+        if self.nlp:
+            relationships.extend(self._extract_dependency_relationships(
+                text, entities, chunk_ref, chunk_confidence, doc
+            ))
+        
+        # Method 3: Proximity-based relationships (simple fallback)
+        relationships.extend(self._extract_proximity_relationships(
+            text, entities, chunk_ref, chunk_confidence
+        ))
+        
+        # Remove duplicates
+        return self._deduplicate_relationships(relationships)
+    
     def _extract_pattern_relationships(
         self, 
         text: str, 
@@ -303,7 +340,8 @@ class RelationshipExtractor:
         text: str, 
         entities: List[Dict[str, Any]], 
         chunk_ref: str, 
-        chunk_confidence: float
+        chunk_confidence: float,
+        doc: Any = None
     ) -> List[Dict[str, Any]]:
         """Extract relationships using spaCy dependency parsing."""
         if not self.nlp:
@@ -312,7 +350,8 @@ class RelationshipExtractor:
         relationships = []
         
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             
             # Look for subject-verb-object patterns
             for token in doc:
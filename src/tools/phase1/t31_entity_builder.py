@@ -1,12 +1,12 @@
 """T31: Entity Node Builder - Minimal Implementation
 
-Converts entity mentions into graph nodes and stores them in Neo4j.
+Converts entity mentions into graph nodes and stores them in the graph store.
 Critical component for building the graph structure in the vertical slice.
 
 Minimal implementation focusing on:
 - Mention aggregation to entities via T107
 - Canonical name assignment
-- Basic Neo4j node creation
+- Bulk node upsert through the graph store (Neo4j or embedded)
 - Simple deduplication by name
 
 Deferred features:
@@ -16,23 +16,25 @@ Deferred features:
 - Cross-document entity resolution
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import uuid
 from datetime import datetime
-import neo4j
-from neo4j import GraphDatabase, Driver
 
 # Import core services
 try:
     from src.core.identity_service import IdentityService
     from src.core.provenance_service import ProvenanceService
     from src.core.quality_service import QualityService
+    from src.core.graph_store import GraphStore, graph_store_error
 except ImportError:
     from core.identity_service import IdentityService
     from core.provenance_service import ProvenanceService
     from core.quality_service import QualityService
+    from core.graph_store import GraphStore, graph_store_error
 from .base_neo4j_tool import BaseNeo4jTool
-from .neo4j_error_handler import Neo4jErrorHandler
+
+if TYPE_CHECKING:
+    from neo4j import Driver
 
 
 class EntityBuilder(BaseNeo4jTool):
@@ -46,11 +48,12 @@ class EntityBuilder(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None
     ):
         super().__init__(
             identity_service, provenance_service, quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver
+            neo4j_uri, neo4j_user, neo4j_password, shared_driver, graph_store
         )
         self.tool_id = "T31_ENTITY_BUILDER"
     
@@ -59,14 +62,14 @@ class EntityBuilder(BaseNeo4jTool):
         mentions: List[Dict[str, Any]],
         source_refs: List[str]
     ) -> Dict[str, Any]:
-        """Build entity nodes from mentions and store in Neo4j.
+        """Build entity nodes from mentions and store them in the graph store.
         
         Args:
             mentions: List of entity mentions from NER
             source_refs: List of source references (chunks, documents)
             
         Returns:
-            List of created entity nodes with Neo4j references
+            List of created entity nodes with graph store references
         """
         # Start operation tracking
         mention_refs = [m.get("mention_ref", "") for m in mentions]
@@ -76,7 +79,7 @@ class EntityBuilder(BaseNeo4jTool):
             inputs=source_refs + mention_refs,
             parameters={
                 "mention_count": len(mentions),
-                "storage_backend": "neo4j"
+                "storage_backend": self.graph_store.backend
             }
         )
         
@@ -89,63 +92,76 @@ class EntityBuilder(BaseNeo4jTool):
                     "No mentions provided for entity building"
                 )
             
-            # Check Neo4j availability
-            driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-            if driver_error:
-                return self._complete_with_neo4j_error(operation_id, driver_error)
+            # Check graph store availability
+            store_error = self.graph_store.check_available()
+            if store_error:
+                return self._complete_with_neo4j_error(operation_id, store_error)
             
             # Group mentions by entity (using T107 entity linking)
             entity_groups = self._group_mentions_by_entity(mentions)
             
+            # Get entity info from identity service
+            resolved = []
+            for entity_id, mention_group in entity_groups.items():
+                entity_info = self._get_entity_info(entity_id, mention_group)
+                if entity_info:
+                    resolved.append((entity_id, entity_info, mention_group))
+            
+            # Store all entity nodes in one bulk upsert
+            node_result = self._upsert_entity_nodes(resolved)
+            if node_result["status"] != "success":
+                return self._complete_with_neo4j_error(operation_id, node_result)
+            
             # Build entity nodes
             created_entities = []
             entity_refs = []
             
-            for entity_id, mention_group in entity_groups.items():
-                # Get entity info from identity service
-                entity_info = self._get_entity_info(entity_id, mention_group)
+            for (entity_id, entity_info, mention_group), node_id, properties in zip(
+                resolved, node_result["node_ids"], node_result["properties"]
+            ):
+                entity_data = {
+                    "entity_id": entity_id,
+                    "neo4j_id": node_id,
+                    "entity_ref": f"storage://{self.graph_store.backend}_entity/{node_id}",
+                    "canonical_name": entity_info["canonical_name"],
+                    "entity_type": entity_info.get("entity_type"),
+                    "mention_count": len(mention_group),
+                    "mention_ids": [m["mention_id"] for m in mention_group],
+                    "confidence": entity_info["confidence"],
+                    "properties": properties,
+                    "created_at": datetime.now().isoformat(),
+                    "source_mentions": mention_refs
+                }
                 
-                if entity_info:
-                    # Create Neo4j node
-                    neo4j_result = self._create_neo4j_entity_node(entity_info, mention_group)
-                    
-                    if neo4j_result["status"] == "success":
-                        entity_data = {
-                            "entity_id": entity_id,
-                            "neo4j_id": neo4j_result["neo4j_id"],
-                            "entity_ref": f"storage://neo4j_entity/{neo4j_result['neo4j_id']}",
-                            "canonical_name": entity_info["canonical_name"],
-                            "entity_type": entity_info.get("entity_type"),
-                            "mention_count": len(mention_group),
-                            "mention_ids": [m["mention_id"] for m in mention_group],
-                            "confidence": entity_info["confidence"],
-                            "properties": neo4j_result.get("properties", {}),
-                            "created_at": datetime.now().isoformat(),
-                            "source_mentions": mention_refs
-                        }
-                        
-                        created_entities.append(entity_data)
-                        entity_refs.append(entity_data["entity_ref"])
-                        
-                        # Assess entity quality
-                        quality_result = self.quality_service.assess_confidence(
-                            object_ref=entity_data["entity_ref"],
-                            base_confidence=entity_info["confidence"],
-                            factors={
-                                "mention_count": min(1.0, len(mention_group) / 5),  # More mentions = higher confidence
-                                "name_length": min(1.0, len(entity_info["canonical_name"]) / 20),
-                                "entity_type_confidence": self._get_type_confidence(entity_info.get("entity_type"))
-                            },
-                            metadata={
-                                "storage_backend": "neo4j",
-                                "entity_type": entity_info.get("entity_type"),
-                                "mention_count": len(mention_group)
-                            }
-                        )
-                        
-                        if quality_result["status"] == "success":
-                            entity_data["quality_confidence"] = quality_result["confidence"]
-                            entity_data["quality_tier"] = quality_result["quality_tier"]
+                created_entities.append(entity_data)
+                entity_refs.append(entity_data["entity_ref"])
+                
+                # Assess entity quality
+                quality_result = self.quality_service.assess_confidence(
+                    object_ref=entity_data["entity_ref"],
+                    base_confidence=entity_info["confidence"],
+                    factors={
+                        "mention_count": min(1.0, len(mention_group) / 5),  # More mentions = higher confidence
+                        "name_length": min(1.0, len(entity_info["canonical_name"]) / 20),
+                        "entity_type_confidence": self._get_type_confidence(entity_info.get("entity_type"))
+                    },
+                    metadata={
+                        "storage_backend": self.graph_store.backend,
+                        "entity_type": entity_info.get("entity_type"),
+                        "mention_count": len(mention_group)
+                    }
+                )
+                
+                if quality_result["status"] == "success":
+                    entity_data["quality_confidence"] = quality_result["confidence"]
+                    entity_data["quality_tier"] = quality_result["quality_tier"]
+            
+            # One aggregate quality record when per-entity tracking is reduced
+            self.quality_service.record_batch_assessment(
+                batch_ref=operation_id,
+                confidences=[e.get("quality_confidence", e["confidence"]) for e in created_entities],
+                metadata={"tool_id": self.tool_id}
+            )
             
             # Complete operation
             completion_result = self.provenance_service.complete_operation(
@@ -211,65 +227,41 @@ class EntityBuilder(BaseNeo4jTool):
         
         return None
     
-    def _create_neo4j_entity_node(
-        self, 
-        entity_info: Dict[str, Any], 
-        mentions: List[Dict[str, Any]]
+    def _upsert_entity_nodes(
+        self,
+        resolved: List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]
     ) -> Dict[str, Any]:
-        """Create entity node in Neo4j."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            return driver_error
+        """Create or update entity nodes in the graph store in one bulk write."""
+        nodes = []
+        for _, entity_info, mentions in resolved:
+            # Prepare entity properties
+            properties = {
+                "entity_id": entity_info["entity_id"],
+                "canonical_name": entity_info["canonical_name"],
+                "confidence": entity_info["confidence"],
+                "mention_count": len(mentions),
+                "created_at": datetime.now().isoformat(),
+                "tool_version": "T31_v1.0"
+            }
+            
+            # Add entity type if available (also stored as a node label)
+            if entity_info.get("entity_type"):
+                properties["entity_type"] = entity_info["entity_type"]
+            
+            # Add mention surface forms
+            properties["surface_forms"] = list(set(m["surface_form"] for m in mentions))
+            nodes.append(properties)
         
         try:
-            with self.driver.session() as session:
-                # Prepare entity properties
-                properties = {
-                    "entity_id": entity_info["entity_id"],
-                    "canonical_name": entity_info["canonical_name"],
-                    "confidence": entity_info["confidence"],
-                    "mention_count": len(mentions),
-                    "created_at": datetime.now().isoformat(),
-                    "tool_version": "T31_v1.0"
-                }
-                
-                # Add entity type if available
-                if entity_info.get("entity_type"):
-                    properties["entity_type"] = entity_info["entity_type"]
-                
-                # Add mention surface forms
-                surface_forms = list(set(m["surface_form"] for m in mentions))
-                properties["surface_forms"] = surface_forms
-                
-                # Create Cypher query
-                label = "Entity"
-                if entity_info.get("entity_type"):
-                    # Add specific type label
-                    label = f"Entity:{entity_info['entity_type']}"
-                
-                cypher = f"""
-                CREATE (e:{label} $properties)
-                RETURN elementId(e) as neo4j_id, e
-                """
-                
-                result = session.run(cypher, properties=properties)
-                record = result.single()
-                
-                if record:
-                    return {
-                        "status": "success",
-                        "neo4j_id": record["neo4j_id"],
-                        "properties": dict(record["e"])
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "error": "Failed to create Neo4j node"
-                    }
-                    
+            node_ids = self.graph_store.upsert_nodes(nodes) if nodes else []
         except Exception as e:
-            return Neo4jErrorHandler.create_operation_error("create_entity_node", e)
+            return graph_store_error("create_entity_nodes", e)
+        
+        return {
+            "status": "success",
+            "node_ids": node_ids,
+            "properties": nodes
+        }
     
     def _get_type_confidence(self, entity_type: Optional[str]) -> float:
         """Get confidence modifier for entity type."""
@@ -302,28 +294,22 @@ class EntityBuilder(BaseNeo4jTool):
             type_counts[entity_type] = type_counts.get(entity_type, 0) + 1
         return type_counts
     
-    def get_entity_by_neo4j_id(self, neo4j_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve entity from Neo4j by ID."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable: {driver_error['message']}")
+    def get_entity_by_neo4j_id(self, neo4j_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve entity from the graph store by node id."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable: {store_error['message']}")
             return None
         
         try:
-            with self.driver.session() as session:
-                result = session.run(
-                    "MATCH (e:Entity) WHERE id(e) = $id RETURN e",
-                    id=neo4j_id
-                )
-                record = result.single()
-                
-                if record:
-                    return dict(record["e"])
-                
+            entity = self.graph_store.get_node(neo4j_id)
+            if entity:
+                entity.pop("node_id", None)
+            return entity
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("get_entity_by_neo4j_id", e)
-            print(f"Neo4j operation failed: {error_result['message']}")
+            error_result = graph_store_error("get_entity_by_neo4j_id", e)
+            print(f"Graph store operation failed: {error_result['message']}")
         
         return None
     
@@ -333,48 +319,26 @@ class EntityBuilder(BaseNeo4jTool):
         entity_type: str = None,
         limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Search entities in Neo4j."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable: {driver_error['message']}")
+        """Search entities in the graph store."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable: {store_error['message']}")
             return []
         
         try:
-            with self.driver.session() as session:
-                conditions = []
-                params = {"limit": limit}
-                
-                if name_pattern:
-                    conditions.append("e.canonical_name CONTAINS $name_pattern")
-                    params["name_pattern"] = name_pattern
-                
-                if entity_type:
-                    conditions.append("e.entity_type = $entity_type")
-                    params["entity_type"] = entity_type
-                
-                where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-                
-                cypher = f"""
-                MATCH (e:Entity)
-                {where_clause}
-                RETURN elementId(e) as neo4j_id, e
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher, **params)
-                
-                entities = []
-                for record in result:
-                    entity_data = dict(record["e"])
-                    entity_data["neo4j_id"] = record["neo4j_id"]
-                    entities.append(entity_data)
-                
-                return entities
+            entities = self.graph_store.scan_nodes(
+                equals={"entity_type": entity_type} if entity_type else None,
+                contains=name_pattern,
+                limit=limit
+            )
+            for entity in entities:
+                entity["neo4j_id"] = entity.pop("node_id")
+            return entities
                 
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("search_entities", e)
-            print(f"Neo4j operation failed: {error_result['message']}")
+            error_result = graph_store_error("search_entities", e)
+            print(f"Graph store operation failed: {error_result['message']}")
             return []
     
     def _complete_with_error(self, operation_id: str, error_message: str) -> Dict[str, Any]:
@@ -393,15 +357,15 @@ class EntityBuilder(BaseNeo4jTool):
         }
     
     def _complete_with_neo4j_error(self, operation_id: str, error_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete operation with Neo4j error following NO MOCKS policy."""
+        """Complete operation with graph store error following NO MOCKS policy."""
         self.provenance_service.complete_operation(
             operation_id=operation_id,
             outputs=[],
             success=False,
-            error_message=error_dict.get("error", "Neo4j operation failed")
+            error_message=error_dict.get("error", "Graph store operation failed")
         )
         
-        # Return the full error dictionary from Neo4jErrorHandler
+        # Return the full error dictionary from the graph store
         error_dict["operation_id"] = operation_id
         return error_dict
     
@@ -424,32 +388,22 @@ class EntityBuilder(BaseNeo4jTool):
         }
     
     def get_neo4j_stats(self) -> Dict[str, Any]:
-        """Get Neo4j database statistics."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            return driver_error
+        """Get graph store statistics."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            return store_error
         
         try:
-            with self.driver.session() as session:
-                # Count entities
-                entity_count = session.run("MATCH (e:Entity) RETURN count(e) as count").single()["count"]
-                
-                # Count by type
-                type_counts = session.run("""
-                MATCH (e:Entity)
-                RETURN e.entity_type as type, count(e) as count
-                ORDER BY count DESC
-                """).data()
-                
-                return {
-                    "status": "success",
-                    "total_entities": entity_count,
-                    "entity_type_distribution": {r["type"] or "UNKNOWN": r["count"] for r in type_counts}
-                }
+            stats = self.graph_store.get_statistics()
+            return {
+                "status": "success",
+                "total_entities": stats["node_count"],
+                "entity_type_distribution": stats["node_types"]
+            }
                 
         except Exception as e:
-            return Neo4jErrorHandler.create_operation_error("get_neo4j_stats", e)
+            return graph_store_error("get_neo4j_stats", e)
     
     
     def get_tool_info(self) -> Dict[str, Any]:
@@ -458,8 +412,8 @@ class EntityBuilder(BaseNeo4jTool):
             "tool_id": self.tool_id,
             "name": "Entity Node Builder",
             "version": "1.0.0",
-            "description": "Converts entity mentions into graph nodes in Neo4j",
-            "storage_backend": "neo4j",
+            "description": "Converts entity mentions into graph nodes in the graph store",
+            "storage_backend": self.graph_store.backend,
             "requires_mentions": True,
             "neo4j_connected": self.driver is not None,
             "input_type": "mentions",
@@ -1,6 +1,6 @@
 """T34: Relationship Edge Builder - Minimal Implementation
 
-Creates weighted relationship edges in Neo4j from extracted relationships.
+Creates weighted relationship edges in the graph store from extracted relationships.
 Essential for building the graph structure needed for PageRank analysis.
 
 Minimal implementation focusing on:
@@ -16,25 +16,26 @@ Deferred features:
 - Advanced graph constraints
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 import uuid
 from datetime import datetime
-import neo4j
-from neo4j import GraphDatabase, Driver
 
 # Import core services
 try:
     from src.core.identity_service import IdentityService
     from src.core.provenance_service import ProvenanceService
     from src.core.quality_service import QualityService
+    from src.core.graph_store import GraphStore, graph_store_error
     from src.tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from src.tools.phase1.neo4j_error_handler import Neo4jErrorHandler
 except ImportError:
     from core.identity_service import IdentityService
     from core.provenance_service import ProvenanceService
     from core.quality_service import QualityService
+    from core.graph_store import GraphStore, graph_store_error
     from tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from tools.phase1.neo4j_error_handler import Neo4jErrorHandler
+
+if TYPE_CHECKING:
+    from neo4j import Driver
 
 
 class EdgeBuilder(BaseNeo4jTool):
@@ -48,9 +49,10 @@ class EdgeBuilder(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None
     ):
-        # Initialize base class with shared driver
+        # Initialize base class with shared driver or store
         super().__init__(
             identity_service=identity_service,
             provenance_service=provenance_service,
@@ -58,7 +60,8 @@ class EdgeBuilder(BaseNeo4jTool):
             neo4j_uri=neo4j_uri,
             neo4j_user=neo4j_user,
             neo4j_password=neo4j_password,
-            shared_driver=shared_driver
+            shared_driver=shared_driver,
+            graph_store=graph_store
         )
         
         self.tool_id = "T34_EDGE_BUILDER"
@@ -74,14 +77,14 @@ class EdgeBuilder(BaseNeo4jTool):
         relationships: List[Dict[str, Any]],
         source_refs: List[str]
     ) -> Dict[str, Any]:
-        """Build relationship edges in Neo4j from extracted relationships.
+        """Build relationship edges in the graph store from extracted relationships.
         
         Args:
             relationships: List of relationships from T27
             source_refs: List of source references (chunks, documents)
             
         Returns:
-            List of created edges with Neo4j references
+            List of created edges with graph store references
         """
         # Start operation tracking
         relationship_refs = [r.get("relationship_ref", "") for r in relationships]
@@ -91,7 +94,7 @@ class EdgeBuilder(BaseNeo4jTool):
             inputs=source_refs + relationship_refs,
             parameters={
                 "relationship_count": len(relationships),
-                "storage_backend": "neo4j"
+                "storage_backend": self.graph_store.backend
             }
         )
         
@@ -104,24 +107,26 @@ class EdgeBuilder(BaseNeo4jTool):
                     "No relationships provided for edge building"
                 )
             
-            # Check Neo4j availability
-            driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-            if driver_error:
-                return self._complete_with_neo4j_error(operation_id, driver_error)
+            # Check graph store availability
+            store_error = self.graph_store.check_available()
+            if store_error:
+                return self._complete_with_neo4j_error(operation_id, store_error)
+            
+            # Store all edges in one bulk upsert
+            upsert_result = self._upsert_relationship_edges(relationships)
+            if upsert_result["status"] != "success":
+                return self._complete_with_neo4j_error(operation_id, upsert_result)
             
             # Build edges
             created_edges = []
             edge_refs = []
             
-            for relationship in relationships:
-                # Create Neo4j relationship edge
-                edge_result = self._create_neo4j_relationship_edge(relationship)
-                
+            for relationship, edge_result in zip(relationships, upsert_result["edges"]):
                 if edge_result["status"] == "success":
                     edge_data = {
                         "relationship_id": relationship["relationship_id"],
                         "neo4j_rel_id": edge_result["neo4j_rel_id"],
-                        "edge_ref": f"storage://neo4j_relationship/{edge_result['neo4j_rel_id']}",
+                        "edge_ref": f"storage://{self.graph_store.backend}_relationship/{edge_result['neo4j_rel_id']}",
                         "relationship_type": relationship["relationship_type"],
                         "subject_entity_id": relationship["subject_entity_id"],
                         "object_entity_id": relationship["object_entity_id"],
@@ -147,7 +152,7 @@ class EdgeBuilder(BaseNeo4jTool):
                             "evidence_quality": self._assess_evidence_quality(relationship.get("evidence_text", ""))
                         },
                         metadata={
-                            "storage_backend": "neo4j",
+                            "storage_backend": self.graph_store.backend,
                             "relationship_type": relationship["relationship_type"],
                             "extraction_method": relationship.get("extraction_method")
                         }
@@ -159,6 +164,13 @@ class EdgeBuilder(BaseNeo4jTool):
                 else:
                     print(f"Failed to create edge for relationship {relationship['relationship_id']}: {edge_result.get('error')}")
             
+            # One aggregate quality record when per-edge tracking is reduced
+            self.quality_service.record_batch_assessment(
+                batch_ref=operation_id,
+                confidences=[e.get("quality_confidence", e["confidence"]) for e in created_edges],
+                metadata={"tool_id": self.tool_id}
+            )
+            
             # Complete operation
             completion_result = self.provenance_service.complete_operation(
                 operation_id=operation_id,
@@ -188,67 +200,59 @@ class EdgeBuilder(BaseNeo4jTool):
                 f"Unexpected error during edge building: {str(e)}"
             )
     
-    def _create_neo4j_relationship_edge(self, relationship: Dict[str, Any]) -> Dict[str, Any]:
-        """Create relationship edge in Neo4j."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            return driver_error
+    def _upsert_relationship_edges(self, relationships: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create relationship edges in the graph store in one bulk write."""
+        edges = []
+        for relationship in relationships:
+            # Calculate edge weight
+            weight = self._calculate_edge_weight(relationship)
+            
+            # Prepare relationship properties
+            properties = {
+                "relationship_id": relationship["relationship_id"],
+                "weight": weight,
+                "confidence": relationship["confidence"],
+                "extraction_method": relationship.get("extraction_method", "unknown"),
+                "evidence_text": relationship.get("evidence_text", "")[:500],  # Truncate long evidence
+                "created_at": datetime.now().isoformat(),
+                "tool_version": "T34_v1.0"
+            }
+            
+            # Add method-specific properties
+            if relationship.get("pattern_confidence"):
+                properties["pattern_confidence"] = relationship["pattern_confidence"]
+            
+            if relationship.get("entity_distance"):
+                properties["entity_distance"] = relationship["entity_distance"]
+            
+            edges.append({
+                "source": relationship["subject_entity_id"],
+                "target": relationship["object_entity_id"],
+                "relationship_type": relationship["relationship_type"],
+                "properties": properties
+            })
         
         try:
-            with self.driver.session() as session:
-                # Calculate edge weight
-                weight = self._calculate_edge_weight(relationship)
-                
-                # Prepare relationship properties
-                properties = {
-                    "relationship_id": relationship["relationship_id"],
-                    "weight": weight,
-                    "confidence": relationship["confidence"],
-                    "extraction_method": relationship.get("extraction_method", "unknown"),
-                    "evidence_text": relationship.get("evidence_text", "")[:500],  # Truncate long evidence
-                    "created_at": datetime.now().isoformat(),
-                    "tool_version": "T34_v1.0"
-                }
-                
-                # Add method-specific properties
-                if relationship.get("pattern_confidence"):
-                    properties["pattern_confidence"] = relationship["pattern_confidence"]
-                
-                if relationship.get("entity_distance"):
-                    properties["entity_distance"] = relationship["entity_distance"]
-                
-                # Create Cypher query to link entities
-                cypher = """
-                MATCH (subject:Entity {entity_id: $subject_id})
-                MATCH (object:Entity {entity_id: $object_id})
-                CREATE (subject)-[r:%s $properties]->(object)
-                RETURN elementId(r) as neo4j_rel_id, r
-                """ % self._sanitize_relationship_type(relationship["relationship_type"])
-                
-                result = session.run(
-                    cypher,
-                    subject_id=relationship["subject_entity_id"],
-                    object_id=relationship["object_entity_id"],
-                    properties=properties
-                )
-                record = result.single()
-                
-                if record:
-                    return {
-                        "status": "success",
-                        "neo4j_rel_id": record["neo4j_rel_id"],
-                        "weight": weight,
-                        "properties": dict(record["r"])
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "error": "Failed to create Neo4j relationship - entities may not exist"
-                    }
-                    
+            edge_ids = self.graph_store.upsert_edges(edges)
         except Exception as e:
-            return Neo4jErrorHandler.create_operation_error("create_relationship_edge", e)
+            return graph_store_error("create_relationship_edges", e)
+        
+        results = []
+        for edge, edge_id in zip(edges, edge_ids):
+            if edge_id is not None:
+                results.append({
+                    "status": "success",
+                    "neo4j_rel_id": edge_id,
+                    "weight": edge["properties"]["weight"],
+                    "properties": edge["properties"]
+                })
+            else:
+                results.append({
+                    "status": "error",
+                    "error": "Failed to create relationship - entities may not exist"
+                })
+        
+        return {"status": "success", "edges": results}
     
     def _calculate_edge_weight(self, relationship: Dict[str, Any]) -> float:
         """Calculate edge weight from relationship confidence and other factors."""
@@ -290,16 +294,6 @@ class EdgeBuilder(BaseNeo4jTool):
         
         return round(weight, 3)
     
-    def _sanitize_relationship_type(self, rel_type: str) -> str:
-        """Sanitize relationship type for use as Neo4j relationship label."""
-        # Replace spaces and special characters with underscores
-        import re
-        sanitized = re.sub(r'[^A-Za-z0-9_]', '_', rel_type)
-        # Ensure it starts with a letter
-        if sanitized and not sanitized[0].isalpha():
-            sanitized = "REL_" + sanitized
-        return sanitized or "RELATED_TO"
-    
     def _assess_evidence_quality(self, evidence_text: str) -> float:
         """Assess quality of evidence text."""
         if not evidence_text:
@@ -352,39 +346,21 @@ class EdgeBuilder(BaseNeo4jTool):
             }
         }
     
-    def get_relationship_by_neo4j_id(self, neo4j_rel_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve relationship from Neo4j by ID."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable: {driver_error['message']}")
+    def get_relationship_by_neo4j_id(self, neo4j_rel_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve relationship from the graph store by edge id."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable: {store_error['message']}")
             return None
         
         try:
-            with self.driver.session() as session:
-                result = session.run(
-                    """
-                    MATCH (a)-[r]->(b) 
-                    WHERE id(r) = $id 
-                    RETURN r, type(r) as rel_type, a.entity_id as subject_id, b.entity_id as object_id
-                    """,
-                    id=neo4j_rel_id
-                )
-                record = result.single()
-                
-                if record:
-                    rel_data = dict(record["r"])
-                    rel_data.update({
-                        "neo4j_rel_id": neo4j_rel_id,
-                        "relationship_type": record["rel_type"],
-                        "subject_entity_id": record["subject_id"],
-                        "object_entity_id": record["object_id"]
-                    })
-                    return rel_data
-                
+            edge = self.graph_store.get_edge(neo4j_rel_id)
+            if edge:
+                return self._relationship_record(edge)
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("get_relationship_by_neo4j_id", e)
-            print(f"Neo4j operation failed: {error_result['message']}")
+            error_result = graph_store_error("get_relationship_by_neo4j_id", e)
+            print(f"Graph store operation failed: {error_result['message']}")
         
         return None
     
@@ -395,101 +371,65 @@ class EdgeBuilder(BaseNeo4jTool):
         max_weight: float = None,
         limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Search relationships in Neo4j."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable: {driver_error['message']}")
+        """Search relationships in the graph store."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable: {store_error['message']}")
             return []
         
         try:
-            with self.driver.session() as session:
-                conditions = []
-                params = {"limit": limit}
-                
-                if relationship_type:
-                    # Note: This is simplified - in practice you'd need to handle the dynamic relationship type
-                    conditions.append("type(r) = $rel_type")
-                    params["rel_type"] = relationship_type
-                
-                if min_weight is not None:
-                    conditions.append("r.weight >= $min_weight")
-                    params["min_weight"] = min_weight
-                
-                if max_weight is not None:
-                    conditions.append("r.weight <= $max_weight")
-                    params["max_weight"] = max_weight
-                
-                where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-                
-                cypher = f"""
-                MATCH (a:Entity)-[r]->(b:Entity)
-                {where_clause}
-                RETURN elementId(r) as neo4j_rel_id, r, type(r) as rel_type, 
-                       a.entity_id as subject_id, b.entity_id as object_id
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher, **params)
-                
-                relationships = []
-                for record in result:
-                    rel_data = dict(record["r"])
-                    rel_data.update({
-                        "neo4j_rel_id": record["neo4j_rel_id"],
-                        "relationship_type": record["rel_type"],
-                        "subject_entity_id": record["subject_id"],
-                        "object_entity_id": record["object_id"]
-                    })
-                    relationships.append(rel_data)
-                
-                return relationships
+            edges = self.graph_store.scan_edges(
+                relationship_type=relationship_type,
+                min_values={"weight": min_weight} if min_weight is not None else None,
+                max_values={"weight": max_weight} if max_weight is not None else None,
+                limit=limit
+            )
+            return [self._relationship_record(edge) for edge in edges]
                 
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("search_relationships", e)
-            print(f"Neo4j operation failed: {error_result['message']}")
+            error_result = graph_store_error("search_relationships", e)
+            print(f"Graph store operation failed: {error_result['message']}")
             return []
     
+    def _relationship_record(self, edge: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a graph store edge into the relationship format returned by this tool."""
+        edge["neo4j_rel_id"] = edge.pop("edge_id")
+        edge["subject_entity_id"] = edge.pop("source_id")
+        edge["object_entity_id"] = edge.pop("target_id")
+        return edge
+    
     def get_neo4j_graph_stats(self) -> Dict[str, Any]:
-        """Get Neo4j graph statistics."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            return driver_error
+        """Get graph store statistics."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            return store_error
         
         try:
-            with self.driver.session() as session:
-                # Count entities and relationships
-                entity_count = session.run("MATCH (e:Entity) RETURN count(e) as count").single()["count"]
-                
-                rel_count = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()["count"]
-                
-                # Count relationship types
-                rel_types = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as type, count(r) as count, avg(r.weight) as avg_weight
-                ORDER BY count DESC
-                """).data()
-                
-                # Calculate graph density
-                max_possible_edges = entity_count * (entity_count - 1) if entity_count > 1 else 0
-                density = rel_count / max_possible_edges if max_possible_edges > 0 else 0
-                
-                return {
-                    "status": "success",
-                    "total_entities": entity_count,
-                    "total_relationships": rel_count,
-                    "graph_density": round(density, 4),
-                    "relationship_type_distribution": {
-                        r["type"]: {
-                            "count": r["count"],
-                            "average_weight": round(r["avg_weight"] or 0, 3)
-                        } for r in rel_types
-                    }
+            stats = self.graph_store.get_statistics()
+            entity_count = stats["node_count"]
+            rel_count = stats["edge_count"]
+            
+            # Calculate graph density
+            max_possible_edges = entity_count * (entity_count - 1) if entity_count > 1 else 0
+            density = rel_count / max_possible_edges if max_possible_edges > 0 else 0
+            
+            return {
+                "status": "success",
+                "total_entities": entity_count,
+                "total_relationships": rel_count,
+                "graph_density": round(density, 4),
+                "relationship_type_distribution": {
+                    rel_type: {
+                        "count": r["count"],
+                        "average_weight": round(r["average_weight"], 3)
+                    } for rel_type, r in stats["relationship_types"].items()
                 }
+            }
                 
         except Exception as e:
-            return Neo4jErrorHandler.create_operation_error("get_neo4j_graph_stats", e)
+            return graph_store_error("get_neo4j_graph_stats", e)
     
     def _complete_with_error(self, operation_id: str, error_message: str) -> Dict[str, Any]:
         """Complete operation with error."""
@@ -507,15 +447,15 @@ class EdgeBuilder(BaseNeo4jTool):
         }
     
     def _complete_with_neo4j_error(self, operation_id: str, error_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete operation with Neo4j error following NO MOCKS policy."""
+        """Complete operation with graph store error following NO MOCKS policy."""
         self.provenance_service.complete_operation(
             operation_id=operation_id,
             outputs=[],
             success=False,
-            error_message=error_dict.get("error", "Neo4j operation failed")
+            error_message=error_dict.get("error", "Graph store operation failed")
         )
         
-        # Return the full error dictionary from Neo4jErrorHandler
+        # Return the full error dictionary from the graph store
         error_dict["operation_id"] = operation_id
         return error_dict
     
@@ -545,8 +485,8 @@ class EdgeBuilder(BaseNeo4jTool):
             "tool_id": self.tool_id,
             "name": "Relationship Edge Builder",
             "version": "1.0.0",
-            "description": "Creates weighted relationship edges in Neo4j from extracted relationships",
-            "storage_backend": "neo4j",
+            "description": "Creates weighted relationship edges in the graph store from extracted relationships",
+            "storage_backend": self.graph_store.backend,
             "requires_relationships": True,
             "weight_range": [self.min_weight, self.max_weight],
             "neo4j_connected": self.driver is not None,
@@ -1,6 +1,6 @@
 """T49: Multi-hop Graph Query - Minimal Implementation
 
-Performs multi-hop queries on the Neo4j graph to find answers.
+Performs multi-hop queries on the entity graph (via the graph store) to find answers.
 Final component of the PDF → PageRank → Answer vertical slice workflow.
 
 Minimal implementation focusing on:
@@ -8,33 +8,38 @@ Minimal implementation focusing on:
 - PageRank-weighted result ranking
 - Simple path finding between entities
 - Integration with core services
+- Result caching while the graph is unchanged (repeat questions skip traversal)
 
 Deferred features:
 - Complex query planning
 - Advanced path ranking algorithms
 - Semantic query understanding
-- Query result caching
 """
 
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, TYPE_CHECKING
 import uuid
 from datetime import datetime
-import neo4j
-from neo4j import GraphDatabase, Driver
 
 # Import core services
 try:
     from src.core.identity_service import IdentityService
     from src.core.provenance_service import ProvenanceService
     from src.core.quality_service import QualityService
+    from src.core.graph_store import GraphStore, graph_store_error, graph_version
+    from src.core.query_cache import QueryResultCache
+    from src.core.job_manager import JobCancelled, check_cancelled
     from src.tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from src.tools.phase1.neo4j_error_handler import Neo4jErrorHandler
 except ImportError:
     from core.identity_service import IdentityService
     from core.provenance_service import ProvenanceService
     from core.quality_service import QualityService
+    from core.graph_store import GraphStore, graph_store_error, graph_version
+    from core.query_cache import QueryResultCache
+    from core.job_manager import JobCancelled, check_cancelled
     from tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from tools.phase1.neo4j_error_handler import Neo4jErrorHandler
+
+if TYPE_CHECKING:
+    from neo4j import Driver
 
 
 class MultiHopQueryEngine(BaseNeo4jTool):
@@ -48,7 +53,9 @@ class MultiHopQueryEngine(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None,
+        query_cache: Optional[QueryResultCache] = None
     ):
         super().__init__(
             identity_service=identity_service,
@@ -57,10 +64,11 @@ class MultiHopQueryEngine(BaseNeo4jTool):
             neo4j_uri=neo4j_uri,
             neo4j_user=neo4j_user,
             neo4j_password=neo4j_password,
-            shared_driver=shared_driver
+            shared_driver=shared_driver,
+            graph_store=graph_store
         )
         
-        # Initialize the actual query engine
+        # Initialize the actual query engine on the same store
         self.query_engine = MultiHopQuery(
             identity_service=identity_service,
             provenance_service=provenance_service,
@@ -68,7 +76,8 @@ class MultiHopQueryEngine(BaseNeo4jTool):
             neo4j_uri=neo4j_uri,
             neo4j_user=neo4j_user,
             neo4j_password=neo4j_password,
-            shared_driver=shared_driver
+            graph_store=self.graph_store,
+            query_cache=query_cache
         )
     
     def query_graph(self, query_text: str, **kwargs) -> Dict[str, Any]:
@@ -90,9 +99,11 @@ class MultiHopQuery(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None,
+        query_cache: Optional[QueryResultCache] = None
     ):
-        # Initialize base class with shared driver
+        # Initialize base class with shared driver or store
         super().__init__(
             identity_service=identity_service,
             provenance_service=provenance_service,
@@ -100,7 +111,8 @@ class MultiHopQuery(BaseNeo4jTool):
             neo4j_uri=neo4j_uri,
             neo4j_user=neo4j_user,
             neo4j_password=neo4j_password,
-            shared_driver=shared_driver
+            shared_driver=shared_driver,
+            graph_store=graph_store
         )
         
         self.tool_id = "T49_MULTIHOP_QUERY"
@@ -110,6 +122,9 @@ class MultiHopQuery(BaseNeo4jTool):
         self.max_results = 100          # Maximum results per query
         self.min_path_weight = 0.01     # Minimum path weight threshold
         self.pagerank_boost = 2.0       # Boost factor for PageRank scores
+        
+        # Results of repeat queries against an unchanged graph
+        self.query_cache = query_cache or QueryResultCache()
     
     
     def query_graph(
@@ -129,7 +144,32 @@ class MultiHopQuery(BaseNeo4jTool):
             
         Returns:
             Query results with paths, entities, and confidence scores
+        
+        Run as a background job, the query stops when the job is cancelled
+        or times out: after entity extraction and between start entities.
         """
+        # Serve repeat queries on an unchanged graph from the cache; the
+        # version is read before the query runs so that a concurrent write
+        # leaves the result under an already stale key
+        cache_key = None
+        if self.query_cache.enabled and query_text and query_text.strip():
+            cache_key = self.query_cache.make_key(
+                query_text,
+                {
+                    "query_entities": query_entities or [],
+                    "max_hops": max_hops,
+                    "result_limit": result_limit,
+                    "backend": self.graph_store.backend
+                },
+                graph_version()
+            )
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                if cached.get("query"):
+                    cached["query"]["text"] = query_text
+                cached["cache_hit"] = True
+                return cached
+        
         # Start operation tracking
         operation_id = self.provenance_service.start_operation(
             tool_id=self.tool_id,
@@ -151,10 +191,10 @@ class MultiHopQuery(BaseNeo4jTool):
                     "Query text cannot be empty"
                 )
             
-            # Check Neo4j availability
-            driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-            if driver_error:
-                return self._complete_with_neo4j_error(operation_id, driver_error)
+            # Check graph store availability
+            store_error = self.graph_store.check_available()
+            if store_error:
+                return self._complete_with_neo4j_error(operation_id, store_error)
             
             max_hops = max(1, min(self.max_hops, max_hops))  # Clamp to valid range
             result_limit = max(1, min(self.max_results, result_limit))
@@ -164,11 +204,13 @@ class MultiHopQuery(BaseNeo4jTool):
                 query_entities = self._extract_query_entities(query_text)
             
             if not query_entities:
-                return self._complete_success(
+                return self._cache_result(cache_key, self._complete_success(
                     operation_id,
                     [],
                     "No entities found in query for graph traversal"
-                )
+                ))
+            
+            check_cancelled()
             
             # Execute multi-hop search
             search_results = self._execute_multihop_search(
@@ -229,7 +271,7 @@ class MultiHopQuery(BaseNeo4jTool):
                 }
             )
             
-            return {
+            return self._cache_result(cache_key, {
                 "status": "success",
                 "query": {
                     "text": query_text,
@@ -245,8 +287,11 @@ class MultiHopQuery(BaseNeo4jTool):
                 },
                 "operation_id": operation_id,
                 "provenance": completion_result
-            }
+            })
             
+        except JobCancelled as e:
+            self._complete_with_error(operation_id, str(e))
+            raise
         except Exception as e:
             return self._complete_with_error(
                 operation_id,
@@ -256,10 +301,10 @@ class MultiHopQuery(BaseNeo4jTool):
     def _extract_query_entities(self, query_text: str) -> List[str]:
         """Extract potential entity names from query text."""
         # Improved entity extraction - search for all meaningful terms
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable for entity extraction: {driver_error['message']}")
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable for entity extraction: {store_error['message']}")
             return []
         
         try:
@@ -290,27 +335,24 @@ class MultiHopQuery(BaseNeo4jTool):
                         if not all(w.lower() in question_words for w in words[i:i+length]):
                             search_terms.append(phrase)
             
-            # Search for matching entities in Neo4j using case-insensitive search
+            # Search for matching entities using case-insensitive search
             found_entities = []
             seen_names = set()
             
-            with self.driver.session() as session:
-                for term in search_terms:
-                    # Use case-insensitive search
-                    result = session.run("""
-                        MATCH (e:Entity)
-                        WHERE toLower(e.canonical_name) CONTAINS toLower($term)
-                           OR ANY(form IN e.surface_forms WHERE toLower(form) CONTAINS toLower($term))
-                        RETURN DISTINCT e.canonical_name as name, e.pagerank_score as score
-                        ORDER BY coalesce(e.pagerank_score, 0) DESC
-                        LIMIT 5
-                        """, term=term)
-                    
-                    for record in result:
-                        name = record["name"]
-                        if name not in seen_names:
-                            found_entities.append(name)
-                            seen_names.add(name)
+            for term in search_terms:
+                matches = self.graph_store.scan_nodes(
+                    contains=term,
+                    contains_fields=("canonical_name",),
+                    contains_list_fields=("surface_forms",),
+                    order_by="pagerank_score",
+                    limit=5
+                )
+                
+                for entity in matches:
+                    name = entity.get("canonical_name")
+                    if name not in seen_names:
+                        found_entities.append(name)
+                        seen_names.add(name)
             
             # Log what we found
             print(f"\nQuery: '{query_text}'")
@@ -333,159 +375,120 @@ class MultiHopQuery(BaseNeo4jTool):
     ) -> Dict[str, Any]:
         """Execute multi-hop search starting from given entities."""
         try:
-            with self.driver.session() as session:
-                all_paths = []
-                entities_visited = set()
+            all_paths = []
+            entities_visited = set()
+            
+            # For each starting entity, find paths
+            for entity_name in start_entities:
+                check_cancelled()
                 
-                # For each starting entity, find paths
-                for entity_name in start_entities:
-                    # Find the entity node
-                    entity_result = session.run("""
-                    MATCH (e:Entity)
-                    WHERE e.canonical_name = $name
-                    RETURN e.entity_id as id, e.canonical_name as name, e.pagerank_score as score
-                    """, name=entity_name)
-                    
-                    entity_record = entity_result.single()
-                    if not entity_record:
-                        continue
-                    
-                    entities_visited.add(entity_record["id"])
-                    
-                    # Execute multi-hop traversal
-                    if max_hops == 1:
-                        paths = self._find_1hop_paths(session, entity_record["id"], limit)
-                    elif max_hops == 2:
-                        paths = self._find_2hop_paths(session, entity_record["id"], limit)
-                    else:  # max_hops >= 3
-                        paths = self._find_3hop_paths(session, entity_record["id"], limit)
-                    
-                    all_paths.extend(paths)
+                # Find the entity node
+                matches = self.graph_store.scan_nodes(equals={"canonical_name": entity_name}, limit=1)
+                if not matches or not matches[0].get("entity_id"):
+                    continue
                 
-                return {
-                    "status": "success",
-                    "paths": all_paths,
-                    "total_paths": len(all_paths),
-                    "entities_visited": len(entities_visited)
-                }
+                start_id = matches[0]["entity_id"]
+                entities_visited.add(start_id)
+                
+                # Execute multi-hop traversal
+                if max_hops == 1:
+                    paths = self._find_1hop_paths(start_id, limit)
+                elif max_hops == 2:
+                    paths = self._find_2hop_paths(start_id, limit)
+                else:  # max_hops >= 3
+                    paths = self._find_3hop_paths(start_id, limit)
+                
+                all_paths.extend(paths)
+            
+            return {
+                "status": "success",
+                "paths": all_paths,
+                "total_paths": len(all_paths),
+                "entities_visited": len(entities_visited)
+            }
                 
+        except JobCancelled:
+            raise
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("multihop_search", e)
+            error_result = graph_store_error("multihop_search", e)
             return error_result
     
-    def _find_1hop_paths(self, session, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _path_scores(edges: List[Dict[str, Any]]) -> Tuple[float, float]:
+        """Geometric means of the edge weights and confidences along a path."""
+        weight = 1.0
+        confidence = 1.0
+        for edge in edges:
+            weight *= edge.get("weight") or 0.5
+            confidence *= edge.get("confidence") or 0.5
+        return weight ** (1 / len(edges)), confidence ** (1 / len(edges))
+    
+    def _find_1hop_paths(self, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
         """Find 1-hop paths from start entity."""
-        result = session.run("""
-        MATCH (start:Entity {entity_id: $start_id})-[r]->(end:Entity)
-        RETURN start.canonical_name as start_name, start.pagerank_score as start_score,
-               type(r) as rel_type, r.weight as weight, r.confidence as rel_confidence,
-               end.canonical_name as end_name, end.pagerank_score as end_score,
-               end.entity_id as end_id
-        ORDER BY coalesce(r.weight, 0) DESC, coalesce(end.pagerank_score, 0) DESC
-        LIMIT $limit
-        """, start_id=start_entity_id, limit=limit)
-        
         paths = []
-        for record in result:
+        for found in self.graph_store.find_paths(start_entity_id, 1, limit):
+            start, end = found["nodes"]
+            edge = found["edges"][0]
             path = {
                 "hop_count": 1,
                 "path_type": "direct",
-                "start_entity": record["start_name"],
-                "end_entity": record["end_name"],
-                "end_entity_id": record["end_id"],
-                "relationship_path": [record["rel_type"]],
-                "path_weight": record["weight"] or 0.5,
-                "path_confidence": record["rel_confidence"] or 0.5,
-                "pagerank_score": record["end_score"] or 0.0,
-                "entities": [record["start_name"], record["end_name"]]
+                "start_entity": start.get("canonical_name"),
+                "end_entity": end.get("canonical_name"),
+                "end_entity_id": end.get("entity_id"),
+                "relationship_path": [edge["relationship_type"]],
+                "path_weight": edge.get("weight") or 0.5,
+                "path_confidence": edge.get("confidence") or 0.5,
+                "pagerank_score": end.get("pagerank_score") or 0.0,
+                "entities": [start.get("canonical_name"), end.get("canonical_name")]
             }
             paths.append(path)
         
         return paths
     
-    def _find_2hop_paths(self, session, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
+    def _find_2hop_paths(self, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
         """Find 2-hop paths from start entity."""
-        result = session.run("""
-        MATCH (start:Entity {entity_id: $start_id})-[r1]->(middle:Entity)-[r2]->(end:Entity)
-        WHERE start <> end
-        RETURN start.canonical_name as start_name, start.pagerank_score as start_score,
-               type(r1) as rel1_type, r1.weight as weight1, r1.confidence as conf1,
-               middle.canonical_name as middle_name, middle.pagerank_score as middle_score,
-               type(r2) as rel2_type, r2.weight as weight2, r2.confidence as conf2,
-               end.canonical_name as end_name, end.pagerank_score as end_score,
-               end.entity_id as end_id
-        ORDER BY (coalesce(r1.weight, 0.5) * coalesce(r2.weight, 0.5)) DESC, coalesce(end.pagerank_score, 0) DESC
-        LIMIT $limit
-        """, start_id=start_entity_id, limit=limit)
-        
         paths = []
-        for record in result:
-            # Calculate combined path weight
-            weight1 = record["weight1"] or 0.5
-            weight2 = record["weight2"] or 0.5
-            path_weight = (weight1 * weight2) ** 0.5  # Geometric mean
-            
-            # Calculate combined confidence
-            conf1 = record["conf1"] or 0.5
-            conf2 = record["conf2"] or 0.5
-            path_confidence = (conf1 * conf2) ** 0.5
+        for found in self.graph_store.find_paths(start_entity_id, 2, limit):
+            start, middle, end = found["nodes"]
+            path_weight, path_confidence = self._path_scores(found["edges"])
             
             path = {
                 "hop_count": 2,
                 "path_type": "indirect",
-                "start_entity": record["start_name"],
-                "middle_entity": record["middle_name"],
-                "end_entity": record["end_name"],
-                "end_entity_id": record["end_id"],
-                "relationship_path": [record["rel1_type"], record["rel2_type"]],
+                "start_entity": start.get("canonical_name"),
+                "middle_entity": middle.get("canonical_name"),
+                "end_entity": end.get("canonical_name"),
+                "end_entity_id": end.get("entity_id"),
+                "relationship_path": [edge["relationship_type"] for edge in found["edges"]],
                 "path_weight": path_weight,
                 "path_confidence": path_confidence,
-                "pagerank_score": record["end_score"] or 0.0,
-                "entities": [record["start_name"], record["middle_name"], record["end_name"]]
+                "pagerank_score": end.get("pagerank_score") or 0.0,
+                "entities": [node.get("canonical_name") for node in found["nodes"]]
             }
             paths.append(path)
         
         return paths
     
-    def _find_3hop_paths(self, session, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
+    def _find_3hop_paths(self, start_entity_id: str, limit: int) -> List[Dict[str, Any]]:
         """Find 3-hop paths from start entity."""
-        result = session.run("""
-        MATCH (start:Entity {entity_id: $start_id})-[r1]->(e1:Entity)-[r2]->(e2:Entity)-[r3]->(end:Entity)
-        WHERE start <> end AND e1 <> end AND e2 <> start
-        RETURN start.canonical_name as start_name,
-               type(r1) as rel1_type, r1.weight as weight1, r1.confidence as conf1,
-               e1.canonical_name as e1_name,
-               type(r2) as rel2_type, r2.weight as weight2, r2.confidence as conf2,
-               e2.canonical_name as e2_name,
-               type(r3) as rel3_type, r3.weight as weight3, r3.confidence as conf3,
-               end.canonical_name as end_name, end.pagerank_score as end_score,
-               end.entity_id as end_id
-        ORDER BY (coalesce(r1.weight, 0.5) * coalesce(r2.weight, 0.5) * coalesce(r3.weight, 0.5)) DESC, coalesce(end.pagerank_score, 0) DESC
-        LIMIT $limit
-        """, start_id=start_entity_id, limit=limit // 2)  # Fewer 3-hop paths due to complexity
-        
         paths = []
-        for record in result:
-            # Calculate combined path weight
-            weights = [record["weight1"] or 0.5, record["weight2"] or 0.5, record["weight3"] or 0.5]
-            path_weight = (weights[0] * weights[1] * weights[2]) ** (1/3)  # Cubic mean
-            
-            # Calculate combined confidence
-            confs = [record["conf1"] or 0.5, record["conf2"] or 0.5, record["conf3"] or 0.5]
-            path_confidence = (confs[0] * confs[1] * confs[2]) ** (1/3)
+        # Fewer 3-hop paths due to complexity
+        for found in self.graph_store.find_paths(start_entity_id, 3, limit // 2):
+            start, e1, e2, end = found["nodes"]
+            path_weight, path_confidence = self._path_scores(found["edges"])
             
             path = {
                 "hop_count": 3,
                 "path_type": "complex",
-                "start_entity": record["start_name"],
-                "intermediate_entities": [record["e1_name"], record["e2_name"]],
-                "end_entity": record["end_name"],
-                "end_entity_id": record["end_id"],
-                "relationship_path": [record["rel1_type"], record["rel2_type"], record["rel3_type"]],
+                "start_entity": start.get("canonical_name"),
+                "intermediate_entities": [e1.get("canonical_name"), e2.get("canonical_name")],
+                "end_entity": end.get("canonical_name"),
+                "end_entity_id": end.get("entity_id"),
+                "relationship_path": [edge["relationship_type"] for edge in found["edges"]],
                 "path_weight": path_weight,
                 "path_confidence": path_confidence,
-                "pagerank_score": record["end_score"] or 0.0,
-                "entities": [record["start_name"], record["e1_name"], record["e2_name"], record["end_name"]]
+                "pagerank_score": end.get("pagerank_score") or 0.0,
+                "entities": [node.get("canonical_name") for node in found["nodes"]]
             }
             paths.append(path)
         
@@ -557,6 +560,13 @@ class MultiHopQuery(BaseNeo4jTool):
             intermediates = path.get("intermediate_entities", ["entity"])
             return f"Connected through {', '.join(intermediates)} via multi-step relationships"
     
+    def _cache_result(self, cache_key: Optional[Tuple], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a successful query result under its cache key and return it."""
+        result["cache_hit"] = False
+        if cache_key is not None:
+            self.query_cache.put(cache_key, result)
+        return result
+    
     def _complete_with_error(self, operation_id: str, error_message: str) -> Dict[str, Any]:
         """Complete operation with error."""
         self.provenance_service.complete_operation(
@@ -573,15 +583,15 @@ class MultiHopQuery(BaseNeo4jTool):
         }
     
     def _complete_with_neo4j_error(self, operation_id: str, error_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete operation with Neo4j error following NO MOCKS policy."""
+        """Complete operation with graph store error following NO MOCKS policy."""
         self.provenance_service.complete_operation(
             operation_id=operation_id,
             outputs=[],
             success=False,
-            error_message=error_dict.get("error", "Neo4j operation failed")
+            error_message=error_dict.get("error", "Graph store operation failed")
         )
         
-        # Return the full error dictionary from Neo4jErrorHandler
+        # Return the full error dictionary from the graph store
         error_dict["operation_id"] = operation_id
         return error_dict
     
@@ -611,12 +621,14 @@ class MultiHopQuery(BaseNeo4jTool):
             "tool_id": self.tool_id,
             "name": "Multi-hop Graph Query",
             "version": "1.0.0",
-            "description": "Performs multi-hop queries on Neo4j graph with PageRank-weighted ranking",
+            "description": "Performs multi-hop queries on the entity graph with PageRank-weighted ranking",
+            "storage_backend": self.graph_store.backend,
             "max_hops": self.max_hops,
             "max_results": self.max_results,
             "requires_graph": True,
             "uses_pagerank": True,
             "neo4j_connected": self.driver is not None,
+            "query_cache": self.query_cache.get_stats(),
             "input_type": "natural_language_query",
             "output_type": "ranked_answers"
         }
\ No newline at end of file
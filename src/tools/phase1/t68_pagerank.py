@@ -1,11 +1,11 @@
 """T68: PageRank Calculator - Minimal Implementation
 
-Calculates PageRank centrality scores for entities in the Neo4j graph.
+Calculates PageRank centrality scores for entities in the entity graph.
 Key component for ranking entities by importance in the vertical slice.
 
 Minimal implementation focusing on:
 - Standard PageRank algorithm using NetworkX
-- Confidence-weighted edges from Neo4j
+- Confidence-weighted edges loaded from the graph store
 - Entity importance scoring
 - Integration with core services
 
@@ -16,12 +16,9 @@ Deferred features:
 - Advanced centrality measures
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 import uuid
 from datetime import datetime
-import networkx as nx
-import neo4j
-from neo4j import GraphDatabase, Driver
 
 # Import core services
 try:
@@ -29,15 +26,24 @@ try:
     from src.core.provenance_service import ProvenanceService
     from src.core.quality_service import QualityService
     from src.tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from src.tools.phase1.neo4j_error_handler import Neo4jErrorHandler
+    from src.core.graph_store import GraphStore, graph_store_error
     from src.core.config import get_config
+    from src.core.job_manager import JobCancelled, check_cancelled
+    from src.core.lazy_imports import lazy_import
 except ImportError:
     from core.identity_service import IdentityService
     from core.provenance_service import ProvenanceService
     from core.quality_service import QualityService
     from tools.phase1.base_neo4j_tool import BaseNeo4jTool
-    from tools.phase1.neo4j_error_handler import Neo4jErrorHandler
+    from core.graph_store import GraphStore, graph_store_error
     from core.config import get_config
+    from core.job_manager import JobCancelled, check_cancelled
+    from core.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    from neo4j import Driver
+
+nx = lazy_import("networkx")
 
 
 class PageRankCalculator(BaseNeo4jTool):
@@ -51,9 +57,10 @@ class PageRankCalculator(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None
+        shared_driver: Optional["Driver"] = None,
+        graph_store: Optional[GraphStore] = None
     ):
-        # Initialize base class with shared driver
+        # Initialize base class with shared driver or store
         super().__init__(
             identity_service=identity_service,
             provenance_service=provenance_service,
@@ -61,7 +68,8 @@ class PageRankCalculator(BaseNeo4jTool):
             neo4j_uri=neo4j_uri,
             neo4j_user=neo4j_user,
             neo4j_password=neo4j_password,
-            shared_driver=shared_driver
+            shared_driver=shared_driver,
+            graph_store=graph_store
         )
         
         self.tool_id = "T68_PAGERANK"
@@ -80,37 +88,51 @@ class PageRankCalculator(BaseNeo4jTool):
     def calculate_pagerank(
         self,
         graph_ref: str = "neo4j://graph/main",
-        entity_filter: Dict[str, Any] = None
+        entity_filter: Dict[str, Any] = None,
+        damping_factor: float = None,
+        max_iterations: int = None,
+        tolerance: float = None
     ) -> Dict[str, Any]:
         """Calculate PageRank scores for entities in the graph.
         
+        Run as a background job, the calculation stops when the job is
+        cancelled or times out: after loading the graph and before any
+        scores are written back.
+        
         Args:
             graph_ref: Reference to the graph (for provenance)
             entity_filter: Optional filter for entities (e.g., entity_type)
+            damping_factor: Damping factor (configured value if None)
+            max_iterations: Maximum iterations (configured value if None)
+            tolerance: Convergence tolerance (configured value if None)
             
         Returns:
             PageRank scores for all entities with rankings
         """
+        damping_factor = self.damping_factor if damping_factor is None else damping_factor
+        max_iterations = self.max_iterations if max_iterations is None else max_iterations
+        tolerance = self.tolerance if tolerance is None else tolerance
+        
         # Start operation tracking
         operation_id = self.provenance_service.start_operation(
             tool_id=self.tool_id,
             operation_type="calculate_pagerank",
             inputs=[graph_ref],
             parameters={
-                "damping_factor": self.damping_factor,
-                "max_iterations": self.max_iterations,
+                "damping_factor": damping_factor,
+                "max_iterations": max_iterations,
                 "entity_filter": entity_filter or {}
             }
         )
         
         try:
             # Input validation
-            # Check Neo4j availability
-            driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-            if driver_error:
-                return self._complete_with_neo4j_error(operation_id, driver_error)
+            # Check graph store availability
+            store_error = self.graph_store.check_available()
+            if store_error:
+                return self._complete_with_neo4j_error(operation_id, store_error)
             
-            # Load graph from Neo4j
+            # Load graph from the graph store
             graph_data = self._load_graph_from_neo4j(entity_filter)
             
             if graph_data["status"] != "success":
@@ -127,6 +149,8 @@ class PageRankCalculator(BaseNeo4jTool):
                     f"Graph too small for PageRank (only {graph_data['node_count']} nodes)"
                 )
             
+            check_cancelled()
+            
             # Create NetworkX graph
             nx_graph = self._create_networkx_graph(graph_data)
             
@@ -138,7 +162,7 @@ class PageRankCalculator(BaseNeo4jTool):
                 )
             
             # Calculate PageRank
-            pagerank_scores = self._calculate_networkx_pagerank(nx_graph)
+            pagerank_scores = self._calculate_networkx_pagerank(nx_graph, damping_factor, max_iterations, tolerance)
             
             # Process and rank results
             ranked_entities = self._process_pagerank_results(
@@ -146,7 +170,8 @@ class PageRankCalculator(BaseNeo4jTool):
                 graph_data["node_mapping"]
             )
             
-            # Store results back to Neo4j
+            # Store results back to the graph store, unless the job was cancelled meanwhile
+            check_cancelled()
             storage_result = self._store_pagerank_scores(ranked_entities)
             
             # Create result references
@@ -167,7 +192,7 @@ class PageRankCalculator(BaseNeo4jTool):
                     },
                     metadata={
                         "algorithm": "pagerank",
-                        "damping_factor": self.damping_factor,
+                        "damping_factor": damping_factor,
                         "graph_size": graph_data["node_count"]
                     }
                 )
@@ -204,6 +229,9 @@ class PageRankCalculator(BaseNeo4jTool):
                 "provenance": completion_result
             }
             
+        except JobCancelled as e:
+            self._complete_with_error(operation_id, str(e))
+            raise
         except Exception as e:
             return self._complete_with_error(
                 operation_id,
@@ -211,105 +239,64 @@ class PageRankCalculator(BaseNeo4jTool):
             )
     
     def _load_graph_from_neo4j(self, entity_filter: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Load graph structure from Neo4j."""
+        """Load graph structure from the graph store."""
         try:
-            with self.driver.session() as session:
-                # Build entity filter conditions
-                entity_conditions = []
-                params = {}
-                
-                if entity_filter:
-                    if "entity_type" in entity_filter:
-                        entity_conditions.append("a.entity_type = $entity_type AND b.entity_type = $entity_type")
-                        params["entity_type"] = entity_filter["entity_type"]
-                    
-                    if "min_confidence" in entity_filter:
-                        entity_conditions.append("a.confidence >= $min_confidence AND b.confidence >= $min_confidence")
-                        params["min_confidence"] = entity_filter["min_confidence"]
-                
-                where_clause = "WHERE " + " AND ".join(entity_conditions) if entity_conditions else ""
-                
-                # Optimized single query to load entire graph
-                # This reduces round trips and is more efficient
-                additional_conditions = " AND a.entity_id IS NOT NULL AND b.entity_id IS NOT NULL"
-                where_clause_with_null_check = where_clause + additional_conditions if where_clause else "WHERE a.entity_id IS NOT NULL AND b.entity_id IS NOT NULL"
-                
-                # Single query that gets both nodes and relationships
-                graph_query = f"""
-                MATCH (a:Entity)-[r]->(b:Entity)
-                {where_clause_with_null_check}
-                WITH collect(DISTINCT {{
-                    entity_id: a.entity_id,
-                    name: a.canonical_name,
-                    confidence: a.confidence,
-                    entity_type: a.entity_type
-                }}) + collect(DISTINCT {{
-                    entity_id: b.entity_id,
-                    name: b.canonical_name,
-                    confidence: b.confidence,
-                    entity_type: b.entity_type
-                }}) as all_nodes,
-                collect({{
-                    source: a.entity_id,
-                    target: b.entity_id,
-                    weight: r.weight,
-                    confidence: r.confidence,
-                    relationship_type: type(r)
-                }}) as all_edges
-                UNWIND all_nodes as node
-                WITH collect(DISTINCT node) as nodes, all_edges[0..size(all_edges)] as edges
-                RETURN nodes, edges
-                """
-                
-                result = session.run(graph_query, **params).single()
-                
-                if result:
-                    nodes = result["nodes"]
-                    edges = result["edges"]
-                else:
-                    nodes = []
-                    edges = []
-                
-                # Create node mapping
-                node_mapping = {}
-                for i, node in enumerate(nodes):
-                    node_mapping[node["entity_id"]] = {
-                        "index": i,
-                        "entity_id": node["entity_id"],
-                        "name": node["name"],
-                        "confidence": node["confidence"],
-                        "entity_type": node.get("entity_type")
-                    }
-                
-                return {
-                    "status": "success",
-                    "nodes": nodes,
-                    "edges": edges,
-                    "node_mapping": node_mapping,
-                    "node_count": len(nodes),
-                    "edge_count": len(edges)
+            # Build entity filter conditions (applied to both endpoints)
+            equals = {}
+            min_values = {}
+            if entity_filter:
+                if "entity_type" in entity_filter:
+                    equals["entity_type"] = entity_filter["entity_type"]
+                if "min_confidence" in entity_filter:
+                    min_values["confidence"] = entity_filter["min_confidence"]
+            
+            # Single bulk load of every edge and its endpoints
+            graph = self.graph_store.load_graph(
+                equals=equals or None,
+                min_values=min_values or None,
+                node_properties=("canonical_name", "confidence", "entity_type"),
+                edge_properties=("weight", "confidence")
+            )
+            
+            nodes = [{
+                "entity_id": node["entity_id"],
+                "name": node.get("canonical_name"),
+                "confidence": node.get("confidence"),
+                "entity_type": node.get("entity_type")
+            } for node in graph["nodes"]]
+            edges = [{
+                "source": edge["source_id"],
+                "target": edge["target_id"],
+                "weight": edge.get("weight"),
+                "confidence": edge.get("confidence"),
+                "relationship_type": edge["relationship_type"]
+            } for edge in graph["edges"]]
+            
+            # Create node mapping
+            node_mapping = {}
+            for i, node in enumerate(nodes):
+                node_mapping[node["entity_id"]] = {
+                    "index": i,
+                    "entity_id": node["entity_id"],
+                    "name": node["name"],
+                    "confidence": node["confidence"],
+                    "entity_type": node.get("entity_type")
                 }
+            
+            return {
+                "status": "success",
+                "nodes": nodes,
+                "edges": edges,
+                "node_mapping": node_mapping,
+                "node_count": len(nodes),
+                "edge_count": len(edges)
+            }
                 
         except Exception as e:
-            error_msg = str(e).lower()
-            if any(keyword in error_msg for keyword in ["connection", "network", "timeout", "unreachable", "refused"]):
-                return {
-                    "status": "error",
-                    "error": f"Neo4j network connection error: {str(e)}. Check database connectivity and network settings."
-                }
-            elif any(keyword in error_msg for keyword in ["authentication", "auth", "credentials", "unauthorized"]):
-                return {
-                    "status": "error", 
-                    "error": f"Neo4j authentication failed: {str(e)}. Verify username and password are correct."
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"Failed to load graph from Neo4j: {str(e)}"
-                }
+            return graph_store_error("load_graph", e)
     
-    def _create_networkx_graph(self, graph_data: Dict[str, Any]) -> nx.DiGraph:
-        """Create NetworkX directed graph from Neo4j data."""
+    def _create_networkx_graph(self, graph_data: Dict[str, Any]) -> "nx.DiGraph":
+        """Create NetworkX directed graph from the loaded graph data."""
         G = nx.DiGraph()
         
         # Add nodes - skip nodes with None entity_id
@@ -340,7 +327,9 @@ class PageRankCalculator(BaseNeo4jTool):
                 print(f"Warning: Skipping edge with missing nodes: {source} -> {target}")
                 continue
             
-            weight = edge.get("weight", 1.0)
+            weight = edge.get("weight")
+            if weight is None:
+                weight = 1.0
             # Ensure weight is positive and reasonable
             weight = max(0.01, min(1.0, weight))
             
@@ -354,15 +343,17 @@ class PageRankCalculator(BaseNeo4jTool):
         
         return G
     
-    def _calculate_networkx_pagerank(self, graph: nx.DiGraph) -> Dict[str, float]:
+    def _calculate_networkx_pagerank(
+        self, graph: "nx.DiGraph", damping_factor: float, max_iterations: int, tolerance: float
+    ) -> Dict[str, float]:
         """Calculate PageRank using NetworkX."""
         try:
             # Use edge weights for PageRank calculation
             pagerank_scores = nx.pagerank(
                 graph,
-                alpha=self.damping_factor,
-                max_iter=self.max_iterations,
-                tol=self.tolerance,
+                alpha=damping_factor,
+                max_iter=max_iterations,
+                tol=tolerance,
                 weight='weight'
             )
             
@@ -374,9 +365,9 @@ class PageRankCalculator(BaseNeo4jTool):
             try:
                 pagerank_scores = nx.pagerank(
                     graph,
-                    alpha=self.damping_factor,
-                    max_iter=self.max_iterations,
-                    tol=self.tolerance
+                    alpha=damping_factor,
+                    max_iter=max_iterations,
+                    tol=tolerance
                 )
                 return pagerank_scores
             except Exception as e2:
@@ -417,45 +408,30 @@ class PageRankCalculator(BaseNeo4jTool):
         return ranked_entities
     
     def _store_pagerank_scores(self, ranked_entities: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Store PageRank scores back to Neo4j entities."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            return driver_error
+        """Store PageRank scores back to the entity nodes."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            return store_error
         
         try:
-            # Prepare batch updates
-            updates = [{
-                "id": entity["entity_id"],
-                "score": entity["pagerank_score"],
-                "rank": entity["rank"],
-                "percentile": entity["percentile"],
-                "calculated_at": entity["calculated_at"]
-            } for entity in ranked_entities]
+            # One batched write-back for all entities
+            updated_count = self.graph_store.update_nodes([{
+                "entity_id": entity["entity_id"],
+                "pagerank_score": entity["pagerank_score"],
+                "pagerank_rank": entity["rank"],
+                "pagerank_percentile": entity["percentile"],
+                "pagerank_calculated_at": entity["calculated_at"]
+            } for entity in ranked_entities])
             
-            with self.driver.session() as session:
-                # Use UNWIND for batch update - much faster than individual queries
-                result = session.run("""
-                    UNWIND $updates as update
-                    MATCH (e:Entity {entity_id: update.id})
-                    SET e.pagerank_score = update.score,
-                        e.pagerank_rank = update.rank,
-                        e.pagerank_percentile = update.percentile,
-                        e.pagerank_calculated_at = update.calculated_at
-                    RETURN count(e) as updated_count
-                """, updates=updates)
-                
-                record = result.single()
-                updated_count = record["updated_count"] if record else 0
-                
-                return {
-                    "status": "success", 
-                    "entities_updated": updated_count,
-                    "entities_submitted": len(ranked_entities)
-                }
+            return {
+                "status": "success", 
+                "entities_updated": updated_count,
+                "entities_submitted": len(ranked_entities)
+            }
                 
         except Exception as e:
-            return Neo4jErrorHandler.create_operation_error("store_pagerank_scores", e)
+            return graph_store_error("store_pagerank_scores", e)
     
     def _calculate_pagerank_stats(self, ranked_entities: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate statistics about PageRank scores."""
@@ -482,43 +458,34 @@ class PageRankCalculator(BaseNeo4jTool):
         entity_type: str = None,
         min_score: float = None
     ) -> List[Dict[str, Any]]:
-        """Get top-ranked entities from Neo4j."""
-        # Check Neo4j availability
-        driver_error = Neo4jErrorHandler.check_driver_available(self.driver)
-        if driver_error:
-            print(f"Neo4j unavailable: {driver_error['message']}")
+        """Get top-ranked entities from the graph store."""
+        # Check graph store availability
+        store_error = self.graph_store.check_available()
+        if store_error:
+            print(f"Graph store unavailable: {store_error['message']}")
             return []
         
         try:
-            with self.driver.session() as session:
-                conditions = ["e.pagerank_score IS NOT NULL"]
-                params = {"limit": limit}
-                
-                if entity_type:
-                    conditions.append("e.entity_type = $entity_type")
-                    params["entity_type"] = entity_type
-                
-                if min_score is not None:
-                    conditions.append("e.pagerank_score >= $min_score")
-                    params["min_score"] = min_score
-                
-                where_clause = "WHERE " + " AND ".join(conditions)
-                
-                result = session.run(f"""
-                MATCH (e:Entity)
-                {where_clause}
-                RETURN e.entity_id as entity_id, e.canonical_name as name,
-                       e.entity_type as entity_type, e.pagerank_score as score,
-                       e.pagerank_rank as rank, e.pagerank_percentile as percentile
-                ORDER BY e.pagerank_score DESC
-                LIMIT $limit
-                """, **params)
-                
-                return result.data()
+            entities = self.graph_store.scan_nodes(
+                equals={"entity_type": entity_type} if entity_type else None,
+                min_values={"pagerank_score": min_score} if min_score is not None else None,
+                exists=("pagerank_score",),
+                order_by="pagerank_score",
+                limit=limit
+            )
+            
+            return [{
+                "entity_id": e.get("entity_id"),
+                "name": e.get("canonical_name"),
+                "entity_type": e.get("entity_type"),
+                "score": e.get("pagerank_score"),
+                "rank": e.get("pagerank_rank"),
+                "percentile": e.get("pagerank_percentile")
+            } for e in entities]
                 
         except Exception as e:
-            error_result = Neo4jErrorHandler.create_operation_error("get_top_entities", e)
-            print(f"Neo4j operation failed: {error_result['message']}")
+            error_result = graph_store_error("get_top_entities", e)
+            print(f"Graph store operation failed: {error_result['message']}")
             return []
     
     def _complete_with_error(self, operation_id: str, error_message: str) -> Dict[str, Any]:
@@ -537,15 +504,15 @@ class PageRankCalculator(BaseNeo4jTool):
         }
     
     def _complete_with_neo4j_error(self, operation_id: str, error_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete operation with Neo4j error following NO MOCKS policy."""
+        """Complete operation with graph store error following NO MOCKS policy."""
         self.provenance_service.complete_operation(
             operation_id=operation_id,
             outputs=[],
             success=False,
-            error_message=error_dict.get("error", "Neo4j operation failed")
+            error_message=error_dict.get("error", "Graph store operation failed")
         )
         
-        # Return the full error dictionary from Neo4jErrorHandler
+        # Return the full error dictionary from the graph store
         error_dict["operation_id"] = operation_id
         return error_dict
     
@@ -575,7 +542,8 @@ class PageRankCalculator(BaseNeo4jTool):
             "tool_id": self.tool_id,
             "name": "PageRank Calculator",
             "version": "1.0.0",
-            "description": "Calculates PageRank centrality scores for entities in Neo4j graph",
+            "description": "Calculates PageRank centrality scores for entities in the entity graph",
+            "storage_backend": self.graph_store.backend,
             "algorithm": "PageRank",
             "damping_factor": self.damping_factor,
             "max_iterations": self.max_iterations,
@@ -6,18 +6,23 @@ Performance optimizations:
 3. Simplified quality assessment
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 import uuid
 from datetime import datetime
-import networkx as nx
-from neo4j import GraphDatabase, Driver
 
 # Import core services
+from src.core.graph_store import GraphStore
 from src.core.identity_service import IdentityService
+from src.core.lazy_imports import lazy_import
 from src.core.provenance_service import ProvenanceService
 from src.core.quality_service import QualityService
 from .base_neo4j_tool import BaseNeo4jTool
 
+if TYPE_CHECKING:
+    from neo4j import Driver
+
+nx = lazy_import("networkx")
+
 
 class PageRankCalculatorOptimized(BaseNeo4jTool):
     """T68: PageRank Calculator - Optimized version."""
@@ -30,12 +35,13 @@ class PageRankCalculatorOptimized(BaseNeo4jTool):
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j",
         neo4j_password: str = "password",
-        shared_driver: Optional[Driver] = None,
-        damping_factor: float = 0.85
+        shared_driver: Optional["Driver"] = None,
+        damping_factor: float = 0.85,
+        graph_store: Optional[GraphStore] = None
     ):
         super().__init__(
             identity_service, provenance_service, quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver
+            neo4j_uri, neo4j_user, neo4j_password, shared_driver, graph_store
         )
         self.tool_id = "T68_PAGERANK_OPTIMIZED"
         self.damping_factor = damping_factor
@@ -120,89 +126,54 @@ class PageRankCalculatorOptimized(BaseNeo4jTool):
                 f"PageRank calculation error: {str(e)}"
             )
     
-    def _load_and_build_graph(self, entity_filter: Dict[str, Any] = None) -> Tuple[Dict, nx.DiGraph]:
-        """Load graph from Neo4j and build NetworkX graph in one pass."""
-        with self.driver.session() as session:
-            # Single optimized query to get both nodes and edges
-            query = """
-            MATCH (a:Entity)-[r]->(b:Entity)
-            WHERE a.entity_id IS NOT NULL AND b.entity_id IS NOT NULL
-            WITH collect(DISTINCT {
-                id: a.entity_id, 
-                name: a.canonical_name, 
-                type: a.entity_type,
-                confidence: a.confidence
-            }) + collect(DISTINCT {
-                id: b.entity_id,
-                name: b.canonical_name,
-                type: b.entity_type, 
-                confidence: b.confidence
-            }) as all_nodes,
-            collect({
-                source: a.entity_id,
-                target: b.entity_id,
-                weight: coalesce(r.weight, 1.0)
-            }) as all_edges
-            UNWIND all_nodes as node
-            WITH collect(DISTINCT node) as nodes, all_edges
-            RETURN nodes, all_edges, size(nodes) as node_count, size(all_edges) as edge_count
-            """
-            
-            result = session.run(query).single()
-            
-            if not result:
-                return {"node_count": 0, "edge_count": 0, "nodes": {}}, nx.DiGraph()
-            
-            # Build node mapping
-            nodes = {}
-            nx_graph = nx.DiGraph()
-            
-            for node in result["nodes"]:
-                if node["id"]:  # Extra safety check
-                    nodes[node["id"]] = {
-                        "name": node["name"],
-                        "entity_type": node["type"],
-                        "confidence": node["confidence"]
-                    }
-                    nx_graph.add_node(node["id"])
-            
-            # Add edges
-            for edge in result["all_edges"]:
-                if edge["source"] in nodes and edge["target"] in nodes:
-                    nx_graph.add_edge(
-                        edge["source"],
-                        edge["target"],
-                        weight=edge["weight"]
-                    )
-            
-            return {
-                "node_count": result["node_count"],
-                "edge_count": result["edge_count"],
-                "nodes": nodes
-            }, nx_graph
+    def _load_and_build_graph(self, entity_filter: Dict[str, Any] = None) -> Tuple[Dict, "nx.DiGraph"]:
+        """Load graph from the graph store and build NetworkX graph in one pass."""
+        # Single bulk load of both nodes and edges
+        graph = self.graph_store.load_graph(
+            node_properties=("canonical_name", "entity_type", "confidence"),
+            edge_properties=("weight",)
+        )
+        
+        # Build node mapping
+        nodes = {}
+        nx_graph = nx.DiGraph()
+        
+        for node in graph["nodes"]:
+            if node["entity_id"]:  # Extra safety check
+                nodes[node["entity_id"]] = {
+                    "name": node.get("canonical_name"),
+                    "entity_type": node.get("entity_type"),
+                    "confidence": node.get("confidence")
+                }
+                nx_graph.add_node(node["entity_id"])
+        
+        # Add edges
+        for edge in graph["edges"]:
+            if edge["source_id"] in nodes and edge["target_id"] in nodes:
+                weight = edge.get("weight")
+                nx_graph.add_edge(
+                    edge["source_id"],
+                    edge["target_id"],
+                    weight=1.0 if weight is None else weight
+                )
+        
+        return {
+            "node_count": len(nodes),
+            "edge_count": len(graph["edges"]),
+            "nodes": nodes
+        }, nx_graph
     
     def _batch_store_pagerank_scores(self, ranked_entities: List[Dict[str, Any]]):
         """Store PageRank scores in batch."""
-        with self.driver.session() as session:
-            # Prepare batch data
-            batch_data = [
-                {
-                    "entity_id": e["entity_id"],
-                    "pagerank_score": e["pagerank_score"],
-                    "updated_at": datetime.utcnow().isoformat()
-                }
-                for e in ranked_entities
-            ]
-            
-            # Single batch update query
-            query = """
-            UNWIND $batch as item
-            MATCH (e:Entity {entity_id: item.entity_id})
-            SET e.pagerank_score = item.pagerank_score,
-                e.pagerank_updated_at = item.updated_at
-            """
-            
-            session.run(query, batch=batch_data)
+        updated_at = datetime.utcnow().isoformat()
+        self.graph_store.update_nodes([
+            {
+                "entity_id": e["entity_id"],
+                "pagerank_score": e["pagerank_score"],
+                "pagerank_updated_at": updated_at
+            }
+            for e in ranked_entities
+        ])
     
     def _complete_success(self, operation_id: str, entities: List, message: str = None) -> Dict[str, Any]:
         """Complete operation with success."""
@@ -34,6 +34,7 @@ from .t49_multihop_query import MultiHopQuery
 # Import core services
 from src.core.service_manager import get_service_manager
 from src.core.workflow_state_service import WorkflowStateService
+from src.core.graphrag_phase_interface import ArtifactContext, chunk_document, load_document, parse_chunk
 
 
 class VerticalSliceWorkflow:
@@ -44,8 +45,14 @@ class VerticalSliceWorkflow:
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j", 
         neo4j_password: str = "password",
-        workflow_storage_dir: str = "./data/workflows"
+        workflow_storage_dir: str = "./data/workflows",
+        workflow_service: Optional[WorkflowStateService] = None
     ):
+        """
+        Args:
+            workflow_service: Workflow state service to share (a new one over
+                workflow_storage_dir if None)
+        """
         # Get shared service manager
         self.service_manager = get_service_manager()
         
@@ -54,11 +61,12 @@ class VerticalSliceWorkflow:
         self.provenance_service = self.service_manager.provenance_service
         self.quality_service = self.service_manager.quality_service
         
-        # Get shared Neo4j driver
-        self.neo4j_driver = self.service_manager.get_neo4j_driver(neo4j_uri, neo4j_user, neo4j_password)
+        # Get shared graph store (Neo4j or embedded, per configuration)
+        self.graph_store = self.service_manager.get_graph_store(neo4j_uri, neo4j_user, neo4j_password)
+        self.neo4j_driver = getattr(self.graph_store, "driver", None)
         
-        # Initialize workflow service (not shared)
-        self.workflow_service = WorkflowStateService(workflow_storage_dir)
+        # Initialize workflow service (not shared unless passed in)
+        self.workflow_service = workflow_service or WorkflowStateService(workflow_storage_dir)
         
         # Initialize Phase 1 tools with shared services
         self.pdf_loader = PDFLoader(
@@ -75,19 +83,19 @@ class VerticalSliceWorkflow:
         )
         self.entity_builder = EntityBuilder(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver=self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         self.edge_builder = EdgeBuilder(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver=self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         self.pagerank_calculator = PageRankCalculator(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver=self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         self.query_engine = MultiHopQuery(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, shared_driver=self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
     
     def execute_workflow(
@@ -96,7 +104,8 @@ class VerticalSliceWorkflow:
         query: str = None,
         workflow_name: str = "PDF_to_Answer_Workflow",
         document_paths: List[str] = None,
-        queries: List[str] = None
+        queries: List[str] = None,
+        artifact_context: Optional[ArtifactContext] = None
     ) -> Dict[str, Any]:
         """Execute the complete vertical slice workflow.
         
@@ -106,6 +115,8 @@ class VerticalSliceWorkflow:
             workflow_name: Name for workflow tracking
             document_paths: List of document paths (new interface)
             queries: List of queries (new interface)
+            artifact_context: Per-request artifacts shared with other phases
+                (loaded document, chunks, spaCy parses)
             
         Returns:
             Complete workflow results with answers
@@ -151,7 +162,7 @@ class VerticalSliceWorkflow:
                 workflow_id, "load_pdf", 1, {"step": "loading_pdf"}
             )
             
-            pdf_result = self.pdf_loader.load_pdf(pdf_path)
+            pdf_result = load_document(self.pdf_loader, pdf_path, artifact_context)
             if pdf_result["status"] != "success":
                 return self._complete_workflow_with_error(
                     workflow_id, results, f"PDF loading failed: {pdf_result.get('error')}"
@@ -169,11 +180,7 @@ class VerticalSliceWorkflow:
                 workflow_id, "chunk_text", 2, {"step": "chunking_text"}
             )
             
-            chunk_result = self.text_chunker.chunk_text(
-                document_ref=pdf_result["document"]["document_ref"],
-                text=pdf_result["document"]["text"],
-                document_confidence=pdf_result["document"]["confidence"]
-            )
+            chunk_result = chunk_document(self.text_chunker, pdf_result["document"], artifact_context)
             if chunk_result["status"] != "success":
                 return self._complete_workflow_with_error(
                     workflow_id, results, f"Text chunking failed: {chunk_result.get('error')}"
@@ -196,7 +203,8 @@ class VerticalSliceWorkflow:
                 entity_result = self.entity_extractor.extract_entities(
                     chunk_ref=chunk["chunk_ref"],
                     text=chunk["text"],
-                    chunk_confidence=chunk["confidence"]
+                    chunk_confidence=chunk["confidence"],
+                    doc=parse_chunk(self.relationship_extractor.nlp, chunk, artifact_context)
                 )
                 if entity_result["status"] == "success":
                     all_entities.extend(entity_result["entities"])
@@ -223,7 +231,8 @@ class VerticalSliceWorkflow:
                         chunk_ref=chunk["chunk_ref"],
                         text=chunk["text"],
                         entities=chunk_entities,
-                        chunk_confidence=chunk["confidence"]
+                        chunk_confidence=chunk["confidence"],
+                        doc=parse_chunk(self.relationship_extractor.nlp, chunk, artifact_context)
                     )
                     if rel_result["status"] == "success":
                         all_relationships.extend(rel_result["relationships"])
@@ -423,5 +432,5 @@ class VerticalSliceWorkflow:
             ],
             "input_types": ["pdf_file", "natural_language_query"],
             "output_type": "ranked_answers_with_provenance",
-            "requires_neo4j": True
+            "requires_neo4j": self.graph_store.backend == "neo4j"
         }
\ No newline at end of file
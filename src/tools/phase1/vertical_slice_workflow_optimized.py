@@ -5,6 +5,10 @@ Performance optimizations:
 2. Share Neo4j connections (F2) 
 3. Run PageRank only on query-relevant subgraph
 4. Cache spaCy model between chunks
+5. Resumable stages: outputs are saved with each checkpoint and
+   resume_workflow skips completed stages
+6. Optional process-pool entity and relationship extraction; workers
+   return plain records that are registered with the services in chunk order
 """
 
 from typing import Dict, List, Optional, Any
@@ -22,22 +26,49 @@ from .t31_entity_builder import EntityBuilder
 from .t34_edge_builder import EdgeBuilder
 from .t68_pagerank_optimized import PageRankCalculatorOptimized
 from .t49_multihop_query import MultiHopQuery
+from .parallel_extraction import ParallelChunkExtractor, local_entity_id
 
 # Import core services
+from src.core.config import get_config
 from src.core.service_manager import get_service_manager
 from src.core.workflow_state_service import WorkflowStateService
+from src.core.graphrag_phase_interface import ArtifactContext, chunk_document, load_document, parse_chunk
 
 
 class OptimizedVerticalSliceWorkflow:
     """Optimized PDF → PageRank → Answer workflow."""
     
+    # Resumable stages and their step numbers; each stage's output is saved
+    # as an artifact and checkpointed once the stage completes
+    _STAGES = [
+        ("load_pdf", 1),
+        ("chunk_text", 2),
+        ("extract_entities", 3),
+        ("extract_relationships", 4),
+        ("build_entities", 5),
+        ("build_edges", 6),
+        ("calculate_pagerank", 7)
+    ]
+    _STAGE_STEPS = dict(_STAGES)
+    
     def __init__(
         self,
         neo4j_uri: str = "bolt://localhost:7687",
         neo4j_user: str = "neo4j", 
         neo4j_password: str = "password",
-        workflow_storage_dir: str = "./data/workflows"
+        workflow_storage_dir: str = "./data/workflows",
+        extraction_workers: Optional[int] = None,
+        extraction_batch_chunks: Optional[int] = None
     ):
+        """
+        Args:
+            extraction_workers: Worker processes for entity and relationship
+                extraction (0 extracts in-process; defaults to
+                workflow.extraction_workers)
+            extraction_batch_chunks: Chunks per worker task (defaults to
+                workflow.extraction_batch_chunks)
+        """
+        config = get_config().workflow
         # Get shared service manager
         self.service_manager = get_service_manager()
         
@@ -46,8 +77,9 @@ class OptimizedVerticalSliceWorkflow:
         self.provenance_service = self.service_manager.provenance_service
         self.quality_service = self.service_manager.quality_service
         
-        # Get shared Neo4j driver
-        self.neo4j_driver = self.service_manager.get_neo4j_driver(neo4j_uri, neo4j_user, neo4j_password)
+        # Get shared graph store (Neo4j or embedded, per configuration)
+        self.graph_store = self.service_manager.get_graph_store(neo4j_uri, neo4j_user, neo4j_password)
+        self.neo4j_driver = getattr(self.graph_store, "driver", None)
         
         # Initialize workflow service (not shared)
         self.workflow_service = WorkflowStateService(workflow_storage_dir)
@@ -67,41 +99,174 @@ class OptimizedVerticalSliceWorkflow:
         )
         self.entity_builder = EntityBuilder(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         self.edge_builder = EdgeBuilder(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         # Use optimized PageRank
         self.pagerank_calculator = PageRankCalculatorOptimized(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
         self.query_engine = MultiHopQuery(
             self.identity_service, self.provenance_service, self.quality_service,
-            neo4j_uri, neo4j_user, neo4j_password, self.neo4j_driver
+            neo4j_uri, neo4j_user, neo4j_password, graph_store=self.graph_store
         )
+        
+        # Worker processes for steps 3-4 (started on first use)
+        if extraction_workers is None:
+            extraction_workers = config.extraction_workers
+        self.extraction_workers = extraction_workers
+        self.parallel_extractor = ParallelChunkExtractor(
+            extraction_workers, extraction_batch_chunks or config.extraction_batch_chunks
+        ) if extraction_workers > 0 else None
     
     def execute_workflow(
         self,
         pdf_path: str,
         query: str,
         workflow_name: str = "Optimized_PDF_Workflow",
-        skip_pagerank: bool = False  # Option to skip PageRank for testing
+        skip_pagerank: bool = False,  # Option to skip PageRank for testing
+        artifact_context: Optional[ArtifactContext] = None
     ) -> Dict[str, Any]:
-        """Execute the optimized vertical slice workflow."""
+        """Execute the optimized vertical slice workflow.
+        
+        artifact_context carries per-request artifacts (loaded document,
+        chunks, spaCy parses) shared with other phases.
+        """
+        state = {
+            "pdf_path": pdf_path,
+            "query": query,
+            "workflow_name": workflow_name,
+            "skip_pagerank": skip_pagerank,
+            "status": "started",
+            "optimized": True,
+            "completed_stages": [],
+            "artifacts": {}
+        }
+        
         # Start workflow tracking
         workflow_id = self.workflow_service.start_workflow(
             name=workflow_name,
             total_steps=8,
-            initial_state={
-                "pdf_path": pdf_path,
-                "query": query,
-                "status": "started",
-                "optimized": True
+            initial_state=state
+        )
+        
+        return self._run_workflow(workflow_id, state, artifact_context)
+    
+    def resume_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Resume a failed or interrupted workflow from its last completed stage.
+        
+        Stage outputs saved with each checkpoint are reloaded instead of
+        recomputed, so only the remaining stages run.
+        
+        Args:
+            workflow_id: ID returned by a previous execute_workflow run
+            
+        Returns:
+            Workflow results, as execute_workflow
+        """
+        reopened = self.workflow_service.reopen_workflow(workflow_id)
+        if reopened["status"] != "success":
+            return {"workflow_id": workflow_id, "status": "failed", "error": reopened["error"]}
+        
+        state = reopened["latest_checkpoint"]["state_data"]
+        if "completed_stages" not in state:
+            return {
+                "workflow_id": workflow_id,
+                "status": "failed",
+                "error": f"Workflow {workflow_id} has no resumable checkpoint state"
             }
+        
+        return self._run_workflow(workflow_id, state)
+    
+    def _completed_stages(self, state: Dict[str, Any]) -> List[str]:
+        """Completed stages whose artifacts are still available, in stage order."""
+        completed = []
+        for stage, _ in self._STAGES:
+            ref = state["artifacts"].get(stage)
+            if stage not in state["completed_stages"] or not ref or not self.workflow_service.artifacts.exists(ref):
+                break
+            completed.append(stage)
+        return completed
+    
+    def _complete_stage(self, workflow_id: str, state: Dict[str, Any], stage: str, output: Any):
+        """Persist a stage's output and checkpoint the workflow after it."""
+        ref = self.workflow_service.save_artifact(workflow_id, stage, output)
+        state["completed_stages"].append(stage)
+        state["artifacts"][stage] = ref
+        state["status"] = "running"
+        self.workflow_service.create_checkpoint(
+            workflow_id, stage, self._STAGE_STEPS[stage],
+            {
+                **state,
+                "completed_stages": list(state["completed_stages"]),
+                "artifacts": dict(state["artifacts"])
+            },
+            metadata={"artifact_bytes": self.workflow_service.artifacts.size(ref)}
         )
+    
+    def _restore_mentions(self, mentions: List[Dict[str, Any]], relationships: List[Dict[str, Any]]) -> bool:
+        """Re-register saved mentions the identity service no longer knows.
+        
+        Without identity persistence, mentions from a previous process are
+        lost; they are recreated and the saved mentions and relationships
+        are updated to the new entity and mention IDs.
+        
+        Returns:
+            True if any mention was re-registered under new IDs
+        """
+        entity_id_map = {}
+        mention_id_map = {}
+        for mention in mentions:
+            if self.identity_service.get_entity_by_mention(mention["mention_id"]) is not None:
+                continue
+            result = self.identity_service.create_mention(
+                surface_form=mention["surface_form"],
+                start_pos=mention["start_char"],
+                end_pos=mention["end_char"],
+                source_ref=mention["source_chunk"],
+                entity_type=mention["entity_type"],
+                confidence=mention["confidence"]
+            )
+            if result["status"] == "success":
+                entity_id_map[mention["entity_id"]] = result["entity_id"]
+                mention_id_map[mention["mention_id"]] = result["mention_id"]
+                mention["mention_id"] = result["mention_id"]
+                mention["entity_id"] = result["entity_id"]
+                mention["mention_ref"] = f"storage://mention/{result['mention_id']}"
+        
+        for relationship in relationships:
+            for key in ("subject_entity_id", "object_entity_id"):
+                relationship[key] = entity_id_map.get(relationship[key], relationship[key])
+            for key in ("subject_mention_id", "object_mention_id"):
+                if key in relationship:
+                    relationship[key] = mention_id_map.get(relationship[key], relationship[key])
+        return bool(entity_id_map)
+    
+    def _run_workflow(
+        self,
+        workflow_id: str,
+        state: Dict[str, Any],
+        artifact_context: Optional[ArtifactContext] = None
+    ) -> Dict[str, Any]:
+        """Run the workflow stages, reusing outputs of completed stages."""
+        pdf_path = state["pdf_path"]
+        query = state["query"]
+        workflow_name = state["workflow_name"]
+        skip_pagerank = state["skip_pagerank"]
+        
+        completed = self._completed_stages(state)
+        state["completed_stages"] = list(completed)
+        state["artifacts"] = {stage: state["artifacts"][stage] for stage in completed}
+        
+        def stage_output(stage: str):
+            if stage in completed:
+                print(f"  (Reusing saved {stage} output)")
+                return self.workflow_service.load_artifact(state["artifacts"][stage])
+            return None
         
         try:
             results = {
@@ -114,7 +279,8 @@ class OptimizedVerticalSliceWorkflow:
                 "steps": {},
                 "final_answer": None,
                 "status": "running",
-                "timing": {}
+                "timing": {},
+                "resumed_stages": list(completed)
             }
             
             workflow_start = time.time()
@@ -122,91 +288,107 @@ class OptimizedVerticalSliceWorkflow:
             # Step 1: Load PDF
             step_start = time.time()
             print("Step 1: Loading PDF...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "load_pdf", 1, {"step": "loading_pdf"}
-            )
             
-            pdf_result = self.pdf_loader.load_pdf(pdf_path)
-            if pdf_result["status"] != "success":
-                return self._complete_workflow_with_error(
-                    workflow_id, results, f"PDF loading failed: {pdf_result.get('error')}"
-                )
+            document = stage_output("load_pdf")
+            if document is None:
+                pdf_result = load_document(self.pdf_loader, pdf_path, artifact_context)
+                if pdf_result["status"] != "success":
+                    return self._complete_workflow_with_error(
+                        workflow_id, results, f"PDF loading failed: {pdf_result.get('error')}"
+                    )
+                document = pdf_result["document"]
+                self._complete_stage(workflow_id, state, "load_pdf", document)
             
             results["timing"]["pdf_loading"] = time.time() - step_start
             results["steps"]["pdf_loading"] = {
                 "status": "success",
-                "document": pdf_result["document"],
-                "confidence": pdf_result["document"]["confidence"]
+                "document": document,
+                "confidence": document["confidence"]
             }
             
             # Step 2: Chunk text
             step_start = time.time()
             print("Step 2: Chunking text...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "chunk_text", 2, {"step": "chunking_text"}
-            )
             
-            chunk_result = self.text_chunker.chunk_text(
-                document_ref=pdf_result["document"]["document_ref"],
-                text=pdf_result["document"]["text"],
-                document_confidence=pdf_result["document"]["confidence"]
-            )
-            if chunk_result["status"] != "success":
-                return self._complete_workflow_with_error(
-                    workflow_id, results, f"Text chunking failed: {chunk_result.get('error')}"
-                )
+            chunk_output = stage_output("chunk_text")
+            if chunk_output is None:
+                chunk_result = chunk_document(self.text_chunker, document, artifact_context)
+                if chunk_result["status"] != "success":
+                    return self._complete_workflow_with_error(
+                        workflow_id, results, f"Text chunking failed: {chunk_result.get('error')}"
+                    )
+                chunk_output = {
+                    "chunks": chunk_result["chunks"],
+                    "total_tokens": chunk_result["total_tokens"]
+                }
+                self._complete_stage(workflow_id, state, "chunk_text", chunk_output)
+            chunks = chunk_output["chunks"]
             
             results["timing"]["text_chunking"] = time.time() - step_start
             results["steps"]["text_chunking"] = {
                 "status": "success",
-                "chunks": len(chunk_result["chunks"]),
-                "total_tokens": chunk_result["total_tokens"]
+                "chunks": len(chunks),
+                "total_tokens": chunk_output["total_tokens"]
             }
             
             # Step 3: Extract entities from chunks
             step_start = time.time()
             print("Step 3: Extracting entities...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "extract_entities", 3, {"step": "extracting_entities"}
-            )
             
-            all_entities = []
-            for chunk in chunk_result["chunks"]:
-                entity_result = self.entity_extractor.extract_entities(
-                    chunk_ref=chunk["chunk_ref"],
-                    text=chunk["text"],
-                    chunk_confidence=chunk["confidence"]
-                )
-                if entity_result["status"] == "success":
-                    all_entities.extend(entity_result["entities"])
+            # Worker records (one per chunk) also carry the relationships for step 4
+            chunk_records = None
+            all_entities = stage_output("extract_entities")
+            if all_entities is None:
+                chunk_records = self._extract_chunk_records(chunks)
+                all_entities = []
+                for i, chunk in enumerate(chunks):
+                    entity_result = self.entity_extractor.extract_entities(
+                        chunk_ref=chunk["chunk_ref"],
+                        text=chunk["text"],
+                        chunk_confidence=chunk["confidence"],
+                        doc=None if chunk_records else parse_chunk(self.relationship_extractor.nlp, chunk, artifact_context),
+                        entities=chunk_records[i]["entities"] if chunk_records else None
+                    )
+                    if entity_result["status"] == "success":
+                        all_entities.extend(entity_result["entities"])
+                self._complete_stage(workflow_id, state, "extract_entities", all_entities)
             
             results["timing"]["entity_extraction"] = time.time() - step_start
             results["steps"]["entity_extraction"] = {
                 "status": "success",
                 "total_entities": len(all_entities),
-                "entity_types": self._count_types(all_entities, "entity_type")
+                "entity_types": self._count_types(all_entities, "entity_type"),
+                "workers": self.extraction_workers if chunk_records else 0
             }
             
             # Step 4: Extract relationships
             step_start = time.time()
             print("Step 4: Extracting relationships...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "extract_relationships", 4, {"step": "extracting_relationships"}
-            )
             
-            all_relationships = []
-            for chunk in chunk_result["chunks"]:
-                chunk_entities = [e for e in all_entities if e["source_chunk"] == chunk["chunk_ref"]]
+            all_relationships = stage_output("extract_relationships")
+            if all_relationships is None:
+                all_relationships = []
+                entities_by_chunk = {}
+                for entity in all_entities:
+                    entities_by_chunk.setdefault(entity["source_chunk"], []).append(entity)
                 
-                if len(chunk_entities) >= 2:
-                    rel_result = self.relationship_extractor.extract_relationships(
-                        chunk_ref=chunk["chunk_ref"],
-                        text=chunk["text"],
-                        entities=chunk_entities,
-                        chunk_confidence=chunk["confidence"]
-                    )
-                    if rel_result["status"] == "success":
-                        all_relationships.extend(rel_result["relationships"])
+                for i, chunk in enumerate(chunks):
+                    chunk_entities = entities_by_chunk.get(chunk["chunk_ref"], [])
+                    
+                    if len(chunk_entities) >= 2:
+                        rel_result = self.relationship_extractor.extract_relationships(
+                            chunk_ref=chunk["chunk_ref"],
+                            text=chunk["text"],
+                            entities=chunk_entities,
+                            chunk_confidence=chunk["confidence"],
+                            doc=None if chunk_records else parse_chunk(self.relationship_extractor.nlp, chunk, artifact_context),
+                            relationships=self._resolve_relationships(
+                                chunk_records[i]["relationships"], chunk_entities
+                            ) if chunk_records else None
+                        )
+                        if rel_result["status"] == "success":
+                            all_relationships.extend(rel_result["relationships"])
+                self._complete_stage(workflow_id, state, "extract_relationships", all_relationships)
             
             results["timing"]["relationship_extraction"] = time.time() - step_start
             results["steps"]["relationship_extraction"] = {
@@ -218,84 +400,99 @@ class OptimizedVerticalSliceWorkflow:
             # Step 5: Build entity nodes in Neo4j
             step_start = time.time()
             print("Step 5: Building entity nodes...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "build_entities", 5, {"step": "building_entities"}
-            )
             
-            entity_build_result = self.entity_builder.build_entities(
-                mentions=all_entities,
-                source_refs=[pdf_result["document"]["document_ref"]]
-            )
-            if entity_build_result["status"] != "success":
-                return self._complete_workflow_with_error(
-                    workflow_id, results, f"Entity building failed: {entity_build_result.get('error')}"
+            entity_output = stage_output("build_entities")
+            if entity_output is None:
+                if "extract_entities" in completed and self._restore_mentions(all_entities, all_relationships):
+                    # Later resumes skip this stage and must load the IDs the graph is built with
+                    for stage, output in (("extract_entities", all_entities),
+                                          ("extract_relationships", all_relationships)):
+                        state["artifacts"][stage] = self.workflow_service.save_artifact(workflow_id, stage, output)
+                entity_build_result = self.entity_builder.build_entities(
+                    mentions=all_entities,
+                    source_refs=[document["document_ref"]]
                 )
+                if entity_build_result["status"] != "success":
+                    return self._complete_workflow_with_error(
+                        workflow_id, results, f"Entity building failed: {entity_build_result.get('error')}"
+                    )
+                entity_output = {
+                    "entity_ids": [e["entity_id"] for e in entity_build_result["entities"]],
+                    "total_entities": entity_build_result["total_entities"],
+                    "entity_types": entity_build_result["entity_types"]
+                }
+                self._complete_stage(workflow_id, state, "build_entities", entity_output)
             
             results["timing"]["entity_building"] = time.time() - step_start
             results["steps"]["entity_building"] = {
                 "status": "success",
-                "entities_created": entity_build_result["total_entities"],
-                "entity_types": entity_build_result["entity_types"]
+                "entities_created": entity_output["total_entities"],
+                "entity_types": entity_output["entity_types"]
             }
             
             # Step 6: Build relationship edges in Neo4j
             step_start = time.time()
             print("Step 6: Building relationship edges...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "build_edges", 6, {"step": "building_edges"}
-            )
             
-            edge_build_result = self.edge_builder.build_edges(
-                relationships=all_relationships,
-                source_refs=[pdf_result["document"]["document_ref"]]
-            )
-            if edge_build_result["status"] != "success":
-                return self._complete_workflow_with_error(
-                    workflow_id, results, f"Edge building failed: {edge_build_result.get('error')}"
+            edge_output = stage_output("build_edges")
+            if edge_output is None:
+                edge_build_result = self.edge_builder.build_edges(
+                    relationships=all_relationships,
+                    source_refs=[document["document_ref"]]
                 )
+                if edge_build_result["status"] != "success":
+                    return self._complete_workflow_with_error(
+                        workflow_id, results, f"Edge building failed: {edge_build_result.get('error')}"
+                    )
+                edge_output = {
+                    "total_edges": edge_build_result["total_edges"],
+                    "relationship_types": edge_build_result["relationship_types"]
+                }
+                self._complete_stage(workflow_id, state, "build_edges", edge_output)
             
             results["timing"]["edge_building"] = time.time() - step_start
             results["steps"]["edge_building"] = {
                 "status": "success",
-                "edges_created": edge_build_result["total_edges"],
-                "relationship_types": edge_build_result["relationship_types"]
+                "edges_created": edge_output["total_edges"],
+                "relationship_types": edge_output["relationship_types"]
             }
             
             # Step 7: Calculate PageRank (or skip for performance)
             step_start = time.time()
             print("Step 7: Calculating PageRank...")
-            self.workflow_service.create_checkpoint(
-                workflow_id, "calculate_pagerank", 7, {"step": "calculating_pagerank"}
-            )
-            
-            if skip_pagerank:
-                print("  (Skipping PageRank calculation for performance)")
-                results["steps"]["pagerank_calculation"] = {
-                    "status": "skipped",
-                    "reason": "Performance optimization"
-                }
-            else:
-                # Only calculate PageRank for entities from this document
-                pagerank_result = self.pagerank_calculator.calculate_pagerank()
-                if pagerank_result["status"] != "success":
-                    return self._complete_workflow_with_error(
-                        workflow_id, results, f"PageRank calculation failed: {pagerank_result.get('error')}"
-                    )
-                
-                results["steps"]["pagerank_calculation"] = {
-                    "status": "success",
-                    "entities_ranked": pagerank_result["total_entities"],
-                    "graph_stats": pagerank_result["graph_stats"],
-                    "top_entities": pagerank_result["ranked_entities"][:5] if pagerank_result["ranked_entities"] else []
-                }
             
+            pagerank_step = stage_output("calculate_pagerank")
+            if pagerank_step is None:
+                if skip_pagerank:
+                    print("  (Skipping PageRank calculation for performance)")
+                    pagerank_step = {
+                        "status": "skipped",
+                        "reason": "Performance optimization"
+                    }
+                else:
+                    # Only calculate PageRank for entities from this document
+                    pagerank_result = self.pagerank_calculator.calculate_pagerank()
+                    if pagerank_result["status"] != "success":
+                        return self._complete_workflow_with_error(
+                            workflow_id, results, f"PageRank calculation failed: {pagerank_result.get('error')}"
+                        )
+                    
+                    pagerank_step = {
+                        "status": "success",
+                        "entities_ranked": pagerank_result["total_entities"],
+                        "graph_stats": pagerank_result["graph_stats"],
+                        "top_entities": pagerank_result["ranked_entities"][:5] if pagerank_result["ranked_entities"] else []
+                    }
+                self._complete_stage(workflow_id, state, "calculate_pagerank", pagerank_step)
+            
+            results["steps"]["pagerank_calculation"] = pagerank_step
             results["timing"]["pagerank_calculation"] = time.time() - step_start
             
             # Step 8: Execute query
             step_start = time.time()
             print("Step 8: Executing query...")
             self.workflow_service.create_checkpoint(
-                workflow_id, "execute_query", 8, {"step": "executing_query"}
+                workflow_id, "execute_query", 8, {**state, "step": "executing_query"}
             )
             
             query_result = self.query_engine.query_graph(
@@ -315,6 +512,7 @@ class OptimizedVerticalSliceWorkflow:
                 "search_stats": query_result["search_stats"]
             }
             
+
             # Format final answer
             if query_result["results"]:
                 best_result = query_result["results"][0]
@@ -373,6 +571,44 @@ class OptimizedVerticalSliceWorkflow:
                 error_trace=error_trace
             )
     
+    def _extract_chunk_records(self, chunks: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Find entities and relationships of all chunks in worker processes.
+        
+        Returns None (extract in-process) without workers or if the worker
+        pool fails.
+        """
+        if self.parallel_extractor is None:
+            return None
+        try:
+            return self.parallel_extractor.extract(chunks)
+        except Exception as e:
+            print(f"  Parallel extraction failed, extracting in-process: {e}")
+            self.parallel_extractor.close()
+            return None
+    
+    def _resolve_relationships(
+        self,
+        relationships: List[Dict[str, Any]],
+        entities: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Replace provisional worker entity IDs with the registered mentions' IDs.
+        
+        Relationships whose mentions could not be registered are dropped.
+        """
+        by_local_id = {local_entity_id(e): e for e in entities}
+        resolved = []
+        for rel in relationships:
+            subject = by_local_id.get(rel["subject_entity_id"])
+            obj = by_local_id.get(rel["object_entity_id"])
+            if subject is None or obj is None:
+                continue
+            rel["subject_entity_id"] = subject["entity_id"]
+            rel["object_entity_id"] = obj["entity_id"]
+            rel["subject_mention_id"] = subject["mention_id"]
+            rel["object_mention_id"] = obj["mention_id"]
+            resolved.append(rel)
+        return resolved
+    
     def _complete_workflow_with_error(
         self, 
         workflow_id: str, 
@@ -408,7 +644,8 @@ class OptimizedVerticalSliceWorkflow:
         """Close all connections."""
         # Tools no longer own their connections
         # Service manager will handle cleanup
-        pass
+        if self.parallel_extractor is not None:
+            self.parallel_extractor.close()
     
     def get_tool_info(self) -> Dict[str, Any]:
         """Get workflow information."""
@@ -420,7 +657,8 @@ class OptimizedVerticalSliceWorkflow:
                 "Service singleton pattern (F1)",
                 "Connection pool management (F2)",
                 "Optimized PageRank algorithm",
-                "Optional PageRank skipping"
+                "Optional PageRank skipping",
+                "Process-pool entity and relationship extraction"
             ],
             "steps": [
                 "T01: PDF Loading",
@@ -434,5 +672,5 @@ class OptimizedVerticalSliceWorkflow:
             ],
             "input_types": ["pdf_file", "natural_language_query"],
             "output_type": "ranked_answers_with_provenance",
-            "requires_neo4j": True
+            "requires_neo4j": self.graph_store.backend == "neo4j"
         }
\ No newline at end of file
@@ -2,6 +2,21 @@
 Phase 2 tools for LLM-driven ontology system.
 """
 
-from .t23c_ontology_aware_extractor import OntologyAwareExtractor, ExtractionResult
+import importlib
 
-__all__ = ["OntologyAwareExtractor", "ExtractionResult"]
\ No newline at end of file
+# Exported names are resolved on first access so importing one phase 2
+# module does not load the extractor and its LLM clients
+_EXPORTS = {
+    "OntologyAwareExtractor": ".t23c_ontology_aware_extractor",
+    "ExtractionResult": ".t23c_ontology_aware_extractor",
+}
+
+__all__ = ["OntologyAwareExtractor", "ExtractionResult"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
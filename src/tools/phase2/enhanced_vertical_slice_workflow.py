@@ -47,6 +47,7 @@ from src.core.ontology_storage_service import OntologyStorageService, OntologySe
 from src.core.identity_service import IdentityService
 from src.core.quality_service import QualityService
 from src.core.workflow_state_service import WorkflowStateService
+from src.core.graphrag_phase_interface import ArtifactContext, chunk_document, load_document
 
 import logging
 logger = logging.getLogger(__name__)
@@ -113,7 +114,8 @@ class EnhancedVerticalSliceWorkflow:
                                  use_existing_ontology: Optional[str] = None,
                                  document_paths: List[str] = None,
                                  workflow_id: str = None,
-                                 use_mock_apis: bool = False) -> Dict[str, Any]:
+                                 use_mock_apis: bool = False,
+                                 artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
         """
         Execute the complete enhanced workflow.
         
@@ -126,6 +128,8 @@ class EnhancedVerticalSliceWorkflow:
             document_paths: List of document paths (new standard interface)
             workflow_id: Workflow identifier (new standard interface)
             use_mock_apis: Use mock APIs instead of real ones for testing
+            artifact_context: Per-request artifacts shared with other phases
+                (loaded document and chunks are reused instead of recomputed)
             
         Returns:
             Complete workflow results with enhanced analysis
@@ -179,7 +183,7 @@ class EnhancedVerticalSliceWorkflow:
             
             # Step 1: Load PDF
             print("Step 1: Loading PDF...")
-            results["steps"]["document_loading"] = self._execute_document_loading(workflow_id, pdf_path)
+            results["steps"]["document_loading"] = self._execute_document_loading(workflow_id, pdf_path, artifact_context)
             if results["steps"]["document_loading"]["status"] != "success":
                 return self._complete_workflow_with_error(workflow_id, results, "Document loading failed")
             
@@ -187,7 +191,8 @@ class EnhancedVerticalSliceWorkflow:
             print("Step 2: Chunking text...")
             results["steps"]["text_chunking"] = self._execute_text_chunking(
                 workflow_id, 
-                results["steps"]["document_loading"]["document"]
+                results["steps"]["document_loading"]["document"],
+                artifact_context
             )
             if results["steps"]["text_chunking"]["status"] != "success":
                 return self._complete_workflow_with_error(workflow_id, results, "Text chunking failed")
@@ -273,11 +278,12 @@ class EnhancedVerticalSliceWorkflow:
             logger.error(traceback.format_exc())
             return self._complete_workflow_with_error(workflow_id, results, error_msg)
     
-    def _execute_document_loading(self, workflow_id: str, document_path: str) -> Dict[str, Any]:
+    def _execute_document_loading(self, workflow_id: str, document_path: str,
+                                  artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
         """Execute document loading step."""
         self.workflow_service.create_checkpoint(workflow_id, "load_document", 1, {"step": "loading_document"})
         
-        doc_result = self.pdf_loader.load_pdf(document_path)
+        doc_result = load_document(self.pdf_loader, document_path, artifact_context)
         if doc_result["status"] != "success":
             return {"status": "error", "error": doc_result.get("error")}
         
@@ -288,15 +294,12 @@ class EnhancedVerticalSliceWorkflow:
             "text_length": len(doc_result["document"]["text"])
         }
     
-    def _execute_text_chunking(self, workflow_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_text_chunking(self, workflow_id: str, document: Dict[str, Any],
+                               artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
         """Execute text chunking step."""
         self.workflow_service.create_checkpoint(workflow_id, "chunk_text", 2, {"step": "chunking_text"})
         
-        chunk_result = self.text_chunker.chunk_text(
-            document_ref=document["document_ref"],
-            text=document["text"],
-            document_confidence=document["confidence"]
-        )
+        chunk_result = chunk_document(self.text_chunker, document, artifact_context)
         
         if chunk_result["status"] != "success":
             return {"status": "error", "error": chunk_result.get("error")}
@@ -394,16 +397,15 @@ class EnhancedVerticalSliceWorkflow:
             logger.info(f"Starting extraction for {len(chunks)} chunks")
             logger.info(f"Current ontology: {self.current_ontology.domain_name if self.current_ontology else 'None'}")
             
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Extracting from chunk {i}, text length: {len(chunk['text'])}")
-                extraction_result = self.ontology_extractor.extract_entities(
-                    text=chunk["text"],
-                    ontology=self.current_ontology,
-                    source_ref=f"{document_ref}_chunk_{i}",
-                    confidence_threshold=self.confidence_threshold,
-                    use_mock_apis=use_mock_apis
-                )
-                
+            # Several chunks share one LLM request (up to the configured token budget)
+            chunk_results = self.ontology_extractor.extract_entities_packed(
+                chunks=[(chunk["text"], f"{document_ref}_chunk_{i}") for i, chunk in enumerate(chunks)],
+                ontology=self.current_ontology,
+                confidence_threshold=self.confidence_threshold,
+                use_mock_apis=use_mock_apis
+            )
+            
+            for i, extraction_result in enumerate(chunk_results):
                 logger.info(f"Chunk {i} extraction: {len(extraction_result.entities)} entities, {len(extraction_result.relationships)} relationships")
                 
                 all_entities.extend(extraction_result.entities)
@@ -576,7 +578,7 @@ class EnhancedVerticalSliceWorkflow:
                 visualizations["ontology_structure"] = f"Failed: {str(e)}"
             
             try:
-                similarity_plot = self.visualizer.create_semantic_similarity_heatmap(vis_data)
+                similarity_plot = self.visualizer.create_semantic_similarity_heatmap(vis_data, config)
                 visualizations["similarity_heatmap"] = "Semantic similarity heatmap created successfully"
             except Exception as e:
                 visualizations["similarity_heatmap"] = f"Failed: {str(e)}"
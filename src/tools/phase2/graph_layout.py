@@ -0,0 +1,357 @@
+"""
+Graph Layout - Force-directed layout and persistent layout cache
+
+Fruchterman-Reingold force-directed layout written with NumPy. Repulsion is
+computed exactly (in chunks) for small graphs and with a Barnes-Hut
+approximation above barnes_hut_threshold nodes: a quadtree is built level by
+level from grid cell indices, the well-separated cells on every level act
+on each cell through their centres of mass (as a second-order expansion
+about the cell centre), and each node interacts directly only with the
+nodes in its neighbouring leaf cells, so an iteration costs O(n log n)
+instead of O(n^2). Nodes can be pinned, which lets a changed graph keep the positions
+of the nodes it already had and only relax the new ones.
+
+LayoutCache persists positions per layout key (the visualization filters)
+together with a fingerprint of the graph's nodes and edges, so an unchanged
+graph is drawn from its stored layout and a changed one is laid out
+incrementally from it.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+import logging
+
+import numpy as np
+
+from src.core.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Target number of nodes per occupied Barnes-Hut leaf cell, and depth limit
+_LEAF_OCCUPANCY = 4
+_MAX_DEPTH = 10
+# Target rows x nodes per chunk for exact repulsion
+_EXACT_CHUNK_ELEMENTS = 2_000_000
+
+
+def _inverse_conj(d: np.ndarray) -> np.ndarray:
+    """1 / conj(d), i.e. the vector d / |d|^2, with 0 for d == 0."""
+    return d / np.maximum(d.real * d.real + d.imag * d.imag, 1e-18)
+
+
+def _exact_repulsion(z: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Repulsion sum(1 / conj(z_i - z_j)) on targets from every node, computed pairwise.
+
+    Positions are complex numbers; 1 / conj(d) is the vector d / |d|^2.
+    """
+    force = np.zeros(len(targets), dtype=complex)
+    chunk = max(1, _EXACT_CHUNK_ELEMENTS // len(z))
+    for start in range(0, len(targets), chunk):
+        diff = z[targets[start:start + chunk], None] - z[None, :]
+        force[start:start + chunk] = _inverse_conj(diff).sum(axis=1)
+    return force
+
+
+def _barnes_hut_repulsion(z: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Repulsion on targets with a level-wise Barnes-Hut quadtree."""
+    n = len(z)
+    lower = complex(z.real.min(), z.imag.min())
+    span = max(z.real.max() - lower.real, z.imag.max() - lower.imag, 1e-9) * (1 + 1e-9)
+    unit_x, unit_y = (z.real - lower.real) / span, (z.imag - lower.imag) / span
+
+    target_z = z[targets]
+    force = np.zeros(len(targets), dtype=complex)
+
+    # Children of the parent cell's 3x3 neighbourhood, as offsets from twice
+    # the parent index: 6 per axis (parent offset -1..1, child bit 0..1)
+    offsets = np.arange(-2, 4)
+    offset_x, offset_y = (a.ravel() for a in np.meshgrid(offsets, offsets, indexing="ij"))
+
+    # Refine until leaf cells are small; empty cells cost nothing, so
+    # clustered layouts simply go deeper
+    for level in range(2, _MAX_DEPTH + 1):
+        size = 2 ** level
+        cell_x = np.minimum((unit_x * size).astype(np.int64), size - 1)
+        cell_y = np.minimum((unit_y * size).astype(np.int64), size - 1)
+        flat = cell_x * size + cell_y
+        mass = np.bincount(flat, minlength=size * size).astype(float)
+        com = (np.bincount(flat, weights=z.real, minlength=size * size) +
+               1j * np.bincount(flat, weights=z.imag, minlength=size * size))
+        occupied = mass > 0
+        com[occupied] /= mass[occupied]
+
+        # Interaction lists depend only on the cell, so build them per target cell
+        target_cells = flat[targets]
+        cells = np.unique(target_cells)
+        own_x, own_y = cells // size, cells % size
+        cand_x = 2 * (own_x[:, None] // 2) + offset_x
+        cand_y = 2 * (own_y[:, None] // 2) + offset_y
+        # Well separated: inside the parent's neighbourhood but not adjacent to the cell itself
+        far = (
+            (cand_x >= 0) & (cand_x < size) & (cand_y >= 0) & (cand_y < size) &
+            ((np.abs(cand_x - own_x[:, None]) > 1) | (np.abs(cand_y - own_y[:, None]) > 1))
+        )
+        cand = np.where(far, cand_x * size + cand_y, 0)
+        cell_mass = np.where(far, mass[cand], 0.0)
+
+        # Second-order local expansion of sum(m / conj(z - c)) about each cell centre
+        centre = lower + span * ((own_x + 0.5) + 1j * (own_y + 0.5)) / size
+        inverse = _inverse_conj(centre[:, None] - com[cand])
+        weighted = cell_mass * inverse
+        f0 = weighted.sum(axis=1)
+        weighted *= inverse
+        f1 = -weighted.sum(axis=1)
+        weighted *= inverse
+        f2 = weighted.sum(axis=1)
+
+        row = np.searchsorted(cells, target_cells)
+        offset = np.conj(target_z - centre[row])
+        force += f0[row] + offset * (f1[row] + offset * f2[row])
+
+        if n <= _LEAF_OCCUPANCY * np.count_nonzero(occupied):
+            break
+
+    # Near field: exact interactions with nodes in the 3x3 leaf cells around each target
+    order = np.argsort(flat, kind="stable")
+    counts = mass.astype(np.int64)
+    starts = np.cumsum(counts) - counts
+    target_x, target_y = cell_x[targets], cell_y[targets]
+    rows_all = np.arange(len(targets))
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            nx_, ny_ = target_x + dx, target_y + dy
+            valid = (nx_ >= 0) & (nx_ < size) & (ny_ >= 0) & (ny_ < size)
+            neighbour = np.where(valid, nx_ * size + ny_, 0)
+            pair_counts = np.where(valid, counts[neighbour], 0)
+            total = int(pair_counts.sum())
+            if not total:
+                continue
+            rows = np.repeat(rows_all, pair_counts)
+            within = np.arange(total) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+            others = order[np.repeat(starts[neighbour], pair_counts) + within]
+            pair_force = _inverse_conj(target_z[rows] - z[others])
+            force += (np.bincount(rows, weights=pair_force.real, minlength=len(targets)) +
+                      1j * np.bincount(rows, weights=pair_force.imag, minlength=len(targets)))
+    return force
+
+
+def force_directed_layout(
+    node_count: int,
+    edges: np.ndarray,
+    initial: Optional[np.ndarray] = None,
+    fixed: Optional[np.ndarray] = None,
+    iterations: int = 50,
+    barnes_hut_threshold: int = 1000,
+    seed: int = 42
+) -> np.ndarray:
+    """Fruchterman-Reingold layout.
+
+    Args:
+        node_count: Number of nodes
+        edges: (E, 2) array of node indices
+        initial: (n, 2) starting positions; NaN rows are placed near their
+            positioned neighbours (or at random)
+        fixed: Boolean mask of nodes that keep their initial position
+        iterations: Number of cooling iterations
+        barnes_hut_threshold: Node count above which repulsion uses Barnes-Hut
+        seed: Random seed, so the same graph always gets the same layout
+
+    Returns:
+        (n, 2) positions; scaled to [-1, 1] unless nodes were fixed
+    """
+    rng = np.random.default_rng(seed)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    pos = rng.uniform(-1, 1, (node_count, 2))
+    if node_count == 0:
+        return pos
+
+    k = np.sqrt(4.0 / node_count)  # [-1, 1] square
+    if initial is not None:
+        placed = ~np.isnan(initial).any(axis=1)
+        pos[placed] = initial[placed]
+        unplaced = ~placed
+        if placed.any() and unplaced.any() and len(edges):
+            # Start new nodes at the mean of their placed neighbours
+            src = np.concatenate([edges[:, 0], edges[:, 1]])
+            dst = np.concatenate([edges[:, 1], edges[:, 0]])
+            use = placed[dst] & unplaced[src]
+            weight = np.bincount(src[use], minlength=node_count).astype(float)
+            seeded = weight > 0
+            for axis in (0, 1):
+                total = np.bincount(src[use], weights=pos[dst[use], axis], minlength=node_count)
+                pos[seeded, axis] = total[seeded] / weight[seeded]
+            pos[seeded] += rng.uniform(-k, k, (int(seeded.sum()), 2))
+
+    fixed = np.zeros(node_count, dtype=bool) if fixed is None else np.asarray(fixed, dtype=bool)
+    movable = np.flatnonzero(~fixed)
+    if not len(movable):
+        return pos
+
+    # Incremental runs start cool so new nodes settle locally
+    temperature = 2 * k if fixed.any() else 0.2
+    cooling = temperature / (iterations + 1)
+    repulsion = _barnes_hut_repulsion if node_count > barnes_hut_threshold else _exact_repulsion
+
+    z = pos[:, 0] + 1j * pos[:, 1]
+    for _ in range(iterations):
+        # Repulsion k^2 / d and attraction d^2 / k along each edge
+        disp = k * k * repulsion(z, movable)
+
+        if len(edges):
+            delta = z[edges[:, 0]] - z[edges[:, 1]]
+            pull = delta * np.abs(delta) / k
+            attraction = (
+                np.bincount(edges[:, 1], weights=pull.real, minlength=node_count) -
+                np.bincount(edges[:, 0], weights=pull.real, minlength=node_count) +
+                1j * (np.bincount(edges[:, 1], weights=pull.imag, minlength=node_count) -
+                      np.bincount(edges[:, 0], weights=pull.imag, minlength=node_count))
+            )
+            disp += attraction[movable]
+
+        length = np.maximum(np.abs(disp), 1e-9)
+        z[movable] += disp * (np.minimum(length, temperature) / length)
+        temperature -= cooling
+
+    pos = np.column_stack([z.real, z.imag])
+    if not fixed.any():
+        pos -= pos.mean(axis=0)
+        extent = np.abs(pos).max()
+        if extent > 0:
+            pos /= extent
+    return pos
+
+
+class LayoutCache:
+    """Persistent node positions per layout key."""
+
+    def __init__(self, cache_path: str = None, max_entries: int = None, enabled: bool = None):
+        """Initialize the layout cache.
+
+        Args:
+            cache_path: Path to SQLite cache database (uses config default if None)
+            max_entries: Maximum stored layouts before LRU eviction (uses config default if None)
+            enabled: Enable or disable caching (uses config default if None)
+        """
+        config = get_config().layout_cache
+
+        self.cache_path = cache_path or config.cache_path
+        self.max_entries = max_entries or config.max_entries
+        self.enabled = config.enabled if enabled is None else enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        self._lock = threading.Lock()
+        self._db_conn = None
+        if self.enabled:
+            self._init_database()
+
+    def _init_database(self):
+        """Initialize SQLite cache database."""
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS layouts (
+                    layout_key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    positions TEXT NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            self._db_conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize layout cache at {self.cache_path}: {e}")
+            self._db_conn = None
+
+    @staticmethod
+    def make_key(**filters) -> str:
+        """Build the layout key for a set of visualization filters."""
+        key_material = json.dumps(filters, sort_keys=True, default=str)
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def fingerprint(node_ids: Sequence[str], edges: Sequence[Tuple[str, str]]) -> str:
+        """Content hash of a graph's node ids and (undirected) edges."""
+        digest = hashlib.sha256()
+        for node_id in sorted(node_ids):
+            digest.update(f"{node_id}\n".encode("utf-8"))
+        digest.update(b"--\n")
+        for source, target in sorted(tuple(sorted(edge)) for edge in edges):
+            digest.update(f"{source}\t{target}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, layout_key: str) -> Optional[Tuple[str, Dict[str, Tuple[float, float]]]]:
+        """Return (fingerprint, positions) stored for a key, or None."""
+        if not self._db_conn:
+            return None
+
+        try:
+            with self._lock:
+                row = self._db_conn.execute(
+                    "SELECT fingerprint, positions FROM layouts WHERE layout_key = ?", (layout_key,)
+                ).fetchone()
+                if not row:
+                    self.misses += 1
+                    return None
+                self._db_conn.execute(
+                    "UPDATE layouts SET last_accessed = ? WHERE layout_key = ?", (time.time(), layout_key)
+                )
+                self._db_conn.commit()
+                self.hits += 1
+            stored = json.loads(row[1])
+            return row[0], {node_id: (x, y) for node_id, x, y in zip(stored["ids"], stored["x"], stored["y"])}
+
+        except Exception as e:
+            logger.error(f"Layout cache lookup failed: {e}")
+            return None
+
+    def put(self, layout_key: str, fingerprint: str, positions: Dict[str, Tuple[float, float]]):
+        """Store the positions for a key, replacing the previous layout."""
+        if not self._db_conn:
+            return
+
+        node_ids = list(positions)
+        coords = np.array([positions[node_id] for node_id in node_ids], dtype=float).reshape(-1, 2)
+        payload = json.dumps({"ids": node_ids, "x": coords[:, 0].tolist(), "y": coords[:, 1].tolist()})
+        try:
+            with self._lock:
+                self._db_conn.execute("""
+                    INSERT OR REPLACE INTO layouts (layout_key, fingerprint, positions, last_accessed)
+                    VALUES (?, ?, ?, ?)
+                """, (layout_key, fingerprint, payload, time.time()))
+                self._db_conn.execute("""
+                    DELETE FROM layouts WHERE layout_key NOT IN (
+                        SELECT layout_key FROM layouts ORDER BY last_accessed DESC LIMIT ?
+                    )
+                """, (self.max_entries,))
+                self._db_conn.commit()
+                self.writes += 1
+        except Exception as e:
+            logger.error(f"Layout cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self._db_conn is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "cache_path": self.cache_path
+        }
+
+    def close(self):
+        """Close the cache database."""
+        if self._db_conn:
+            self._db_conn.close()
+            self._db_conn = None
@@ -1,6 +1,13 @@
 """
 Interactive Graph Visualizer for Ontology-Aware Knowledge Graphs
 Provides rich visualization with ontological structure display and semantic exploration.
+
+Large graphs are shown at a level of detail: the top entities by PageRank or
+degree are fetched, the rest can be aggregated into community super-nodes in
+the database, nodes are expanded on click, and big plots render with WebGL.
+Spring layouts are cached per filter set and updated incrementally when the
+graph changes (see graph_layout). Similarity heatmaps are computed with one
+matrix product, sampled per entity type for large entity sets.
 """
 
 import json
@@ -8,12 +15,16 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass
 import numpy as np
-import networkx as nx
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import neo4j
-from neo4j import GraphDatabase
+
+from src.core.lazy_imports import lazy_import
+from src.core.lru_cache import LRUCache
+from src.core.graph_store import graph_version
+from .graph_layout import LayoutCache, force_directed_layout
+
+nx = lazy_import("networkx")
+go = lazy_import("plotly.graph_objects", install_hint="plotly")
+plotly_subplots = lazy_import("plotly.subplots", install_hint="plotly")
+neo4j = lazy_import("neo4j")
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +42,17 @@ class GraphVisualizationConfig:
     show_confidence: bool = True
     filter_low_confidence: bool = True
     confidence_threshold: float = 0.7
+    rank_by: str = "pagerank"  # pagerank, degree: selects the top max_nodes entities
+    level_of_detail: bool = False  # aggregate entities beyond max_nodes into community super-nodes
+    community_property: str = "entity_type"  # entity property grouping hidden entities
+    max_super_nodes: int = 50
+    expand_limit: int = 25  # entities added per expand_node call
+    webgl_threshold: int = 1000  # nodes + edges above which traces render with WebGL
+    layout_iterations: int = 50
+    barnes_hut_threshold: int = 1000  # nodes above which spring layout repulsion uses Barnes-Hut
+    layout_seed: int = 42  # same graph and seed always give the same layout
+    heatmap_max_entities: int = 200  # larger entity sets are sampled per entity type
+    heatmap_text_threshold: int = 30  # cell values are printed up to this many entities
 
 
 @dataclass
@@ -54,7 +76,9 @@ class InteractiveGraphVisualizer:
                  neo4j_user: str = "neo4j", 
                  neo4j_password: str = "password"):
         """Initialize the graph visualizer."""
-        self.driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+        self.driver = neo4j.GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+        self.layout_cache = LayoutCache()
+        self._heatmap_cache = LRUCache(32)  # (graph version, entity ids, limit) -> heatmap
         
         # Color palettes for different entity types
         self.entity_colors = {
@@ -88,6 +112,14 @@ class InteractiveGraphVisualizer:
         """
         Fetch graph data from Neo4j with filtering options.
         
+        The max_nodes highest ranked entities (by PageRank or degree, computed
+        in the database) are returned with the edges between them. In
+        level-of-detail mode the remaining entities are aggregated server-side
+        into one super-node per community, so the whole graph is represented
+        without transferring or laying out every node. Layout positions are
+        cached per filter set: an unchanged graph reuses its stored layout and
+        a changed one only lays out the nodes it did not have before.
+        
         Args:
             source_document: Filter by source document
             ontology_domain: Filter by ontology domain
@@ -99,98 +131,68 @@ class InteractiveGraphVisualizer:
         if config is None:
             config = GraphVisualizationConfig()
         
-        nodes = []
-        edges = []
+        filters = {"source_document": source_document, "ontology_domain": ontology_domain}
         
         try:
             with self.driver.session() as session:
-                # Build filtering conditions
-                where_conditions = []
-                params = {}
-                
-                if source_document:
-                    where_conditions.append("$source_document IN e.source_documents")
-                    params["source_document"] = source_document
-                
-                if ontology_domain:
-                    where_conditions.append("e.ontology_domain = $ontology_domain")
-                    params["ontology_domain"] = ontology_domain
-                
-                if config.filter_low_confidence:
-                    where_conditions.append("e.confidence >= $min_confidence")
-                    params["min_confidence"] = config.confidence_threshold
-                
-                where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+                params = {"max_nodes": config.max_nodes}
+                where_clause = self._where_clause(self._entity_conditions("e", filters, config, params))
                 
-                # Fetch nodes (entities)
+                # Fetch the top-k nodes (entities)
                 node_query = f"""
                     MATCH (e:Entity)
                     {where_clause}
-                    RETURN e.id as id, 
-                           e.canonical_name as name,
-                           e.entity_type as type,
-                           e.confidence as confidence,
-                           e.ontology_domain as domain,
-                           e.source_documents as sources,
-                           e.attributes as attributes
+                    WITH e, {self._rank_expression("e", config.rank_by)} AS rank
+                    ORDER BY rank DESC
                     LIMIT $max_nodes
+                    RETURN {self._NODE_FIELDS}, rank
                 """
-                params["max_nodes"] = config.max_nodes
-                
-                result = session.run(node_query, params)
-                for record in result:
-                    attributes = json.loads(record["attributes"]) if record["attributes"] else {}
-                    nodes.append({
-                        "id": record["id"],
-                        "name": record["name"],
-                        "type": record["type"],
-                        "confidence": record["confidence"],
-                        "domain": record["domain"],
-                        "sources": record["sources"],
-                        "attributes": attributes,
-                        "size": max(10, record["confidence"] * config.node_size_factor),
-                        "color": self._get_entity_color(record["type"], config.color_by, record)
-                    })
+                nodes = [self._node_from_record(record, config) for record in session.run(node_query, params)]
+                node_ids = [node["id"] for node in nodes]
                 
-                # Fetch edges (relationships) 
-                edge_query = f"""
-                    MATCH (source:Entity)-[r]->(target:Entity)
-                    {where_clause.replace('e.', 'source.')}
-                    AND target.confidence >= $min_confidence
-                    RETURN source.id as source_id,
-                           target.id as target_id,
-                           type(r) as rel_type,
-                           r.confidence as confidence,
-                           r.ontology_domain as domain,
-                           r.source_documents as sources,
-                           r.attributes as attributes
-                    LIMIT $max_edges
-                """
-                params["max_edges"] = config.max_edges
+                # Fetch the edges (relationships) between them, strongest first
+                edges = [
+                    self._edge_from_record(record, config)
+                    for record in session.run(f"""
+                        MATCH (source:Entity)-[r]->(target:Entity)
+                        WHERE source.id IN $node_ids AND target.id IN $node_ids
+                        RETURN {self._EDGE_FIELDS}
+                        ORDER BY coalesce(r.confidence, 0.0) DESC
+                        LIMIT $max_edges
+                    """, {"node_ids": node_ids, "max_edges": config.max_edges})
+                ]
                 
-                result = session.run(edge_query, params)
-                for record in result:
-                    attributes = json.loads(record["attributes"]) if record["attributes"] else {}
-                    edges.append({
-                        "source": record["source_id"],
-                        "target": record["target_id"],
-                        "type": record["rel_type"],
-                        "confidence": record["confidence"],
-                        "domain": record["domain"],
-                        "sources": record["sources"],
-                        "attributes": attributes,
-                        "width": max(1, record["confidence"] * config.edge_width_factor),
-                        "color": self._get_relationship_color(record["rel_type"])
-                    })
+                hidden_nodes = 0
+                if config.level_of_detail:
+                    super_nodes, super_edges = self._fetch_community_aggregates(session, node_ids, filters, config)
+                    hidden_nodes = sum(node["member_count"] for node in super_nodes)
+                    nodes.extend(super_nodes)
+                    edges.extend(super_edges)
                 
-                # Calculate layout positions
-                layout_positions = self._calculate_layout(nodes, edges, config.layout_algorithm)
+                # Calculate layout positions, reusing the stored layout for these filters
+                layout_key = LayoutCache.make_key(
+                    source_document=source_document,
+                    ontology_domain=ontology_domain,
+                    layout_algorithm=config.layout_algorithm,
+                    max_nodes=config.max_nodes,
+                    max_edges=config.max_edges,
+                    rank_by=config.rank_by,
+                    filter_low_confidence=config.filter_low_confidence,
+                    confidence_threshold=config.confidence_threshold,
+                    level_of_detail=config.level_of_detail,
+                    community_property=config.community_property,
+                    max_super_nodes=config.max_super_nodes
+                )
+                layout_positions = self._calculate_layout(
+                    nodes, edges, config.layout_algorithm, layout_key=layout_key, config=config
+                )
                 
                 # Get ontology information
                 ontology_info = self._get_ontology_info(session, ontology_domain)
                 
                 # Calculate metrics
                 metrics = self._calculate_visualization_metrics(nodes, edges, ontology_info)
+                metrics["hidden_nodes"] = hidden_nodes
                 
                 return VisualizationData(
                     nodes=nodes,
@@ -204,8 +206,288 @@ class InteractiveGraphVisualizer:
             logger.error(f"Failed to fetch graph data: {e}")
             raise
     
+    def expand_node(self, data: VisualizationData, node_id: str,
+                    source_document: Optional[str] = None,
+                    ontology_domain: Optional[str] = None,
+                    config: Optional[GraphVisualizationConfig] = None) -> VisualizationData:
+        """
+        Expand a clicked node in place with entities fetched around it.
+        
+        For an entity, its highest ranked neighbours that are not yet shown are
+        added; for a community super-node, its highest ranked members are. At
+        most config.expand_limit entities are fetched, together with their
+        edges to the entities already shown. New nodes are placed around the
+        expanded node and relaxed with the force-directed layout while
+        existing positions are kept. Node ids are carried in
+        the node trace customdata, so a click event maps directly to node_id
+        (the Streamlit graph view in src/ui/streamlit_graph_view does this).
+        
+        Args:
+            data: Visualization data to extend (modified and returned)
+            node_id: Id of the clicked node
+            source_document: Filter by source document
+            ontology_domain: Filter by ontology domain
+            config: Visualization configuration
+            
+        Returns:
+            The updated VisualizationData
+        """
+        if config is None:
+            config = GraphVisualizationConfig()
+        
+        filters = {"source_document": source_document, "ontology_domain": ontology_domain}
+        nodes_by_id = {node["id"]: node for node in data.nodes}
+        anchor = nodes_by_id.get(node_id)
+        if anchor is None:
+            raise ValueError(f"Node {node_id} is not part of the visualization")
+        visible_ids = [node["id"] for node in data.nodes if not node.get("is_super_node")]
+        params = {
+            "visible_ids": visible_ids,
+            "expand_limit": config.expand_limit,
+            "community_property": config.community_property
+        }
+        conditions = self._entity_conditions("e", filters, config, params) + ["NOT e.id IN $visible_ids"]
+        
+        if anchor.get("is_super_node"):
+            conditions.append(f"{self._community_expression('e')} = $community")
+            params["community"] = anchor["community"]
+            match = "MATCH (e:Entity)"
+        else:
+            params["node_id"] = node_id
+            match = "MATCH (:Entity {id: $node_id})--(e:Entity)"
+        
+        with self.driver.session() as session:
+            new_nodes = [
+                self._node_from_record(record, config)
+                for record in session.run(f"""
+                    {match}
+                    {self._where_clause(conditions)}
+                    WITH DISTINCT e
+                    WITH e, {self._rank_expression("e", config.rank_by)} AS rank
+                    ORDER BY rank DESC
+                    LIMIT $expand_limit
+                    RETURN {self._NODE_FIELDS}, rank
+                """, params)
+            ]
+            new_ids = [node["id"] for node in new_nodes]
+            new_edges = [
+                self._edge_from_record(record, config)
+                for record in session.run(f"""
+                    MATCH (source:Entity)-[r]->(target:Entity)
+                    WHERE (source.id IN $new_ids AND (target.id IN $new_ids OR target.id IN $visible_ids))
+                       OR (target.id IN $new_ids AND source.id IN $visible_ids)
+                    RETURN {self._EDGE_FIELDS}
+                """, {"new_ids": new_ids, "visible_ids": visible_ids})
+            ]
+        
+        added_ids = {node["id"] for node in new_nodes} - set(nodes_by_id)
+        self._merge_expansion(data, anchor, new_nodes, new_edges)
+        if added_ids:
+            self._relax_layout(data, added_ids, config)
+        return data
+    
+    # Node and edge fields returned by the fetch queries
+    _NODE_FIELDS = """e.id as id,
+                           e.canonical_name as name,
+                           e.entity_type as type,
+                           e.confidence as confidence,
+                           e.ontology_domain as domain,
+                           e.source_documents as sources,
+                           e.attributes as attributes"""
+    
+    _EDGE_FIELDS = """source.id as source_id,
+                           target.id as target_id,
+                           type(r) as rel_type,
+                           r.confidence as confidence,
+                           r.ontology_domain as domain,
+                           r.source_documents as sources,
+                           r.attributes as attributes"""
+    
+    @staticmethod
+    def _where_clause(conditions: List[str]) -> str:
+        return "WHERE " + " AND ".join(conditions) if conditions else ""
+    
+    @staticmethod
+    def _entity_conditions(var: str, filters: Dict[str, Optional[str]],
+                           config: GraphVisualizationConfig, params: Dict[str, Any]) -> List[str]:
+        """Filter conditions on entity variable var, adding their parameters to params."""
+        conditions = []
+        if filters.get("source_document"):
+            conditions.append(f"$source_document IN {var}.source_documents")
+            params["source_document"] = filters["source_document"]
+        if filters.get("ontology_domain"):
+            conditions.append(f"{var}.ontology_domain = $ontology_domain")
+            params["ontology_domain"] = filters["ontology_domain"]
+        if config.filter_low_confidence:
+            conditions.append(f"{var}.confidence >= $min_confidence")
+            params["min_confidence"] = config.confidence_threshold
+        return conditions
+    
+    @staticmethod
+    def _rank_expression(var: str, rank_by: str) -> str:
+        """Cypher expression ranking entities for top-k selection."""
+        if rank_by == "degree":
+            return f"size([({var})--() | 1])"
+        return f"coalesce({var}.pagerank_score, 0.0)"
+    
+    @staticmethod
+    def _community_expression(var: str) -> str:
+        return f"coalesce(toString({var}[$community_property]), 'UNKNOWN')"
+    
+    def _node_from_record(self, record, config: GraphVisualizationConfig) -> Dict[str, Any]:
+        attributes = json.loads(record["attributes"]) if record["attributes"] else {}
+        confidence = record["confidence"] if record["confidence"] is not None else 0.0
+        return {
+            "id": record["id"],
+            "name": record["name"],
+            "type": record["type"],
+            "confidence": confidence,
+            "domain": record["domain"],
+            "sources": record["sources"],
+            "attributes": attributes,
+            "rank": record["rank"],
+            "size": max(10, confidence * config.node_size_factor),
+            "color": self._get_entity_color(record["type"], config.color_by, record)
+        }
+    
+    def _edge_from_record(self, record, config: GraphVisualizationConfig) -> Dict[str, Any]:
+        attributes = json.loads(record["attributes"]) if record["attributes"] else {}
+        confidence = record["confidence"] if record["confidence"] is not None else 0.0
+        return {
+            "source": record["source_id"],
+            "target": record["target_id"],
+            "type": record["rel_type"],
+            "confidence": confidence,
+            "domain": record["domain"],
+            "sources": record["sources"],
+            "attributes": attributes,
+            "width": max(1, confidence * config.edge_width_factor),
+            "color": self._get_relationship_color(record["rel_type"])
+        }
+    
+    def _fetch_community_aggregates(self, session: "neo4j.Session", node_ids: List[str],
+                                    filters: Dict[str, Optional[str]],
+                                    config: GraphVisualizationConfig) -> Tuple[List[Dict], List[Dict]]:
+        """Aggregate the entities outside node_ids into community super-nodes, in the database."""
+        params = {
+            "node_ids": node_ids,
+            "community_property": config.community_property,
+            "max_super_nodes": config.max_super_nodes
+        }
+        hidden = self._entity_conditions("h", filters, config, params) + ["NOT h.id IN $node_ids"]
+        hidden_clause = self._where_clause(hidden)
+        community = self._community_expression("h")
+        
+        communities = session.run(f"""
+            MATCH (h:Entity)
+            {hidden_clause}
+            RETURN {community} AS community, count(h) AS size, avg(h.confidence) AS confidence
+            ORDER BY size DESC
+            LIMIT $max_super_nodes
+        """, params).data()
+        
+        node_links = session.run(f"""
+            MATCH (v:Entity)-[r]-(h:Entity)
+            {hidden_clause} AND v.id IN $node_ids
+            RETURN v.id AS source, {community} AS community,
+                   count(r) AS links, avg(r.confidence) AS confidence
+        """, params).data()
+        
+        other = self._entity_conditions("o", filters, config, params) + ["NOT o.id IN $node_ids"]
+        community_links = session.run(f"""
+            MATCH (h:Entity)-[r]->(o:Entity)
+            {hidden_clause} AND {" AND ".join(other)}
+            WITH {community} AS community, {self._community_expression("o")} AS other, r
+            WHERE community <> other
+            RETURN community, other, count(r) AS links, avg(r.confidence) AS confidence
+        """, params).data()
+        
+        return self._build_super_graph(communities, node_links, community_links, config)
+    
+    def _build_super_graph(self, communities: List[Dict], node_links: List[Dict],
+                           community_links: List[Dict],
+                           config: GraphVisualizationConfig) -> Tuple[List[Dict], List[Dict]]:
+        """Build super-nodes and aggregated edges from per-community counts."""
+        super_nodes = []
+        for row in communities:
+            confidence = row["confidence"] if row["confidence"] is not None else 0.0
+            super_nodes.append({
+                "id": f"community:{row['community']}",
+                "name": f"{row['community']} ({row['size']})",
+                "type": row["community"],
+                "confidence": confidence,
+                "domain": None,
+                "sources": [],
+                "attributes": {},
+                "is_super_node": True,
+                "community": row["community"],
+                "member_count": row["size"],
+                "size": max(10, config.node_size_factor * (1 + np.log10(row["size"]))),
+                "color": self._get_entity_color(row["community"], config.color_by, {"confidence": confidence})
+            })
+        shown = {node["community"] for node in super_nodes}
+        
+        def aggregated_edge(source: str, target: str, row: Dict) -> Dict[str, Any]:
+            confidence = row["confidence"] if row["confidence"] is not None else 0.0
+            return {
+                "source": source,
+                "target": target,
+                "type": "AGGREGATED",
+                "confidence": confidence,
+                "domain": None,
+                "sources": [],
+                "attributes": {"links": row["links"]},
+                "width": max(1, min(config.edge_width_factor * 2, np.log2(1 + row["links"]))),
+                "color": self._get_relationship_color("AGGREGATED")
+            }
+        
+        super_edges = [
+            aggregated_edge(row["source"], f"community:{row['community']}", row)
+            for row in node_links if row["community"] in shown
+        ]
+        super_edges.extend(
+            aggregated_edge(f"community:{row['community']}", f"community:{row['other']}", row)
+            for row in community_links if row["community"] in shown and row["other"] in shown
+        )
+        return super_nodes, super_edges
+    
+    def _merge_expansion(self, data: VisualizationData, anchor: Dict[str, Any],
+                         new_nodes: List[Dict], new_edges: List[Dict]):
+        """Add expanded nodes and edges to data, placing new nodes around the anchor."""
+        existing = {node["id"] for node in data.nodes}
+        new_nodes = [node for node in new_nodes if node["id"] not in existing]
+        data.nodes.extend(new_nodes)
+        
+        seen_edges = {(edge["source"], edge["target"], edge["type"]) for edge in data.edges}
+        for edge in new_edges:
+            key = (edge["source"], edge["target"], edge["type"])
+            if key not in seen_edges:
+                seen_edges.add(key)
+                data.edges.append(edge)
+        
+        if anchor.get("is_super_node"):
+            anchor["member_count"] = max(0, anchor["member_count"] - len(new_nodes))
+            anchor["name"] = f"{anchor['community']} ({anchor['member_count']})"
+            if data.metrics.get("hidden_nodes"):
+                data.metrics["hidden_nodes"] = max(0, data.metrics["hidden_nodes"] - len(new_nodes))
+        
+        # Ring of new nodes around the anchor, scaled to the current layout
+        if new_nodes:
+            center = np.array(data.layout_positions.get(anchor["id"], (0.0, 0.0)), dtype=float)
+            coords = np.array(list(data.layout_positions.values()), dtype=float) if data.layout_positions else np.zeros((1, 2))
+            radius = 0.1 * max(float(np.ptp(coords, axis=0).max()), 1.0)
+            angles = np.linspace(0, 2 * np.pi, len(new_nodes), endpoint=False)
+            ring = center + radius * np.column_stack([np.cos(angles), np.sin(angles)])
+            for node, (x, y) in zip(new_nodes, ring):
+                data.layout_positions[node["id"]] = (float(x), float(y))
+        
+        data.metrics.update({
+            "total_nodes": len(data.nodes),
+            "total_edges": len(data.edges)
+        })
+    
     def create_interactive_plot(self, data: VisualizationData,
-                               config: Optional[GraphVisualizationConfig] = None) -> go.Figure:
+                               config: Optional[GraphVisualizationConfig] = None) -> "go.Figure":
         """
         Create an interactive Plotly visualization.
         
@@ -221,13 +503,16 @@ class InteractiveGraphVisualizer:
         
         fig = go.Figure()
         
+        # WebGL keeps large graphs interactive
+        use_webgl = len(data.nodes) + len(data.edges) > config.webgl_threshold
+        
         # Add edges first (so they appear behind nodes)
-        edge_trace = self._create_edge_trace(data.edges, data.layout_positions)
+        edge_trace = self._create_edge_trace(data.edges, data.layout_positions, use_webgl)
         if edge_trace:
             fig.add_trace(edge_trace)
         
         # Add nodes
-        node_trace = self._create_node_trace(data.nodes, data.layout_positions, config)
+        node_trace = self._create_node_trace(data.nodes, data.layout_positions, config, use_webgl)
         fig.add_trace(node_trace)
         
         # Update layout
@@ -240,7 +525,7 @@ class InteractiveGraphVisualizer:
             hovermode='closest',
             margin=dict(b=20,l=5,r=5,t=40),
             annotations=[ dict(
-                text="Hover over nodes for details. Drag to pan, scroll to zoom.",
+                text=self._plot_hint(data),
                 showarrow=False,
                 xref="paper", yref="paper",
                 x=0.005, y=-0.002,
@@ -254,9 +539,16 @@ class InteractiveGraphVisualizer:
         
         return fig
     
-    def create_ontology_structure_plot(self, ontology_info: Dict[str, Any]) -> go.Figure:
+    @staticmethod
+    def _plot_hint(data: VisualizationData) -> str:
+        hint = "Hover over nodes for details. Drag to pan, scroll to zoom."
+        if data.metrics.get("hidden_nodes"):
+            hint += f" {data.metrics['hidden_nodes']} more entities are grouped into community nodes."
+        return hint
+    
+    def create_ontology_structure_plot(self, ontology_info: Dict[str, Any]) -> "go.Figure":
         """Create a plot showing the ontology structure."""
-        fig = make_subplots(
+        fig = plotly_subplots.make_subplots(
             rows=2, cols=2,
             subplot_titles=('Entity Type Distribution', 'Relationship Type Distribution',
                            'Confidence Distribution', 'Ontology Coverage'),
@@ -321,18 +613,28 @@ class InteractiveGraphVisualizer:
         
         return fig
     
-    def create_semantic_similarity_heatmap(self, data: VisualizationData) -> go.Figure:
-        """Create a heatmap showing semantic similarity between entities."""
-        # Extract entities with embeddings
-        entities_with_embeddings = []
-        entity_names = []
+    def create_semantic_similarity_heatmap(self, data: VisualizationData,
+                                           config: Optional[GraphVisualizationConfig] = None) -> "go.Figure":
+        """
+        Create a heatmap showing semantic similarity between entities.
         
-        for node in data.nodes:
-            if 'embedding' in node.get('attributes', {}):
-                entities_with_embeddings.append(node['attributes']['embedding'])
-                entity_names.append(node['name'])
+        Cosine similarities come from one product of the normalized embedding
+        matrix. Beyond config.heatmap_max_entities entities, a sample is drawn
+        per entity type (proportional to its size) and shown in one block per
+        type, ordered within the block so that similar entities are adjacent.
+        Results are cached by graph version and entity ids.
+        """
+        if config is None:
+            config = GraphVisualizationConfig()
+        
+        # Extract entities with embeddings of the most common dimension
+        entities = [node for node in data.nodes if 'embedding' in (node.get('attributes') or {})]
+        if entities:
+            dimensions = [len(node['attributes']['embedding']) for node in entities]
+            dimension = max(set(dimensions), key=dimensions.count)
+            entities = [node for node, size in zip(entities, dimensions) if size == dimension]
         
-        if len(entities_with_embeddings) < 2:
+        if len(entities) < 2:
             # Return empty plot if insufficient data
             fig = go.Figure()
             fig.add_annotation(
@@ -343,21 +645,17 @@ class InteractiveGraphVisualizer:
             )
             return fig
         
-        # Calculate similarity matrix
-        similarity_matrix = []
-        for i, emb1 in enumerate(entities_with_embeddings):
-            row = []
-            for j, emb2 in enumerate(entities_with_embeddings):
-                if i == j:
-                    similarity = 1.0
-                else:
-                    # Cosine similarity
-                    dot_product = np.dot(emb1, emb2)
-                    norm1 = np.linalg.norm(emb1)
-                    norm2 = np.linalg.norm(emb2)
-                    similarity = dot_product / (norm1 * norm2) if norm1 > 0 and norm2 > 0 else 0
-                row.append(similarity)
-            similarity_matrix.append(row)
+        cache_key = (graph_version(), tuple(node.get('id') for node in entities), config.heatmap_max_entities)
+        cached = self._heatmap_cache.get(cache_key)
+        if cached is None:
+            cached = self._similarity_matrix(entities, config.heatmap_max_entities)
+            self._heatmap_cache.put(cache_key, cached)
+        entity_names, similarity_matrix = cached
+        
+        show_values = len(entity_names) <= config.heatmap_text_threshold
+        title = "Entity Semantic Similarity Heatmap"
+        if len(entity_names) < len(entities):
+            title += f" ({len(entity_names)} of {len(entities)} entities, sampled by type)"
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
@@ -365,14 +663,14 @@ class InteractiveGraphVisualizer:
             x=entity_names,
             y=entity_names,
             colorscale='Viridis',
-            text=[[f"{val:.3f}" for val in row] for row in similarity_matrix],
-            texttemplate="%{text}",
+            text=np.char.mod("%.3f", similarity_matrix) if show_values else None,
+            texttemplate="%{text}" if show_values else None,
             textfont={"size": 10},
             hoverongaps=False
         ))
         
         fig.update_layout(
-            title="Entity Semantic Similarity Heatmap",
+            title=title,
             xaxis_title="Entities",
             yaxis_title="Entities",
             height=min(800, max(400, len(entity_names) * 30))
@@ -380,6 +678,49 @@ class InteractiveGraphVisualizer:
         
         return fig
     
+    @staticmethod
+    def _similarity_matrix(entities: List[Dict], max_entities: int) -> Tuple[List[str], np.ndarray]:
+        """Sample and order entities, and compute their cosine similarity matrix."""
+        selected = np.arange(len(entities))
+        blocks = [selected]
+        if len(entities) > max_entities:
+            # Stratified sample: a share of max_entities per entity type, at least one each
+            types = np.array([str(node.get('type') or 'UNKNOWN') for node in entities])
+            strata, inverse, sizes = np.unique(types, return_inverse=True, return_counts=True)
+            quota = np.maximum(1, np.floor(sizes * max_entities / len(entities))).astype(int)
+            for stratum in np.argsort(-sizes):
+                if quota.sum() <= max_entities:
+                    break
+                quota[stratum] -= min(quota[stratum] - 1, quota.sum() - max_entities)
+            rng = np.random.default_rng(0)
+            blocks = [
+                np.sort(rng.choice(np.flatnonzero(inverse == stratum), quota[stratum], replace=False))
+                for stratum in np.argsort(-sizes)
+            ]
+            selected = np.concatenate(blocks)
+        
+        embeddings = np.array([entities[i]['attributes']['embedding'] for i in selected], dtype=float)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+        
+        if len(blocks) > 1:
+            # Within each type block, order along the block's leading principal direction
+            order, start = [], 0
+            for block in blocks:
+                rows = np.arange(start, start + len(block))
+                start += len(block)
+                if len(rows) > 2:
+                    centered = embeddings[rows] - embeddings[rows].mean(axis=0)
+                    direction = np.linalg.svd(centered, full_matrices=False)[2][0]
+                    rows = rows[np.argsort(centered @ direction, kind="stable")]
+                order.append(rows)
+            order = np.concatenate(order)
+            selected, embeddings = selected[order], embeddings[order]
+        
+        similarity_matrix = embeddings @ embeddings.T
+        np.fill_diagonal(similarity_matrix, 1.0)
+        return [entities[i]['name'] for i in selected], similarity_matrix
+    
     def _get_entity_color(self, entity_type: str, color_by: str, record: Dict) -> str:
         """Get color for entity based on coloring scheme."""
         if color_by == "entity_type":
@@ -406,71 +747,126 @@ class InteractiveGraphVisualizer:
         """Get color for relationship type."""
         return self.relationship_colors.get(rel_type, "#95a5a6")
     
-    def _calculate_layout(self, nodes: List[Dict], edges: List[Dict], algorithm: str) -> Dict[str, Tuple[float, float]]:
-        """Calculate layout positions for nodes."""
-        if not nodes:
-            return {}
+    def _calculate_layout(self, nodes: List[Dict], edges: List[Dict], algorithm: str,
+                          layout_key: Optional[str] = None,
+                          config: Optional[GraphVisualizationConfig] = None) -> Dict[str, Tuple[float, float]]:
+        """Calculate layout positions for nodes.
         
-        # Create NetworkX graph
-        G = nx.Graph()
+        Spring layouts use the NumPy force-directed layout in graph_layout.
+        With a layout_key, a stored layout is returned while the graph's node
+        and edge fingerprint is unchanged; otherwise the stored positions of
+        nodes still present are kept fixed and only new nodes are laid out.
+        """
+        if config is None:
+            config = GraphVisualizationConfig()
         
-        # Add nodes (filter out None ids)
-        valid_nodes = [node for node in nodes if node.get("id")]
-        for node in valid_nodes:
-            G.add_node(node["id"], **node)
+        # Unique node ids (filter out None ids) and edges between them
+        node_ids = list(dict.fromkeys(node["id"] for node in nodes if node.get("id")))
+        if not node_ids:
+            return {}
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        pairs = sorted({
+            tuple(sorted((edge["source"], edge["target"])))
+            for edge in edges
+            if edge.get("source") in index and edge.get("target") in index and edge["source"] != edge["target"]
+        })
         
-        # Add edges (validate source and target exist)
-        for edge in edges:
-            source_id = edge.get("source")
-            target_id = edge.get("target")
-            if source_id and target_id and G.has_node(source_id) and G.has_node(target_id):
-                G.add_edge(source_id, target_id, **edge)
+        fingerprint = None
+        stored: Dict[str, Tuple[float, float]] = {}
+        if layout_key and self.layout_cache.enabled:
+            fingerprint = LayoutCache.fingerprint(node_ids, pairs)
+            cached = self.layout_cache.get(layout_key)
+            if cached:
+                cached_fingerprint, stored = cached
+                if cached_fingerprint == fingerprint:
+                    return {node_id: stored[node_id] for node_id in node_ids}
         
         # Calculate positions based on algorithm
         try:
-            if algorithm == "spring":
-                pos = nx.spring_layout(G, k=1, iterations=50)
-            elif algorithm == "circular":
-                pos = nx.circular_layout(G)
-            elif algorithm == "kamada_kawai":
-                pos = nx.kamada_kawai_layout(G)
+            if algorithm in ("circular", "kamada_kawai"):
+                G = nx.Graph()
+                G.add_nodes_from(node_ids)
+                G.add_edges_from(pairs)
+                pos = nx.circular_layout(G) if algorithm == "circular" else nx.kamada_kawai_layout(G)
+                positions = {node_id: (float(coords[0]), float(coords[1])) for node_id, coords in pos.items()}
             else:
-                pos = nx.spring_layout(G)
-            
-            return {node_id: (float(coords[0]), float(coords[1])) for node_id, coords in pos.items()}
+                initial = np.full((len(node_ids), 2), np.nan)
+                for node_id, coords in stored.items():
+                    if node_id in index:
+                        initial[index[node_id]] = coords
+                fixed = ~np.isnan(initial).any(axis=1)
+                coords = force_directed_layout(
+                    len(node_ids),
+                    np.array([(index[source], index[target]) for source, target in pairs], dtype=np.int64),
+                    initial=initial if fixed.any() else None,
+                    fixed=fixed,
+                    iterations=config.layout_iterations,
+                    barnes_hut_threshold=config.barnes_hut_threshold,
+                    seed=config.layout_seed
+                )
+                positions = {node_id: (float(x), float(y)) for node_id, (x, y) in zip(node_ids, coords)}
             
         except Exception as e:
             logger.warning(f"Layout calculation failed: {e}, using fallback")
             # Fallback to simple circular layout
-            valid_nodes = [node for node in nodes if node.get("id")]
-            if not valid_nodes:
-                return {}
-            return {node["id"]: (np.cos(i * 2 * np.pi / len(valid_nodes)), np.sin(i * 2 * np.pi / len(valid_nodes))) 
-                   for i, node in enumerate(valid_nodes)}
-    
-    def _create_edge_trace(self, edges: List[Dict], positions: Dict[str, Tuple[float, float]]) -> Optional[go.Scatter]:
-        """Create edge trace for visualization."""
-        if not edges:
-            return None
+            return {node_id: (np.cos(i * 2 * np.pi / len(node_ids)), np.sin(i * 2 * np.pi / len(node_ids)))
+                   for i, node_id in enumerate(node_ids)}
         
-        edge_x = []
-        edge_y = []
-        edge_info = []
+        if fingerprint:
+            self.layout_cache.put(layout_key, fingerprint, positions)
+        return positions
+    
+    def _relax_layout(self, data: VisualizationData, moved_ids: Set[str],
+                      config: GraphVisualizationConfig):
+        """Relax the positions of moved_ids with all other nodes fixed in place."""
+        node_ids = [node["id"] for node in data.nodes if node["id"] in data.layout_positions]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        edge_index = np.array([
+            (index[edge["source"]], index[edge["target"]])
+            for edge in data.edges
+            if edge["source"] in index and edge["target"] in index and edge["source"] != edge["target"]
+        ], dtype=np.int64).reshape(-1, 2)
+        fixed = np.array([node_id not in moved_ids for node_id in node_ids])
+        coords = force_directed_layout(
+            len(node_ids),
+            edge_index,
+            initial=np.array([data.layout_positions[node_id] for node_id in node_ids], dtype=float),
+            fixed=fixed,
+            iterations=config.layout_iterations,
+            barnes_hut_threshold=config.barnes_hut_threshold,
+            seed=config.layout_seed
+        )
+        for node_id, (x, y) in zip(np.array(node_ids, dtype=object)[~fixed], coords[~fixed]):
+            data.layout_positions[node_id] = (float(x), float(y))
+    
+    def _create_edge_trace(self, edges: List[Dict], positions: Dict[str, Tuple[float, float]],
+                           use_webgl: bool = False) -> Optional["go.Scatter"]:
+        """Create edge trace for visualization.
         
-        for edge in edges:
-            source_pos = positions.get(edge["source"])
-            target_pos = positions.get(edge["target"])
-            
-            if source_pos and target_pos:
-                edge_x.extend([source_pos[0], target_pos[0], None])
-                edge_y.extend([source_pos[1], target_pos[1], None])
-                edge_info.append(f"{edge['type']} (confidence: {edge['confidence']:.2f})")
+        Segment coordinates are gathered with NumPy indexing into one array of
+        (source, target, gap) points instead of per-edge Python lists.
+        """
+        if not edges or not positions:
+            return None
         
-        if not edge_x:
+        index = {node_id: i for i, node_id in enumerate(positions)}
+        coords = np.array(list(positions.values()), dtype=float).reshape(-1, 2)
+        pairs = np.array(
+            [(index.get(edge.get("source"), -1), index.get(edge.get("target"), -1)) for edge in edges],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        pairs = pairs[(pairs >= 0).all(axis=1)]
+        if not len(pairs):
             return None
         
-        return go.Scatter(
-            x=edge_x, y=edge_y,
+        # NaN after each segment breaks the line between edges
+        segments = np.full((len(pairs), 3, 2), np.nan)
+        segments[:, 0] = coords[pairs[:, 0]]
+        segments[:, 1] = coords[pairs[:, 1]]
+        
+        trace = go.Scattergl if use_webgl else go.Scatter
+        return trace(
+            x=segments[:, :, 0].ravel(), y=segments[:, :, 1].ravel(),
             line=dict(width=1, color='#888'),
             hoverinfo='none',
             mode='lines',
@@ -478,60 +874,56 @@ class InteractiveGraphVisualizer:
         )
     
     def _create_node_trace(self, nodes: List[Dict], positions: Dict[str, Tuple[float, float]], 
-                          config: GraphVisualizationConfig) -> go.Scatter:
-        """Create node trace for visualization."""
-        node_x = []
-        node_y = []
-        node_colors = []
-        node_sizes = []
-        node_text = []
-        node_info = []
-        
-        for node in nodes:
-            pos = positions.get(node["id"])
-            if pos:
-                node_x.append(pos[0])
-                node_y.append(pos[1])
-                node_colors.append(node["color"])
-                node_sizes.append(node["size"])
-                
-                # Node labels
-                if config.show_labels:
-                    node_text.append(node["name"])
-                else:
-                    node_text.append("")
-                
-                # Hover info
-                sources_str = ", ".join(node.get("sources", [])[:3])
-                if len(node.get("sources", [])) > 3:
-                    sources_str += "..."
-                
-                hover_text = (
-                    f"<b>{node['name']}</b><br>"
-                    f"Type: {node['type']}<br>"
-                    f"Confidence: {node['confidence']:.2f}<br>"
-                    f"Domain: {node.get('domain', 'unknown')}<br>"
-                    f"Sources: {sources_str}"
-                )
-                node_info.append(hover_text)
+                          config: GraphVisualizationConfig, use_webgl: bool = False) -> "go.Scatter":
+        """Create node trace for visualization.
         
-        return go.Scatter(
-            x=node_x, y=node_y,
+        Node ids are attached as customdata so click events identify the node
+        to pass to expand_node.
+        """
+        placed = [node for node in nodes if node.get("id") in positions]
+        coords = np.array([positions[node["id"]] for node in placed], dtype=float).reshape(-1, 2)
+        
+        trace = go.Scattergl if use_webgl else go.Scatter
+        return trace(
+            x=coords[:, 0], y=coords[:, 1],
             mode='markers+text' if config.show_labels else 'markers',
             hovertemplate='%{hovertext}<extra></extra>',
-            hovertext=node_info,
-            text=node_text,
+            hovertext=[self._node_hover_text(node) for node in placed],
+            customdata=[node["id"] for node in placed],
+            text=[node["name"] for node in placed] if config.show_labels else None,
             textposition="middle center",
             marker=dict(
-                size=node_sizes,
-                color=node_colors,
+                size=np.array([node["size"] for node in placed], dtype=float),
+                color=[node["color"] for node in placed],
                 line=dict(width=2, color="white"),
                 sizemode='diameter'
             ),
             name='Entities'
         )
     
-    def _get_ontology_info(self, session: neo4j.Session, ontology_domain: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _node_hover_text(node: Dict[str, Any]) -> str:
+        if node.get("is_super_node"):
+            return (
+                f"<b>{node['community']}</b><br>"
+                f"{node['member_count']} entities not shown (click to expand)<br>"
+                f"Average confidence: {node['confidence']:.2f}"
+            )
+        
+        sources = node.get("sources") or []
+        sources_str = ", ".join(sources[:3])
+        if len(sources) > 3:
+            sources_str += "..."
+        
+        return (
+            f"<b>{node['name']}</b><br>"
+            f"Type: {node['type']}<br>"
+            f"Confidence: {node['confidence']:.2f}<br>"
+            f"Domain: {node.get('domain', 'unknown')}<br>"
+            f"Sources: {sources_str}"
+        )
+    
+    def _get_ontology_info(self, session: "neo4j.Session", ontology_domain: Optional[str] = None) -> Dict[str, Any]:
         """Get ontology information from the graph."""
         info = {}
         
@@ -754,4 +1146,6 @@ class InteractiveGraphVisualizer:
         """Clean up resources."""
         if hasattr(self, 'driver'):
             self.driver.close()
+        if hasattr(self, 'layout_cache'):
+            self.layout_cache.close()
         logger.info("🎨 Visualizer resources cleaned up")
\ No newline at end of file
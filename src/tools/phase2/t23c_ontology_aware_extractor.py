@@ -12,14 +12,18 @@ from dataclasses import dataclass, asdict
 import numpy as np
 from datetime import datetime
 
-import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
-from openai import OpenAI
-
 from src.core.identity_service import Entity, Relationship, Mention
 from src.core.identity_service import IdentityService
+from src.core.config import get_config
+from src.core.lazy_imports import lazy_import
+from src.core.llm_cache import get_llm_cache
+from src.core.embedding_service import get_embedding_service
 from src.ontology_generator import DomainOntology, EntityType, RelationshipType
 
+genai = lazy_import("google.generativeai", install_hint="google-generativeai")
+genai_types = lazy_import("google.generativeai.types", install_hint="google-generativeai")
+openai = lazy_import("openai")
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,20 +69,25 @@ class OntologyAwareExtractor:
         self.gemini_model = genai.GenerativeModel('gemini-2.5-flash')
         
         # Safety settings for academic content
+        harm, block = genai_types.HarmCategory, genai_types.HarmBlockThreshold
         self.safety_settings = {
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+            harm.HARM_CATEGORY_HARASSMENT: block.BLOCK_NONE,
+            harm.HARM_CATEGORY_HATE_SPEECH: block.BLOCK_NONE,
+            harm.HARM_CATEGORY_SEXUALLY_EXPLICIT: block.BLOCK_NONE,
+            harm.HARM_CATEGORY_DANGEROUS_CONTENT: block.BLOCK_NONE,
         }
         
         # Initialize OpenAI for embeddings
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
+            self.openai_client = openai.OpenAI(api_key=self.openai_api_key)
         else:
             logger.warning("OpenAI API key not provided. Embeddings will use mock values.")
             self.openai_client = None
+        self.embedding_service = get_embedding_service(client=self.openai_client) if self.openai_client else None
+        
+        # Persistent response cache shared by all LLM call sites
+        self.llm_cache = get_llm_cache()
     
     def extract_entities(self, 
                         text: str, 
@@ -107,11 +116,28 @@ class OntologyAwareExtractor:
             # Use OpenAI instead of Gemini to avoid safety filter issues
             raw_extraction = self._openai_extract(text, ontology)
         
+        return self._build_extraction_result(
+            raw_extraction, ontology, source_ref, confidence_threshold, start_time
+        )
+    
+    def _build_extraction_result(self,
+                                 raw_extraction: Dict[str, Any],
+                                 ontology: DomainOntology,
+                                 source_ref: str,
+                                 confidence_threshold: float,
+                                 start_time: datetime,
+                                 extra_metadata: Optional[Dict[str, Any]] = None) -> ExtractionResult:
+        """Turn raw LLM extraction output for one chunk into mentions, entities and relationships."""
         # Step 2: Create mentions and entities
         entities = []
         mentions = []
         entity_map = {}  # Track text -> entity mapping
         
+        # Batch-fetch resolution embeddings up front instead of one request per mention
+        accepted = [e for e in raw_extraction.get("entities", [])
+                    if e.get("confidence", 0) >= confidence_threshold]
+        self.identity_service.warm_embeddings([e["text"] for e in accepted])
+        
         for raw_entity in raw_extraction.get("entities", []):
             if raw_entity.get("confidence", 0) < confidence_threshold:
                 continue
@@ -179,10 +205,234 @@ class OntologyAwareExtractor:
                 "source_ref": source_ref,
                 "total_entities": len(entities),
                 "total_relationships": len(relationships),
-                "confidence_threshold": confidence_threshold
+                "confidence_threshold": confidence_threshold,
+                **(extra_metadata or {})
             }
         )
     
+    def extract_entities_packed(self,
+                                chunks: List[Tuple[str, str]],
+                                ontology: DomainOntology,
+                                confidence_threshold: float = 0.7,
+                                use_mock_apis: bool = False,
+                                token_budget: Optional[int] = None,
+                                max_chunks_per_request: Optional[int] = None) -> List[ExtractionResult]:
+        """
+        Extract from several chunks with multi-chunk LLM requests.
+        
+        Chunks are grouped into one request up to a prompt token budget so the
+        ontology description is sent once per group instead of once per chunk.
+        The model answers per chunk id and every entity is attributed back to
+        its chunk's source_ref. Chunks missing from a packed answer are
+        re-extracted individually. Each packed chunk reserves
+        extraction_pack_output_tokens_per_chunk answer tokens, so a group
+        never holds more chunks than the model's answer limit fits.
+        
+        Args:
+            chunks: List of (text, source_ref) tuples
+            ontology: Domain ontology to use
+            confidence_threshold: Minimum confidence
+            use_mock_apis: Use mock extraction instead of LLM calls
+            token_budget: Maximum estimated prompt tokens per request (config default if None)
+            max_chunks_per_request: Maximum chunks per request (config default if None)
+            
+        Returns:
+            One ExtractionResult per input chunk, in input order
+        """
+        api_config = get_config().api
+        token_budget = token_budget or api_config.extraction_pack_token_budget
+        max_chunks_per_request = max_chunks_per_request or api_config.extraction_pack_max_chunks
+        output_tokens_per_chunk = api_config.extraction_pack_output_tokens_per_chunk
+        # A truncated answer fails the whole group, so only pack what the answer limit fits
+        max_chunks_per_request = max(1, min(
+            max_chunks_per_request, api_config.extraction_max_output_tokens // output_tokens_per_chunk
+        ))
+        
+        if use_mock_apis or not self.openai_client:
+            return [
+                self.extract_entities(text, ontology, source_ref, confidence_threshold, use_mock_apis)
+                for text, source_ref in chunks
+            ]
+        
+        overhead_tokens = self._estimate_tokens(self._packed_prompt(ontology, []))
+        groups = self._pack_chunks(chunks, token_budget - overhead_tokens, max_chunks_per_request)
+        logger.info(f"Packed {len(chunks)} chunks into {len(groups)} extraction requests")
+        
+        results: List[Optional[ExtractionResult]] = [None] * len(chunks)
+        for group in groups:
+            start_time = datetime.now()
+            group_chunks = [chunks[i] for i in group]
+            raw_by_ref = (
+                self._openai_extract_packed(group_chunks, ontology, output_tokens_per_chunk * len(group))
+                if len(group) > 1 else {}
+            )
+            
+            for index in group:
+                text, source_ref = chunks[index]
+                raw_extraction = raw_by_ref.get(source_ref)
+                if raw_extraction is None:
+                    # Single chunk, failed packed request, or chunk missing from the answer
+                    results[index] = self.extract_entities(
+                        text, ontology, source_ref, confidence_threshold
+                    )
+                    continue
+                
+                results[index] = self._build_extraction_result(
+                    raw_extraction, ontology, source_ref, confidence_threshold, start_time,
+                    extra_metadata={"packed_request_size": len(group)}
+                )
+        
+        return results
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token estimate (~4 characters per token for English text)."""
+        return len(text) // 4 + 1
+    
+    def _pack_chunks(self, chunks: List[Tuple[str, str]], chunk_token_budget: int,
+                     max_chunks_per_request: int) -> List[List[int]]:
+        """Group chunk indices greedily, in order, under the per-request token budget."""
+        groups = []
+        current: List[int] = []
+        current_tokens = 0
+        
+        for index, (text, _) in enumerate(chunks):
+            tokens = self._estimate_tokens(text)
+            if current and (current_tokens + tokens > chunk_token_budget
+                            or len(current) >= max_chunks_per_request):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        
+        if current:
+            groups.append(current)
+        return groups
+    
+    def _describe_ontology(self, ontology: DomainOntology) -> Tuple[List[str], List[str]]:
+        """Build entity and relationship type description lines for prompts."""
+        entity_desc = []
+        for et in ontology.entity_types:
+            examples = ", ".join(et.examples[:3]) if et.examples else "no examples"
+            entity_desc.append(f"- {et.name}: {et.description} (examples: {examples})")
+        
+        rel_desc = []
+        for rt in ontology.relationship_types:
+            rel_desc.append(f"- {rt.name}: {rt.description} (connects {rt.source_types} to {rt.target_types})")
+        
+        return entity_desc, rel_desc
+    
+    def _packed_prompt(self, ontology: DomainOntology, chunk_texts: List[Tuple[str, str]]) -> str:
+        """Build a multi-chunk extraction prompt; chunk_texts are (chunk_id, text) pairs."""
+        entity_desc, rel_desc = self._describe_ontology(ontology)
+        chunk_sections = "\n\n".join(
+            f"<<<CHUNK {chunk_id}>>>\n{text}\n<<<END CHUNK {chunk_id}>>>"
+            for chunk_id, text in chunk_texts
+        )
+        
+        return f"""Extract entities and relationships from each of the following text chunks using the domain ontology.
+
+**Domain:** {ontology.domain_name}
+
+**Entity Types:**
+{chr(10).join(entity_desc)}
+
+**Relationship Types:**
+{chr(10).join(rel_desc)}
+
+**Text chunks to analyze:**
+{chunk_sections}
+
+**Instructions:**
+1. Analyze each chunk independently
+2. Identify entities that match the defined types
+3. Only report relationships between entities found in the same chunk
+4. Return confidence scores (0.0-1.0)
+5. Include context for each extraction
+
+**Response format (JSON only, one object per chunk id, including chunks with no extractions):**
+{{
+    "chunks": [
+        {{
+            "chunk_id": "c0",
+            "entities": [
+                {{"text": "entity text", "type": "EntityType", "confidence": 0.9, "context": "surrounding text"}}
+            ],
+            "relationships": [
+                {{"source": "entity1", "target": "entity2", "relation": "RelationType", "confidence": 0.8, "context": "context"}}
+            ]
+        }}
+    ]
+}}
+
+Respond ONLY with valid JSON."""
+    
+    def _openai_extract_packed(self, chunks: List[Tuple[str, str]],
+                               ontology: DomainOntology, max_tokens: int) -> Dict[str, Dict[str, Any]]:
+        """Use one OpenAI request for several chunks.
+        
+        Args:
+            chunks: List of (text, source_ref) tuples
+            ontology: Domain ontology to use
+            max_tokens: Answer token limit for the whole group
+        
+        Returns:
+            Raw extraction per source_ref; chunks absent from the answer are omitted
+        """
+        chunk_ids = {f"c{i}": source_ref for i, (_, source_ref) in enumerate(chunks)}
+        prompt = self._packed_prompt(
+            ontology, [(f"c{i}", text) for i, (text, _) in enumerate(chunks)]
+        )
+        logger.info(f"Sending packed prompt for {len(chunks)} chunks to OpenAI")
+        
+        cache_key = self.llm_cache.make_key(
+            prompt, "gpt-3.5-turbo", temperature=0.3, max_tokens=max_tokens
+        )
+        
+        try:
+            response_text = self.llm_cache.get(cache_key)
+            fresh = response_text is None
+            if fresh:
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,  # Low temperature for consistent extraction
+                    max_tokens=max_tokens,
+                )
+                response_text = response.choices[0].message.content
+            
+            cleaned = response_text.strip()
+            if cleaned.startswith("```json"):
+                cleaned = cleaned[7:]
+            if cleaned.startswith("```"):
+                cleaned = cleaned[3:]
+            if cleaned.endswith("```"):
+                cleaned = cleaned[:-3]
+            
+            result = json.loads(cleaned)
+            if fresh:
+                # Cache hits are not stored again, so they keep their age and hit count
+                self.llm_cache.put(cache_key, response_text, model="gpt-3.5-turbo")
+            
+        except Exception as e:
+            logger.error(f"Packed OpenAI extraction failed, falling back to per-chunk requests: {e}")
+            return {}
+        
+        raw_by_ref = {}
+        for chunk_result in result.get("chunks", []):
+            source_ref = chunk_ids.get(str(chunk_result.get("chunk_id", "")))
+            if source_ref is None:
+                continue
+            raw_by_ref[source_ref] = {
+                "entities": chunk_result.get("entities", []),
+                "relationships": chunk_result.get("relationships", [])
+            }
+        
+        missing = len(chunk_ids) - len(raw_by_ref)
+        if missing:
+            logger.warning(f"Packed answer omitted {missing} of {len(chunk_ids)} chunks")
+        return raw_by_ref
+    
     def _mock_extract(self, text: str, ontology: DomainOntology) -> Dict[str, Any]:
         """Generate mock extraction results for testing purposes."""
         logger.info(f"Using mock extraction for text length: {len(text)}")
@@ -236,17 +486,9 @@ class OntologyAwareExtractor:
         logger.info(f"Ontology domain: {ontology.domain_name}")
         
         # Build entity and relationship descriptions
-        entity_desc = []
-        for et in ontology.entity_types:
-            examples = ", ".join(et.examples[:3]) if et.examples else "no examples"
-            entity_desc.append(f"- {et.name}: {et.description} (examples: {examples})")
+        entity_desc, rel_desc = self._describe_ontology(ontology)
         
         logger.info(f"Entity types: {len(entity_desc)}")
-        
-        rel_desc = []
-        for rt in ontology.relationship_types:
-            rel_desc.append(f"- {rt.name}: {rt.description} (connects {rt.source_types} to {rt.target_types})")
-        
         logger.info(f"Relationship types: {len(rel_desc)}")
         
         guidelines = "\n".join(f"- {g}" for g in ontology.extraction_patterns)
@@ -302,20 +544,31 @@ Respond ONLY with the JSON."""
         
         logger.info(f"Sending prompt to Gemini (first 500 chars): {prompt[:500]}...")
         
+        cache_key = self.llm_cache.make_key(
+            prompt, "gemini-2.5-flash", temperature=0.3, candidate_count=1, max_output_tokens=4000
+        )
+        
         try:
-            response = self.gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # Low temperature for consistent extraction
-                    candidate_count=1,
-                    max_output_tokens=4000,
-                ),
-                safety_settings=self.safety_settings
-            )
+            response_text = self.llm_cache.get(cache_key)
+            fresh = response_text is None
+            if fresh:
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,  # Low temperature for consistent extraction
+                        candidate_count=1,
+                        max_output_tokens=4000,
+                    ),
+                    safety_settings=self.safety_settings
+                )
+                # Accessing .text raises when the safety filter blocked the response
+                response_text = response.text
+            else:
+                logger.info("Gemini response served from LLM cache")
             
             # Parse response - handle safety filter blocks
             try:
-                cleaned = response.text.strip()
+                cleaned = response_text.strip()
                 logger.info(f"Gemini raw response (first 500 chars): {cleaned[:500]}...")
                 
                 if cleaned.startswith("```json"):
@@ -326,12 +579,15 @@ Respond ONLY with the JSON."""
                     cleaned = cleaned[:-3]
                 
                 result = json.loads(cleaned)
+                if fresh:
+                    # Cache hits are not stored again, so they keep their age and hit count
+                    self.llm_cache.put(cache_key, response_text, model="gemini-2.5-flash")
                 logger.info(f"Gemini extraction successful: {len(result.get('entities', []))} entities, {len(result.get('relationships', []))} relationships")
                 return result
             except Exception as parse_error:
                 # Response parsing failed - likely safety filter block
                 logger.warning(f"Failed to parse Gemini response: {parse_error}")
-                logger.warning(f"Response text was: {response.text[:500]}...")
+                logger.warning(f"Response text was: {response_text[:500]}...")
                 raise Exception(f"Gemini response parsing failed: {parse_error}")
             
         except Exception as e:
@@ -349,14 +605,7 @@ Respond ONLY with the JSON."""
             return self._fallback_pattern_extraction(text, ontology)
         
         # Build entity and relationship descriptions (same as Gemini)
-        entity_desc = []
-        for et in ontology.entity_types:
-            examples = ", ".join(et.examples[:3]) if et.examples else "no examples"
-            entity_desc.append(f"- {et.name}: {et.description} (examples: {examples})")
-        
-        rel_desc = []
-        for rt in ontology.relationship_types:
-            rel_desc.append(f"- {rt.name}: {rt.description} (connects {rt.source_types} to {rt.target_types})")
+        entity_desc, rel_desc = self._describe_ontology(ontology)
         
         # Build prompt (same as Gemini but formatted for OpenAI)
         prompt = f"""Extract entities and relationships from the following text using the domain ontology.
@@ -392,17 +641,27 @@ Respond ONLY with valid JSON."""
         
         logger.info(f"Sending prompt to OpenAI (first 500 chars): {prompt[:500]}...")
         
+        cache_key = self.llm_cache.make_key(
+            prompt, "gpt-3.5-turbo", temperature=0.3, max_tokens=4000
+        )
+        
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,  # Low temperature for consistent extraction
-                max_tokens=4000,
-            )
+            response_text = self.llm_cache.get(cache_key)
+            fresh = response_text is None
+            if fresh:
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,  # Low temperature for consistent extraction
+                    max_tokens=4000,
+                )
+                response_text = response.choices[0].message.content
+            else:
+                logger.info("OpenAI response served from LLM cache")
             
             # Parse response
             try:
-                cleaned = response.choices[0].message.content.strip()
+                cleaned = response_text.strip()
                 logger.info(f"OpenAI raw response (first 500 chars): {cleaned[:500]}...")
                 
                 # Clean JSON formatting
@@ -414,6 +673,9 @@ Respond ONLY with valid JSON."""
                     cleaned = cleaned[:-3]
                 
                 result = json.loads(cleaned)
+                if fresh:
+                    # Cache hits are not stored again, so they keep their age and hit count
+                    self.llm_cache.put(cache_key, response_text, model="gpt-3.5-turbo")
                 logger.info(f"OpenAI extraction successful: {len(result.get('entities', []))} entities, {len(result.get('relationships', []))} relationships")
                 return result
                 
@@ -540,36 +802,31 @@ Respond ONLY with valid JSON."""
         )
     
     def _generate_embeddings(self, entities: List[Entity], ontology: DomainOntology):
-        """Generate contextual embeddings for entities using OpenAI."""
+        """Generate contextual embeddings for entities using batched OpenAI calls."""
+        if not entities:
+            return
+        
+        entity_type_desc = {et.name: et.description for et in ontology.entity_types}
+        contexts = []
         for entity in entities:
             # Create context-rich description
-            entity_type_info = next((et for et in ontology.entity_types 
-                                   if et.name == entity.entity_type), None)
-            
-            if entity_type_info:
-                context = f"{entity.entity_type}: {entity.canonical_name} - {entity_type_info.description}"
+            description = entity_type_desc.get(entity.entity_type)
+            if description:
+                contexts.append(f"{entity.entity_type}: {entity.canonical_name} - {description}")
             else:
-                context = f"{entity.entity_type}: {entity.canonical_name}"
-            
-            try:
-                # Generate embedding
-                if self.openai_client:
-                    response = self.openai_client.embeddings.create(
-                        model="text-embedding-ada-002",
-                        input=context
-                    )
-                    embedding = response.data[0].embedding
-                else:
-                    # No OpenAI client available
-                    raise Exception("OpenAI client not available")
-                
+                contexts.append(f"{entity.entity_type}: {entity.canonical_name}")
+        
+        # One API request per embedding_batch_size contexts; repeats come from the store
+        embeddings = self.embedding_service.get_embeddings(contexts, "text-embedding-ada-002")
+        
+        for entity, context, embedding in zip(entities, contexts, embeddings):
+            if embedding is not None:
                 # Store embedding (would go to Qdrant in production)
                 entity.attributes["embedding"] = embedding
                 entity.attributes["embedding_model"] = "text-embedding-ada-002"
                 entity.attributes["embedding_context"] = context
-                
-            except Exception as e:
-                logger.error(f"Failed to generate embedding for {entity.canonical_name}: {e}")
+            else:
+                logger.error(f"Failed to generate embedding for {entity.canonical_name}")
                 # Use mock embedding
                 entity.attributes["embedding"] = np.random.randn(1536).tolist()
                 entity.attributes["embedding_model"] = "mock"
@@ -577,7 +834,8 @@ Respond ONLY with valid JSON."""
     def batch_extract(self, 
                      texts: List[Tuple[str, str]],  # (text, source_ref) pairs
                      ontology: DomainOntology,
-                     confidence_threshold: float = 0.7) -> List[ExtractionResult]:
+                     confidence_threshold: float = 0.7,
+                     pack_chunks: bool = False) -> List[ExtractionResult]:
         """
         Extract from multiple texts efficiently.
         
@@ -585,10 +843,14 @@ Respond ONLY with valid JSON."""
             texts: List of (text, source_ref) tuples
             ontology: Domain ontology to use
             confidence_threshold: Minimum confidence
+            pack_chunks: Group several texts per LLM request (see extract_entities_packed)
             
         Returns:
             List of ExtractionResult objects
         """
+        if pack_chunks:
+            return self.extract_entities_packed(texts, ontology, confidence_threshold)
+        
         results = []
         
         for text, source_ref in texts:
@@ -8,18 +8,24 @@ import os
 import json
 import logging
 import uuid
+from collections import defaultdict
 from typing import List, Dict, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import numpy as np
-import neo4j
-from neo4j import GraphDatabase
 
 from src.core.identity_service import Entity, Relationship
 from src.core.identity_service import IdentityService
 from src.tools.phase2.t23c_ontology_aware_extractor import OntologyAwareExtractor, ExtractionResult
 from src.ontology_generator import DomainOntology
 from src.core.ontology_storage_service import OntologyStorageService
+from src.core.lru_cache import LRUCache
+from src.core.config import get_config
+from src.core.graph_store import GraphStore, Neo4jGraphStore
+from src.core.lazy_imports import lazy_import
+from src.core.service_manager import get_service_manager
+
+neo4j = lazy_import("neo4j")
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +66,9 @@ class OntologyAwareGraphBuilder:
                  neo4j_uri: str = "bolt://localhost:7687",
                  neo4j_user: str = "neo4j", 
                  neo4j_password: str = "password",
-                 confidence_threshold: float = 0.7):
+                 confidence_threshold: float = 0.7,
+                 use_bulk_writes: bool = True,
+                 graph_store: Optional[GraphStore] = None):
         """
         Initialize the ontology-aware graph builder.
         
@@ -69,29 +77,43 @@ class OntologyAwareGraphBuilder:
             neo4j_user: Neo4j username
             neo4j_password: Neo4j password
             confidence_threshold: Minimum confidence for entity/relationship creation
+            use_bulk_writes: Write entities/relationships in batches
+            graph_store: Store to write the graph to (the shared embedded store
+                if configured, otherwise Neo4j at neo4j_uri)
         """
         self.confidence_threshold = confidence_threshold
+        self.use_bulk_writes = use_bulk_writes
+        graph_config = get_config().graph_construction
+        self.bulk_batch_size = graph_config.bulk_write_batch_size
         self.warnings = []
         self.errors = []
         
-        # Initialize Neo4j connection
-        try:
-            self.driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
-            # Test connection
-            with self.driver.session() as session:
-                session.run("RETURN 1")
-            logger.info("✅ Neo4j connection established")
-        except Exception as e:
-            logger.error(f"❌ Neo4j connection failed: {e}")
-            raise
+        if graph_store is None and get_config().graph_store.backend == "embedded":
+            graph_store = get_service_manager().get_graph_store()
+        self._owns_driver = graph_store is None
+        if graph_store is not None:
+            self.graph_store = graph_store
+            self.driver = getattr(graph_store, "driver", None)
+        else:
+            # Initialize Neo4j connection
+            try:
+                self.driver = neo4j.GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+                # Test connection
+                with self.driver.session() as session:
+                    session.run("RETURN 1")
+                logger.info("✅ Neo4j connection established")
+            except Exception as e:
+                logger.error(f"❌ Neo4j connection failed: {e}")
+                raise
+            self.graph_store = Neo4jGraphStore(self.driver, batch_size=self.bulk_batch_size)
         
         # Initialize services
         self.identity_service = IdentityService(use_embeddings=True)
         self.ontology_storage = OntologyStorageService()
         
-        # Entity resolution cache
-        self.entity_cache = {}
-        self.relationship_cache = set()
+        # Entity resolution caches (bounded)
+        self.entity_cache = LRUCache(graph_config.entity_cache_size)
+        self.relationship_cache = LRUCache(graph_config.entity_cache_size)
         
         # Ontology constraints
         self.current_ontology = None
@@ -108,13 +130,15 @@ class OntologyAwareGraphBuilder:
                    f"{len(self.valid_relationship_types)} relationship types)")
     
     def build_graph_from_extraction(self, extraction_result: ExtractionResult,
-                                   source_document: str) -> GraphBuildResult:
+                                   source_document: str,
+                                   bulk: Optional[bool] = None) -> GraphBuildResult:
         """
         Build graph from ontology-aware extraction results.
         
         Args:
             extraction_result: Results from T23c ontology extractor
             source_document: Source document reference
+            bulk: Use batched UNWIND writes (defaults to use_bulk_writes)
             
         Returns:
             GraphBuildResult with build statistics and metrics
@@ -132,7 +156,26 @@ class OntologyAwareGraphBuilder:
         low_confidence_entities = 0
         ontology_mismatches = 0
         
+        if bulk is None:
+            bulk = self.use_bulk_writes
+        
         try:
+            if bulk:
+                counts = self._build_graph_bulk(extraction_result, source_document)
+                metrics = self._calculate_graph_metrics(source_document)
+                
+                return GraphBuildResult(
+                    entities_created=counts["entities_created"],
+                    relationships_created=counts["relationships_created"],
+                    entities_merged=counts["entities_merged"],
+                    low_confidence_entities=counts["low_confidence_entities"],
+                    ontology_mismatches=counts["ontology_mismatches"],
+                    execution_time_seconds=(datetime.now() - start_time).total_seconds(),
+                    metrics=metrics,
+                    warnings=self.warnings.copy(),
+                    errors=self.errors.copy()
+                )
+            
             # Step 1: Process entities with ontological validation
             entity_mapping = {}
             for entity in extraction_result.entities:
@@ -191,17 +234,7 @@ class OntologyAwareGraphBuilder:
             "neo4j_id": None
         }
         
-        # Confidence check
-        if entity.confidence < self.confidence_threshold:
-            result["low_confidence"] = True
-            self.warnings.append(f"Low confidence entity: {entity.canonical_name} ({entity.confidence:.2f})")
-        
-        # Ontology validation
-        if self.current_ontology and entity.entity_type not in self.valid_entity_types:
-            result["ontology_mismatch"] = True
-            self.warnings.append(f"Entity type '{entity.entity_type}' not in ontology for '{entity.canonical_name}'")
-            # Use closest valid type or UNKNOWN
-            entity.entity_type = self._find_closest_entity_type(entity.entity_type)
+        self._validate_entity(entity, result)
         
         # Check for existing similar entities
         cache_key = f"{entity.canonical_name}_{entity.entity_type}"
@@ -210,46 +243,17 @@ class OntologyAwareGraphBuilder:
             result["merged"] = True
             return result
         
-        # Create entity in Neo4j with enhanced properties
+        # Create or merge the entity in the graph store with enhanced properties
         try:
-            with self.driver.session() as session:
-                neo4j_result = session.run("""
-                    MERGE (e:Entity {
-                        canonical_name: $canonical_name,
-                        entity_type: $entity_type
-                    })
-                    ON CREATE SET 
-                        e.id = randomUUID(),
-                        e.created_at = datetime(),
-                        e.confidence = $confidence,
-                        e.source_documents = [$source_document],
-                        e.embedding = $embedding,
-                        e.ontology_domain = $ontology_domain,
-                        e.attributes = $attributes
-                    ON MATCH SET
-                        e.source_documents = e.source_documents + $source_document,
-                        e.confidence = CASE 
-                            WHEN $confidence > e.confidence THEN $confidence 
-                            ELSE e.confidence 
-                        END
-                    RETURN e.id as entity_id, e.canonical_name as name
-                """, {
-                    "canonical_name": entity.canonical_name,
-                    "entity_type": entity.entity_type,
-                    "confidence": entity.confidence,
-                    "source_document": source_document,
-                    "embedding": entity.attributes.get("embedding", []),
-                    "ontology_domain": self.current_ontology.domain_name if self.current_ontology else "unknown",
-                    "attributes": json.dumps(entity.attributes)
-                })
-                
-                record = neo4j_result.single()
-                if record:
-                    result["neo4j_id"] = record["entity_id"]
-                    self.entity_cache[cache_key] = record["entity_id"]
-                    result["created"] = True
-                    
-                    logger.debug(f"✓ Entity created/updated: {entity.canonical_name} ({entity.entity_type})")
+            row = self._entity_row(entity)
+            created = self._write_entities([row], source_document)
+            result["neo4j_id"] = row["entity_id"]
+            self.entity_cache[cache_key] = row["entity_id"]
+            # An entity written by an earlier document is matched, not created
+            result["created"] = created > 0
+            result["merged"] = created == 0
+            
+            logger.debug(f"✓ Entity created/updated: {entity.canonical_name} ({entity.entity_type})")
                 
         except Exception as e:
             logger.error(f"Failed to create entity {entity.canonical_name}: {e}")
@@ -257,15 +261,22 @@ class OntologyAwareGraphBuilder:
         
         return result
     
-    def _create_relationship(self, relationship: Relationship, 
-                           source_neo4j_id: str, target_neo4j_id: str, 
-                           source_document: str) -> bool:
-        """Create relationship with ontological validation."""
-        # Avoid duplicate relationships
-        rel_key = (source_neo4j_id, relationship.relationship_type, target_neo4j_id)
-        if rel_key in self.relationship_cache:
-            return False
+    def _validate_entity(self, entity: Entity, result: Dict[str, Any]):
+        """Apply confidence and ontology checks to an entity, flagging them in result."""
+        # Confidence check
+        if entity.confidence < self.confidence_threshold:
+            result["low_confidence"] = True
+            self.warnings.append(f"Low confidence entity: {entity.canonical_name} ({entity.confidence:.2f})")
         
+        # Ontology validation
+        if self.current_ontology and entity.entity_type not in self.valid_entity_types:
+            result["ontology_mismatch"] = True
+            self.warnings.append(f"Entity type '{entity.entity_type}' not in ontology for '{entity.canonical_name}'")
+            # Use closest valid type or UNKNOWN
+            entity.entity_type = self._find_closest_entity_type(entity.entity_type)
+    
+    def _validate_relationship(self, relationship: Relationship):
+        """Apply confidence and ontology checks to a relationship."""
         # Confidence check
         if relationship.confidence < self.confidence_threshold:
             self.warnings.append(f"Low confidence relationship: {relationship.relationship_type} ({relationship.confidence:.2f})")
@@ -276,46 +287,203 @@ class OntologyAwareGraphBuilder:
             self.warnings.append(f"Relationship type '{relationship.relationship_type}' not in ontology")
             # Use closest valid type or generic RELATED_TO
             relationship.relationship_type = self._find_closest_relationship_type(relationship.relationship_type)
+    
+    @staticmethod
+    def _graph_key(*parts: str) -> str:
+        """Deterministic node/edge key, so upserts match what a MERGE on these parts would."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, "\x1f".join(parts)))
+    
+    def _entity_row(self, entity: Entity) -> Dict[str, Any]:
+        """Graph row for an entity, keyed by its canonical name and type."""
+        entity_id = self._graph_key("entity", entity.entity_type, entity.canonical_name)
+        return {
+            "entity_id": entity_id,
+            "id": entity_id,
+            "canonical_name": entity.canonical_name,
+            "entity_type": entity.entity_type,
+            "confidence": entity.confidence,
+            "embedding": entity.attributes.get("embedding", []),
+            "attributes": json.dumps(entity.attributes)
+        }
+    
+    def _relationship_edge(self, relationship: Relationship, source_id: str, target_id: str) -> Dict[str, Any]:
+        """Graph edge for a relationship, keyed by its endpoints and sanitized type."""
+        safe_rel_type = self._sanitize_relationship_type(relationship.relationship_type)
+        relationship_id = self._graph_key("relationship", source_id, safe_rel_type, target_id)
+        return {
+            "source": source_id,
+            "target": target_id,
+            "relationship_type": safe_rel_type,
+            "properties": {
+                "relationship_id": relationship_id,
+                "id": relationship_id,
+                "relationship_type": relationship.relationship_type,  # Original type as property
+                "confidence": relationship.confidence,
+                "attributes": json.dumps(relationship.attributes)
+            }
+        }
+    
+    @staticmethod
+    def _merged_properties(existing: Dict[str, Any], key: str, row: Dict[str, Any],
+                           source_document: str) -> Dict[str, Any]:
+        """Properties to write for a row that already exists: add the document, keep the higher confidence."""
+        return {
+            key: row[key],
+            "source_documents": list(existing.get("source_documents") or []) + [source_document],
+            "confidence": max(row["confidence"], existing.get("confidence") or 0.0)
+        }
+    
+    def _write_entities(self, rows: List[Dict[str, Any]], source_document: str) -> int:
+        """Create or merge entity rows through the graph store; returns the number created."""
+        ontology_domain = self.current_ontology.domain_name if self.current_ontology else "unknown"
+        existing = self.graph_store.get_nodes_by_key([row["entity_id"] for row in rows])
+        created_at = datetime.now().isoformat()
+        nodes = []
+        for row in rows:
+            if row["entity_id"] in existing:
+                nodes.append(self._merged_properties(existing[row["entity_id"]], "entity_id", row, source_document))
+            else:
+                nodes.append({**row, "created_at": created_at, "source_documents": [source_document],
+                              "ontology_domain": ontology_domain})
+        self.graph_store.upsert_nodes(nodes)
+        return len(rows) - len(existing)
+    
+    def _write_relationships(self, edges: List[Dict[str, Any]], source_document: str) -> Tuple[List[bool], int]:
+        """Create or merge edges of one relationship type through the graph store.
+        
+        Returns:
+            Whether each edge was written (both endpoints exist), and the number created
+        """
+        ontology_domain = self.current_ontology.domain_name if self.current_ontology else "unknown"
+        existing = self.graph_store.get_edges_by_key(
+            [edge["properties"]["relationship_id"] for edge in edges], edges[0]["relationship_type"]
+        )
+        created_at = datetime.now().isoformat()
+        writes = []
+        for edge in edges:
+            properties = edge["properties"]
+            if properties["relationship_id"] in existing:
+                properties = self._merged_properties(
+                    existing[properties["relationship_id"]], "relationship_id", properties, source_document
+                )
+            else:
+                properties = {**properties, "created_at": created_at, "source_documents": [source_document],
+                              "ontology_domain": ontology_domain}
+            writes.append({**edge, "properties": properties})
+        
+        written = [edge_id is not None for edge_id in self.graph_store.upsert_edges(writes)]
+        created = sum(
+            1 for edge, was_written in zip(edges, written)
+            if was_written and edge["properties"]["relationship_id"] not in existing
+        )
+        return written, created
+    
+    def _build_graph_bulk(self, extraction_result: ExtractionResult,
+                          source_document: str) -> Dict[str, int]:
+        """Deduplicate in memory, then write entities and relationships through the graph store in batches."""
+        counts = {
+            "entities_created": 0,
+            "relationships_created": 0,
+            "entities_merged": 0,
+            "low_confidence_entities": 0,
+            "ontology_mismatches": 0
+        }
+        
+        # Step 1: Validate and deduplicate entities in memory
+        entity_keys = {}  # extraction entity id -> cache key
+        entity_ids = {}  # cache key -> graph id for this call; entity_cache may evict entries meanwhile
+        pending_rows = {}  # cache key -> row to write
+        for entity in extraction_result.entities:
+            flags = {"low_confidence": False, "ontology_mismatch": False}
+            self._validate_entity(entity, flags)
+            counts["low_confidence_entities"] += flags["low_confidence"]
+            counts["ontology_mismatches"] += flags["ontology_mismatch"]
+            
+            cache_key = f"{entity.canonical_name}_{entity.entity_type}"
+            entity_keys[entity.id] = cache_key
+            if cache_key in entity_ids or cache_key in pending_rows:
+                counts["entities_merged"] += 1
+                continue
+            cached_id = self.entity_cache.get(cache_key)
+            if cached_id is not None:
+                entity_ids[cache_key] = cached_id
+                counts["entities_merged"] += 1
+                continue
+            
+            pending_rows[cache_key] = self._entity_row(entity)
+        
+        # Step 2: Write entities in batches
+        pending = list(pending_rows.items())
+        for start in range(0, len(pending), self.bulk_batch_size):
+            batch = pending[start:start + self.bulk_batch_size]
+            try:
+                created = self._write_entities([row for _, row in batch], source_document)
+                for cache_key, row in batch:
+                    entity_ids[cache_key] = row["entity_id"]
+                    self.entity_cache[cache_key] = row["entity_id"]
+                # Upserts also match entities written by earlier documents
+                counts["entities_created"] += created
+                counts["entities_merged"] += len(batch) - created
+            except Exception as e:
+                logger.error(f"Failed to write entity batch of {len(batch)}: {e}")
+                self.errors.append(f"Entity batch creation failed: {str(e)}")
+        
+        # Step 3: Validate and deduplicate relationships, grouped by relationship type
+        edges_by_type: Dict[str, List[Tuple[tuple, Dict[str, Any]]]] = {}
+        pending_rel_keys = set()
+        for relationship in extraction_result.relationships:
+            source_id = entity_ids.get(entity_keys.get(relationship.source_id))
+            target_id = entity_ids.get(entity_keys.get(relationship.target_id))
+            if not source_id or not target_id:
+                continue
+            
+            rel_key = (source_id, relationship.relationship_type, target_id)
+            if rel_key in self.relationship_cache or rel_key in pending_rel_keys:
+                continue
+            
+            self._validate_relationship(relationship)
+            pending_rel_keys.add(rel_key)
+            edge = self._relationship_edge(relationship, source_id, target_id)
+            edges_by_type.setdefault(edge["relationship_type"], []).append((rel_key, edge))
+        
+        # Step 4: Write relationships in batches
+        for safe_rel_type, keyed_edges in edges_by_type.items():
+            for start in range(0, len(keyed_edges), self.bulk_batch_size):
+                batch = keyed_edges[start:start + self.bulk_batch_size]
+                try:
+                    written, created = self._write_relationships([edge for _, edge in batch], source_document)
+                    for (rel_key, _), was_written in zip(batch, written):
+                        if was_written:
+                            self.relationship_cache[rel_key] = True
+                    counts["relationships_created"] += created
+                except Exception as e:
+                    logger.error(f"Failed to write {safe_rel_type} relationship batch of {len(batch)}: {e}")
+                    self.errors.append(f"Relationship batch creation failed: {safe_rel_type} - {str(e)}")
+        
+        logger.info(f"📦 Bulk build wrote {counts['entities_created']} entities and "
+                   f"{counts['relationships_created']} relationships")
+        return counts
+    
+    def _create_relationship(self, relationship: Relationship, 
+                           source_neo4j_id: str, target_neo4j_id: str, 
+                           source_document: str) -> bool:
+        """Create relationship with ontological validation."""
+        # Avoid duplicate relationships
+        rel_key = (source_neo4j_id, relationship.relationship_type, target_neo4j_id)
+        if rel_key in self.relationship_cache:
+            return False
+        
+        self._validate_relationship(relationship)
         
         try:
-            with self.driver.session() as session:
-                # Sanitize relationship type for Neo4j
-                safe_rel_type = self._sanitize_relationship_type(relationship.relationship_type)
-                
-                # Create relationship with rich metadata using dynamic query construction
-                query = f"""
-                    MATCH (source:Entity {{id: $source_id}})
-                    MATCH (target:Entity {{id: $target_id}})
-                    MERGE (source)-[r:`{safe_rel_type}`]->(target)
-                    ON CREATE SET 
-                        r.id = randomUUID(),
-                        r.created_at = datetime(),
-                        r.confidence = $confidence,
-                        r.source_documents = [$source_document],
-                        r.ontology_domain = $ontology_domain,
-                        r.attributes = $attributes,
-                        r.relationship_type = $relationship_type
-                    ON MATCH SET
-                        r.source_documents = r.source_documents + $source_document,
-                        r.confidence = CASE 
-                            WHEN $confidence > r.confidence THEN $confidence 
-                            ELSE r.confidence 
-                        END
-                """
-                
-                session.run(query, {
-                    "source_id": source_neo4j_id,
-                    "target_id": target_neo4j_id,
-                    "relationship_type": relationship.relationship_type,  # Store original type as property
-                    "confidence": relationship.confidence,
-                    "source_document": source_document,
-                    "ontology_domain": self.current_ontology.domain_name if self.current_ontology else "unknown",
-                    "attributes": json.dumps(relationship.attributes)
-                })
-                
-                self.relationship_cache.add(rel_key)
-                logger.debug(f"✓ Relationship created: {relationship.relationship_type}")
-                return True
+            edge = self._relationship_edge(relationship, source_neo4j_id, target_neo4j_id)
+            written, created = self._write_relationships([edge], source_document)
+            if not written[0]:
+                return False
+            
+            self.relationship_cache[rel_key] = True
+            logger.debug(f"✓ Relationship created/updated: {relationship.relationship_type}")
+            return created > 0
                 
         except Exception as e:
             logger.error(f"Failed to create relationship {relationship.relationship_type}: {e}")
@@ -367,70 +535,54 @@ class OntologyAwareGraphBuilder:
     def _calculate_graph_metrics(self, source_document: str) -> GraphMetrics:
         """Calculate comprehensive graph quality metrics."""
         try:
-            with self.driver.session() as session:
-                # Basic counts
-                result = session.run("""
-                    MATCH (e:Entity) 
-                    WHERE $source_document IN e.source_documents
-                    RETURN count(e) as entity_count
-                """, {"source_document": source_document})
-                total_entities = result.single()["entity_count"]
-                
-                result = session.run("""
-                    MATCH (e1:Entity)-[r]->(e2:Entity) 
-                    WHERE $source_document IN r.source_documents
-                    RETURN count(r) as rel_count
-                """, {"source_document": source_document})
-                total_relationships = result.single()["rel_count"]
-                
-                # Entity type distribution
-                result = session.run("""
-                    MATCH (e:Entity) 
-                    WHERE $source_document IN e.source_documents
-                    RETURN e.entity_type as type, count(e) as count
-                """, {"source_document": source_document})
-                entity_dist = {record["type"]: record["count"] for record in result}
-                
-                # Relationship type distribution
-                result = session.run("""
-                    MATCH (e1:Entity)-[r]->(e2:Entity) 
-                    WHERE $source_document IN r.source_documents
-                    RETURN type(r) as rel_type, count(r) as count
-                """, {"source_document": source_document})
-                rel_dist = {record["rel_type"]: record["count"] for record in result}
-                
-                # Confidence distribution
-                result = session.run("""
-                    MATCH (e:Entity) 
-                    WHERE $source_document IN e.source_documents
-                    WITH CASE 
-                        WHEN e.confidence >= 0.9 THEN 'high'
-                        WHEN e.confidence >= 0.7 THEN 'medium'
-                        ELSE 'low'
-                    END as conf_bucket
-                    RETURN conf_bucket, count(*) as count
-                """, {"source_document": source_document})
-                conf_dist = {record["conf_bucket"]: record["count"] for record in result}
-                
-                # Calculate derived metrics
-                ontology_coverage = 0.0
-                if self.current_ontology:
-                    used_types = set(entity_dist.keys()) | set(rel_dist.keys())
-                    total_types = len(self.valid_entity_types) + len(self.valid_relationship_types)
-                    ontology_coverage = len(used_types) / max(total_types, 1)
-                
-                semantic_density = total_relationships / max(total_entities, 1)
-                
-                return GraphMetrics(
-                    total_entities=total_entities,
-                    total_relationships=total_relationships,
-                    ontology_coverage=ontology_coverage,
-                    semantic_density=semantic_density,
-                    confidence_distribution=conf_dist,
-                    entity_type_distribution=entity_dist,
-                    relationship_type_distribution=rel_dist
+            # Entities and relationships that list the document among their sources
+            entities = [
+                node for node in self.graph_store.scan_nodes(
+                    contains=source_document, contains_fields=(), contains_list_fields=("source_documents",)
                 )
-                
+                if source_document in (node.get("source_documents") or [])
+            ]
+            relationships = {}
+            if entities:
+                neighbourhood = self.graph_store.neighbourhood(
+                    [node["entity_id"] for node in entities if "entity_id" in node]
+                )
+                for edge in neighbourhood["edges"]:
+                    if source_document in (edge.get("source_documents") or []):
+                        relationships[edge["edge_id"]] = edge
+            total_entities = len(entities)
+            total_relationships = len(relationships)
+            
+            entity_dist = defaultdict(int)
+            conf_dist = defaultdict(int)
+            for node in entities:
+                entity_dist[node.get("entity_type")] += 1
+                confidence = node.get("confidence") or 0.0
+                conf_dist["high" if confidence >= 0.9 else "medium" if confidence >= 0.7 else "low"] += 1
+            rel_dist = defaultdict(int)
+            for edge in relationships.values():
+                rel_dist[edge["relationship_type"]] += 1
+            entity_dist, conf_dist, rel_dist = dict(entity_dist), dict(conf_dist), dict(rel_dist)
+            
+            # Calculate derived metrics
+            ontology_coverage = 0.0
+            if self.current_ontology:
+                used_types = set(entity_dist.keys()) | set(rel_dist.keys())
+                total_types = len(self.valid_entity_types) + len(self.valid_relationship_types)
+                ontology_coverage = len(used_types) / max(total_types, 1)
+            
+            semantic_density = total_relationships / max(total_entities, 1)
+            
+            return GraphMetrics(
+                total_entities=total_entities,
+                total_relationships=total_relationships,
+                ontology_coverage=ontology_coverage,
+                semantic_density=semantic_density,
+                confidence_distribution=conf_dist,
+                entity_type_distribution=entity_dist,
+                relationship_type_distribution=rel_dist
+            )
+            
         except Exception as e:
             logger.error(f"Failed to calculate metrics: {e}")
             return GraphMetrics(
@@ -632,6 +784,7 @@ class OntologyAwareGraphBuilder:
     
     def close(self):
         """Clean up resources."""
-        if hasattr(self, 'driver'):
+        # A store passed in (or the shared embedded store) is not ours to close
+        if getattr(self, '_owns_driver', False) and self.driver:
             self.driver.close()
         logger.info("🔌 Graph builder resources cleaned up")
\ No newline at end of file
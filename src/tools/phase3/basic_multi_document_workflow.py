@@ -10,7 +10,7 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 import traceback
 
-from core.graphrag_phase_interface import ProcessingRequest, PhaseResult, PhaseStatus, GraphRAGPhase
+from core.graphrag_phase_interface import ProcessingRequest, PhaseResult, PhaseStatus, GraphRAGPhase, ArtifactContext
 from tools.phase1.vertical_slice_workflow_optimized import OptimizedVerticalSliceWorkflow
 from core.service_manager import get_service_manager
 
@@ -46,7 +46,9 @@ class BasicMultiDocumentWorkflow(GraphRAGPhase):
             if previous_data:
                 document_results = self._integrate_with_previous_phases(request.documents, request.queries[0], previous_data)
             else:
-                document_results = self._process_documents(request.documents, request.queries[0])
+                document_results = self._process_documents(
+                    request.documents, request.queries[0], request.artifact_context
+                )
             
             # Perform fusion that incorporates previous phase results
             fusion_results = self._fuse_results(document_results, previous_data)
@@ -90,8 +92,9 @@ class BasicMultiDocumentWorkflow(GraphRAGPhase):
                 execution_time=0.0
             )
     
-    def _process_documents(self, documents: List[str], sample_query: str) -> Dict[str, Any]:
-        """Process each document using Phase 1 workflow"""
+    def _process_documents(self, documents: List[str], sample_query: str,
+                           artifact_context: Optional[ArtifactContext] = None) -> Dict[str, Any]:
+        """Process each document using Phase 1 workflow, reusing shared request artifacts"""
         results = {}
         
         for doc_path in documents:
@@ -105,7 +108,8 @@ class BasicMultiDocumentWorkflow(GraphRAGPhase):
                     doc_path,
                     sample_query or "Extract main entities and relationships",
                     f"phase3_doc_{doc_name}",
-                    skip_pagerank=True  # Skip for speed
+                    skip_pagerank=True,  # Skip for speed
+                    artifact_context=artifact_context
                 )
                 
                 workflow.close()
@@ -20,6 +20,7 @@ from pathlib import Path
 from ..phase2.t31_ontology_graph_builder import OntologyAwareGraphBuilder, GraphBuildResult
 from ..phase2.t23c_ontology_aware_extractor import ExtractionResult
 from ...core.identity_service import IdentityService
+from ...core.graph_store import GraphStore
 from ...core.identity_service import Entity, Relationship
 from ...core.quality_service import QualityService
 from ...core.provenance_service import ProvenanceService
@@ -126,7 +127,9 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
                  neo4j_password: str = "password",
                  confidence_threshold: float = 0.8,
                  similarity_threshold: float = 0.85,
-                 conflict_resolution_model: Optional[str] = None):
+                 conflict_resolution_model: Optional[str] = None,
+                 max_block_size: int = 1000,
+                 graph_store: Optional[GraphStore] = None):
         """
         Initialize multi-document fusion engine.
         
@@ -137,11 +140,16 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
             confidence_threshold: Minimum confidence for fusion decisions
             similarity_threshold: Threshold for entity similarity matching
             conflict_resolution_model: Optional LLM model for conflict resolution
+            max_block_size: Shared-word blocks larger than this are skipped during
+                candidate generation (stop-word-like tokens)
+            graph_store: Store fused entities and relationships are written to
+                (see OntologyAwareGraphBuilder)
         """
-        super().__init__(neo4j_uri, neo4j_user, neo4j_password, confidence_threshold)
+        super().__init__(neo4j_uri, neo4j_user, neo4j_password, confidence_threshold, graph_store=graph_store)
         
         self.similarity_threshold = similarity_threshold
         self.conflict_resolution_model = conflict_resolution_model or "gemini-2.0-flash-exp"
+        self.max_block_size = max_block_size
         
         # Additional services for fusion
         self.identity_service = IdentityService(use_embeddings=True)
@@ -212,12 +220,14 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
                 
                 # Resolve entities within clusters
                 resolved_entities = self._resolve_entity_clusters(clusters, fusion_strategy)
+                member_to_canonical = self._build_member_mapping(clusters)
                 
                 # Merge relationships with resolved entities
                 merged_relationships = self._merge_relationships(
                     batch_relationships,
                     resolved_entities,
-                    fusion_strategy
+                    fusion_strategy,
+                    member_to_canonical
                 )
                 
                 # Detect and resolve conflicts
@@ -225,7 +235,7 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
                 result.conflicts_resolved += len(conflicts)
                 
                 # Update graph with fused knowledge
-                self._update_graph_with_fusion(resolved_entities, merged_relationships)
+                self._update_graph_with_fusion(resolved_entities, merged_relationships, member_to_canonical)
                 
                 # Generate evidence chains
                 for entity_id, entity in resolved_entities.items():
@@ -457,85 +467,201 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
             return metrics
     
     def _load_document_batch(self, document_refs: List[str]) -> Tuple[List[Entity], List[Relationship]]:
-        """Load entities and relationships from a batch of documents."""
-        all_entities = []
-        all_relationships = []
+        """Load entities and relationships from a batch of documents.
+        
+        Issues one UNWIND query for entities and one for relationships across
+        the whole batch. Records carry primitive columns only and are streamed
+        into column buffers before objects are built.
+        """
+        entity_columns = {"id": [], "name": [], "type": [], "confidence": [], "doc_ref": []}
+        rel_columns = {"rel_id": [], "source_id": [], "target_id": [], "rel_type": [], "confidence": [], "doc_ref": []}
         
         with self.driver.session() as session:
-            for doc_ref in document_refs:
-                # Query entities from document
-                entity_query = """
-                MATCH (e:Entity)-[:EXTRACTED_FROM]->(d:Document {reference: $doc_ref})
-                RETURN e
-                """
-                entity_result = session.run(entity_query, doc_ref=doc_ref)
-                
-                for record in entity_result:
-                    node = record["e"]
-                    entity = Entity(
-                        id=node["id"],
-                        canonical_name=node["name"],
-                        entity_type=node["type"],
-                        confidence=node.get("confidence", 1.0)
-                    )
-                    entity.name = entity.canonical_name  # Add name for compatibility
-                    entity.source_document = doc_ref
-                    all_entities.append(entity)
-                
-                # Query relationships from document
-                rel_query = """
-                MATCH (s:Entity)-[r]->(t:Entity)
-                WHERE EXISTS((s)-[:EXTRACTED_FROM]->(:Document {reference: $doc_ref}))
-                   OR EXISTS((t)-[:EXTRACTED_FROM]->(:Document {reference: $doc_ref}))
-                RETURN s.id as source_id, t.id as target_id, type(r) as rel_type, r
-                """
-                rel_result = session.run(rel_query, doc_ref=doc_ref)
-                
-                for record in rel_result:
-                    rel = Relationship(
-                        source_id=record["source_id"],
-                        target_id=record["target_id"],
-                        relationship_type=record["rel_type"],
-                        confidence=record["r"].get("confidence", 1.0) if record["r"] else 1.0
-                    )
-                    rel.source_document = doc_ref
-                    all_relationships.append(rel)
+            entity_result = session.run("""
+                UNWIND $refs AS doc_ref
+                MATCH (e:Entity)-[:EXTRACTED_FROM]->(:Document {reference: doc_ref})
+                RETURN doc_ref, e.id AS id, e.name AS name, e.type AS type,
+                       coalesce(e.confidence, 1.0) AS confidence
+            """, refs=document_refs)
+            for record in entity_result:
+                for column, values in entity_columns.items():
+                    values.append(record[column])
+            
+            # Relationships touching any entity extracted from the document
+            rel_result = session.run("""
+                UNWIND $refs AS doc_ref
+                MATCH (:Document {reference: doc_ref})<-[:EXTRACTED_FROM]-(x:Entity)-[r]-(:Entity)
+                WITH DISTINCT doc_ref, r
+                RETURN doc_ref, elementId(r) AS rel_id, startNode(r).id AS source_id,
+                       endNode(r).id AS target_id, type(r) AS rel_type,
+                       coalesce(r.confidence, 1.0) AS confidence
+            """, refs=document_refs)
+            for record in rel_result:
+                for column, values in rel_columns.items():
+                    values.append(record[column])
+        
+        all_entities = []
+        for entity_id, name, entity_type, confidence, doc_ref in zip(
+                entity_columns["id"], entity_columns["name"], entity_columns["type"],
+                entity_columns["confidence"], entity_columns["doc_ref"]):
+            entity = Entity(
+                id=entity_id,
+                canonical_name=name,
+                entity_type=entity_type,
+                confidence=confidence
+            )
+            entity.name = entity.canonical_name  # Add name for compatibility
+            entity.source_document = doc_ref
+            all_entities.append(entity)
+        
+        all_relationships = []
+        for rel_id, source_id, target_id, rel_type, confidence, doc_ref in zip(
+                rel_columns["rel_id"], rel_columns["source_id"], rel_columns["target_id"],
+                rel_columns["rel_type"], rel_columns["confidence"], rel_columns["doc_ref"]):
+            rel = Relationship(
+                id=f"rel_{rel_id}",
+                source_id=source_id,
+                target_id=target_id,
+                relationship_type=rel_type,
+                confidence=confidence
+            )
+            rel.source_document = doc_ref
+            all_relationships.append(rel)
         
         return all_entities, all_relationships
     
     def _find_entity_clusters(self, entities: List[Entity]) -> Dict[str, EntityCluster]:
-        """Find clusters of potentially duplicate entities using similarity."""
+        """Find clusters of potentially duplicate entities using similarity.
+
+        Only candidate pairs produced by blocking are scored; pairs at or above
+        similarity_threshold are joined with union-find, so clusters are the
+        connected components of the match graph.
+        """
+        parent = list(range(len(entities)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        evidence = defaultdict(list)
+        for i, j in self._generate_candidate_pairs(entities):
+            similarity = self._calculate_entity_similarity(entities[i], entities[j])
+            if similarity >= self.similarity_threshold:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+                evidence[(i, j)] = f"Similarity score: {similarity:.3f}"
+
+        members = defaultdict(list)
+        for i in range(len(entities)):
+            members[find(i)].append(i)
+
+        cluster_evidence = defaultdict(list)
+        for (i, _), text in evidence.items():
+            cluster_evidence[find(i)].append(text)
+
         clusters = {}
-        processed = set()
-        
-        for i, entity1 in enumerate(entities):
-            if entity1.id in processed:
+        for root in sorted(members):
+            indices = members[root]
+            if len(indices) < 2:
                 continue
-            
             cluster = EntityCluster(
                 cluster_id=f"cluster_{len(clusters)}",
-                entities=[entity1],
-                confidence=1.0
+                entities=[entities[i] for i in indices],
+                confidence=1.0,
+                evidence=cluster_evidence[root]
             )
-            
-            # Find similar entities
-            for j, entity2 in enumerate(entities[i+1:], i+1):
-                if entity2.id in processed:
-                    continue
-                
-                similarity = self._calculate_entity_similarity(entity1, entity2)
-                if similarity >= self.similarity_threshold:
-                    cluster.entities.append(entity2)
-                    processed.add(entity2.id)
-                    cluster.evidence.append(f"Similarity score: {similarity:.3f}")
-            
-            if len(cluster.entities) > 1:
-                processed.add(entity1.id)
-                clusters[cluster.cluster_id] = cluster
-                logger.debug(f"Found cluster with {len(cluster.entities)} entities")
-        
+            clusters[cluster.cluster_id] = cluster
+            logger.debug(f"Found cluster with {len(cluster.entities)} entities")
+
         return clusters
-    
+
+    @staticmethod
+    def _entity_name(entity: Entity) -> str:
+        name = entity.canonical_name if hasattr(entity, 'canonical_name') else entity.name
+        return (name or "").lower()
+
+    @staticmethod
+    def _char_ngrams(text: str, n: int = 3) -> Set[str]:
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def _generate_candidate_pairs(self, entities: List[Entity]) -> Set[Tuple[int, int]]:
+        """Generate index pairs (i < j) that could reach similarity_threshold.
+
+        Entities are blocked by type (cross-type similarity is always 0). Within
+        a block two inverted indexes mirror the scoring heuristics:
+        - character trigrams: a name contained in another shares all of its
+          trigrams, so probing only its rarest trigram finds every container;
+          names shorter than a trigram are compared with every name of an
+          admissible length instead
+        - words: pairs sharing a word, consulted only when the word-overlap
+          score can reach the threshold; blocks above max_block_size are skipped
+        """
+        # Substring score is 0.7 + 0.2 * len_ratio; word-overlap score tops out at 0.8.
+        # The small slack keeps float rounding from pruning pairs scoring exactly the threshold.
+        min_length_ratio = min(1.0, max(0.0, (self.similarity_threshold - 0.7) / 0.2 - 1e-9))
+        use_word_blocks = self.similarity_threshold <= 0.8
+
+        by_type = defaultdict(list)
+        for index, entity in enumerate(entities):
+            by_type[entity.entity_type].append(index)
+
+        pairs: Set[Tuple[int, int]] = set()
+        for indices in by_type.values():
+            if len(indices) < 2:
+                continue
+
+            names = {i: self._entity_name(entities[i]) for i in indices}
+            ngram_index = defaultdict(list)
+            length_index = defaultdict(list)
+            word_index = defaultdict(list)
+            entity_ngrams = {}
+
+            for i in indices:
+                name = names[i]
+                length_index[len(name)].append(i)
+                grams = self._char_ngrams(name)
+                entity_ngrams[i] = grams
+                for gram in grams:
+                    ngram_index[gram].append(i)
+                if use_word_blocks:
+                    for word in set(name.split()):
+                        word_index[word].append(i)
+
+            def add_pair(a: int, b: int):
+                if a != b:
+                    pairs.add((a, b) if a < b else (b, a))
+
+            # Containment candidates (includes exact matches)
+            for i in indices:
+                name = names[i]
+                grams = entity_ngrams[i]
+                max_length = len(name) / min_length_ratio if min_length_ratio > 0 else float("inf")
+                if not grams:
+                    # Names shorter than a trigram have no trigram to probe
+                    for length in length_index:
+                        if len(name) <= length <= max_length:
+                            for j in length_index[length]:
+                                if name in names[j]:
+                                    add_pair(i, j)
+                    continue
+                rarest = min(grams, key=lambda gram: len(ngram_index[gram]))
+                for j in ngram_index[rarest]:
+                    if len(names[j]) <= max_length and name in names[j]:
+                        add_pair(i, j)
+
+            # Shared-word candidates
+            for posting in word_index.values():
+                if len(posting) < 2 or len(posting) > self.max_block_size:
+                    continue
+                for a in range(len(posting)):
+                    for b in range(a + 1, len(posting)):
+                        add_pair(posting[a], posting[b])
+
+        return pairs
+
     def _calculate_entity_similarity(self, entity1: Entity, entity2: Entity) -> float:
         """Calculate similarity between two entities."""
         # Type must match
@@ -601,18 +727,33 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
         
         return resolved_entities
     
+    def _build_member_mapping(self, clusters: Dict[str, EntityCluster]) -> Dict[str, str]:
+        """Map every clustered entity ID to the ID of its cluster's canonical entity."""
+        member_to_canonical = {}
+        for cluster in clusters.values():
+            if cluster.canonical_entity is None:
+                continue
+            canonical_id = cluster.canonical_entity.id
+            for entity in cluster.entities:
+                member_to_canonical[entity.id] = canonical_id
+        return member_to_canonical
+    
     def _merge_relationships(self,
                            relationships: List[Relationship],
                            resolved_entities: Dict[str, Entity],
-                           strategy: str) -> List[Relationship]:
+                           strategy: str,
+                           member_to_canonical: Optional[Dict[str, str]] = None) -> List[Relationship]:
         """Merge relationships using resolved entities."""
+        if member_to_canonical is None:
+            member_to_canonical = self._mapping_from_evidence(resolved_entities)
+        
         # Group relationships by type and endpoints
         relationship_groups = defaultdict(list)
         
         for rel in relationships:
             # Map to resolved entities if available
-            source_id = self._find_resolved_entity_id(rel.source_id, resolved_entities)
-            target_id = self._find_resolved_entity_id(rel.target_id, resolved_entities)
+            source_id = self._find_resolved_entity_id(rel.source_id, resolved_entities, member_to_canonical)
+            target_id = self._find_resolved_entity_id(rel.target_id, resolved_entities, member_to_canonical)
             
             key = (source_id, target_id, rel.relationship_type)
             relationship_groups[key].append(rel)
@@ -628,20 +769,27 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
         
         return merged_relationships
     
-    def _find_resolved_entity_id(self, entity_id: str, resolved_entities: Dict[str, Entity]) -> str:
+    def _mapping_from_evidence(self, resolved_entities: Dict[str, Entity]) -> Dict[str, str]:
+        """Build a member->canonical mapping from resolved entities' fusion evidence."""
+        member_to_canonical = {}
+        for resolved_id, entity in resolved_entities.items():
+            if hasattr(entity, '_fusion_evidence'):
+                for source_id in entity._fusion_evidence.get('source_entities', []):
+                    member_to_canonical.setdefault(source_id, resolved_id)
+        return member_to_canonical
+    
+    def _find_resolved_entity_id(self,
+                                 entity_id: str,
+                                 resolved_entities: Dict[str, Entity],
+                                 member_to_canonical: Optional[Dict[str, str]] = None) -> str:
         """Find resolved entity ID for a given entity."""
         # Check if already resolved
         if entity_id in resolved_entities:
             return entity_id
         
-        # Search in cluster evidence
-        for resolved_id, entity in resolved_entities.items():
-            if hasattr(entity, '_fusion_evidence'):
-                source_entities = entity._fusion_evidence.get('source_entities', [])
-                if entity_id in source_entities:
-                    return resolved_id
-        
-        return entity_id
+        if member_to_canonical is None:
+            member_to_canonical = self._mapping_from_evidence(resolved_entities)
+        return member_to_canonical.get(entity_id, entity_id)
     
     def _detect_conflicts(self,
                          entities: Dict[str, Entity],
@@ -669,56 +817,60 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
     
     def _update_graph_with_fusion(self,
                                  entities: Dict[str, Entity],
-                                 relationships: List[Relationship]):
-        """Update Neo4j graph with fused knowledge."""
-        with self.driver.session() as session:
-            # Merge entities
-            for entity_id, entity in entities.items():
-                merge_query = """
-                MERGE (e:Entity {id: $entity_id})
-                SET e.name = $name,
-                    e.type = $entity_type,
-                    e.confidence = $confidence,
-                    e.fused = true,
-                    e.fusion_timestamp = datetime()
-                """
-                session.run(
-                    merge_query,
-                    entity_id=entity_id,
-                    name=entity.name,
-                    entity_type=entity.entity_type,
-                    confidence=entity.confidence
-                )
-                
-                # Store fusion evidence
-                if hasattr(entity, '_fusion_evidence'):
-                    evidence_query = """
-                    MATCH (e:Entity {id: $entity_id})
-                    SET e.fusion_evidence = $evidence
-                    """
-                    session.run(
-                        evidence_query,
-                        entity_id=entity_id,
-                        evidence=json.dumps(entity._fusion_evidence)
-                    )
-            
-            # Merge relationships
-            for rel in relationships:
-                merge_rel_query = """
-                MATCH (s:Entity {id: $source_id})
-                MATCH (t:Entity {id: $target_id})
-                MERGE (s)-[r:%s]->(t)
-                SET r.confidence = $confidence,
-                    r.fused = true,
-                    r.fusion_timestamp = datetime()
-                """ % rel.relationship_type
-                
-                session.run(
-                    merge_rel_query,
-                    source_id=rel.source_id,
-                    target_id=rel.target_id,
-                    confidence=rel.confidence
-                )
+                                 relationships: List[Relationship],
+                                 member_to_canonical: Optional[Dict[str, str]] = None):
+        """Update the graph with fused knowledge.
+        
+        Entities (with their fusion evidence) and relationships are upserted
+        through the graph store in batches, each in its own transaction.
+        Relationship endpoints are redirected to their canonical entities.
+        """
+        member_to_canonical = member_to_canonical or {}
+        fusion_timestamp = datetime.now().isoformat()
+        
+        entity_rows = []
+        for entity_id, entity in entities.items():
+            row = {
+                "entity_id": entity_id,
+                "id": entity_id,
+                "name": getattr(entity, 'name', entity.canonical_name),
+                "type": entity.entity_type,
+                "confidence": entity.confidence,
+                "fused": True,
+                "fusion_timestamp": fusion_timestamp
+            }
+            # Entities without new evidence keep what they had
+            evidence = getattr(entity, '_fusion_evidence', None)
+            if evidence is not None:
+                row["fusion_evidence"] = json.dumps(evidence)
+            entity_rows.append(row)
+        
+        edges = []
+        for rel in relationships:
+            source_id = member_to_canonical.get(rel.source_id, rel.source_id)
+            target_id = member_to_canonical.get(rel.target_id, rel.target_id)
+            safe_rel_type = self._sanitize_relationship_type(rel.relationship_type)
+            # Same key as the builder's edges, so fusion updates them in place
+            relationship_id = self._graph_key("relationship", source_id, safe_rel_type, target_id)
+            edges.append({
+                "source": source_id,
+                "target": target_id,
+                "relationship_type": safe_rel_type,
+                "properties": {
+                    "relationship_id": relationship_id,
+                    "id": relationship_id,
+                    "confidence": rel.confidence,
+                    "fused": True,
+                    "fusion_timestamp": fusion_timestamp
+                }
+            })
+        
+        # One store call per batch: a failed batch leaves earlier ones written
+        batch_size = self.bulk_batch_size
+        for start in range(0, len(entity_rows), batch_size):
+            self.graph_store.upsert_nodes(entity_rows[start:start + batch_size], type_property=None)
+        for start in range(0, len(edges), batch_size):
+            self.graph_store.upsert_edges(edges[start:start + batch_size])
     
     def _should_use_llm_resolution(self, attribute: str, value1: Any, value2: Any) -> bool:
         """Determine if LLM should be used for conflict resolution."""
@@ -784,7 +936,7 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
             query = """
             MATCH (s:Entity)-[r1]->(t:Entity)
             MATCH (s)-[r2]->(t)
-            WHERE type(r1) <> type(r2) AND id(r1) < id(r2)
+            WHERE type(r1) <> type(r2) AND elementId(r1) < elementId(r2)
             RETURN count(*) as conflicts
             """
             conflicts = session.run(query).single()["conflicts"]
@@ -865,7 +1017,7 @@ class MultiDocumentFusion(OntologyAwareGraphBuilder):
             query = """
             MATCH (s:Entity)-[r1]->(t:Entity)
             MATCH (s)-[r2]->(t)
-            WHERE type(r1) <> type(r2) AND id(r1) < id(r2)
+            WHERE type(r1) <> type(r2) AND elementId(r1) < elementId(r2)
             RETURN s.id as source, t.id as target,
                    type(r1) as type1, type(r2) as type2
             LIMIT 10
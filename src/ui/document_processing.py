@@ -0,0 +1,288 @@
+"""
+Document Processing Tasks - UI pipelines run by the processing queue
+
+The per-phase pipelines behind the UIs' "Process Documents" and "Run Query"
+buttons. They are plain functions in an importable module so that
+ProcessingQueue workers can run them by name ("module:function") in
+separate processes; each worker keeps its own lazily created workflows.
+Tasks that receive an uploaded file delete it when they are done.
+"""
+
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict
+
+# Per-worker workflow instances, created on first use
+_phase1_workflow = None
+_phase2_workflow = None
+_phase3_workflow = None
+_query_workflows: Dict[str, Any] = {}
+
+
+@dataclass
+class DocumentProcessingResult:
+    document_id: str
+    filename: str
+    entities_found: int
+    relationships_found: int
+    graph_data: Dict
+    processing_time: float
+    phase_used: str
+
+
+def _get_phase1_workflow():
+    """Lazy load Phase 1 workflow."""
+    global _phase1_workflow
+    if _phase1_workflow is None:
+        try:
+            from src.tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
+            _phase1_workflow = VerticalSliceWorkflow()
+        except ImportError as e:
+            raise Exception(f"❌ Phase 1 not available: {e}")
+    return _phase1_workflow
+
+def process_with_phase1(file_path: str, filename: str) -> DocumentProcessingResult:
+    """Process document with Phase 1 basic pipeline"""
+    try:
+        workflow = _get_phase1_workflow()
+        
+        # Extract basic query for testing
+        query = "What are the main entities and relationships in this document?"
+        
+        # Run the workflow
+        result = workflow.execute_workflow(file_path, query, f"UI_Test_{filename}")
+        
+        # Extract data from workflow steps, even if final status is "failed"
+        entities = []
+        relationships = []
+        
+        # The workflow steps contain the actual extracted data
+        steps = result.get("steps", {})
+        
+        # Get entity extraction results
+        entity_extraction = steps.get("entity_extraction", {})
+        total_entities = entity_extraction.get("total_entities", 0)
+        
+        # Get relationship extraction results  
+        relationship_extraction = steps.get("relationship_extraction", {})
+        total_relationships = relationship_extraction.get("total_relationships", 0)
+        
+        print(f"DEBUG: Entity extraction step found {total_entities} entities")
+        print(f"DEBUG: Relationship extraction step found {total_relationships} relationships")
+        print(f"DEBUG: Workflow status: {result.get('status', 'unknown')}")
+        if result.get("error"):
+            print(f"DEBUG: Workflow error: {result.get('error')}")
+        
+        # Use the counts from the extraction steps, not final aggregated results
+        entities_found = total_entities
+        relationships_found = total_relationships
+        
+        # If still 0, check if extraction steps actually failed
+        if entities_found == 0 and relationships_found == 0:
+            entity_status = entity_extraction.get("status", "unknown")
+            rel_status = relationship_extraction.get("status", "unknown")
+            if entity_status == "failed" or rel_status == "failed":
+                raise Exception(f"Entity extraction ({entity_status}) or relationship extraction ({rel_status}) failed")
+            else:
+                print("WARNING: Document may be empty or extraction found nothing (not necessarily an error)")
+        
+        # Query Neo4j for the actual extracted entities and relationships
+        # The workflow stores data in Neo4j even if PageRank fails
+        try:
+            from py2neo import Graph
+            graph = Graph(uri="bolt://localhost:7687", auth=None)
+            
+            # Query for entities (limit to recent ones from this document)
+            entity_query = """
+            MATCH (e:Entity) 
+            RETURN e.id as id, e.canonical_name as name, e.entity_type as type
+            ORDER BY e.created_at DESC 
+            LIMIT $limit
+            """
+            entity_results = graph.run(entity_query, limit=entities_found*2).data()
+            entities = entity_results[:entities_found] if entity_results else []
+            
+            # Query for relationships
+            rel_query = """
+            MATCH (a:Entity)-[r:RELATIONSHIP]->(b:Entity)
+            RETURN a.id as source, b.id as target, r.relation_type as type
+            ORDER BY r.created_at DESC
+            LIMIT $limit
+            """
+            rel_results = graph.run(rel_query, limit=relationships_found*2).data()
+            relationships = rel_results[:relationships_found] if rel_results else []
+            
+            print(f"DEBUG: Retrieved {len(entities)} entities and {len(relationships)} relationships from Neo4j")
+            
+        except Exception as e:
+            print(f"DEBUG: Could not query Neo4j for actual data: {e}")
+            # If we can't query Neo4j, we'll show the counts but no visualization
+            entities = []
+            relationships = []
+        
+        # Create enhanced graph data with actual entities and relationships
+        enhanced_graph_data = {
+            "original_result": result,
+            "entities": entities,
+            "relationships": relationships,
+            "extraction_stats": {
+                "entities_found": entities_found,
+                "relationships_found": relationships_found,
+                "workflow_status": result.get("status", "unknown"),
+                "workflow_error": result.get("error", None)
+            }
+        }
+        
+        return DocumentProcessingResult(
+            document_id=str(uuid.uuid4()),
+            filename=filename,
+            entities_found=entities_found,
+            relationships_found=relationships_found,
+            graph_data=enhanced_graph_data,
+            processing_time=0,  # Will be set by caller
+            phase_used="Phase 1"
+        )
+    
+    except Exception as e:
+        raise Exception(f"Phase 1 processing failed: {str(e)}")
+
+def _get_phase2_workflow():
+    """Lazy load Phase 2 workflow."""
+    global _phase2_workflow
+    if _phase2_workflow is None:
+        try:
+            from src.tools.phase2.enhanced_vertical_slice_workflow import EnhancedVerticalSliceWorkflow
+            _phase2_workflow = EnhancedVerticalSliceWorkflow()
+        except ImportError as e:
+            raise Exception(f"❌ Phase 2 not available: {e}")
+    return _phase2_workflow
+
+def process_with_phase2(file_path: str, filename: str) -> DocumentProcessingResult:
+    """Process document with Phase 2 enhanced pipeline"""
+    try:
+        workflow = _get_phase2_workflow()
+        
+        # Use ontology-aware processing
+        query = "What are the main entities and relationships in this document?"
+        
+        result = workflow.execute_enhanced_workflow(file_path, query, f"UI_Enhanced_{filename}")
+        
+        entities_found = len(result.get("entities", []))
+        relationships_found = len(result.get("relationships", []))
+        
+        return DocumentProcessingResult(
+            document_id=str(uuid.uuid4()),
+            filename=filename,
+            entities_found=entities_found,
+            relationships_found=relationships_found,
+            graph_data=result,
+            processing_time=0,
+            phase_used="Phase 2"
+        )
+    
+    except Exception as e:
+        raise Exception(f"Phase 2 processing failed: {str(e)}")
+
+def _get_phase3_adapter():
+    """Lazy load Phase 3 adapter."""
+    global _phase3_workflow  
+    if _phase3_workflow is None:
+        try:
+            from src.core.phase_adapters import Phase3Adapter
+            _phase3_workflow = Phase3Adapter()
+        except ImportError as e:
+            raise Exception(f"❌ Phase 3 not available: {e}")
+    return _phase3_workflow
+
+def process_with_phase3(file_path: str, filename: str) -> DocumentProcessingResult:
+    """Process document with Phase 3 multi-document fusion"""
+    try:
+        # Import Phase 3 interface
+        from src.core.graphrag_phase_interface import ProcessingRequest
+        
+        # Get Phase 3 adapter
+        phase3 = _get_phase3_adapter()
+        
+        # Create processing request for multi-document workflow
+        # Note: Phase 3 is designed for multiple documents, but we'll use single document here
+        request = ProcessingRequest(
+            workflow_id=f"ui_phase3_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            documents=[file_path],
+            queries=["Extract main entities and relationships from this document"],
+            domain_description="General document analysis"
+        )
+        
+        # Execute Phase 3 processing
+        phase_result = phase3.execute(request)
+        
+        # Extract metrics from Phase 3 result
+        if phase_result.status == "success":
+            fusion_summary = phase_result.results.get("processing_summary", {})
+            
+            result = DocumentProcessingResult(
+                document_id=f"phase3_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                filename=filename,
+                entities_found=fusion_summary.get("total_entities_after_fusion", 0),
+                relationships_found=fusion_summary.get("total_relationships", 0),
+                processing_time=phase_result.execution_time,
+                phase_used="Phase 3",
+                graph_data={
+                    "documents_processed": phase_result.results.get("documents_processed", 1),
+                    "fusion_reduction": fusion_summary.get("fusion_reduction", 0),
+                    "entities_before_fusion": fusion_summary.get("total_entities_before_fusion", 0),
+                    "entities_after_fusion": fusion_summary.get("total_entities_after_fusion", 0),
+                    "confidence_score": phase_result.confidence_score,
+                    "raw_result": phase_result.results
+                }
+            )
+        else:
+            # Phase 3 failed - raise exception following the pattern of other phases
+            raise Exception(f"Phase 3 execution failed: {phase_result.error_message}")
+        
+        return result
+    
+    except Exception as e:
+        raise Exception(f"Phase 3 processing failed: {str(e)}")
+
+def process_document(phase: str, file_path: str, filename: str) -> DocumentProcessingResult:
+    """Process an uploaded document with "Phase 1", "Phase 2" or "Phase 3" and delete the file."""
+    try:
+        start_time = datetime.now()
+        
+        if phase == "Phase 2":
+            result = process_with_phase2(file_path, filename)
+        elif phase == "Phase 3":
+            result = process_with_phase3(file_path, filename)
+        else:
+            result = process_with_phase1(file_path, filename)
+        
+        result.processing_time = (datetime.now() - start_time).total_seconds()
+        return result
+    
+    finally:
+        # Clean up the uploaded file
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
+
+def run_vertical_slice_query(file_path: str, query: str, workflow_name: str,
+                             workflow_storage_dir: str = "./data/ui_workflows") -> Dict[str, Any]:
+    """Answer a query about an uploaded PDF with the Phase 1 workflow and delete the file."""
+    try:
+        workflow = _query_workflows.get(workflow_storage_dir)
+        if workflow is None:
+            from src.tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
+            workflow = VerticalSliceWorkflow(workflow_storage_dir=workflow_storage_dir)
+            _query_workflows[workflow_storage_dir] = workflow
+        
+        return workflow.execute_workflow(pdf_path=file_path, query=query, workflow_name=workflow_name)
+    
+    finally:
+        # Clean up the uploaded file
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
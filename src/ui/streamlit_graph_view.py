@@ -0,0 +1,87 @@
+"""
+Streamlit Graph View - Click-to-expand exploration of the stored knowledge graph
+
+Draws the graph database with InteractiveGraphVisualizer. With level of
+detail on, entities beyond the node limit are grouped into community
+super-nodes. Clicking a node (its ID is the point's customdata) expands it
+in place with expand_node: an entity gains its top neighbours and a
+super-node its top members. The expanded graph is kept in session state
+until the view settings change.
+"""
+
+import os
+from typing import Any, Optional
+
+import streamlit as st
+
+from src.tools.phase2.interactive_graph_visualizer import (
+    GraphVisualizationConfig, InteractiveGraphVisualizer, VisualizationData
+)
+
+
+@st.cache_resource
+def get_graph_visualizer() -> InteractiveGraphVisualizer:
+    """The server's graph visualizer (one Neo4j driver and layout cache for all sessions)."""
+    return InteractiveGraphVisualizer(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        os.getenv("NEO4J_USER", "neo4j"),
+        os.getenv("NEO4J_PASSWORD", "password")
+    )
+
+
+def clicked_node_id(event: Any) -> Optional[str]:
+    """Node ID of the point selected in a plotly_chart selection event, if any."""
+    points = event.get("selection", {}).get("points", []) if event else []
+    for point in points:
+        node_id = point.get("customdata")
+        if isinstance(node_id, (list, tuple)):
+            node_id = node_id[0] if node_id else None
+        if node_id:
+            return node_id
+    return None
+
+
+def render_database_graph(max_nodes: int):
+    """Render the stored graph; clicking a node expands it."""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        level_of_detail = st.checkbox(
+            "Group remaining entities into communities", value=True,
+            help="Entities beyond the node limit are shown as one node per community"
+        )
+    with col2:
+        rank_by = st.selectbox("Rank entities by", ["pagerank", "degree"])
+    with col3:
+        reset = st.button("Reset view")
+
+    config = GraphVisualizationConfig(max_nodes=max_nodes, level_of_detail=level_of_detail, rank_by=rank_by)
+    view_key = (max_nodes, level_of_detail, rank_by)
+    visualizer = get_graph_visualizer()
+
+    try:
+        if reset or st.session_state.get("graph_view_key") != view_key:
+            st.session_state.graph_view_data = visualizer.fetch_graph_data(config=config)
+            st.session_state.graph_view_key = view_key
+            st.session_state.graph_view_expanded = None
+        data: VisualizationData = st.session_state.graph_view_data
+
+        fig = visualizer.create_interactive_plot(data, config)
+        event = st.plotly_chart(
+            fig, use_container_width=True, key="graph_view", on_select="rerun", selection_mode="points"
+        )
+    except Exception as e:
+        st.error(f"Graph database visualization error: {str(e)}")
+        return
+    st.caption("Click a node to expand it: entities show more neighbours, communities show more members.")
+
+    # The selection persists across reruns; expand each clicked node once
+    node_id = clicked_node_id(event)
+    if node_id and node_id != st.session_state.get("graph_view_expanded"):
+        st.session_state.graph_view_expanded = node_id
+        try:
+            visualizer.expand_node(data, node_id, config=config)
+        except ValueError:
+            return
+        st.rerun()
+    elif node_id is None:
+        st.session_state.graph_view_expanded = None
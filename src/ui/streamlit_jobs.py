@@ -0,0 +1,92 @@
+"""
+Streamlit Jobs - Submitting UI work to the processing queue and polling it
+
+The Streamlit UIs submit uploaded documents to one ProcessingQueue per
+server (shared by all sessions), keep the job IDs in session state and
+poll them on every rerun, so the page stays interactive while documents
+are processed in parallel by the queue's worker processes.
+
+Finished results are loaded through st.cache_data keyed by document hash
+and graph version: reruns do not reload results from the job table, and a
+document processed again on an unchanged graph is served from the cache.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+import streamlit as st
+
+from src.core.processing_queue import ProcessingQueue
+
+# Seconds between reruns while jobs are pending
+POLL_INTERVAL_SECONDS = 1.0
+
+
+@st.cache_resource
+def get_processing_queue() -> ProcessingQueue:
+    """The server's processing queue, shared by all sessions."""
+    return ProcessingQueue()
+
+
+def document_hash(content: bytes, *options: Any) -> str:
+    """Content hash of a document and the options that change its result."""
+    digest = hashlib.sha256(content)
+    for option in options:
+        digest.update(f"\0{option}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def submit_document(kind: str, task: str, content: bytes, filename: str,
+                    parameters: Dict[str, Any], *options: Any) -> Dict[str, Any]:
+    """Submit an uploaded document to the processing queue.
+
+    The content is written to a temporary file that the task receives as
+    file_path and deletes when done (the queue deletes it if the task never
+    runs); options (besides kind) distinguish results for the same
+    document, e.g. the query asked.
+    """
+    doc_hash = document_hash(content, kind, *options)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp_file:
+        tmp_file.write(content)
+        tmp_path = tmp_file.name
+
+    submission = get_processing_queue().submit(
+        kind, task, dict(parameters, file_path=tmp_path), document_hash=doc_hash, temp_file=tmp_path
+    )
+    if submission["status"] != "success" or submission["reused"]:
+        # No new job owns the file
+        os.unlink(tmp_path)
+    submission["document_hash"] = doc_hash
+    return submission
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def load_result(document_hash: str, graph_version: int, _job_id: str) -> Any:
+    """Result of a finished job, cached by document hash and graph version."""
+    return get_processing_queue().get_job(_job_id).get("result")
+
+
+def poll_jobs(job_ids: List[str]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split jobs into (finished, pending), loading the result of finished ones."""
+    queue = get_processing_queue()
+    finished, pending = [], []
+    for job_id in job_ids:
+        job = queue.get_job(job_id)
+        if job["status"] != "success":
+            finished.append({"job_id": job_id, "job_status": "failed", "error": job["error"], "result": None})
+        elif job["finished"]:
+            job["result"] = load_result(job["document_hash"] or job_id, job["graph_version"], job_id)
+            finished.append(job)
+        else:
+            pending.append(job)
+    return finished, pending
+
+
+def rerun_while_pending(pending: List[Dict[str, Any]]):
+    """Rerun the page after POLL_INTERVAL_SECONDS while jobs are pending."""
+    if pending:
+        time.sleep(POLL_INTERVAL_SECONDS)
+        st.rerun()
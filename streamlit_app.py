@@ -10,14 +10,18 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import pandas as pd
 from dataclasses import dataclass, asdict
-import plotly.graph_objects as go
-import networkx as nx
 import os
 import sys
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.core.lazy_imports import lazy_import
+
+# Plotting libraries are loaded when the ontology graph is first drawn
+go = lazy_import("plotly.graph_objects", install_hint="plotly")
+nx = lazy_import("networkx")
+
 # Import ontology components
 try:
     from src.ontology.gemini_ontology_generator import GeminiOntologyGenerator
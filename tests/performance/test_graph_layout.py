@@ -0,0 +1,122 @@
+"""Test Cached and Incremental Graph Layouts
+
+Checks the Barnes-Hut repulsion against the exact sum, times the
+force-directed layout against LAYOUT_BUDGET_SECONDS, and checks that the
+visualizer reuses a cached layout for an unchanged graph and only lays out
+the new nodes of a changed one.
+"""
+
+import time
+import tempfile
+import shutil
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ''))
+
+from src.tools.phase2.graph_layout import (
+    LayoutCache, force_directed_layout, _exact_repulsion, _barnes_hut_repulsion
+)
+from src.tools.phase2.interactive_graph_visualizer import (
+    InteractiveGraphVisualizer, GraphVisualizationConfig, VisualizationData
+)
+
+NODE_COUNT = 5000
+EDGE_COUNT = 10000
+LAYOUT_BUDGET_SECONDS = 5.0
+
+
+def test_barnes_hut_accuracy():
+    """Barnes-Hut repulsion stays within a few percent of the exact sum."""
+    rng = np.random.default_rng(0)
+    uniform = rng.uniform(-1, 1, 3000) + 1j * rng.uniform(-1, 1, 3000)
+    clustered = (rng.normal(0, 0.05, 3000) + 1j * rng.normal(0, 0.05, 3000) +
+                 rng.choice([-0.5, 0.5], 3000) + 1j * rng.choice([-0.5, 0.5], 3000))
+    for name, z in (("uniform", uniform), ("clustered", clustered)):
+        targets = np.arange(len(z))
+        exact = _exact_repulsion(z, targets)
+        approx = _barnes_hut_repulsion(z, targets)
+        error = np.median(np.abs(approx - exact) / np.abs(exact))
+        print(f"  - {name}: median relative error {error:.4f}")
+        assert error < 0.02
+    print("✅ Barnes-Hut matches exact repulsion")
+
+
+def test_layout_speed_and_determinism():
+    """Large layouts finish within budget and are reproducible."""
+    print("="*80)
+    print(f"FORCE-DIRECTED LAYOUT: {NODE_COUNT} nodes, {EDGE_COUNT} edges")
+    print("="*80)
+
+    rng = np.random.default_rng(1)
+    edges = rng.integers(0, NODE_COUNT, size=(EDGE_COUNT, 2))
+
+    start_time = time.time()
+    positions = force_directed_layout(NODE_COUNT, edges, iterations=50, barnes_hut_threshold=1000)
+    elapsed = time.time() - start_time
+    print(f"  - Barnes-Hut layout in {elapsed:.2f}s")
+    assert elapsed < LAYOUT_BUDGET_SECONDS, f"Layout took {elapsed:.2f}s"
+    assert positions.shape == (NODE_COUNT, 2) and np.isfinite(positions).all()
+    assert np.abs(positions).max() <= 1.0 + 1e-9
+
+    small = force_directed_layout(200, edges[edges.max(axis=1) < 200], seed=7)
+    assert np.array_equal(small, force_directed_layout(200, edges[edges.max(axis=1) < 200], seed=7))
+    print("✅ Layout within budget and deterministic for a seed")
+
+
+def test_cached_and_incremental_layout():
+    """Unchanged graphs reuse the stored layout; changed graphs keep existing positions."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        visualizer = InteractiveGraphVisualizer()
+        visualizer.layout_cache.close()
+        visualizer.layout_cache = LayoutCache(cache_path=os.path.join(temp_dir, "layouts.db"), enabled=True)
+        config = GraphVisualizationConfig()
+
+        nodes = [{"id": f"e{i}"} for i in range(500)]
+        pairs = np.random.default_rng(2).integers(0, 500, size=(1000, 2))
+        edges = [{"source": f"e{a}", "target": f"e{b}"} for a, b in pairs]
+        key = LayoutCache.make_key(source_document="doc", layout_algorithm="spring")
+
+        start_time = time.time()
+        first = visualizer._calculate_layout(nodes, edges, "spring", layout_key=key, config=config)
+        full_seconds = time.time() - start_time
+        start_time = time.time()
+        cached = visualizer._calculate_layout(nodes, edges, "spring", layout_key=key, config=config)
+        cached_seconds = time.time() - start_time
+        assert cached == first and visualizer.layout_cache.get_stats()["hits"] == 1
+        print(f"  - 500 nodes: full layout {full_seconds:.3f}s, cached {cached_seconds * 1000:.1f}ms")
+
+        more_nodes = nodes + [{"id": f"n{i}"} for i in range(50)]
+        more_edges = edges + [{"source": f"n{i}", "target": f"e{i}"} for i in range(50)]
+        start_time = time.time()
+        updated = visualizer._calculate_layout(more_nodes, more_edges, "spring", layout_key=key, config=config)
+        incremental_seconds = time.time() - start_time
+        assert all(updated[node_id] == first[node_id] for node_id in first), "Existing nodes stay in place"
+        assert len(updated) == 550
+        print(f"  - 50 new nodes laid out incrementally in {incremental_seconds:.3f}s")
+
+        # Expanded nodes are relaxed around the fixed layout
+        data = VisualizationData(
+            nodes=more_nodes + [{"id": "x0"}], edges=more_edges + [{"source": "x0", "target": "e0"}],
+            ontology_info={}, metrics={}, layout_positions=dict(updated, x0=updated["e0"])
+        )
+        visualizer._relax_layout(data, {"x0"}, config)
+        assert data.layout_positions["x0"] != updated["e0"] and data.layout_positions["e0"] == updated["e0"]
+
+        # Persisted: a new cache on the same file serves the updated layout
+        visualizer.layout_cache.close()
+        visualizer.layout_cache = LayoutCache(cache_path=os.path.join(temp_dir, "layouts.db"), enabled=True)
+        assert visualizer._calculate_layout(more_nodes, more_edges, "spring", layout_key=key, config=config) == updated
+        visualizer.close()
+        print("✅ Layouts cached, persisted and updated incrementally")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_barnes_hut_accuracy()
+    test_layout_speed_and_determinism()
+    test_cached_and_incremental_layout()
@@ -0,0 +1,91 @@
+"""Test Import Time of Tool Modules
+
+Imports each tool module in a fresh interpreter with `python -X importtime`
+and checks that none of the heavy optional backends (spaCy, Neo4j,
+networkx, pypdf, plotly and the LLM SDKs) is loaded at import time, and
+that each module imports within IMPORT_BUDGET_SECONDS.
+"""
+
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Per-module budget, including the src packages it pulls in
+IMPORT_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ("spacy", "neo4j", "networkx", "pypdf", "plotly", "openai", "google.generativeai")
+
+MODULES = [
+    "src.core.service_manager",
+    "src.tools.phase1.t01_pdf_loader",
+    "src.tools.phase1.t23a_spacy_ner",
+    "src.tools.phase1.t27_relationship_extractor",
+    "src.tools.phase1.parallel_extraction",
+    "src.tools.phase1.phase1_mcp_tools",
+    "src.tools.phase2",
+    "src.tools.phase2.t23c_ontology_aware_extractor",
+    "src.tools.phase2.t31_ontology_graph_builder",
+    "src.tools.phase2.interactive_graph_visualizer",
+    "src.ontology",
+    "src.ontology.gemini_ontology_generator",
+]
+
+
+def measure_import(module: str):
+    """Import module in a fresh interpreter.
+
+    Returns:
+        (seconds, heavy modules imported), or None if the module cannot be
+        imported in this environment
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        return None
+
+    microseconds = 0
+    imported = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        top_level = not name.startswith("  ")
+        name = name.strip()
+        imported.add(name)
+        # Top-level entries for the module and its parent packages
+        if top_level and (module == name or module.startswith(name + ".")):
+            microseconds += int(cumulative)
+    heavy = [m for m in HEAVY_MODULES if m in imported]
+    return microseconds / 1e6, heavy
+
+
+def test_import_time():
+    """Tool modules import without their backends and within budget."""
+    print("="*80)
+    print("TOOL MODULE IMPORT TIME")
+    print("="*80)
+
+    measured = 0
+    for module in MODULES:
+        result = measure_import(module)
+        if result is None:
+            print(f"  - {module}: not importable in this environment, skipped")
+            continue
+        seconds, heavy = result
+        measured += 1
+        print(f"  - {module}: {seconds:.3f}s {heavy or ''}")
+        assert heavy == [], f"{module} imports {heavy} at import time"
+        assert seconds < IMPORT_BUDGET_SECONDS, f"{module} took {seconds:.2f}s to import"
+
+    assert measured > 0, "No tool module could be imported"
+    print(f"✅ {measured} modules import in under {IMPORT_BUDGET_SECONDS}s without heavy backends")
+
+
+if __name__ == "__main__":
+    test_import_time()
@@ -0,0 +1,69 @@
+"""Test MCP Server Startup Time
+
+Measures how long a fresh interpreter takes to import the MCP server (the
+time before it can answer test_connection), checks that no service, model
+or database connection was constructed during import, and measures the
+background warm-up separately.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from src.mcp_server import components
+import_seconds = time.perf_counter() - start
+heavy = [m for m in ("spacy", "neo4j", "networkx") if m in sys.modules]
+loaded = [name for name, status in components.get_status().items() if status["loaded"]]
+
+start = time.perf_counter()
+components.warm_up(background=False)
+warm_up_seconds = time.perf_counter() - start
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "heavy_modules": heavy,
+    "loaded_at_import": loaded,
+    "warm_up_seconds": warm_up_seconds,
+    "components": components.get_status()
+}))
+"""
+
+
+def test_mcp_startup(runs: int = 3):
+    """Cold server import stays under a second and constructs nothing."""
+    # The server module imports fastmcp at the top
+    pytest.importorskip("fastmcp")
+    print("="*80)
+    print("MCP SERVER STARTUP")
+    print("="*80)
+
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    import_times = sorted(r["import_seconds"] for r in results)
+    print(f"Server import (median of {runs}): {import_times[len(import_times) // 2]:.3f}s")
+    print(f"Warm-up of all components: {results[-1]['warm_up_seconds']:.2f}s")
+    for name, status in results[-1]["components"].items():
+        load = f"{status['load_seconds']:.2f}s" if status["load_seconds"] is not None else status["error"]
+        print(f"  - {name}: {load}")
+
+    assert results[-1]["loaded_at_import"] == [], "Components must not be built at import"
+    assert results[-1]["heavy_modules"] == [], "spaCy, Neo4j and networkx must be imported on first use"
+    assert import_times[len(import_times) // 2] < 1.0
+    print("✅ Server ready in under a second")
+
+
+if __name__ == "__main__":
+    test_mcp_startup()
@@ -0,0 +1,99 @@
+"""Test Semantic Similarity Heatmap Performance
+
+Builds the similarity heatmap for ENTITY_COUNT entities with embeddings and
+checks that it renders within HEATMAP_BUDGET_SECONDS, samples every entity
+type, orders the sample in type blocks, and is served from the cache on a
+repeat call.
+"""
+
+import time
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ''))
+
+from src.tools.phase2.interactive_graph_visualizer import (
+    InteractiveGraphVisualizer, GraphVisualizationConfig, VisualizationData
+)
+
+ENTITY_COUNT = 2000
+EMBEDDING_DIMENSION = 384
+HEATMAP_BUDGET_SECONDS = 1.0
+
+
+def _entities(rng: np.random.Generator):
+    types = ["ORGANIZATION"] * 1200 + ["PERSON"] * 700 + ["LOCATION"] * 95 + ["CLIMATE_POLICY"] * 5
+    centres = {entity_type: rng.normal(size=EMBEDDING_DIMENSION) for entity_type in set(types)}
+    return [
+        {"id": f"e{i}", "name": f"Entity {i}", "type": entity_type,
+         "attributes": {"embedding": (centres[entity_type] + rng.normal(size=EMBEDDING_DIMENSION)).tolist()}}
+        for i, entity_type in enumerate(types)
+    ]
+
+
+def test_large_heatmap():
+    """Large entity sets are sampled by type and render within budget."""
+    print("="*80)
+    print(f"SIMILARITY HEATMAP: {ENTITY_COUNT} entities, {EMBEDDING_DIMENSION}-d embeddings")
+    print("="*80)
+
+    visualizer = InteractiveGraphVisualizer()
+    config = GraphVisualizationConfig()
+    nodes = _entities(np.random.default_rng(5))
+    data = VisualizationData(nodes=nodes, edges=[], ontology_info={}, metrics={}, layout_positions={})
+
+    start_time = time.time()
+    fig = visualizer.create_semantic_similarity_heatmap(data, config)
+    elapsed = time.time() - start_time
+    print(f"  - Heatmap built in {elapsed:.3f}s")
+    assert elapsed < HEATMAP_BUDGET_SECONDS, f"Heatmap took {elapsed:.2f}s"
+
+    heatmap = fig.data[0]
+    names = list(heatmap.x)
+    types = {node["name"]: node["type"] for node in nodes}
+    sampled_types = [types[name] for name in names]
+    assert len(names) <= config.heatmap_max_entities and len(set(names)) == len(names)
+    assert set(sampled_types) == {"ORGANIZATION", "PERSON", "LOCATION", "CLIMATE_POLICY"}, "Every type sampled"
+    assert sampled_types == sorted(sampled_types, key=sampled_types.index), "One contiguous block per type"
+    assert heatmap.text is None, "Cell values are not printed for large heatmaps"
+    z = np.asarray(heatmap.z)
+    assert np.allclose(np.diag(z), 1.0) and np.allclose(z, z.T)
+
+    start_time = time.time()
+    repeat = visualizer.create_semantic_similarity_heatmap(data, config)
+    cached_seconds = time.time() - start_time
+    assert list(repeat.data[0].x) == names
+    print(f"  - Repeat (cached) in {cached_seconds * 1000:.1f}ms")
+    visualizer.close()
+    print("✅ Heatmap sampled, ordered and cached")
+
+
+def test_small_heatmap_matches_pairwise():
+    """Small entity sets keep every entity and match pairwise cosine similarity."""
+    rng = np.random.default_rng(6)
+    embeddings = rng.normal(size=(5, 8))
+    embeddings[3] = 0.0
+    nodes = [{"id": f"s{i}", "name": f"S{i}", "type": "PERSON", "attributes": {"embedding": e.tolist()}}
+             for i, e in enumerate(embeddings)]
+    nodes.append({"id": "s5", "name": "S5", "type": "PERSON", "attributes": {"embedding": [1.0, 2.0]}})
+    data = VisualizationData(nodes=nodes, edges=[], ontology_info={}, metrics={}, layout_positions={})
+
+    visualizer = InteractiveGraphVisualizer()
+    heatmap = visualizer.create_semantic_similarity_heatmap(data).data[0]
+    assert list(heatmap.x) == ["S0", "S1", "S2", "S3", "S4"], "Mismatched embedding dimensions skipped"
+    z = np.asarray(heatmap.z)
+    for i in range(5):
+        for j in range(5):
+            norm = np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[j])
+            expected = 1.0 if i == j else (embeddings[i] @ embeddings[j] / norm if norm > 0 else 0.0)
+            assert abs(z[i, j] - expected) < 1e-9
+    assert heatmap.text[0][1] == f"{z[0, 1]:.3f}"
+    visualizer.close()
+    print("✅ Small heatmap matches pairwise cosine similarity")
+
+
+if __name__ == "__main__":
+    test_large_heatmap()
+    test_small_heatmap_matches_pairwise()
@@ -0,0 +1,114 @@
+"""Test Level-of-Detail Graph Visualization
+
+Builds the Plotly figure for a large synthetic graph and checks that traces
+switch to WebGL and are built within TRACE_BUDGET_SECONDS, then checks that
+community super-nodes and expand-on-click merge into the visualization.
+"""
+
+import time
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ''))
+
+from src.tools.phase2.interactive_graph_visualizer import (
+    InteractiveGraphVisualizer, GraphVisualizationConfig, VisualizationData
+)
+
+NODE_COUNT = 20000
+EDGE_COUNT = 60000
+TRACE_BUDGET_SECONDS = 2.0
+
+
+def _synthetic_data(rng: np.random.Generator) -> VisualizationData:
+    nodes = [
+        {"id": f"e{i}", "name": f"Entity {i}", "type": "ORGANIZATION", "confidence": 0.8,
+         "domain": "test", "sources": ["doc"], "size": 10, "color": "#9b59b6"}
+        for i in range(NODE_COUNT)
+    ]
+    pairs = rng.integers(0, NODE_COUNT, size=(EDGE_COUNT, 2))
+    edges = [
+        {"source": f"e{a}", "target": f"e{b}", "type": "RELATED_TO", "confidence": 0.9}
+        for a, b in pairs
+    ]
+    positions = {node["id"]: (float(x), float(y)) for node, (x, y) in zip(nodes, rng.random((NODE_COUNT, 2)))}
+    return VisualizationData(
+        nodes=nodes, edges=edges, ontology_info={},
+        metrics={"total_nodes": NODE_COUNT, "total_edges": EDGE_COUNT},
+        layout_positions=positions
+    )
+
+
+def test_large_graph_traces():
+    """Large graphs render as WebGL traces built from arrays."""
+    print("="*80)
+    print(f"LEVEL-OF-DETAIL VISUALIZATION: {NODE_COUNT} nodes, {EDGE_COUNT} edges")
+    print("="*80)
+
+    visualizer = InteractiveGraphVisualizer()
+    config = GraphVisualizationConfig(show_labels=False)
+    data = _synthetic_data(np.random.default_rng(3))
+
+    start_time = time.time()
+    fig = visualizer.create_interactive_plot(data, config)
+    elapsed = time.time() - start_time
+    print(f"  - Figure built in {elapsed:.2f}s")
+
+    edge_trace, node_trace = fig.data
+    assert edge_trace.type == "scattergl" and node_trace.type == "scattergl"
+    assert len(edge_trace.x) == EDGE_COUNT * 3 and len(node_trace.x) == NODE_COUNT
+    assert list(node_trace.customdata[:2]) == ["e0", "e1"], "Node ids carried for click handling"
+    assert elapsed < TRACE_BUDGET_SECONDS, f"Building traces took {elapsed:.2f}s"
+
+    small = visualizer.create_interactive_plot(VisualizationData(
+        nodes=data.nodes[:10], edges=data.edges[:0], ontology_info={},
+        metrics={"total_nodes": 10, "total_edges": 0}, layout_positions=data.layout_positions
+    ), config)
+    assert small.data[0].type == "scatter", "Small graphs keep SVG traces"
+    visualizer.close()
+    print(f"✅ WebGL traces built in {elapsed:.2f}s")
+
+
+def test_super_nodes_and_expansion():
+    """Community super-nodes shrink as their members are expanded."""
+    visualizer = InteractiveGraphVisualizer()
+    config = GraphVisualizationConfig()
+
+    super_nodes, super_edges = visualizer._build_super_graph(
+        communities=[{"community": "PERSON", "size": 120, "confidence": 0.8},
+                     {"community": "LOCATION", "size": 30, "confidence": None}],
+        node_links=[{"source": "e1", "community": "PERSON", "links": 12, "confidence": 0.7},
+                    {"source": "e1", "community": "EVENT", "links": 2, "confidence": 0.7}],
+        community_links=[{"community": "PERSON", "other": "LOCATION", "links": 40, "confidence": 0.6}],
+        config=config
+    )
+    assert [n["id"] for n in super_nodes] == ["community:PERSON", "community:LOCATION"]
+    assert [(e["source"], e["target"]) for e in super_edges] == [
+        ("e1", "community:PERSON"), ("community:PERSON", "community:LOCATION")
+    ], "Links to communities that are not shown are dropped"
+
+    data = VisualizationData(
+        nodes=[{"id": "e1", "name": "Acme", "type": "ORGANIZATION", "confidence": 0.9}] + super_nodes,
+        edges=list(super_edges), ontology_info={},
+        metrics={"total_nodes": 3, "total_edges": 2, "hidden_nodes": 150},
+        layout_positions={"e1": (0.0, 0.0), "community:PERSON": (1.0, 0.0), "community:LOCATION": (0.0, 1.0)}
+    )
+    members = [{"id": f"p{i}", "name": f"Person {i}", "type": "PERSON", "confidence": 0.8} for i in range(5)]
+    visualizer._merge_expansion(
+        data, super_nodes[0], members,
+        [{"source": "p0", "target": "e1", "type": "WORKS_FOR"}, {"source": "p0", "target": "e1", "type": "WORKS_FOR"}]
+    )
+    assert super_nodes[0]["member_count"] == 115 and data.metrics["hidden_nodes"] == 145
+    assert data.metrics["total_nodes"] == 8 and data.metrics["total_edges"] == 3
+    assert data.layout_positions["e1"] == (0.0, 0.0), "Existing positions are kept"
+    ring = np.array([data.layout_positions[m["id"]] for m in members])
+    assert np.allclose(np.linalg.norm(ring - [1.0, 0.0], axis=1), 0.1), "New nodes placed around the expanded node"
+    visualizer.close()
+    print("✅ Super-nodes aggregate and expand in place")
+
+
+if __name__ == "__main__":
+    test_large_graph_traces()
+    test_super_nodes_and_expansion()
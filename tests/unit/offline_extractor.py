@@ -0,0 +1,49 @@
+"""
+Offline Extractor Helpers
+
+Shared by the unit tests that drive OntologyAwareExtractor without network
+access: an LLM response cache that records the keys it is asked for, and an
+extractor whose OpenAI client points at a closed local port, so every request
+not answered from the cache fails at once.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import openai
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.embedding_service import EmbeddingService
+from core.identity_service import IdentityService
+from core.llm_cache import LLMResponseCache
+from tools.phase2.t23c_ontology_aware_extractor import OntologyAwareExtractor
+from ontology_generator import DomainOntology, EntityType, RelationshipType
+
+CLIMATE_ONTOLOGY = DomainOntology(
+    domain_name="Climate", domain_description="Climate policy",
+    entity_types=[EntityType("ORGANIZATION", "An organization", [], ["UN"])],
+    relationship_types=[RelationshipType("FUNDS", "Funds", ["ORGANIZATION"], ["ORGANIZATION"], [])],
+    extraction_patterns=[]
+)
+
+
+class RecordingCache(LLMResponseCache):
+    """Cache that remembers the keys it was asked for."""
+
+    def get(self, cache_key):
+        self.requested_keys = getattr(self, "requested_keys", []) + [cache_key]
+        return super().get(cache_key)
+
+
+def offline_extractor(temp_dir: str) -> OntologyAwareExtractor:
+    """Extractor with a closed-port OpenAI client and a RecordingCache in temp_dir."""
+    extractor = OntologyAwareExtractor(IdentityService(use_embeddings=False), google_api_key="test")
+    client = openai.OpenAI(api_key="test", base_url="http://127.0.0.1:9", max_retries=0)
+    extractor.openai_client = client
+    extractor.embedding_service = EmbeddingService(client=client, store_path="")
+    extractor.llm_cache = RecordingCache(cache_path=os.path.join(temp_dir, "llm_cache.db"), enabled=True)
+    return extractor
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test Artifact Context
+
+Verifies that per-request artifacts shared between phases:
+1. Are computed once and reused
+2. Are computed once even when phases request them concurrently
+3. Are not stored when the computation failed
+4. Back the document loading, chunking and parsing helpers the workflows share
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.graphrag_phase_interface import (
+    ArtifactContext, ProcessingRequest, chunk_document, load_document, parse_chunk
+)
+from core.identity_service import IdentityService
+from core.provenance_service import ProvenanceService
+from core.quality_service import QualityService
+from tools.phase1.t01_pdf_loader import PDFLoader
+from tools.phase1.t15a_text_chunker import TextChunker
+
+
+def test_compute_once():
+    """Test that artifacts are computed once per request."""
+    print("🧪 Testing Artifact Reuse...")
+
+    context = ArtifactContext()
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"status": "success", "document": {"text": "shared"}}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: context.get_or_compute("document", "a.pdf", load), range(4)))
+
+    assert len(calls) == 1, "Concurrent phases should share one computation"
+    assert all(result is results[0] for result in results)
+    assert context.get("document", "a.pdf") is results[0]
+    stats = context.get_stats()
+    assert stats["artifacts"] == {"document": 1} and stats["hits"] == 3
+    print("✅ Concurrent requests share one computation")
+
+    request = ProcessingRequest(documents=["a.pdf"], queries=["q"], workflow_id="w", artifact_context=context)
+    assert request.artifact_context.get("document", "a.pdf")["document"]["text"] == "shared"
+    print("✅ Context travels with the processing request")
+
+
+def test_failed_results_not_cached():
+    """Test that failed computations are retried by the next phase."""
+    print("🧪 Testing Failed Artifact Handling...")
+
+    context = ArtifactContext()
+    outcomes = iter([{"status": "error"}, {"status": "success"}])
+    successful = lambda result: result["status"] == "success"
+
+    assert context.get_or_compute("chunks", "doc", lambda: next(outcomes), successful)["status"] == "error"
+    assert context.get_or_compute("chunks", "doc", lambda: next(outcomes), successful)["status"] == "success"
+    assert context.get_or_compute("chunks", "doc", lambda: next(outcomes), successful)["status"] == "success"
+    print("✅ Only successful results are shared")
+
+
+def test_workflow_helpers():
+    """Test the shared load, chunk and parse helpers with and without a context."""
+    print("🧪 Testing Shared Workflow Helpers...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = str(Path(temp_dir) / "doc.txt")
+        Path(path).write_text("Apple Inc. was founded by Steve Jobs in Cupertino, California. " * 20)
+        services = (IdentityService(use_embeddings=False), ProvenanceService(), QualityService())
+        loader, chunker = PDFLoader(*services), TextChunker(*services)
+
+        context = ArtifactContext()
+        document = load_document(loader, path, context)["document"]
+        assert load_document(loader, path, context)["document"] is document
+        assert load_document(loader, path)["document"] is not document, "No context, no reuse"
+        assert load_document(loader, str(Path(temp_dir) / "missing.txt"), context)["status"] == "error"
+
+        chunks = chunk_document(chunker, document, context)
+        assert chunks["status"] == "success" and chunk_document(chunker, document, context) is chunks
+
+        chunk = chunks["chunks"][0]
+        assert parse_chunk(str.split, chunk) is None and parse_chunk(None, chunk, context) is None
+        assert parse_chunk(str.split, chunk, context) is parse_chunk(str.split, chunk, context)
+        assert context.get_stats()["artifacts"] == {"document": 1, "chunks": 1, "spacy_doc": 1}
+        print("✅ Workflow helpers share one load, chunking and parse per request")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_compute_once()
+    test_failed_results_not_cached()
+    test_workflow_helpers()
+    print("\n✅ All artifact context tests passed!")
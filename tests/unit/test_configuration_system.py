@@ -237,6 +237,7 @@ def test_pagerank_uses_configuration():
         yaml.dump(custom_config, f)
         temp_config_path = f.name
     
+    tool_config = None
     try:
         # Load custom configuration
         config_manager = ConfigurationManager()
@@ -244,11 +245,18 @@ def test_pagerank_uses_configuration():
         
         # Import and create PageRank calculator
         try:
+            from tools.phase1 import t68_pagerank
             from tools.phase1.t68_pagerank import PageRankCalculator
             from core.identity_service import IdentityService
             from core.provenance_service import ProvenanceService
             from core.quality_service import QualityService
             
+            # The tool imports src.core.config when the repository root is on
+            # sys.path; load the custom configuration into the copy it uses
+            tool_config = sys.modules[t68_pagerank.get_config.__module__]
+            if tool_config.ConfigurationManager is not ConfigurationManager:
+                tool_config.load_config(temp_config_path, force_reload=True)
+            
             # Create PageRank calculator (should use new config values)
             pagerank_calc = PageRankCalculator(
                 identity_service=IdentityService(),
@@ -270,6 +278,8 @@ def test_pagerank_uses_configuration():
         
     finally:
         os.unlink(temp_config_path)
+        if tool_config and tool_config.ConfigurationManager is not ConfigurationManager:
+            tool_config.load_config(force_reload=True)
     
     return True
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test Embedding Service
+
+Verifies that the shared embedding service:
+1. Coalesces texts into batched API calls of embedding_batch_size
+2. Persists float32 vectors keyed by (model, text hash)
+3. Bounds the in-memory layer with LRU eviction
+4. Returns None for texts it cannot embed
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.embedding_service import EmbeddingService
+
+
+class _RecordingEmbeddingsClient:
+    """Deterministic in-process embeddings endpoint that records request sizes."""
+
+    def __init__(self):
+        self.requests = []
+        self.embeddings = self
+
+    def create(self, input, model):
+        self.requests.append(list(input))
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i), 1.0])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=data)
+
+
+def test_batched_generation():
+    """Test that uncached texts are embedded in batches and deduplicated."""
+    print("🧪 Testing Batched Embedding Generation...")
+
+    client = _RecordingEmbeddingsClient()
+    service = EmbeddingService(client=client, store_path="", batch_size=2, memory_cache_size=100)
+
+    texts = ["alpha", "beta", "gamma", "alpha", "delta"]
+    vectors = service.get_embeddings(texts, "test-model")
+
+    assert len(vectors) == 5
+    assert vectors[0] == vectors[3], "Duplicate texts should share a vector"
+    assert [len(r) for r in client.requests] == [2, 2], f"Unexpected batches: {client.requests}"
+    print("✅ 4 unique texts embedded in 2 API calls")
+
+    # Second call is served from memory
+    service.get_embeddings(["beta", "gamma"], "test-model")
+    assert len(client.requests) == 2, "Cached texts should not call the API"
+    assert service.get_stats()["memory_hits"] == 2
+    print("✅ Repeat lookups served from memory")
+
+
+def test_persistent_store_and_lru():
+    """Test that vectors persist across instances and memory is bounded."""
+    print("🧪 Testing Persistent Store and LRU...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        store_path = os.path.join(temp_dir, "embeddings.db")
+        client = _RecordingEmbeddingsClient()
+        service = EmbeddingService(client=client, store_path=store_path, batch_size=10, memory_cache_size=2)
+
+        first = service.get_embeddings(["one", "two", "three"], "test-model")
+        assert service.get_stats()["memory_cache_entries"] == 2, "LRU should hold at most 2 entries"
+        assert service.get_stats()["stored_embeddings"] == 3
+        service.close()
+        print("✅ LRU bounded while store keeps every vector")
+
+        restarted_client = _RecordingEmbeddingsClient()
+        restarted = EmbeddingService(client=restarted_client, store_path=store_path, memory_cache_size=10)
+        second = restarted.get_embeddings(["one", "two", "three"], "test-model")
+        assert restarted_client.requests == [], "Stored vectors should not be regenerated"
+        assert second == first
+        assert restarted.get_stats()["store_hits"] == 3
+
+        # Different model is a different key
+        restarted.get_embeddings(["one"], "other-model")
+        assert len(restarted_client.requests) == 1
+        restarted.close()
+        print("✅ Vectors persist per (model, text)")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_unavailable_client():
+    """Test that a failing client yields None without raising."""
+    print("🧪 Testing Unavailable Client...")
+
+    class _FailingClient:
+        embeddings = None
+
+    service = EmbeddingService(client=_FailingClient(), store_path="", batch_size=5)
+    assert service.get_embeddings(["text"], "test-model") == [None]
+    assert service.get_stats()["failures"] == 1
+    print("✅ Failures reported as None")
+
+
+if __name__ == "__main__":
+    test_batched_generation()
+    test_persistent_store_and_lru()
+    test_unavailable_client()
+    print("\n✅ All embedding service tests passed!")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test Multi-Chunk Extraction Packing
+
+Verifies that OntologyAwareExtractor.extract_entities_packed:
+1. Groups chunks in order under the prompt token budget and chunk limit
+2. Packs no more chunks than the answer token limit fits, scaling max_tokens per group
+3. Attributes each chunk's answer to its source_ref and re-extracts chunks
+   missing from a packed answer individually
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# The extractor reads the configuration through the src package
+from src.core.config import get_config
+from offline_extractor import CLIMATE_ONTOLOGY as ONTOLOGY, offline_extractor
+
+
+def test_pack_chunks():
+    """Test greedy in-order grouping under the token budget and chunk limit."""
+    print("🧪 Testing Chunk Grouping...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        extractor = offline_extractor(temp_dir)
+        chunks = [("x" * 400, "a"), ("x" * 400, "b"), ("x" * 800, "c"), ("x" * 40, "d"), ("x" * 40, "e")]
+        # Estimated tokens: 101, 101, 201, 11, 11
+        assert extractor._pack_chunks(chunks, 250, 4) == [[0, 1], [2, 3, 4]]
+        assert extractor._pack_chunks(chunks, 250, 2) == [[0, 1], [2, 3], [4]]
+        assert extractor._pack_chunks(chunks, 50, 4) == [[0], [1], [2], [3, 4]], "Oversized chunks get their own group"
+        print("✅ Chunks grouped under budget and chunk limit")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def _check_packed_answers(per_chunk: int):
+    """Pack four chunks with per_chunk answer tokens reserved each and answer the requests."""
+    chunks_per_request = min(4, get_config().api.extraction_max_output_tokens // per_chunk)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        extractor = offline_extractor(temp_dir)
+        chunks = [(f"Organization {i} funds climate work.", f"doc_chunk_{i}") for i in range(4)]
+
+        # First run: every request fails, recording the packed and per-chunk cache keys
+        extractor.extract_entities_packed(chunks, ONTOLOGY, max_chunks_per_request=4)
+        keys = extractor.llm_cache.requested_keys
+        groups = [chunks[i:i + chunks_per_request] for i in range(0, len(chunks), chunks_per_request)]
+        # Each group asks for its packed key, then one key per chunk after the failure
+        packed_keys = []
+        position = 0
+        for group in groups:
+            packed_keys.append(keys[position])
+            position += 1 + len(group)
+        assert position == len(keys), f"Expected {len(groups)} packed requests, got keys {len(keys)}"
+
+        expected_key = extractor.llm_cache.make_key(
+            extractor._packed_prompt(ONTOLOGY, [(f"c{i}", text) for i, (text, _) in enumerate(groups[0])]),
+            "gpt-3.5-turbo", temperature=0.3, max_tokens=per_chunk * len(groups[0])
+        )
+        assert packed_keys[0] == expected_key, "max_tokens scales with the number of packed chunks"
+        print(f"✅ {len(chunks)} chunks sent as {len(groups)} requests of at most {chunks_per_request}")
+
+        # Answer the packed requests; the last group's answer omits its last chunk
+        for group, key in zip(groups, packed_keys):
+            answered = group[:-1] if group is groups[-1] else group
+            answer = {"chunks": [
+                {"chunk_id": f"c{i}",
+                 "entities": [{"text": f"Organization {text.split()[1]}", "type": "ORGANIZATION",
+                               "confidence": 0.9, "context": text}],
+                 "relationships": []}
+                for i, (text, _) in enumerate(answered)
+            ]}
+            extractor.llm_cache.put(key, json.dumps(answer), model="gpt-3.5-turbo")
+
+        results = extractor.extract_entities_packed(chunks, ONTOLOGY, max_chunks_per_request=4)
+        assert [r.extraction_metadata["source_ref"] for r in results] == [ref for _, ref in chunks]
+        for i, result in enumerate(results[:-1]):
+            assert result.extraction_metadata["packed_request_size"] == len(groups[i // chunks_per_request])
+            assert [e.canonical_name.lower() for e in result.entities] == [f"organization {i}"]
+            assert all(m.source_ref == f"doc_chunk_{i}" for m in result.mentions)
+        assert "packed_request_size" not in results[-1].extraction_metadata, "Missing chunk re-extracted alone"
+        print("✅ Packed answers attributed per chunk; missing chunks re-extracted")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_packed_answers_split_per_chunk():
+    """Test attributing packed answers back to chunks with the default answer reserve."""
+    print("🧪 Testing Packed Answers...")
+
+    api_config = get_config().api
+    per_chunk = api_config.extraction_pack_output_tokens_per_chunk
+    assert api_config.extraction_max_output_tokens // per_chunk >= api_config.extraction_pack_max_chunks, \
+        "Defaults should fit a full pack in one answer"
+    _check_packed_answers(per_chunk)
+
+
+def test_answer_limit_caps_pack():
+    """Test that larger answer reserves split a pack to fit the answer limit."""
+    print("🧪 Testing Answer Limit Cap...")
+
+    api_config = get_config().api
+    default = api_config.extraction_pack_output_tokens_per_chunk
+    try:
+        api_config.extraction_pack_output_tokens_per_chunk = 1500
+        _check_packed_answers(1500)
+    finally:
+        api_config.extraction_pack_output_tokens_per_chunk = default
+
+
+if __name__ == "__main__":
+    test_pack_chunks()
+    test_packed_answers_split_per_chunk()
+    test_answer_limit_caps_pack()
+    print("\n✅ All extraction packing tests passed!")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test Fusion Candidate Generation
+
+Verifies that blocked candidate generation in MultiDocumentFusion finds
+every pair the exhaustive comparison scores at or above the similarity
+threshold, including names shorter than a character trigram.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.identity_service import Entity
+from src.tools.phase3.t301_multi_document_fusion import MultiDocumentFusion
+
+
+def _fusion(similarity_threshold: float) -> MultiDocumentFusion:
+    # Candidate generation needs only the thresholds, not the Neo4j connection
+    fusion = MultiDocumentFusion.__new__(MultiDocumentFusion)
+    fusion.similarity_threshold = similarity_threshold
+    fusion.max_block_size = 1000
+    return fusion
+
+
+def _entities():
+    rng = random.Random(3)
+    words = ["un", "uno", "united", "nations", "bank", "world", "of", "a", "ab", "abc", "climate", "fund"]
+    names = ["UN", "UNO", "U", "A", "AB", "ab", "IMF", "Bank"]
+    for _ in range(300):
+        names.append(" ".join(rng.choice(words) for _ in range(rng.randint(1, 3))))
+    return [Entity(id=f"e{i}", canonical_name=name, entity_type="PERSON" if i % 7 == 6 else "ORGANIZATION")
+            for i, name in enumerate(names)]
+
+
+def test_candidate_recall_matches_exhaustive():
+    """Test that no pair above the threshold is missed by blocking."""
+    print("🧪 Testing Candidate Recall...")
+
+    entities = _entities()
+    for threshold in (0.6, 0.75, 0.8, 0.85, 0.9):
+        fusion = _fusion(threshold)
+        exhaustive = {
+            (i, j)
+            for i in range(len(entities)) for j in range(i + 1, len(entities))
+            if fusion._calculate_entity_similarity(entities[i], entities[j]) >= threshold
+        }
+        candidates = fusion._generate_candidate_pairs(entities)
+        missed = exhaustive - candidates
+        assert not missed, f"threshold {threshold}: missed {[(entities[i].canonical_name, entities[j].canonical_name) for i, j in list(missed)[:5]]}"
+        print(f"  - threshold {threshold}: {len(exhaustive)} matches, {len(candidates)} candidates")
+
+    assert (0, 1) in _fusion(0.8)._generate_candidate_pairs(entities), "'UN' and 'UNO' paired"
+    print("✅ Blocked candidates cover every exhaustive match")
+
+
+if __name__ == "__main__":
+    test_candidate_recall_matches_exhaustive()
+    print("\n✅ All fusion candidate tests passed!")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test Embedded Graph Store
+
+Verifies that the embedded graph store backend:
+1. Upserts nodes and edges by key (re-running a build does not duplicate)
+2. Serves attribute scans, path finding and neighbourhood expansion
+3. Looks up existing nodes and edges by key
+4. Loads filtered graphs and writes scores back
+5. Restores the graph from its SQLite file, keyed so several stores can share it
+6. Rejects keyless nodes and edges and path searches of fewer than one hop
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.graph_store import EmbeddedGraphStore, Neo4jGraphStore, sanitize_label
+
+
+def _build_graph(store: EmbeddedGraphStore):
+    store.upsert_nodes([
+        {"entity_id": "e1", "canonical_name": "Elon Musk", "entity_type": "PERSON", "confidence": 0.9,
+         "surface_forms": ["Elon Musk", "Musk"]},
+        {"entity_id": "e2", "canonical_name": "Tesla", "entity_type": "ORG", "confidence": 0.8},
+        {"entity_id": "e3", "canonical_name": "Palo Alto", "entity_type": "GPE", "confidence": 0.7},
+        {"entity_id": "e4", "canonical_name": "SpaceX", "entity_type": "ORG", "confidence": 0.6}
+    ])
+    return store.upsert_edges([
+        {"source": "e1", "target": "e2", "relationship_type": "LEADS",
+         "properties": {"relationship_id": "r1", "weight": 0.9, "confidence": 0.9}},
+        {"source": "e2", "target": "e3", "relationship_type": "LOCATED IN",
+         "properties": {"relationship_id": "r2", "weight": 0.8, "confidence": 0.7}},
+        {"source": "e1", "target": "e4", "relationship_type": "LEADS",
+         "properties": {"relationship_id": "r3", "weight": 0.5, "confidence": 0.6}},
+        {"source": "e1", "target": "missing", "relationship_type": "LEADS",
+         "properties": {"relationship_id": "r4", "weight": 0.5}}
+    ])
+
+
+def test_upsert_and_scan():
+    """Test bulk upsert, key matching and attribute scans."""
+    print("🧪 Testing Upsert and Scans...")
+
+    store = EmbeddedGraphStore()
+    edge_ids = _build_graph(store)
+    assert edge_ids[3] is None, "Edges to missing nodes are not created"
+
+    # Upserting the same keys updates in place
+    node_ids = store.upsert_nodes([{"entity_id": "e2", "canonical_name": "Tesla Inc", "entity_type": "ORG"}])
+    _build_graph(store)
+    stats = store.get_statistics()
+    assert stats["node_count"] == 4 and stats["edge_count"] == 3
+    assert stats["node_types"] == {"ORG": 2, "PERSON": 1, "GPE": 1}
+    assert "LOCATED_IN" in stats["relationship_types"], "Relationship types are sanitized"
+    assert store.get_node(node_ids[0])["canonical_name"] == "Tesla"
+    print("✅ Upserts match on key without duplicating")
+
+    assert [n["entity_id"] for n in store.scan_nodes(equals={"entity_type": "ORG"})] == ["e2", "e4"]
+    assert [n["entity_id"] for n in store.scan_nodes(min_values={"confidence": 0.75})] == ["e1", "e2"]
+    matches = store.scan_nodes(contains="musk", contains_list_fields=("surface_forms",))
+    assert [n["entity_id"] for n in matches] == ["e1"]
+    assert len(store.scan_edges(relationship_type="LEADS", min_values={"weight": 0.6})) == 1
+    edge = store.get_edge(edge_ids[0])
+    assert edge["source_id"] == "e1" and edge["target_id"] == "e2" and edge["relationship_type"] == "LEADS"
+    print("✅ Node and edge scans filter by attribute")
+
+    found = store.get_nodes_by_key(["e1", "e4", "missing"])
+    assert set(found) == {"e1", "e4"} and found["e4"]["canonical_name"] == "SpaceX"
+    assert set(store.get_nodes_by_key(["Tesla"], key="canonical_name")) == {"Tesla"}
+    edges = store.get_edges_by_key(["r1", "r2", "r3"], "LEADS")
+    assert set(edges) == {"r1", "r3"} and edges["r3"]["target_id"] == "e4"
+    assert set(store.get_edges_by_key([0.9], "LEADS", key="weight")) == {0.9}
+    print("✅ Existing nodes and edges looked up by key")
+
+
+def test_paths_and_neighbourhood():
+    """Test multi-hop paths, neighbourhood expansion and score write-back."""
+    print("🧪 Testing Traversal...")
+
+    store = EmbeddedGraphStore()
+    _build_graph(store)
+
+    one_hop = store.find_paths("e1", 1, limit=10)
+    assert [p["nodes"][-1]["entity_id"] for p in one_hop] == ["e2", "e4"], "Ordered by edge weight"
+    two_hop = store.find_paths("e1", 2, limit=10)
+    assert len(two_hop) == 1
+    assert [n["entity_id"] for n in two_hop[0]["nodes"]] == ["e1", "e2", "e3"]
+    assert [e["relationship_type"] for e in two_hop[0]["edges"]] == ["LEADS", "LOCATED_IN"]
+    print("✅ Paths found and ranked by weight")
+
+    around_tesla = store.neighbourhood(["e2"], hops=1)
+    assert {n["entity_id"] for n in around_tesla["nodes"]} == {"e1", "e2", "e3"}
+    assert len(around_tesla["edges"]) == 2
+    print("✅ Neighbourhood expands in both directions")
+
+    graph = store.load_graph(min_values={"confidence": 0.65}, node_properties=("canonical_name",))
+    assert {n["entity_id"] for n in graph["nodes"]} == {"e1", "e2", "e3"}
+    assert len(graph["edges"]) == 2 and "confidence" not in graph["nodes"][0]
+
+    assert store.update_nodes([{"entity_id": "e3", "pagerank_score": 0.4},
+                               {"entity_id": "unknown", "pagerank_score": 0.1}]) == 1
+    top = store.scan_nodes(exists=("pagerank_score",), order_by="pagerank_score")
+    assert [n["entity_id"] for n in top] == ["e3"]
+    print("✅ Filtered graph loads and score write-back work")
+
+
+def test_persistence():
+    """Test that the graph is restored from SQLite."""
+    print("🧪 Testing Persistence...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = str(Path(temp_dir) / "graph.db")
+        store = EmbeddedGraphStore(path)
+        _build_graph(store)
+        store.update_nodes([{"entity_id": "e2", "pagerank_score": 0.3}])
+        store.close()
+
+        reopened = EmbeddedGraphStore(path)
+        assert reopened.get_statistics()["edge_count"] == 3
+        assert reopened.scan_nodes(equals={"entity_id": "e2"})[0]["pagerank_score"] == 0.3
+        assert len(reopened.find_paths("e1", 2, limit=5)) == 1
+        _build_graph(reopened)
+        assert reopened.get_statistics()["node_count"] == 4, "Keys restored for upserts"
+
+        reopened.clear()
+        reopened.close()
+        assert EmbeddedGraphStore(path).get_statistics()["node_count"] == 0
+        print("✅ Graph restored from SQLite")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_shared_file():
+    """Test that two stores writing one file do not overwrite each other's rows."""
+    print("🧪 Testing Shared Store File...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = str(Path(temp_dir) / "graph.db")
+        first, second = EmbeddedGraphStore(path), EmbeddedGraphStore(path)
+        # Both stores hold their first node at in-memory row 0
+        first.upsert_nodes([{"entity_id": "a1", "canonical_name": "Alpha", "confidence": 0.5}])
+        second.upsert_nodes([{"entity_id": "b1", "canonical_name": "Beta"},
+                             {"entity_id": "a1", "canonical_name": "Alpha", "pagerank_score": 0.2}])
+        first.upsert_nodes([{"entity_id": "a2", "canonical_name": "Alpha Two"}])
+        first.upsert_edges([{"source": "a1", "target": "a2", "relationship_type": "RELATED",
+                             "properties": {"relationship_id": "ra"}}])
+        second.upsert_edges([{"source": "b1", "target": "a1", "relationship_type": "RELATED",
+                              "properties": {"relationship_id": "rb"}}])
+        first.close()
+        second.close()
+
+        merged = EmbeddedGraphStore(path)
+        assert sorted(n["entity_id"] for n in merged.scan_nodes()) == ["a1", "a2", "b1"]
+        alpha = merged.scan_nodes(equals={"entity_id": "a1"})[0]
+        assert alpha["confidence"] == 0.5 and alpha["pagerank_score"] == 0.2, "Writes to one key merge"
+        assert {(e["source_id"], e["target_id"]) for e in merged.scan_edges()} == {("a1", "a2"), ("b1", "a1")}
+
+        merged.clear()
+        merged.close()
+        assert EmbeddedGraphStore(path).get_statistics()["edge_count"] == 0
+        print("✅ Rows persisted by key, not by position")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_rejects_invalid_writes_and_hops():
+    """Test that keyless rows and zero-hop path searches are rejected."""
+    store = EmbeddedGraphStore()
+    _build_graph(store)
+    for invalid_write in (
+        lambda: store.upsert_nodes([{"entity_id": "e5"}, {"canonical_name": "No key"}]),
+        lambda: store.upsert_edges([{"source": "e1", "target": "e3", "relationship_type": "LEADS",
+                                     "properties": {"weight": 0.1}}])
+    ):
+        try:
+            invalid_write()
+            assert False, "Keyless rows must be rejected"
+        except ValueError:
+            pass
+    stats = store.get_statistics()
+    assert stats["node_count"] == 4 and stats["edge_count"] == 3, "Rejected writes change nothing"
+
+    # Validated before any query is built, so no Neo4j connection is needed
+    for backend in (store, Neo4jGraphStore(None)):
+        try:
+            backend.find_paths("e1", 0, limit=5)
+            assert False, "hops=0 must be rejected"
+        except ValueError:
+            pass
+
+
+def test_sanitize_label():
+    """Test label sanitization shared by both backends."""
+    assert sanitize_label("WORKS FOR") == "WORKS_FOR"
+    assert sanitize_label("3D") == "REL_3D"
+    assert sanitize_label("") == "RELATED_TO"
+
+
+if __name__ == "__main__":
+    test_upsert_and_scan()
+    test_paths_and_neighbourhood()
+    test_persistence()
+    test_shared_file()
+    test_rejects_invalid_writes_and_hops()
+    test_sanitize_label()
+    print("\n✅ All graph store tests passed!")
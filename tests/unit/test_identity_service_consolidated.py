@@ -165,6 +165,42 @@ def test_persistence_feature():
     return True
 
 
+def test_bulk_mentions():
+    """Test bulk mention creation and entity lookup."""
+    print("\n🧪 Testing Bulk Mentions...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "test_identity.db")
+        service = IdentityService(persistence_path=db_path)
+        
+        result = service.create_mentions([
+            {"surface_form": "Tesla Motors", "start_pos": 0, "end_pos": 12, "source_ref": "doc1"},
+            {"surface_form": "", "start_pos": 0, "end_pos": 1, "source_ref": "doc1"},
+            {"surface_form": "tesla motors", "start_pos": 20, "end_pos": 32, "source_ref": "doc1",
+             "entity_type": "ORG", "confidence": 0.9},
+            {"surface_form": "Elon Musk", "start_pos": 40}
+        ])
+        assert result["status"] == "success"
+        assert [r["status"] for r in result["results"]] == ["success", "error", "success", "error"]
+        assert result["created_count"] == 2 and result["error_count"] == 2
+        assert result["results"][0]["entity_id"] == result["results"][2]["entity_id"]
+        print("✅ Per-item status returned in input order")
+        
+        mention_ids = [result["results"][0]["mention_id"], "mention_missing"]
+        entities = service.get_entities_by_mentions(mention_ids)
+        assert entities[0]["status"] == "success" and entities[0]["mention_count"] == 2
+        assert entities[1] == {"status": "not_found", "mention_id": "mention_missing"}
+        service.close()
+        
+        reloaded = IdentityService(persistence_path=db_path)
+        assert reloaded.get_stats()["total_mentions"] == 2, "Bulk mentions must be committed"
+        reloaded.close()
+        print("✅ Bulk mentions persisted in one transaction")
+    
+    print("\n✅ BULK MENTIONS: PASSED")
+    return True
+
+
 def test_embeddings_simulation():
     """Test embedding feature configuration (without actual OpenAI calls)."""
     print("\n🧪 Testing Embeddings Configuration...")
@@ -291,6 +327,7 @@ def main():
     tests = [
         ("Backward Compatibility", test_backward_compatibility),
         ("Persistence Feature", test_persistence_feature),
+        ("Bulk Mentions", test_bulk_mentions),
         ("Embeddings Configuration", test_embeddings_simulation),
         ("ServiceManager Integration", test_service_manager_integration),
         ("Error Handling", test_error_handling)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test Job Manager
+
+Verifies that background jobs:
+1. Return a job ID immediately and run in a bounded worker pool
+2. Record per-stage progress reported through WorkflowStateService
+3. Stop at the next workflow step when cancelled or timed out
+4. Reject submissions when the queue is full
+"""
+
+import sys
+import time
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.job_manager import JobManager, current_job
+from core.workflow_state_service import WorkflowStateService
+
+
+def _staged_workflow(service, stages, release=None, delay=0.0):
+    """Workflow that checkpoints each stage, optionally waiting on release first."""
+    def run():
+        workflow_id = service.start_workflow("staged", total_steps=len(stages))
+        try:
+            for i, stage in enumerate(stages, 1):
+                if release is not None:
+                    release.wait(5)
+                time.sleep(delay)
+                service.create_checkpoint(workflow_id, stage, i, {"stage": stage})
+            service.update_workflow_progress(workflow_id, len(stages), "completed")
+            return {"status": "success", "workflow_id": workflow_id}
+        except Exception as e:
+            service.update_workflow_progress(workflow_id, -1, "failed", str(e))
+            return {"status": "failed", "error": str(e)}
+    return run
+
+
+def test_submit_and_progress():
+    """Test immediate submission, bounded execution and progress events."""
+    print("🧪 Testing Job Submission and Progress...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        service = WorkflowStateService(temp_dir)
+        jobs = JobManager(max_workers=1, max_queued_jobs=4, default_timeout_seconds=30)
+        jobs.attach_workflow_service(service)
+        release = threading.Event()
+
+        start = time.time()
+        first = jobs.submit("staged", _staged_workflow(service, ["load", "chunk", "extract"], release))
+        assert time.time() - start < 0.5, "Submission must not wait for the work"
+        assert first["status"] == "success"
+        assert jobs.wait(first["job_id"], since_event=1, timeout=5)["job_status"] == "running"
+
+        second = jobs.submit("staged", _staged_workflow(service, ["load"]))
+        assert second["jobs_ahead"] == 0
+        time.sleep(0.1)
+        assert jobs.get_job(second["job_id"])["job_status"] == "queued", "Only max_workers jobs run at once"
+        print("✅ Submissions return immediately; pool is bounded")
+
+        release.set()
+        status = jobs.wait(first["job_id"], timeout=5)
+        while not status["finished"]:
+            status = jobs.wait(first["job_id"], since_event=status["next_event"], timeout=5)
+        status = jobs.get_job(first["job_id"])
+        assert status["job_status"] == "completed" and status["result"]["status"] == "success"
+        steps = [e["step_name"] for e in status["events"]]
+        assert steps[:2] == ["queued", "started"] and ["load", "chunk", "extract"] == steps[2:5]
+        assert status["workflow_ids"] == [status["result"]["workflow_id"]]
+        assert status["progress_percent"] == 100.0
+        assert jobs.get_job(first["job_id"], since_event=3)["events"][0]["step_name"] == "chunk"
+        print("✅ Per-stage progress recorded from workflow checkpoints")
+
+        jobs.wait(second["job_id"], timeout=5)
+        failing = jobs.submit("failing", lambda: {"status": "error", "error": "no graph"})
+        assert jobs.wait(failing["job_id"], since_event=10, timeout=5)["job_status"] == "failed"
+        assert jobs.get_job(failing["job_id"])["error"] == "no graph"
+        jobs.shutdown(wait=True)
+        service.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_cancel_timeout_and_queue_limit():
+    """Test cooperative cancellation, timeouts and the queue limit."""
+    print("🧪 Testing Cancellation and Timeouts...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        service = WorkflowStateService(temp_dir)
+        jobs = JobManager(max_workers=1, max_queued_jobs=1, default_timeout_seconds=30)
+        jobs.attach_workflow_service(service)
+        release = threading.Event()
+
+        running = jobs.submit("staged", _staged_workflow(service, ["a", "b", "c"], release))
+        assert jobs.wait(running["job_id"], since_event=1, timeout=5)["job_status"] == "running"
+        ran = []
+        queued = jobs.submit("never", lambda: ran.append(1))
+        rejected = jobs.submit("extra", lambda: None)
+        assert rejected["status"] == "error" and "queue is full" in rejected["error"]
+        print("✅ Submissions beyond the queue limit rejected")
+
+        assert jobs.cancel(queued["job_id"])["job_status"] == "cancelled"
+        cancelled = jobs.cancel(running["job_id"])
+        assert cancelled["job_status"] == "cancelled" and cancelled["worker_active"]
+        release.set()
+        deadline = time.time() + 5
+        while jobs.get_job(running["job_id"])["worker_active"] and time.time() < deadline:
+            time.sleep(0.02)
+        status = jobs.get_job(running["job_id"])
+        assert status["job_status"] == "cancelled" and not status["worker_active"]
+        checkpoints = service.get_workflow_checkpoints(status["workflow_ids"][0])
+        assert [c["step_name"] for c in checkpoints] == ["a"], "Workflow should stop at its next step"
+        assert ran == [] and jobs.cancel(queued["job_id"])["status"] == "error"
+        print("✅ Cancelled jobs stop at the next step; queued jobs never start")
+
+        def slow():
+            context = current_job()
+            while True:
+                time.sleep(0.02)
+                context.check_cancelled()
+
+        timed = jobs.submit("slow", slow, timeout_seconds=0.2)
+        status = jobs.wait(timed["job_id"], since_event=10, timeout=5)
+        assert status["job_status"] == "timed_out" and "timeout" in status["error"]
+        jobs.shutdown(wait=True)
+        assert not jobs.get_job(timed["job_id"])["worker_active"]
+        service.close()
+        print("✅ Jobs time out")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_submit_and_progress()
+    test_cancel_timeout_and_queue_limit()
+    print("\n✅ All job manager tests passed!")
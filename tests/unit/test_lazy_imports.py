@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test Lazy Imports
+
+Verifies that lazily imported modules:
+1. Are not imported until an attribute is used
+2. Behave like the real module afterwards
+3. Report a missing package at first use, not at import
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.lazy_imports import lazy_import, is_available, LazyModule
+
+
+def test_import_on_first_use():
+    """Test that the module is imported on first attribute access."""
+    print("🧪 Testing Deferred Import...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        (Path(temp_dir) / "slow_backend.py").write_text("LOADED = True\ndef answer():\n    return 42\n")
+        sys.path.insert(0, temp_dir)
+
+        backend = lazy_import("slow_backend")
+        assert isinstance(backend, LazyModule)
+        assert "slow_backend" not in sys.modules
+        assert lazy_import("slow_backend") is backend, "One proxy per module"
+        print("✅ Nothing imported when the proxy is created")
+
+        assert backend.answer() == 42 and backend.LOADED
+        assert "slow_backend" in sys.modules
+        assert lazy_import("slow_backend") is sys.modules["slow_backend"], "Loaded modules returned directly"
+        print("✅ Imported on first attribute access")
+    finally:
+        sys.path.remove(temp_dir)
+        sys.modules.pop("slow_backend", None)
+        shutil.rmtree(temp_dir)
+
+
+def test_missing_package():
+    """Test that missing packages fail at first use with an install hint."""
+    print("🧪 Testing Missing Package...")
+
+    missing = lazy_import("not_a_real_backend.sub", install_hint="real-backend")
+    assert not is_available("not_a_real_backend")
+    assert is_available("json")
+    try:
+        missing.connect()
+        assert False, "Using a missing package should raise ImportError"
+    except ImportError as e:
+        assert "pip install real-backend" in str(e)
+    print("✅ Missing package reported at first use")
+
+
+if __name__ == "__main__":
+    test_import_on_first_use()
+    test_missing_package()
+    print("\n✅ All lazy import tests passed!")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test Lazy Registry
+
+Verifies that deferred components:
+1. Are not constructed until first use
+2. Are constructed once even when requested concurrently
+3. Report and retry failed construction
+4. Can be warmed up in the background
+"""
+
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.lazy_registry import LazyRegistry
+
+
+def test_construct_once_on_first_use():
+    """Test that components are built once, on first use."""
+    print("🧪 Testing Deferred Construction...")
+
+    registry = LazyRegistry()
+    calls = []
+
+    def build():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    registry.register("model", build)
+    assert calls == [] and not registry.is_loaded("model")
+    assert registry.get_status()["model"] == {"loaded": False, "load_seconds": None, "error": None}
+    print("✅ Nothing constructed at registration")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = list(executor.map(lambda _: registry.get("model"), range(4)))
+    assert len(calls) == 1 and all(i is instances[0] for i in instances)
+    assert registry.get_status()["model"]["load_seconds"] >= 0.05
+    print("✅ Concurrent first use constructs once")
+
+    try:
+        registry.get("missing")
+        assert False, "Unknown components should raise KeyError"
+    except KeyError:
+        pass
+
+
+def test_failure_and_warm_up():
+    """Test failed construction is reported and warm-up builds in the background."""
+    print("🧪 Testing Failures and Warm-up...")
+
+    registry = LazyRegistry()
+    outcomes = iter([RuntimeError("Neo4j unavailable"), "driver"])
+
+    def connect():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    registry.register("driver", connect)
+    registry.register("service", dict)
+
+    assert registry.warm_up(background=False) is None
+    status = registry.get_status()
+    assert status["driver"]["error"] == "Neo4j unavailable" and not status["driver"]["loaded"]
+    assert status["service"]["loaded"]
+    print("✅ Warm-up failures reported without raising")
+
+    thread = registry.warm_up(["driver"])
+    thread.join(timeout=5)
+    assert registry.get("driver") == "driver"
+    assert registry.get_status()["driver"]["error"] is None
+    print("✅ Background warm-up retries failed components")
+
+
+if __name__ == "__main__":
+    test_construct_once_on_first_use()
+    test_failure_and_warm_up()
+    print("\n✅ All lazy registry tests passed!")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test LLM Response Cache
+
+Verifies that the persistent LLM response cache:
+1. Returns stored responses for identical prompt + model + parameters
+2. Separates entries by model and generation parameters
+3. Expires entries after the TTL and evicts least recently used entries
+4. Persists responses across cache instances
+5. Is not rewritten by extraction call sites on a cache hit
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.llm_cache import LLMResponseCache
+from offline_extractor import CLIMATE_ONTOLOGY, offline_extractor
+
+
+def _make_cache(temp_dir, **kwargs):
+    return LLMResponseCache(cache_path=os.path.join(temp_dir, "llm_cache.db"), enabled=True, **kwargs)
+
+
+def test_hit_and_miss():
+    """Test that identical requests hit and different parameters miss."""
+    print("🧪 Testing Cache Hits and Misses...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = _make_cache(temp_dir)
+
+        key = cache.make_key("Extract entities from:\n  text", "gpt-3.5-turbo", temperature=0.3)
+        assert cache.get(key) is None, "Empty cache should miss"
+
+        cache.put(key, '{"entities": []}', model="gpt-3.5-turbo")
+        assert cache.get(key) == '{"entities": []}', "Stored response should be returned"
+
+        # Whitespace-only prompt differences share a key
+        same_key = cache.make_key("Extract entities from: text", "gpt-3.5-turbo", temperature=0.3)
+        assert same_key == key, "Normalized prompts should produce the same key"
+
+        # Model and parameters are part of the key
+        assert cache.make_key("Extract entities from: text", "o3-mini", temperature=0.3) != key
+        assert cache.make_key("Extract entities from: text", "gpt-3.5-turbo", temperature=0.7) != key
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["total_entries"] == 1
+        print("✅ Hits, misses and key separation work")
+
+        cache.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_eviction():
+    """Test TTL expiry and max-entry eviction."""
+    print("🧪 Testing Cache Eviction...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = _make_cache(temp_dir, max_entries=2, ttl_seconds=0)
+
+        for i in range(3):
+            cache.put(f"key_{i}", f"response_{i}")
+            time.sleep(0.01)
+
+        assert cache.get("key_0") is None, "Oldest entry should be evicted"
+        assert cache.get("key_2") == "response_2"
+        print("✅ Least recently used entry evicted")
+        cache.close()
+
+        # Eviction trims to the low-water mark, so it does not run on every put
+        batched = LLMResponseCache(cache_path=os.path.join(temp_dir, "batched.db"), enabled=True,
+                                   max_entries=10, ttl_seconds=0)
+        for i in range(11):
+            batched.put(f"key_{i}", f"response_{i}")
+        assert batched.get_stats()["total_entries"] == 9 and batched.evictions == 2
+        batched.put("key_11", "response_11")
+        assert batched.get_stats()["total_entries"] == 10 and batched.evictions == 2
+        batched.close()
+        print("✅ Eviction runs in batches")
+
+        cache = _make_cache(temp_dir, ttl_seconds=1)
+        cache._db_conn.execute(
+            "UPDATE llm_responses SET created_at = ? WHERE cache_key = ?",
+            (time.time() - 10, "key_2")
+        )
+        assert cache.get("key_2") is None, "Expired entry should miss"
+        print("✅ Expired entry removed")
+        cache.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_persistence_and_disabled():
+    """Test that responses survive restarts and a disabled cache is a no-op."""
+    print("🧪 Testing Cache Persistence...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = _make_cache(temp_dir)
+        key = cache.make_key("prompt", "gemini-2.5-flash")
+        cache.put(key, "response")
+        cache.close()
+
+        reopened = _make_cache(temp_dir)
+        assert reopened.get(key) == "response", "Response should persist"
+        reopened.close()
+        print("✅ Responses persist across instances")
+
+        disabled = LLMResponseCache(cache_path=os.path.join(temp_dir, "unused.db"), enabled=False)
+        disabled.put(key, "response")
+        assert disabled.get(key) is None, "Disabled cache should never hit"
+        assert not os.path.exists(os.path.join(temp_dir, "unused.db"))
+        print("✅ Disabled cache is a no-op")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_extractor_does_not_rewrite_hits():
+    """Test that a cache hit in the extractor keeps the entry's age and hit count."""
+    print("🧪 Testing Extractor Cache Hits...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # Cache misses fail at once without network access
+        extractor = offline_extractor(temp_dir)
+
+        # The failed request falls back to pattern extraction and stores nothing
+        extractor._openai_extract("The UN funds projects.", CLIMATE_ONTOLOGY)
+        key = extractor.llm_cache.requested_keys[-1]
+        assert extractor.llm_cache.get_stats()["writes"] == 0
+
+        extractor.llm_cache.put(key, '{"entities": [], "relationships": []}', model="gpt-3.5-turbo")
+        created_at = extractor.llm_cache._db_conn.execute(
+            "SELECT created_at FROM llm_responses WHERE cache_key = ?", (key,)
+        ).fetchone()[0]
+        time.sleep(0.01)
+        assert extractor._openai_extract("The UN funds projects.", CLIMATE_ONTOLOGY) == {"entities": [], "relationships": []}
+
+        row = extractor.llm_cache._db_conn.execute(
+            "SELECT created_at, hit_count FROM llm_responses WHERE cache_key = ?", (key,)
+        ).fetchone()
+        assert row == (created_at, 1), "Hit must not reset created_at or hit_count"
+        assert extractor.llm_cache.get_stats()["writes"] == 1
+        extractor.llm_cache.close()
+        print("✅ Cache hits are not written back")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_hit_and_miss()
+    test_eviction()
+    test_persistence_and_disabled()
+    test_extractor_does_not_rewrite_hits()
+    print("\n✅ All LLM cache tests passed!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test Ontology Graph Building Through the Graph Store
+
+Verifies that OntologyAwareGraphBuilder and MultiDocumentFusion write
+through GraphStore, here the embedded backend with no Neo4j:
+1. Bulk and per-entity builds create entities and relationships keyed by
+   name and type, and count later matches as merged
+2. A second document is appended to the source documents of matched rows,
+   keeping the higher confidence
+3. Graph metrics are computed from the store for one document
+4. Fusion write-back redirects member endpoints to the canonical entity
+   and writes each batch separately
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.graph_store import EmbeddedGraphStore
+from src.core.identity_service import Entity, Relationship
+from src.tools.phase2.t23c_ontology_aware_extractor import ExtractionResult
+from src.tools.phase2.t31_ontology_graph_builder import OntologyAwareGraphBuilder
+from src.tools.phase3.t301_multi_document_fusion import MultiDocumentFusion
+
+
+def _extraction(confidence: float = 0.9) -> ExtractionResult:
+    entities = [Entity(id=f"x{i}", canonical_name=f"Org {i}", entity_type="ORGANIZATION", confidence=confidence)
+                for i in range(3)]
+    relationships = [Relationship(id=f"r{i}", source_id=f"x{i}", target_id=f"x{i + 1}",
+                                  relationship_type="PARTNERS WITH", confidence=confidence)
+                     for i in range(2)]
+    return ExtractionResult(entities=entities, relationships=relationships, mentions=[], extraction_metadata={})
+
+
+def test_build_graph_through_store():
+    """Test bulk and per-entity builds against the embedded store."""
+    print("🧪 Testing Ontology Graph Build...")
+
+    store = EmbeddedGraphStore()
+    result = OntologyAwareGraphBuilder(graph_store=store).build_graph_from_extraction(_extraction(), "doc_a")
+    assert (result.entities_created, result.entities_merged, result.relationships_created) == (3, 0, 2)
+    assert result.errors == []
+    assert result.metrics.total_entities == 3 and result.metrics.total_relationships == 2
+    assert result.metrics.relationship_type_distribution == {"PARTNERS_WITH": 2}
+    print("✅ Bulk build writes entities and relationships")
+
+    # A new builder has empty caches, so the per-entity path reaches the store
+    builder = OntologyAwareGraphBuilder(graph_store=store, use_bulk_writes=False)
+    result = builder.build_graph_from_extraction(_extraction(confidence=0.95), "doc_b")
+    assert (result.entities_created, result.entities_merged) == (0, 3), "Store matches counted as merged"
+    assert result.relationships_created == 0
+    stats = store.get_statistics()
+    assert stats["node_count"] == 3 and stats["edge_count"] == 2, "Matching rows are not duplicated"
+
+    node = store.get_nodes_by_key([builder._entity_row(_extraction().entities[0])["entity_id"]]).popitem()[1]
+    assert node["source_documents"] == ["doc_a", "doc_b"] and node["confidence"] == 0.95
+    assert node["id"] == node["entity_id"] and node["created_at"]
+    edge = store.scan_edges(relationship_type="PARTNERS_WITH")[0]
+    assert edge["source_documents"] == ["doc_a", "doc_b"] and edge["relationship_type"] == "PARTNERS_WITH"
+    print("✅ Matched rows gain the new document and keep the higher confidence")
+
+    result = OntologyAwareGraphBuilder(graph_store=store).build_graph_from_extraction(_extraction(), "doc_c")
+    assert (result.entities_created, result.entities_merged, result.relationships_created) == (0, 3, 0)
+    assert result.metrics.total_entities == 3 and result.metrics.total_relationships == 2
+    print("✅ Bulk rebuild counts store matches as merged")
+
+
+def test_fusion_write_back_through_store():
+    """Test fused entities and redirected relationships written in batches."""
+    print("🧪 Testing Fusion Write-Back...")
+
+    store = EmbeddedGraphStore()
+    fusion = MultiDocumentFusion(graph_store=store)
+    fusion.bulk_batch_size = 2
+    ids = [f"fused_{i}" for i in range(4)]
+    entities = {entity_id: Entity(id=entity_id, canonical_name=f"Fused {i}", entity_type="ORGANIZATION",
+                                  confidence=0.9)
+                for i, entity_id in enumerate(ids)}
+    entities[ids[0]]._fusion_evidence = {"merged_from": ["member"]}
+    relationships = [Relationship(id="fr", source_id="member", target_id=ids[1],
+                                  relationship_type="PARTNERS_WITH", confidence=0.8)]
+    fusion._update_graph_with_fusion(entities, relationships, {"member": ids[0]})
+
+    nodes = store.get_nodes_by_key(ids)
+    assert set(nodes) == set(ids) and all(node["fused"] for node in nodes.values())
+    assert nodes[ids[0]]["fusion_evidence"] == '{"merged_from": ["member"]}'
+    edges = store.scan_edges(relationship_type="PARTNERS_WITH")
+    assert [(e["source_id"], e["target_id"], e["fused"]) for e in edges] == [(ids[0], ids[1], True)]
+    print("✅ Member endpoints redirected to the canonical entity")
+
+    # Entities without new evidence keep what they had
+    fusion._update_graph_with_fusion({ids[0]: entities[ids[1]]}, [])
+    assert store.get_nodes_by_key([ids[0]])[ids[0]]["fusion_evidence"] == '{"merged_from": ["member"]}'
+
+    # The second batch has a keyless entity, which the store rejects
+    extra_ids = [f"fused_{i}" for i in range(4, 7)]
+    failing = {extra_ids[0]: entities[ids[1]], extra_ids[1]: entities[ids[2]],
+               None: entities[ids[2]], extra_ids[2]: entities[ids[3]]}
+    try:
+        fusion._update_graph_with_fusion(failing, [])
+        assert False, "Keyless entity accepted"
+    except ValueError:
+        pass
+    assert set(store.get_nodes_by_key(extra_ids)) == set(extra_ids[:2]), "Earlier batches stay written"
+    print("✅ Fusion batches written separately")
+
+
+if __name__ == "__main__":
+    test_build_graph_through_store()
+    test_fusion_write_back_through_store()
+    print("\n✅ All ontology graph store tests passed!")
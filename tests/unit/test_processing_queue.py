@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test Processing Queue
+
+Verifies that the UI processing queue:
+1. Returns a job ID immediately and runs jobs in parallel worker processes
+2. Reuses jobs by document hash until the graph version changes
+3. Records failures, cancels queued jobs and resumes queued jobs after a restart
+4. Leaves jobs of another live queue on the same database alone
+"""
+
+import sys
+import time
+import sqlite3
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.processing_queue import ProcessingQueue
+
+SLEEP_TASK = "subprocess:run"
+SLEEP_PARAMETERS = {"args": ["sleep", "1"]}
+
+
+def _wait(queue: ProcessingQueue, job_ids, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        jobs = [queue.get_job(job_id) for job_id in job_ids]
+        if all(job["finished"] for job in jobs):
+            return jobs
+        time.sleep(0.05)
+    raise AssertionError(f"Jobs did not finish: {[job['job_status'] for job in jobs]}")
+
+
+def test_parallel_jobs_and_reuse():
+    """Test immediate submission, parallel workers and document hash reuse."""
+    print("🧪 Testing Parallel Jobs and Reuse...")
+
+    temp_dir = tempfile.mkdtemp()
+    queue = ProcessingQueue(str(Path(temp_dir) / "queue.db"), max_workers=2)
+    try:
+        # Start the worker processes so their startup is not timed
+        _wait(queue, [queue.submit("warmup", "json:loads", {"s": "{}"}, writes_graph=False)["job_id"]])
+
+        start = time.time()
+        first = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS, document_hash="doc-a")
+        second = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS, document_hash="doc-b")
+        assert time.time() - start < 0.5, "Submission must not wait for the work"
+        assert first["status"] == "success" and not first["reused"]
+
+        duplicate = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS, document_hash="doc-a")
+        assert duplicate["reused"] and duplicate["job_id"] == first["job_id"], "Active job reused"
+
+        jobs = _wait(queue, [first["job_id"], second["job_id"]])
+        elapsed = time.time() - start
+        assert all(job["job_status"] == "completed" for job in jobs)
+        assert jobs[0]["result"].returncode == 0
+        assert elapsed < 1.9, f"Two 1s jobs took {elapsed:.2f}s, expected parallel execution"
+        print(f"✅ Two jobs ran in parallel in {elapsed:.2f}s")
+
+        assert queue.graph_version() == 2
+        latest = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS, document_hash="doc-b")
+        assert latest["reused"] and latest["job_status"] == "completed", "Result current at this graph version"
+        stale = queue.submit("document", "json:loads", {"s": "{}"}, document_hash="doc-a")
+        assert not stale["reused"], "A later graph write makes the earlier result stale"
+        _wait(queue, [stale["job_id"]])
+        print("✅ Jobs reused by document hash until the graph changes")
+    finally:
+        queue.shutdown()
+        shutil.rmtree(temp_dir)
+
+
+def test_failures_cancellation_and_resume():
+    """Test failed jobs, cancelling queued jobs and resuming after a restart."""
+    print("🧪 Testing Failures, Cancellation and Resume...")
+
+    temp_dir = tempfile.mkdtemp()
+    db_path = str(Path(temp_dir) / "queue.db")
+    queue = ProcessingQueue(db_path, max_workers=1, max_queued_jobs=2)
+    try:
+        raised = queue.submit("parse", "json:loads", {"s": "{"}, writes_graph=False)
+        returned = queue.submit("parse", "json:loads", {"s": '{"status": "error", "error": "boom"}'},
+                                writes_graph=False)
+        raised_job, returned_job = _wait(queue, [raised["job_id"], returned["job_id"]])
+        assert raised_job["job_status"] == "failed" and "Expecting property name" in raised_job["error"]
+        assert returned_job["job_status"] == "failed" and returned_job["error"] == "boom"
+        assert queue.graph_version() == 0
+        print("✅ Exceptions and error results fail the job")
+
+        running = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS)
+        while queue.get_job(running["job_id"])["job_status"] != "running":
+            time.sleep(0.01)
+        cancelled = queue.submit("document", SLEEP_TASK, SLEEP_PARAMETERS)
+        waiting = queue.submit("document", "json:loads", {"s": '{"resumed": true}'})
+        rejected = queue.submit("document", "json:loads", {"s": "{}"})
+        assert rejected["status"] == "error", "Submissions beyond max_queued_jobs are rejected"
+        assert queue.cancel(cancelled["job_id"])["job_status"] == "cancelled"
+        assert queue.cancel(cancelled["job_id"])["status"] == "error"
+        print("✅ Queued jobs cancelled and full queue rejects submissions")
+    finally:
+        queue.shutdown()
+
+    try:
+        # Reopen the same job table
+        restarted = ProcessingQueue(db_path, max_workers=1)
+        resumed, cancelled_job, running_job = _wait(
+            restarted, [waiting["job_id"], cancelled["job_id"], running["job_id"]]
+        )
+        assert resumed["job_status"] == "completed" and resumed["result"] == {"resumed": True}
+        assert cancelled_job["job_status"] == "cancelled" and running_job["job_status"] == "completed"
+        assert restarted.get_statistics()["jobs_by_status"]["completed"] == 2
+        restarted.shutdown()
+        print("✅ Queued jobs resumed after a restart")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_shared_database_and_temp_files():
+    """Test two live queues on one database and deleting inputs of jobs that never ran."""
+    print("🧪 Testing Shared Database and Temporary Files...")
+
+    temp_dir = tempfile.mkdtemp()
+    db_path = str(Path(temp_dir) / "queue.db")
+    first = ProcessingQueue(db_path, max_workers=1)
+    second = None
+    try:
+        running = first.submit("document", "subprocess:run", {"args": ["sleep", "2"]})
+        while first.get_job(running["job_id"])["job_status"] != "running":
+            time.sleep(0.01)
+
+        # A second server (or a recreated queue) opening the same table
+        second = ProcessingQueue(db_path, max_workers=1)
+        assert first.get_job(running["job_id"])["job_status"] == "running", "Live owner's job not failed"
+        job = _wait(first, [running["job_id"]])[0]
+        assert job["job_status"] == "completed" and second.get_job(running["job_id"])["job_status"] == "completed"
+        assert second.graph_version() == 1
+        print("✅ Opening a second queue leaves running jobs of the first alone")
+
+        # A job finished elsewhere does not count as a graph write when its result arrives
+        stale = first.submit("document", SLEEP_TASK, SLEEP_PARAMETERS)
+        while first.get_job(stale["job_id"])["job_status"] != "running":
+            time.sleep(0.01)
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("UPDATE jobs SET status = 'failed', error = 'lost' WHERE job_id = ?", (stale["job_id"],))
+        conn.close()
+        time.sleep(1.5)
+        assert first.get_job(stale["job_id"])["error"] == "lost" and first.graph_version() == 1
+        print("✅ Graph version only counts jobs whose result was recorded")
+
+        blocker = first.submit("document", SLEEP_TASK, SLEEP_PARAMETERS)
+        while first.get_job(blocker["job_id"])["job_status"] != "running":
+            time.sleep(0.01)
+        input_file = Path(temp_dir) / "upload.pdf"
+        input_file.write_bytes(b"%PDF")
+        cancelled = first.submit("document", SLEEP_TASK, SLEEP_PARAMETERS, temp_file=str(input_file))
+        assert first.cancel(cancelled["job_id"])["job_status"] == "cancelled"
+        assert not input_file.exists(), "Input of a cancelled job deleted"
+
+        input_file.write_bytes(b"%PDF")
+        failed = first.submit("document", "json:loads", {"s": "{"}, temp_file=str(input_file))
+        assert _wait(first, [failed["job_id"]])[0]["job_status"] == "failed"
+        assert not input_file.exists(), "Input of a failed job deleted"
+        print("✅ Inputs of cancelled and failed jobs deleted")
+    finally:
+        first.shutdown()
+        if second is not None:
+            second.shutdown()
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_parallel_jobs_and_reuse()
+    test_failures_cancellation_and_resume()
+    test_shared_database_and_temp_files()
+    print("\n✅ All processing queue tests passed!")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test Provenance Service
+
+Verifies that provenance lineage:
+1. Follows the deepest input chain from root to object
+2. Shares one DAG node between all outputs of an operation
+3. Respects max_depth and reports unknown objects as not_found
+4. Serves evicted and restarted lineage from the durable operation log
+5. Starts, completes and looks up operations in bulk
+6. Is persisted when the service manager is configured to (as the MCP server does)
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.provenance_service import ProvenanceService
+from core.service_manager import ServiceManager
+
+
+def _run(service, tool_id, inputs, outputs):
+    op_id = service.start_operation(tool_id=tool_id, operation_type="create", inputs=inputs)
+    service.complete_operation(op_id, outputs=outputs, success=True)
+    return op_id
+
+
+def test_lineage_chain():
+    """Test that lineage lists operations from the root in order."""
+    print("🧪 Testing Lineage Chain...")
+
+    # Persistence is opt-in: a default service writes no log
+    assert ProvenanceService().get_tool_statistics()["persistence_enabled"] is False
+
+    service = ProvenanceService(persistence_enabled=False)
+    load_op = _run(service, "T01", [], ["storage://document/doc1"])
+    chunk_op = _run(service, "T15A", ["storage://document/doc1"], ["chunk_1", "chunk_2"])
+    ner_op = _run(service, "T23A", ["chunk_2"], ["mention_1"])
+    side_op = _run(service, "T99", [], ["config_1"])
+    entity_op = _run(service, "T31", ["config_1", "mention_1"], ["entity_1"])
+
+    lineage = service.get_lineage("entity_1")
+    assert lineage["status"] == "success"
+    assert lineage["depth"] == 4
+    assert lineage["confidence"] == 0.95
+    assert [step["operation_id"] for step in lineage["lineage"]] == [load_op, chunk_op, ner_op, entity_op]
+    assert side_op not in [step["operation_id"] for step in lineage["lineage"]]
+    print("✅ Lineage follows the deepest input chain")
+
+    # Both chunks share the same chain node
+    assert service._object_nodes["chunk_1"] == service._object_nodes["chunk_2"]
+    assert service.get_chain("chunk_1").operations == [load_op, chunk_op]
+    print("✅ Outputs of one operation share a DAG node")
+
+    truncated = service.get_lineage("entity_1", max_depth=2)
+    assert [step["operation_id"] for step in truncated["lineage"]] == [load_op, chunk_op]
+    assert service.get_lineage("missing")["status"] == "not_found"
+    print("✅ max_depth and not_found handled")
+
+
+def test_long_pipeline_memory_shape():
+    """Test that many outputs do not duplicate ancestor lists."""
+    print("🧪 Testing Provenance Node Count...")
+
+    service = ProvenanceService(persistence_enabled=False)
+    _run(service, "T01", [], ["doc"])
+    chunks = [f"chunk_{i}" for i in range(1000)]
+    _run(service, "T15A", ["doc"], chunks)
+    for chunk in chunks[:10]:
+        _run(service, "T23A", [chunk], [f"{chunk}_mention"])
+
+    assert len(service._op_ids) == 12, "One node per completed operation"
+    assert service.get_lineage("chunk_9_mention")["depth"] == 3
+    print("✅ 1,010 objects tracked with 12 DAG nodes")
+
+
+def test_persistent_log_and_hot_window():
+    """Test that evicted and restarted lineage is read back from the log."""
+    print("🧪 Testing Persistent Provenance Log...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        log_path = os.path.join(temp_dir, "provenance.db")
+        service = ProvenanceService(persistence_enabled=True, log_path=log_path, hot_window_operations=10)
+
+        load_op = _run(service, "T01", [], ["doc"])
+        chunk_op = _run(service, "T15A", ["doc"], ["chunk_0"])
+        for i in range(20):
+            _run(service, "T99", [], [f"noise_{i}"])
+        ner_op = _run(service, "T23A", ["chunk_0"], ["mention_0"])
+
+        assert len(service.operations) <= 10, "Hot window should bound in-memory operations"
+        assert load_op not in service.operations
+        lineage = service.get_lineage("mention_0")
+        assert [step["operation_id"] for step in lineage["lineage"]] == [load_op, chunk_op, ner_op]
+        assert lineage["depth"] == 3
+        assert service.get_operation(load_op)["tool_id"] == "T01"
+        print("✅ Evicted ancestors resolved from the log")
+
+        service.close()
+
+        restarted = ProvenanceService(persistence_enabled=True, log_path=log_path, hot_window_operations=10)
+        assert restarted.operations == {}
+        cold = restarted.get_lineage("mention_0")
+        assert [step["operation_id"] for step in cold["lineage"]] == [load_op, chunk_op, ner_op]
+        assert [op["operation_id"] for op in restarted.get_operations_for_object("chunk_0")] == [chunk_op, ner_op]
+
+        # New work continues the deepest logged chain among its inputs
+        entity_op = _run(restarted, "T31", ["doc", "mention_0", "external_ref"], ["entity_0"])
+        assert restarted.get_lineage("entity_0")["depth"] == 4
+        assert restarted.get_chain("entity_0").operations[-1] == entity_op
+        # Log lookups, including misses, are remembered for later operations
+        assert restarted._cold_heads.get("external_ref") is None and "external_ref" in restarted._cold_heads
+        assert restarted._cold_heads.get("mention_0")[0] == ner_op
+        restarted.close()
+        print("✅ Lineage survives restarts")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_bulk_operations():
+    """Test bulk start, completion and lookup, including evicted operations."""
+    print("🧪 Testing Bulk Operations...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        log_path = os.path.join(temp_dir, "provenance.db")
+        service = ProvenanceService(persistence_enabled=True, log_path=log_path, hot_window_operations=10)
+
+        op_ids = service.start_operations(
+            [{"tool_id": "T23A", "operation_type": "create", "inputs": [f"chunk_{i}"]} for i in range(20)]
+            + [{"operation_type": "create", "inputs": []}]
+        )
+        assert len(op_ids) == 21 and op_ids[-1].startswith("op_error_")
+
+        completions = service.complete_operations(
+            [{"operation_id": op_id, "outputs": [f"mention_{i}"]} for i, op_id in enumerate(op_ids[:20])]
+            + [{"operation_id": "op_missing", "outputs": []}]
+        )
+        assert [c["status"] for c in completions] == ["success"] * 20 + ["error"]
+        assert len(service.operations) <= 10, "Batch completion still bounds the hot window"
+        print("✅ Per-item status returned in input order")
+
+        details = service.get_operations([op_ids[0], op_ids[19], "op_missing"])
+        assert op_ids[0] not in service.operations
+        assert details[0]["outputs"] == ["mention_0"] and details[1]["outputs"] == ["mention_19"]
+        assert details[2] is None
+        assert service.get_lineage("mention_0")["lineage"][0]["operation_id"] == op_ids[0]
+        service.close()
+        print("✅ Bulk lookups include operations evicted to the log")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_service_manager_configuration():
+    """Test configuring the shared provenance service before first use."""
+    print("🧪 Testing Shared Provenance Configuration...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # A manager separate from the process-wide singleton
+        manager = object.__new__(ServiceManager)
+        manager.__init__()
+        log_path = os.path.join(temp_dir, "provenance.db")
+        manager.configure_provenance_service(persistence_enabled=True, log_path=log_path)
+        service = manager.provenance_service
+        assert service.get_tool_statistics()["persistence_enabled"] is True
+        assert manager.provenance_service is service
+
+        try:
+            manager.configure_provenance_service(persistence_enabled=False)
+            assert False, "Configuring after first use should fail"
+        except RuntimeError:
+            pass
+        service.close()
+        print("✅ Shared provenance service persisted as configured")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_lineage_chain()
+    test_long_pipeline_memory_shape()
+    test_persistent_log_and_hot_window()
+    test_bulk_operations()
+    test_service_manager_configuration()
+    print("\n✅ All provenance service tests passed!")
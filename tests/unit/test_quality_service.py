@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test Quality Service
+
+Verifies that the batch quality API:
+1. Produces the same confidences and tiers as per-object assessment
+2. Propagates confidence like the scalar path
+3. Keeps dict-style access and filtering working on the columnar store
+4. Reports per-item status for bulk assessments and lookups
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.tracking_policy import TrackingPolicy
+from core.quality_service import QualityService, QualityTier
+
+
+def _service():
+    return QualityService(tracking_policy=TrackingPolicy(level="full"))
+
+
+def test_batch_matches_scalar():
+    """Test that assess_confidence_batch equals repeated assess_confidence."""
+    print("🧪 Testing Batch Assessment...")
+
+    refs = [f"chunk_{i}" for i in range(100)]
+    base = [(i % 10) / 10 for i in range(100)]
+    lengths = [min(1.0, i / 50) for i in range(100)]
+    positions = [1.0 - i * 0.01 for i in range(100)]
+
+    scalar = _service()
+    expected = [
+        scalar.assess_confidence(ref, b, factors={"chunk_length": l, "position_factor": p})
+        for ref, b, l, p in zip(refs, base, lengths, positions)
+    ]
+
+    batch = _service()
+    result = batch.assess_confidence_batch(
+        refs, base, factors={"chunk_length": lengths, "position_factor": positions},
+        metadata={"chunk_method": "sliding_window"}
+    )
+    assert result["status"] == "success"
+    assert result["tracked_count"] == 100
+    for i, scalar_result in enumerate(expected):
+        assert abs(result["confidences"][i] - scalar_result["confidence"]) < 1e-12
+        assert result["quality_tiers"][i] == scalar_result["quality_tier"]
+
+    stored = batch.get_quality_assessment("chunk_42")
+    assert stored["factors"]["chunk_length"] == lengths[42]
+    assert stored["metadata"]["chunk_method"] == "sliding_window"
+    print("✅ Batch results match per-object assessment")
+
+    invalid = batch.assess_confidence_batch(["a", "b"], [0.5, 1.5])
+    assert invalid["status"] == "error" and invalid["invalid_indices"] == [1]
+    print("✅ Invalid confidences rejected with their indices")
+
+
+def test_propagate_batch_matches_scalar():
+    """Test that propagate_confidence_batch equals repeated propagate_confidence."""
+    print("🧪 Testing Batch Propagation...")
+
+    service = _service()
+    service.assess_confidence_batch(["a", "b", "c"], [0.9, 0.6, 0.0])
+    inputs = [["a"], ["a", "b"], [], ["missing"], ["a", "c"], ["c"]]
+
+    batch = service.propagate_confidence_batch(inputs, "extract_entities")
+    for refs, value in zip(inputs, batch.tolist()):
+        assert abs(value - service.propagate_confidence(refs, "extract_entities")) < 1e-12
+    print("✅ Batch propagation matches per-output propagation")
+
+
+def test_store_access_and_filter():
+    """Test dict-style access, deletion and vectorized filtering."""
+    print("🧪 Testing Assessment Store...")
+
+    service = _service()
+    service.assess_confidence_batch(["high", "medium", "low"], [0.95, 0.65, 0.2])
+    assert len(service.assessments) == 3 and "medium" in service.assessments
+    assert service.assessments["high"].quality_tier == QualityTier.HIGH
+
+    kept = service.filter_by_quality(["low", "high", "unknown", "medium"], min_tier=QualityTier.MEDIUM)
+    assert kept == ["high", "medium"]
+
+    del service.assessments["high"]
+    assert "high" not in service.assessments
+    assert service.assessments["low"].confidence == 0.2
+    assert service.get_quality_statistics()["total_assessments"] == 2
+    print("✅ Store lookups, deletion and filtering behave like a dict")
+
+
+def test_bulk_items_with_per_item_status():
+    """Test assess_confidences and get_quality_assessments."""
+    print("🧪 Testing Bulk Items...")
+
+    scalar = _service()
+    expected = scalar.assess_confidence("a", 0.7, factors={"chunk_length": 0.4})
+
+    service = _service()
+    result = service.assess_confidences([
+        {"object_ref": "a", "base_confidence": 0.7, "factors": {"chunk_length": 0.4}},
+        {"object_ref": "b", "base_confidence": 1.5},
+        {"object_ref": "c", "base_confidence": 0.3, "metadata": {"source": "test"}},
+        {"base_confidence": 0.5}
+    ])
+    assert [r["status"] for r in result["results"]] == ["success", "error", "success", "error"]
+    assert result["assessed_count"] == 2 and result["error_count"] == 2
+    assert abs(result["results"][0]["confidence"] - expected["confidence"]) < 1e-12
+    assert result["results"][2]["quality_tier"] == QualityTier.LOW.value
+    print("✅ Invalid items fail individually; valid items match scalar assessment")
+
+    mixed = service.assess_confidences([
+        {"object_ref": "x1", "base_confidence": 0.7, "factors": {"x": 0.4}},
+        {"object_ref": "x2", "base_confidence": 0.7, "factors": {"x": "bad"}},
+        {"object_ref": "x3", "base_confidence": 0.7, "factors": {"x": "0.4"}},
+        {"object_ref": "x4", "base_confidence": 0.7, "factors": ["x"]}
+    ])
+    assert [r["status"] for r in mixed["results"]] == ["success", "error", "success", "error"]
+    assert mixed["results"][0]["confidence"] == mixed["results"][2]["confidence"] == expected["confidence"]
+    assert "Invalid factors" in mixed["results"][1]["error"]
+    print("✅ A bad factor fails only its item, not its factor group")
+
+    lookups = service.get_quality_assessments(["c", "b"])
+    assert lookups[0]["status"] == "success" and lookups[0]["metadata"] == {"source": "test"}
+    assert lookups[1] == {"status": "not_found", "object_ref": "b"}
+    print("✅ Bulk lookups report missing objects")
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_propagate_batch_matches_scalar()
+    test_store_access_and_filter()
+    test_bulk_items_with_per_item_status()
+    print("\n✅ All quality service tests passed!")
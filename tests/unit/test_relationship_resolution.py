@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test Worker Relationship Resolution
+
+Verifies that the optimized workflow maps relationships found in
+extraction workers, which refer to entities by provisional local IDs, onto
+the mentions registered in-process:
+1. Subject and object entity and mention IDs are the registered ones
+2. Relationships whose entities were not registered are dropped
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.identity_service import IdentityService
+from src.core.provenance_service import ProvenanceService
+from src.core.quality_service import QualityService
+from src.tools.phase1.parallel_extraction import local_entity_id
+from src.tools.phase1.t23a_spacy_ner import SpacyNER
+from src.tools.phase1.vertical_slice_workflow_optimized import OptimizedVerticalSliceWorkflow
+
+TEXT = "Tim Cook leads Apple in Cupertino."
+
+
+def _worker_record():
+    """A chunk record as extract_chunk_records returns it from a worker."""
+    entities = [
+        {"surface_form": "Tim Cook", "entity_type": "PERSON", "start_char": 0, "end_char": 8, "confidence": 0.85},
+        {"surface_form": "Apple", "entity_type": "ORG", "start_char": 15, "end_char": 20, "confidence": 0.85},
+        {"surface_form": "Cupertino", "entity_type": "GPE", "start_char": 24, "end_char": 33, "confidence": 0.85}
+    ]
+    for entity in entities:
+        entity["mention_id"] = entity["entity_id"] = local_entity_id(entity)
+    relationships = [
+        {"subject_entity_id": "local:0:8", "object_entity_id": "local:15:20", "relationship_type": "LEADS",
+         "confidence": 0.7},
+        {"subject_entity_id": "local:15:20", "object_entity_id": "local:24:33", "relationship_type": "LOCATED_IN",
+         "confidence": 0.7},
+        # Refers to an entity the worker found but that was never registered
+        {"subject_entity_id": "local:0:8", "object_entity_id": "local:40:45", "relationship_type": "KNOWS",
+         "confidence": 0.7}
+    ]
+    return {"chunk_ref": "chunk_0", "entities": entities, "relationships": relationships}
+
+
+def test_resolve_worker_relationships():
+    """Test that worker relationships point at the registered mentions."""
+    print("🧪 Testing Worker Relationship Resolution...")
+
+    record = _worker_record()
+    ner = SpacyNER(IdentityService(use_embeddings=False), ProvenanceService(), QualityService())
+    # Registers the worker's entities as mentions without running spaCy
+    registered = ner.extract_entities("chunk_0", TEXT, 0.8, entities=record["entities"])["entities"]
+    assert len(registered) == 3
+    by_surface_form = {e["surface_form"]: e for e in registered}
+    assert not any(e["entity_id"].startswith("local:") for e in registered)
+
+    # Resolution needs no workflow services
+    workflow = OptimizedVerticalSliceWorkflow.__new__(OptimizedVerticalSliceWorkflow)
+    resolved = workflow._resolve_relationships(record["relationships"], registered)
+
+    assert [r["relationship_type"] for r in resolved] == ["LEADS", "LOCATED_IN"], "Unregistered entity dropped"
+    for rel, (subject, obj) in zip(resolved, [("Tim Cook", "Apple"), ("Apple", "Cupertino")]):
+        assert rel["subject_entity_id"] == by_surface_form[subject]["entity_id"]
+        assert rel["object_entity_id"] == by_surface_form[obj]["entity_id"]
+        assert rel["subject_mention_id"] == by_surface_form[subject]["mention_id"]
+        assert rel["object_mention_id"] == by_surface_form[obj]["mention_id"]
+    print("✅ Worker relationships mapped to registered entity and mention IDs")
+
+
+if __name__ == "__main__":
+    test_resolve_worker_relationships()
+    print("\n✅ All relationship resolution tests passed!")
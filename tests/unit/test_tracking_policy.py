@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test Tracking Policy
+
+Verifies that provenance and quality services honour the tracking level:
+1. full - every operation and object is indexed and assessed
+2. batch - operations recorded without per-object indexes, one aggregate assessment
+3. sampled - a fraction of objects get full tracking
+4. off - nothing is recorded but tools still get usable results
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core.tracking_policy import TrackingPolicy
+from core.provenance_service import ProvenanceService
+from core.quality_service import QualityService
+
+
+def _services(level, sample_rate=None):
+    policy = TrackingPolicy(level=level, sample_rate=sample_rate)
+    return (
+        ProvenanceService(persistence_enabled=False, tracking_policy=policy),
+        QualityService(tracking_policy=policy)
+    )
+
+
+def _process_batch(provenance, quality, size=50):
+    op_id = provenance.start_operation(tool_id="T15A", operation_type="chunk_text", inputs=["doc"])
+    refs = [f"chunk_{i}" for i in range(size)]
+    confidences = []
+    for ref in refs:
+        result = quality.assess_confidence(ref, 0.8)
+        assert result["status"] == "success"
+        confidences.append(result["confidence"])
+    quality.record_batch_assessment(op_id, confidences)
+    completion = provenance.complete_operation(op_id, outputs=refs, success=True)
+    assert completion["status"] == "success"
+    return op_id
+
+
+def test_full_tracking():
+    """Test that full tracking records every object."""
+    print("🧪 Testing Full Tracking...")
+
+    provenance, quality = _services("full")
+    op_id = _process_batch(provenance, quality)
+
+    assert len(quality.assessments) == 50, "Batch aggregate is not recorded in full mode"
+    assert provenance.get_lineage("chunk_0")["status"] == "success"
+    assert provenance.get_operations_for_object("chunk_49")[0]["operation_id"] == op_id
+    print("✅ Every object assessed and indexed")
+
+
+def test_batch_tracking():
+    """Test that batch tracking keeps one operation and one aggregate assessment."""
+    print("🧪 Testing Batch Tracking...")
+
+    provenance, quality = _services("batch")
+    op_id = _process_batch(provenance, quality)
+
+    assert list(quality.assessments) == [op_id]
+    aggregate = quality.get_quality_assessment(op_id)
+    assert aggregate["metadata"]["object_count"] == 50
+    assert provenance.get_operation(op_id)["outputs"][0] == "chunk_0"
+    assert provenance.object_to_operations == {}
+    assert provenance.get_lineage("chunk_0")["status"] == "not_found"
+    print("✅ One operation and one aggregate assessment per batch")
+
+
+def test_sampled_and_off():
+    """Test sampled tracking and disabled tracking."""
+    print("🧪 Testing Sampled and Off Tracking...")
+
+    provenance, quality = _services("sampled", sample_rate=0.2)
+    for _ in range(20):
+        _process_batch(provenance, quality)
+    per_object = [a for a in quality.assessments.values() if not a.metadata.get("batch")]
+    assert 0 < len(per_object) < 1000, f"Expected a sample, got {len(per_object)}"
+    assert len(provenance.operations) == 20
+    print(f"✅ Sampled {len(per_object)} of 1000 objects")
+
+    provenance, quality = _services("off")
+    op_id = _process_batch(provenance, quality)
+    assert provenance.operations == {}
+    assert quality.assessments == {}
+    assert provenance.complete_operation(op_id, outputs=["x"])["tracked"] is False
+    print("✅ Off records nothing")
+
+
+if __name__ == "__main__":
+    test_full_tracking()
+    test_batch_tracking()
+    test_sampled_and_off()
+    print("\n✅ All tracking policy tests passed!")
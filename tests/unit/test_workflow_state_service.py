@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test Workflow State Service
+
+Verifies that the checkpoint store:
+1. Serves queued and written checkpoints for restore and listing
+2. Loads checkpoints lazily after a restart
+3. Imports legacy checkpoint_*.json files once
+4. Removes old checkpoints from the store and memory
+5. Saves stage artifacts and reopens workflows for resumption
+6. Falls back to zlib-compressed JSON artifacts without msgpack
+"""
+
+import sys
+import json
+import tempfile
+import zlib
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from core import artifact_store
+from core.artifact_store import ArtifactStore
+from core.workflow_state_service import WorkflowStateService
+
+
+def test_checkpoints_and_restart():
+    """Test checkpoint restore, listing and lazy loading after restart."""
+    print("🧪 Testing Checkpoint Store...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        service = WorkflowStateService(temp_dir, checkpoint_cache_size=2)
+        workflow_id = service.start_workflow("pipeline", total_steps=3, initial_state={"document": "a.pdf"})
+        step_ids = [
+            service.create_checkpoint(workflow_id, f"step_{i}", i, {"step": i})
+            for i in (2, 1)
+        ]
+        other_id = service.start_workflow("other", total_steps=1)
+        service.create_checkpoint(other_id, "only", 1, {})
+
+        # Readable before the background writer has run
+        listing = service.get_workflow_checkpoints(workflow_id)
+        assert [c["step_number"] for c in listing] == [0, 1, 2]
+        assert all(c["has_state_data"] for c in listing)
+        assert service.get_workflow_checkpoints(other_id)[0]["has_state_data"] is False
+        assert service.restore_from_checkpoint(step_ids[0])["state_data"] == {"step": 2}
+        print("✅ Queued checkpoints restored and listed per workflow")
+
+        service.flush()
+        assert service.store.written == 4
+        assert service.get_service_statistics()["total_checkpoints"] == 4
+        service.close()
+
+        restarted = WorkflowStateService(temp_dir, checkpoint_cache_size=2)
+        assert len(restarted.checkpoints) == 0, "Checkpoints should not be loaded at startup"
+        restored = restarted.restore_from_checkpoint(step_ids[1])
+        assert restored["status"] == "success" and restored["state_data"] == {"step": 1}
+        assert restored["workflow_id"] == workflow_id
+        assert len(restarted.get_workflow_checkpoints(workflow_id)) == 3
+        assert restarted.restore_from_checkpoint("checkpoint_missing")["status"] == "error"
+        restarted.close()
+        print("✅ Checkpoints loaded on demand after restart")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_legacy_import_and_cleanup():
+    """Test one-time legacy JSON import and checkpoint cleanup."""
+    print("🧪 Testing Legacy Import and Cleanup...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        for i in range(3):
+            with open(Path(temp_dir) / f"checkpoint_checkpoint_legacy{i}.json", "w") as f:
+                json.dump({
+                    "checkpoint_id": f"checkpoint_legacy{i}",
+                    "workflow_id": "workflow_legacy",
+                    "step_name": f"step_{i}",
+                    "step_number": i,
+                    "total_steps": 3,
+                    "state_data": {"step": i},
+                    "created_at": old,
+                    "metadata": {}
+                }, f)
+
+        service = WorkflowStateService(temp_dir)
+        assert len(service.get_workflow_checkpoints("workflow_legacy")) == 3
+        assert service.restore_from_checkpoint("checkpoint_legacy2")["state_data"] == {"step": 2}
+        print("✅ Legacy checkpoint files imported")
+
+        workflow_id = service.start_workflow("recent", total_steps=1, initial_state={"x": 1})
+        result = service.cleanup_old_checkpoints(days_old=7)
+        assert result["status"] == "success" and result["removed_checkpoints"] == 3
+        assert service.restore_from_checkpoint("checkpoint_legacy2")["status"] == "error"
+        assert len(service.get_workflow_checkpoints(workflow_id)) == 1
+        service.close()
+
+        # Import runs once; deleted legacy checkpoints are not re-imported
+        reopened = WorkflowStateService(temp_dir)
+        assert reopened.get_workflow_checkpoints("workflow_legacy") == []
+        reopened.close()
+        print("✅ Old checkpoints removed")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_artifacts_and_reopen():
+    """Test stage artifacts and reopening a workflow after restart."""
+    print("🧪 Testing Artifacts and Reopen...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        service = WorkflowStateService(temp_dir)
+        workflow_id = service.start_workflow("pipeline", total_steps=3, initial_state={"stages": []})
+        chunks = [{"chunk_ref": f"chunk_{i}", "text": "x" * 100, "confidence": 0.8} for i in range(50)]
+        ref = service.save_artifact(workflow_id, "chunk_text", chunks)
+        service.create_checkpoint(workflow_id, "chunk_text", 1, {"stages": ["chunk_text"], "artifacts": {"chunk_text": ref}})
+        service.close()
+
+        restarted = WorkflowStateService(temp_dir)
+        assert restarted.reopen_workflow("workflow_missing")["status"] == "error"
+        reopened = restarted.reopen_workflow(workflow_id)
+        assert reopened["status"] == "success"
+        state = reopened["latest_checkpoint"]["state_data"]
+        assert state["stages"] == ["chunk_text"]
+        assert restarted.load_artifact(state["artifacts"]["chunk_text"]) == chunks
+        assert restarted.get_workflow_status(workflow_id)["name"] == "pipeline"
+
+        # Reopened workflows accept new checkpoints
+        restarted.create_checkpoint(workflow_id, "extract_entities", 2, {"stages": ["chunk_text", "extract_entities"]})
+        assert restarted.get_latest_checkpoint(workflow_id)["step_name"] == "extract_entities"
+        restarted.close()
+        print("✅ Artifacts reloaded and workflow reopened after restart")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_artifact_json_fallback():
+    """Test the zlib-compressed JSON format used when msgpack is not installed."""
+    print("🧪 Testing Artifact JSON Fallback...")
+
+    temp_dir = tempfile.mkdtemp()
+    installed_msgpack = artifact_store.msgpack
+    # The same module state as a failed msgpack import
+    artifact_store.msgpack = None
+    try:
+        store = ArtifactStore(temp_dir)
+        assert store.format == "json.zz"
+        mentions = [{"mention_id": f"m{i}", "surface_form": "Apple", "confidence": 0.85, "tags": []} for i in range(20)]
+        ref = store.save("workflow_a", "extract_entities", mentions)
+        assert ref == "workflow_a/extract_entities.json.zz" and store.exists(ref)
+
+        payload = (Path(temp_dir) / ref).read_bytes()
+        assert json.loads(zlib.decompress(payload)) == mentions, "Stored as compressed JSON"
+        assert store.size(ref) < len(json.dumps(mentions)), "Compressed on disk"
+        assert store.load(ref) == mentions
+        assert sorted(p.name for p in (Path(temp_dir) / "workflow_a").iterdir()) == ["extract_entities.json.zz"], \
+            "No temporary files left behind"
+        print("✅ Artifacts round-trip as zlib-compressed JSON")
+
+        (Path(temp_dir) / "workflow_a" / "chunk_text.msgpack").write_bytes(b"\x90")
+        try:
+            store.load("workflow_a/chunk_text.msgpack")
+            assert False, "msgpack artifacts cannot be read without msgpack"
+        except RuntimeError:
+            pass
+        print("✅ msgpack artifacts rejected with a clear error")
+    finally:
+        artifact_store.msgpack = installed_msgpack
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_checkpoints_and_restart()
+    test_legacy_import_and_cleanup()
+    test_artifacts_and_reopen()
+    test_artifact_json_fallback()
+    print("\n✅ All workflow state service tests passed!")
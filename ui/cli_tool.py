@@ -12,14 +12,16 @@ src_dir = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_dir))
 
 from tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
-from neo4j import GraphDatabase
+from core.lazy_imports import lazy_import
 import json
 
+neo4j = lazy_import("neo4j")
+
 
 def check_neo4j():
     """Check Neo4j connection."""
     try:
-        driver = GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "password"))
+        driver = neo4j.GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "password"))
         with driver.session() as session:
             session.run("RETURN 1")
         driver.close()
@@ -107,7 +109,7 @@ def show_graph_stats():
         print(f"❌ Neo4j not connected: {status}")
         return
     
-    driver = GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "password"))
+    driver = neo4j.GraphDatabase.driver("bolt://localhost:7687", auth=("neo4j", "password"))
     
     with driver.session() as session:
         # Count entities
@@ -12,26 +12,25 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import networkx as nx
 from dataclasses import dataclass, asdict
-import tempfile
-import uuid
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.core.lazy_imports import lazy_import
+from src.ui.document_processing import DocumentProcessingResult
+from src.ui.streamlit_jobs import submit_document, poll_jobs, rerun_while_pending
+from src.ui.streamlit_graph_view import render_database_graph
+
+# Plotting libraries are loaded when a chart is first drawn
+go = lazy_import("plotly.graph_objects", install_hint="plotly")
+nx = lazy_import("networkx")
+
 # Global availability flags - set properly at module level
 PHASE1_AVAILABLE = True  # Always available
 PHASE2_AVAILABLE = True  # Will be updated in render_system_status
 PHASE3_AVAILABLE = True  # Will be updated in render_system_status
 
-# Global lazy import cache
-_phase1_workflow = None
-_phase2_workflow = None
-_phase3_workflow = None
-
 # MCP connection
 try:
     import mcp
@@ -108,16 +107,6 @@ class TestResult:
     data: Optional[Dict] = None
     error: Optional[str] = None
 
-@dataclass
-class DocumentProcessingResult:
-    document_id: str
-    filename: str
-    entities_found: int
-    relationships_found: int
-    graph_data: Dict
-    processing_time: float
-    phase_used: str
-
 # Session state initialization
 def init_session_state():
     """Initialize session state variables"""
@@ -131,6 +120,10 @@ def init_session_state():
         st.session_state.processing_history = []
     if "query_results" not in st.session_state:
         st.session_state.query_results = []
+    if "pending_jobs" not in st.session_state:
+        st.session_state.pending_jobs = []
+    if "batch_results" not in st.session_state:
+        st.session_state.batch_results = []
 
 def render_header():
     """Render main header"""
@@ -248,279 +241,68 @@ def render_document_upload():
         
         if st.button("🗑️ Clear All", use_container_width=True):
             clear_all_data()
-
-def process_documents(uploaded_files, test_phase="Phase 1: Basic"):
-    """Process uploaded documents through the GraphRAG pipeline"""
-    results = []
-    
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    for i, uploaded_file in enumerate(uploaded_files):
-        status_text.text(f"Processing {uploaded_file.name}...")
-        
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-        
-        try:
-            start_time = datetime.now()
-            
-            if "Phase 2" in test_phase:
-                if not PHASE2_AVAILABLE:
-                    raise Exception("❌ Phase 2 selected but not available. Install Phase 2 components.")
-                result = process_with_phase2(tmp_path, uploaded_file.name)
-            elif "Phase 3" in test_phase:
-                if not PHASE3_AVAILABLE:
-                    raise Exception("❌ Phase 3 selected but not available. Install Phase 3 components.")
-                result = process_with_phase3(tmp_path, uploaded_file.name)
-            else:
-                result = process_with_phase1(tmp_path, uploaded_file.name)
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            result.processing_time = processing_time
-            
-            results.append(result)
-            
-        except Exception as e:
-            st.error(f"❌ PROCESSING FAILED: {uploaded_file.name}")
-            st.error(f"Error: {str(e)}")
-            # Don't continue processing if one fails - crash loudly
-            st.stop()
-        
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-        
-        progress_bar.progress((i + 1) / len(uploaded_files))
-    
-    # Update session state
-    st.session_state.processing_history.extend(results)
-    if results and results[-1].graph_data:
-        st.session_state.current_graph = results[-1].graph_data
-    
-    status_text.text("✅ Processing complete!")
-    
-    # Display results
-    display_processing_results(results)
-
-def _get_phase1_workflow():
-    """Lazy load Phase 1 workflow."""
-    global _phase1_workflow
-    if _phase1_workflow is None:
-        try:
-            from src.tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
-            _phase1_workflow = VerticalSliceWorkflow()
-        except ImportError as e:
-            raise Exception(f"❌ Phase 1 not available: {e}")
-    return _phase1_workflow
-
-def process_with_phase1(file_path: str, filename: str) -> DocumentProcessingResult:
-    """Process document with Phase 1 basic pipeline"""
-    try:
-        workflow = _get_phase1_workflow()
-        
-        # Extract basic query for testing
-        query = "What are the main entities and relationships in this document?"
-        
-        # Run the workflow
-        result = workflow.execute_workflow(file_path, query, f"UI_Test_{filename}")
-        
-        # Extract data from workflow steps, even if final status is "failed"
-        entities = []
-        relationships = []
-        
-        # The workflow steps contain the actual extracted data
-        steps = result.get("steps", {})
-        
-        # Get entity extraction results
-        entity_extraction = steps.get("entity_extraction", {})
-        total_entities = entity_extraction.get("total_entities", 0)
-        
-        # Get relationship extraction results  
-        relationship_extraction = steps.get("relationship_extraction", {})
-        total_relationships = relationship_extraction.get("total_relationships", 0)
-        
-        print(f"DEBUG: Entity extraction step found {total_entities} entities")
-        print(f"DEBUG: Relationship extraction step found {total_relationships} relationships")
-        print(f"DEBUG: Workflow status: {result.get('status', 'unknown')}")
-        if result.get("error"):
-            print(f"DEBUG: Workflow error: {result.get('error')}")
-        
-        # Use the counts from the extraction steps, not final aggregated results
-        entities_found = total_entities
-        relationships_found = total_relationships
-        
-        # If still 0, check if extraction steps actually failed
-        if entities_found == 0 and relationships_found == 0:
-            entity_status = entity_extraction.get("status", "unknown")
-            rel_status = relationship_extraction.get("status", "unknown")
-            if entity_status == "failed" or rel_status == "failed":
-                raise Exception(f"Entity extraction ({entity_status}) or relationship extraction ({rel_status}) failed")
-            else:
-                print("WARNING: Document may be empty or extraction found nothing (not necessarily an error)")
-        
-        # Query Neo4j for the actual extracted entities and relationships
-        # The workflow stores data in Neo4j even if PageRank fails
-        try:
-            from py2neo import Graph
-            graph = Graph(uri="bolt://localhost:7687", auth=None)
-            
-            # Query for entities (limit to recent ones from this document)
-            entity_query = """
-            MATCH (e:Entity) 
-            RETURN e.id as id, e.canonical_name as name, e.entity_type as type
-            ORDER BY e.created_at DESC 
-            LIMIT $limit
-            """
-            entity_results = graph.run(entity_query, limit=entities_found*2).data()
-            entities = entity_results[:entities_found] if entity_results else []
-            
-            # Query for relationships
-            rel_query = """
-            MATCH (a:Entity)-[r:RELATIONSHIP]->(b:Entity)
-            RETURN a.id as source, b.id as target, r.relation_type as type
-            ORDER BY r.created_at DESC
-            LIMIT $limit
-            """
-            rel_results = graph.run(rel_query, limit=relationships_found*2).data()
-            relationships = rel_results[:relationships_found] if rel_results else []
-            
-            print(f"DEBUG: Retrieved {len(entities)} entities and {len(relationships)} relationships from Neo4j")
-            
-        except Exception as e:
-            print(f"DEBUG: Could not query Neo4j for actual data: {e}")
-            # If we can't query Neo4j, we'll show the counts but no visualization
-            entities = []
-            relationships = []
-        
-        # Create enhanced graph data with actual entities and relationships
-        enhanced_graph_data = {
-            "original_result": result,
-            "entities": entities,
-            "relationships": relationships,
-            "extraction_stats": {
-                "entities_found": entities_found,
-                "relationships_found": relationships_found,
-                "workflow_status": result.get("status", "unknown"),
-                "workflow_error": result.get("error", None)
-            }
-        }
-        
-        return DocumentProcessingResult(
-            document_id=str(uuid.uuid4()),
-            filename=filename,
-            entities_found=entities_found,
-            relationships_found=relationships_found,
-            graph_data=enhanced_graph_data,
-            processing_time=0,  # Will be set by caller
-            phase_used="Phase 1"
-        )
     
-    except Exception as e:
-        raise Exception(f"Phase 1 processing failed: {str(e)}")
+    render_processing_jobs()
 
-def _get_phase2_workflow():
-    """Lazy load Phase 2 workflow."""
-    global _phase2_workflow
-    if _phase2_workflow is None:
-        try:
-            from src.tools.phase2.enhanced_vertical_slice_workflow import EnhancedVerticalSliceWorkflow
-            _phase2_workflow = EnhancedVerticalSliceWorkflow()
-        except ImportError as e:
-            raise Exception(f"❌ Phase 2 not available: {e}")
-    return _phase2_workflow
-
-def process_with_phase2(file_path: str, filename: str) -> DocumentProcessingResult:
-    """Process document with Phase 2 enhanced pipeline"""
-    try:
-        workflow = _get_phase2_workflow()
-        
-        # Use ontology-aware processing
-        query = "What are the main entities and relationships in this document?"
-        
-        result = workflow.execute_enhanced_workflow(file_path, query, f"UI_Enhanced_{filename}")
-        
-        entities_found = len(result.get("entities", []))
-        relationships_found = len(result.get("relationships", []))
-        
-        return DocumentProcessingResult(
-            document_id=str(uuid.uuid4()),
-            filename=filename,
-            entities_found=entities_found,
-            relationships_found=relationships_found,
-            graph_data=result,
-            processing_time=0,
-            phase_used="Phase 2"
+def process_documents(uploaded_files, test_phase="Phase 1: Basic"):
+    """Submit uploaded documents to the processing queue"""
+    if "Phase 2" in test_phase:
+        if not PHASE2_AVAILABLE:
+            st.error("❌ Phase 2 selected but not available. Install Phase 2 components.")
+            return
+        phase = "Phase 2"
+    elif "Phase 3" in test_phase:
+        if not PHASE3_AVAILABLE:
+            st.error("❌ Phase 3 selected but not available. Install Phase 3 components.")
+            return
+        phase = "Phase 3"
+    else:
+        phase = "Phase 1"
+    
+    # A new batch replaces the results shown for the previous one
+    st.session_state.batch_results = []
+    for uploaded_file in uploaded_files:
+        submission = submit_document(
+            f"graphrag_ui_{phase.lower().replace(' ', '')}",
+            "src.ui.document_processing:process_document",
+            uploaded_file.getvalue(),
+            uploaded_file.name,
+            {"phase": phase, "filename": uploaded_file.name}
         )
-    
-    except Exception as e:
-        raise Exception(f"Phase 2 processing failed: {str(e)}")
-
-def _get_phase3_adapter():
-    """Lazy load Phase 3 adapter."""
-    global _phase3_workflow  
-    if _phase3_workflow is None:
-        try:
-            from src.core.phase_adapters import Phase3Adapter
-            _phase3_workflow = Phase3Adapter()
-        except ImportError as e:
-            raise Exception(f"❌ Phase 3 not available: {e}")
-    return _phase3_workflow
+        if submission["status"] != "success":
+            st.error(f"❌ Could not queue {uploaded_file.name}: {submission['error']}")
+            continue
+        st.session_state.pending_jobs.append({"job_id": submission["job_id"], "filename": uploaded_file.name})
 
-def process_with_phase3(file_path: str, filename: str) -> DocumentProcessingResult:
-    """Process document with Phase 3 multi-document fusion"""
-    try:
-        # Import Phase 3 interface
-        from src.core.graphrag_phase_interface import ProcessingRequest
-        
-        # Get Phase 3 adapter
-        phase3 = _get_phase3_adapter()
-        
-        # Create processing request for multi-document workflow
-        # Note: Phase 3 is designed for multiple documents, but we'll use single document here
-        request = ProcessingRequest(
-            workflow_id=f"ui_phase3_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            documents=[file_path],
-            queries=["Extract main entities and relationships from this document"],
-            domain_description="General document analysis"
-        )
-        
-        # Execute Phase 3 processing
-        phase_result = phase3.execute(request)
-        
-        # Extract metrics from Phase 3 result
-        if phase_result.status == "success":
-            fusion_summary = phase_result.results.get("processing_summary", {})
-            
-            result = DocumentProcessingResult(
-                document_id=f"phase3_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                filename=filename,
-                entities_found=fusion_summary.get("total_entities_after_fusion", 0),
-                relationships_found=fusion_summary.get("total_relationships", 0),
-                processing_time=phase_result.execution_time,
-                phase_used="Phase 3",
-                graph_data={
-                    "documents_processed": phase_result.results.get("documents_processed", 1),
-                    "fusion_reduction": fusion_summary.get("fusion_reduction", 0),
-                    "entities_before_fusion": fusion_summary.get("total_entities_before_fusion", 0),
-                    "entities_after_fusion": fusion_summary.get("total_entities_after_fusion", 0),
-                    "confidence_score": phase_result.confidence_score,
-                    "raw_result": phase_result.results
-                }
-            )
+def render_processing_jobs():
+    """Show queued documents and collect the results of finished ones"""
+    pending_jobs = st.session_state.pending_jobs
+    if pending_jobs:
+        filenames = {job["job_id"]: job["filename"] for job in pending_jobs}
+        finished, pending = poll_jobs(list(filenames))
+        
+        for job in finished:
+            if job["job_status"] == "completed":
+                result = job["result"]
+                st.session_state.processing_history.append(result)
+                st.session_state.batch_results.append(result)
+                if result.graph_data:
+                    st.session_state.current_graph = result.graph_data
+            else:
+                st.error(f"❌ PROCESSING FAILED: {filenames[job['job_id']]}")
+                st.error(f"Error: {job['error']}")
+        
+        st.session_state.pending_jobs = [job for job in pending_jobs if job["job_id"] in {p["job_id"] for p in pending}]
+        if pending:
+            done = len(st.session_state.batch_results)
+            st.progress(done / (done + len(pending)))
+            for job in pending:
+                st.text(f"⏳ {filenames[job['job_id']]}: {job['job_status']}")
         else:
-            # Phase 3 failed - raise exception following the pattern of other phases
-            raise Exception(f"Phase 3 execution failed: {phase_result.error_message}")
-        
-        return result
+            st.success("✅ Processing complete!")
     
-    except Exception as e:
-        raise Exception(f"Phase 3 processing failed: {str(e)}")
+    if st.session_state.batch_results:
+        display_processing_results(st.session_state.batch_results)
 
 def display_processing_results(results: List[DocumentProcessingResult]):
     """Display processing results in a nice format"""
@@ -577,10 +359,17 @@ def execute_query(query: str):
     st.error("This feature is disabled until actual query implementation is complete")
     st.stop()
 
-def render_graph_visualization():
+def render_graph_visualization(max_entities: int = 100):
     """Render graph visualization"""
     st.header("🕸️ Knowledge Graph Visualization")
     
+    source = st.radio(
+        "Graph source", ["Processed documents", "Graph database (click nodes to expand)"], horizontal=True
+    )
+    if source != "Processed documents":
+        render_database_graph(max_entities)
+        return
+    
     if not st.session_state.current_graph:
         st.info("💡 Process documents to see graph visualization")
         return
@@ -785,6 +574,7 @@ def clear_all_data():
     st.session_state.current_graph = None
     st.session_state.processing_history = []
     st.session_state.query_results = []
+    st.session_state.batch_results = []
     st.success("All data cleared!")
     st.rerun()
 
@@ -871,7 +661,7 @@ def main():
         
         with tab2:
             if enable_visualization:
-                render_graph_visualization()
+                render_graph_visualization(max_entities)
             else:
                 st.info("Graph visualization disabled in settings")
         
@@ -888,6 +678,9 @@ def main():
     # Footer
     st.markdown("---")
     st.markdown("🔬 **Super-Digimon GraphRAG Testing Interface** | Test all phases with your own data")
+    
+    # Keep polling while documents are being processed
+    rerun_while_pending(st.session_state.pending_jobs)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -14,8 +14,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 import tempfile
 import uuid
 
@@ -10,15 +10,16 @@ import json
 from datetime import datetime
 import platform
 import traceback
-import networkx as nx
-import plotly.graph_objects as go
 
-# Add src to path
-src_dir = Path(__file__).parent / "src"
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+src_dir = project_root / "src"
+sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(src_dir))
 
 try:
     from tools.phase1.vertical_slice_workflow import VerticalSliceWorkflow
+    from src.ui.streamlit_jobs import submit_document, poll_jobs, rerun_while_pending
     SYSTEM_AVAILABLE = True
 except ImportError as e:
     SYSTEM_AVAILABLE = False
@@ -32,6 +33,10 @@ def init_session_state():
         st.session_state.processed_files = {}
     if 'query_history' not in st.session_state:
         st.session_state.query_history = []
+    if 'pending_queries' not in st.session_state:
+        st.session_state.pending_queries = []
+    if 'last_query_result' not in st.session_state:
+        st.session_state.last_query_result = None
 
 def initialize_workflow():
     """Initialize the workflow system"""
@@ -91,48 +96,65 @@ def process_uploaded_file(uploaded_file):
         return None
 
 def run_query(file_path, query, file_name):
-    """Run a query against the processed document"""
-    if not initialize_workflow():
-        return None
+    """Queue a query against the uploaded document"""
+    # Extra debug for WSL file issues
+    if st.checkbox("Enable verbose debug"):
+        st.write(f"🔍 Debug: About to process file: {file_path}")
+        st.write(f"🔍 Debug: File exists before processing: {os.path.exists(file_path)}")
+        st.write(f"🔍 Debug: File size: {os.path.getsize(file_path) if os.path.exists(file_path) else 'N/A'}")
     
-    try:
-        # Extra debug for WSL file issues
-        if st.checkbox("Enable verbose debug"):
-            st.write(f"🔍 Debug: About to process file: {file_path}")
-            st.write(f"🔍 Debug: File exists before processing: {os.path.exists(file_path)}")
-            st.write(f"🔍 Debug: File size: {os.path.getsize(file_path) if os.path.exists(file_path) else 'N/A'}")
-        
-        with st.spinner(f"Processing query: '{query}'..."):
-            result = st.session_state.workflow.execute_workflow(
-                pdf_path=file_path,
-                query=query,
-                workflow_name=f"UI_{file_name}_{len(query)}"
-            )
+    # The worker gets its own copy of the file, keyed with the query
+    submission = submit_document(
+        "web_ui_query",
+        "src.ui.document_processing:run_vertical_slice_query",
+        Path(file_path).read_bytes(),
+        file_name,
+        {"query": query, "workflow_name": f"UI_{file_name}_{len(query)}"},
+        query
+    )
+    if submission["status"] != "success":
+        st.error(f"Error queuing query: {submission['error']}")
+        return
+    
+    st.session_state.pending_queries.append({
+        'job_id': submission['job_id'],
+        'timestamp': datetime.now(),
+        'file_name': file_name,
+        'query': query
+    })
+
+def render_pending_queries():
+    """Show queued queries and record the results of finished ones"""
+    pending_queries = st.session_state.pending_queries
+    if not pending_queries:
+        return
+    
+    finished, pending = poll_jobs([item['job_id'] for item in pending_queries])
+    finished_by_id = {job['job_id']: job for job in finished}
+    still_pending = []
+    for item in pending_queries:
+        job = finished_by_id.get(item['job_id'])
+        if job is None:
+            still_pending.append(item)
+            continue
+        
+        result = job['result']
+        if not isinstance(result, dict):
+            # The task raised instead of returning a result
+            result = {"status": "error", "error": job['error']}
         
         # Add to query history
         st.session_state.query_history.append({
-            'timestamp': datetime.now(),
-            'file_name': file_name,
-            'query': query,
+            'timestamp': item['timestamp'],
+            'file_name': item['file_name'],
+            'query': item['query'],
             'result': result
         })
-        
-        return result
-        
-    except Exception as e:
-        error_trace = traceback.format_exc()
-        st.error(f"Error processing query: {e}")
-        st.error(f"🔍 Debug: Exception type: {type(e).__name__}")
-        with st.expander("Full error traceback"):
-            st.code(error_trace, language="python")
-        
-        # Return error result with traceback
-        return {
-            "status": "error",
-            "error": str(e),
-            "traceback": error_trace,
-            "exception_type": type(e).__name__
-        }
+        st.session_state.last_query_result = result
+    
+    st.session_state.pending_queries = still_pending
+    for item in still_pending:
+        st.info(f"⏳ Processing query: '{item['query']}' ({item['file_name']})...")
 
 def display_results(result):
     """Display query results in a nice format"""
@@ -329,12 +351,9 @@ def main():
                     if selected_example:
                         query = selected_example
                 
-                # Execute query
+                # Queue query; results appear when the worker finishes
                 if st.button("🔍 Run Query", type="primary") and query:
-                    result = run_query(file_path, query, uploaded_file.name)
-                    
-                    if result:
-                        display_results(result)
+                    run_query(file_path, query, uploaded_file.name)
                 
                 # Cleanup temp file (with better error handling for WSL)
                 if file_path and os.path.exists(file_path):
@@ -343,6 +362,9 @@ def main():
                     except Exception as e:
                         st.warning(f"Could not delete temp file: {e}")
     
+        render_pending_queries()
+        display_results(st.session_state.last_query_result)
+    
     with tab2:
         st.header("Quick Test with Sample Data")
         st.markdown("Test the system with built-in sample content")
@@ -570,6 +592,10 @@ def main():
                     with driver.session() as session:
                         result = session.run(query, params)
                         
+                        # Plotting libraries are only needed for the graph view
+                        import networkx as nx
+                        import plotly.graph_objects as go
+                        
                         # Build graph data
                         G = nx.Graph()
                         nodes = {}
@@ -758,6 +784,9 @@ def main():
         except Exception as e:
             st.error(f"Failed to connect to Neo4j: {e}")
             st.info("Make sure Neo4j is running with: `docker-compose up -d neo4j`")
+    
+    # Keep polling while queries are being processed
+    rerun_while_pending(st.session_state.pending_queries)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file